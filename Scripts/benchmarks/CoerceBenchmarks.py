@@ -0,0 +1,77 @@
+import timeit
+
+import System
+
+import Rhino
+import Rhino.Geometry as g
+
+import rhinocompat as compat
+import scriptcontext as sc
+
+from rhinoscript import utility as rhutil
+
+
+def legacy_coerce3dpoint(point, raise_on_error=False):
+    # the type cascade used by utility.coerce3dpoint before the dispatch table
+    if type(point) is g.Point3d: return point
+    enumerable = compat.GET_HOST().Coerce3dPointFromEnumerables(point)
+    if enumerable is not None: return enumerable
+    if type(point) is System.Guid:
+        found, pt = sc.doc.Objects.TryFindPoint(point)
+        if found: return pt
+    if hasattr(point, "__len__") and len(point)==3 and hasattr(point, "__getitem__"):
+        try:
+            return g.Point3d(float(point[0]), float(point[1]), float(point[2]))
+        except:
+            if raise_on_error: raise
+    if type(point) is g.Vector3d or type(point) is g.Point3f or type(point) is g.Vector3f:
+        return g.Point3d(point.X, point.Y, point.Z)
+    if type(point) is str:
+        point = point.split(',')
+        return g.Point3d( float(point[0]), float(point[1]), float(point[2]) )
+    if hasattr(point, "__len__") and len(point)==2 and hasattr(point, "__getitem__"):
+        try:
+            return g.Point3d(float(point[0]), float(point[1]), 0.0)
+        except:
+            if raise_on_error: raise
+    if raise_on_error: raise ValueError("Could not convert %s to a Point3d" % point)
+
+
+def legacy_coerce3dvector(vector, raise_on_error=False):
+    if type(vector) is g.Vector3d: return vector
+    point = legacy_coerce3dpoint(vector, False)
+    if point: return g.Vector3d(point.X, point.Y, point.Z)
+    if raise_on_error: raise ValueError("Could not convert %s to a Vector3d" % vector)
+
+
+def per_call_us(func, value, count):
+    seconds = min(timeit.repeat(lambda: func(value), number=count, repeat=3))
+    return seconds * 1.0e6 / count
+
+
+def run(count=100000):
+    point_id = sc.doc.Objects.AddPoint(g.Point3d(1, 2, 3))
+    inputs = [
+        ("tuple", (1.0, 2.0, 3.0)),
+        ("list", [1.0, 2.0, 3.0]),
+        ("Point3d", g.Point3d(1, 2, 3)),
+        ("Vector3d", g.Vector3d(1, 2, 3)),
+        ("Guid", point_id),
+        ]
+    pairs = [
+        ("coerce3dpoint", legacy_coerce3dpoint, rhutil.coerce3dpoint),
+        ("coerce3dvector", legacy_coerce3dvector, rhutil.coerce3dvector),
+        ]
+    try:
+        print("{:<16}{:<10}{:>12}{:>12}{:>9}".format("function", "input", "before us", "after us", "speedup"))
+        for name, before, after in pairs:
+            for label, value in inputs:
+                t0 = per_call_us(before, value, count)
+                t1 = per_call_us(after, value, count)
+                print("{:<16}{:<10}{:>12.3f}{:>12.3f}{:>8.1f}x".format(name, label, t0, t1, t0 / t1))
+    finally:
+        sc.doc.Objects.Delete(point_id, True)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,85 @@
+import array
+import math
+import random
+import timeit
+
+import Rhino.Geometry as g
+
+import rhinoscriptsyntax as rs
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000.0
+
+
+def random_points(count, size, seed=1):
+    random.seed(seed)
+    return [g.Point3d(random.uniform(0, size), random.uniform(0, size), random.uniform(0, size)) for i in range(count)]
+
+
+def run_points(count=200000, tolerance=0.01):
+    points = random_points(count, 100.0)
+    points.extend(points[:count//10])
+    cases = [
+        ("Point3d.CullDuplicates", lambda: g.Point3d.CullDuplicates(points[:5000], tolerance)),
+        ("first, 5000 points", lambda: rs.CullDuplicatePoints(points[:5000], tolerance)),
+        ("first", lambda: rs.CullDuplicatePoints(points, tolerance)),
+        ("centroid", lambda: rs.CullDuplicatePoints(points, tolerance, "centroid")),
+        ]
+    if numpy is not None:
+        xyz = numpy.array([(p.X, p.Y, p.Z) for p in points])
+        cases.append(("numpy (N,3)", lambda: rs.CullDuplicatePoints(xyz, tolerance)))
+    print("CullDuplicatePoints of {} points, tolerance {}".format(len(points), tolerance))
+    print("{:<28}{:>12}".format("case", "ms"))
+    for label, func in cases:
+        print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+
+
+def legacy_cullduplicatenumbers(numbers, tolerance):
+    # the sort and list.pop loop CullDuplicateNumbers used before
+    count = len(numbers)
+    numbers = sorted(numbers)
+    d = numbers[0]
+    index = 1
+    for step in range(1,count):
+        test_value = numbers[index]
+        if math.fabs(d-test_value)<=tolerance:
+            numbers.pop(index)
+        else:
+            d = test_value
+            index += 1
+    return numbers
+
+
+def run_numbers(count=200000, tolerance=0.001):
+    random.seed(2)
+    numbers = [round(random.uniform(0, count/1000.0), 4) for i in range(count)]
+    flat = array.array('d', numbers)
+    cases = [
+        ("list, before", lambda: legacy_cullduplicatenumbers(numbers, tolerance)),
+        ("list", lambda: rs.CullDuplicateNumbers(numbers, tolerance)),
+        ("list, indices", lambda: rs.CullDuplicateNumbers(numbers, tolerance, True)),
+        ("array('d')", lambda: rs.CullDuplicateNumbers(flat, tolerance)),
+        ]
+    if numpy is not None:
+        values = numpy.array(numbers)
+        cases.append(("numpy", lambda: rs.CullDuplicateNumbers(values, tolerance)))
+    print("CullDuplicateNumbers of {} numbers, tolerance {}".format(count, tolerance))
+    print("{:<28}{:>12}".format("case", "ms"))
+    for label, func in cases:
+        print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+
+
+def run():
+    run_points()
+    print("")
+    run_numbers()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,184 @@
+import array
+import random
+import timeit
+
+import Rhino
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+def best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000.0
+
+
+def divide_each(ids, segments):
+    # one DivideCurve call per curve, the way scripts divided many curves
+    return [rs.DivideCurve(id, segments) for id in ids]
+
+
+def intersect_each(ids):
+    # one CurveCurveIntersection call per pair of curves
+    events = []
+    for i in range(len(ids)):
+        for j in range(i+1, len(ids)):
+            rc = rs.CurveCurveIntersection(ids[i], ids[j])
+            if rc: events.extend((i, j) + event for event in rc)
+    return events
+
+
+def grid_curves(size):
+    # size x size grid of short line cells crossed by size arcs where the
+    # arcs are available, the headless stand-in only has lines
+    ids = []
+    for i in range(size):
+        for j in range(size):
+            ids.append(rs.AddLine((i, j, 0), (i + 1, j + 0.5, 0)))
+            ids.append(rs.AddLine((i + 0.5, j, 0), (i + 0.5, j + 1, 0)))
+    try:
+        for i in range(size):
+            ids.append(rs.AddArc(rs.MovePlane(rs.WorldXYPlane(), (i, i, 0)), 1.5, 180.0))
+    except NotImplementedError:
+        print("arcs are not available, intersecting lines only")
+    return ids
+
+
+def run_intersection(size=15):
+    ids = grid_curves(size)
+    cases = [
+        ("CurveCurveIntersection pairs", lambda: intersect_each(ids)),
+        ("CurveArrayIntersection, 1 thread", lambda: rs.CurveArrayIntersection(ids, threads=1)),
+        ("CurveArrayIntersection", lambda: rs.CurveArrayIntersection(ids)),
+        ]
+    try:
+        print("{} curves, {} intersection events".format(len(ids), len(rs.CurveArrayIntersection(ids))))
+        print("{:<36}{:>12}".format("function", "ms"))
+        for label, func in cases:
+            print("{:<36}{:>12.2f}".format(label, best_ms(func, 1)))
+    finally:
+        rs.DeleteObjects(ids)
+
+
+def run_divide(curve_count=500, segments=100):
+    ids = [rs.AddLine((0, i, 0), (10 + i % 7, i, 1)) for i in range(curve_count)]
+    cases = [
+        ("DivideCurve per curve", lambda: divide_each(ids, segments)),
+        ("DivideCurves, 1 thread", lambda: rs.DivideCurves(ids, segments, threads=1)),
+        ("DivideCurves", lambda: rs.DivideCurves(ids, segments)),
+        ("DivideCurves parameters", lambda: rs.DivideCurves(ids, segments, False)),
+        ("DivideCurvesLength", lambda: rs.DivideCurvesLength(ids, 0.1)),
+        ]
+    try:
+        print("{} curves divided into {} segments".format(curve_count, segments))
+        print("{:<28}{:>12}".format("function", "ms"))
+        for label, func in cases:
+            print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+    finally:
+        rs.DeleteObjects(ids)
+
+
+def run_evaluate(count=1000):
+    id = rs.AddLine((0, 0, 0), (10, 5, 1))
+    parameters = rs.linspace(0.0, rs.CurveDomain(id)[1], count)
+    cases = [
+        ("EvaluateCurve per parameter", lambda: [rs.EvaluateCurve(id, t) for t in parameters]),
+        ("EvaluateCurve", lambda: rs.EvaluateCurve(id, parameters)),
+        ("EvaluateCurve, 2 derivatives", lambda: rs.EvaluateCurve(id, parameters, derivative=2)),
+        ("CurveTangent per parameter", lambda: [rs.CurveTangent(id, t) for t in parameters]),
+        ("CurveTangent", lambda: rs.CurveTangent(id, parameters)),
+        ("CurveCurvature", lambda: rs.CurveCurvature(id, parameters)),
+        ("CurvePerpFrame per parameter", lambda: [rs.CurvePerpFrame(id, t) for t in parameters]),
+        ("CurvePerpFrame", lambda: rs.CurvePerpFrame(id, parameters)),
+        ]
+    try:
+        print("{} parameters on one curve".format(count))
+        print("{:<36}{:>12}".format("function", "ms"))
+        for label, func in cases:
+            print("{:<36}{:>12.2f}".format(label, best_ms(func)))
+    finally:
+        rs.DeleteObject(id)
+
+
+def closest_each(id, points):
+    # resolve-then-query loop that also measures the distance
+    parameters, distances = [], []
+    for point in points:
+        t = rs.CurveClosestPoint(id, point)
+        parameters.append(t)
+        distances.append(rs.Distance(point, rs.EvaluateCurve(id, t)))
+    return parameters, distances
+
+
+def run_closest(count=20000):
+    id = rs.AddLine((0, 0, 0), (100, 20, 0))
+    flat = array.array('d')
+    for i in range(count): flat.extend((i % 101, (i * 7) % 23, (i * 3) % 5))
+    points = rs.UnflattenArray(flat)
+    cases = [
+        ("CurveClosestPoint per point", lambda: [rs.CurveClosestPoint(id, point) for point in points]),
+        ("... and distance per point", lambda: closest_each(id, points)),
+        ("CurveClosestPoints, 1 thread", lambda: rs.CurveClosestPoints(id, flat, threads=1)),
+        ("CurveClosestPoints", lambda: rs.CurveClosestPoints(id, flat)),
+        ("CurveClosestPoints within 5", lambda: rs.CurveClosestPoints(id, flat, 5.0)),
+        ]
+    try:
+        print("{} test points on one curve".format(count))
+        print("{:<36}{:>12}".format("function", "ms"))
+        for label, func in cases:
+            print("{:<36}{:>12.2f}".format(label, best_ms(func)))
+    finally:
+        rs.DeleteObject(id)
+
+
+def legacy_joincurves(ids, tolerance):
+    # the single Curve.JoinCurves call JoinCurves made for all curves
+    curves = [rs.coercecurve(id, -1, True) for id in ids]
+    return Rhino.Geometry.Curve.JoinCurves(curves, tolerance)
+
+
+def linework(chain_count, chain_length):
+    # polylines exploded into shuffled segments, like imported DXF linework
+    ids = []
+    for i in range(chain_count):
+        points = [(j + (i % 3) * 0.1 * j, i * 2.0 + (j % 2), 0) for j in range(chain_length + 1)]
+        ids.extend(rs.AddLine(a, b) for a, b in zip(points, points[1:]))
+    random.Random(1).shuffle(ids)
+    return ids
+
+
+def run_join(chain_count=300, chain_length=10):
+    ids = linework(chain_count, chain_length)
+    tolerance = 2.1 * sc.doc.ModelAbsoluteTolerance
+    joined = []
+    def join(**kwargs):
+        rc = rs.JoinCurves(ids, **kwargs)
+        joined.extend(rc)
+        return rc
+    cases = [
+        ("Curve.JoinCurves, all at once", lambda: legacy_joincurves(ids, tolerance)),
+        ("JoinCurves, 1 thread", lambda: join(threads=1)),
+        ("JoinCurves", lambda: join()),
+        ]
+    try:
+        print("{} segments in {} chains".format(len(ids), chain_count))
+        print("{:<36}{:>12}".format("function", "ms"))
+        for label, func in cases:
+            print("{:<36}{:>12.2f}".format(label, best_ms(func, 1)))
+    finally:
+        rs.DeleteObjects(ids + joined)
+
+
+def run():
+    run_divide()
+    print("")
+    run_evaluate()
+    print("")
+    run_closest()
+    print("")
+    run_join()
+    print("")
+    run_intersection()
+
+
+if __name__ == "__main__":
+    run()
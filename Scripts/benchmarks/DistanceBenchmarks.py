@@ -0,0 +1,106 @@
+import random
+import timeit
+
+import Rhino.Geometry as g
+
+import rhinoscriptsyntax as rs
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000.0
+
+
+def random_points(count, size, seed):
+    random.seed(seed)
+    return [g.Point3d(random.uniform(0, size), random.uniform(0, size), random.uniform(0, size)) for i in range(count)]
+
+
+def run_matrix(count1=1000, count2=1000, cutoff=1.0):
+    points1 = random_points(count1, 50.0, 1)
+    points2 = random_points(count2, 50.0, 2)
+    cases = [
+        ("Distance per point", lambda: [rs.Distance(point, points2) for point in points1]),
+        ("DistanceMatrix", lambda: rs.DistanceMatrix(points1, points2)),
+        ("DistanceMatrix squared", lambda: rs.DistanceMatrix(points1, points2, True)),
+        ("DistanceMatrix cutoff", lambda: rs.DistanceMatrix(points1, points2, cutoff=cutoff)),
+        ]
+    if numpy is not None:
+        xyz1 = numpy.array([(p.X, p.Y, p.Z) for p in points1])
+        xyz2 = numpy.array([(p.X, p.Y, p.Z) for p in points2])
+        cases.append(("numpy dense", lambda: rs.DistanceMatrix(xyz1, xyz2)))
+        cases.append(("numpy cutoff", lambda: rs.DistanceMatrix(xyz1, xyz2, cutoff=cutoff)))
+    print("{} x {} points, cutoff {}".format(count1, count2, cutoff))
+    print("{:<28}{:>12}".format("case", "ms"))
+    for label, func in cases:
+        print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+
+
+def run_index(count=100000, query_count=1000):
+    points = random_points(count, 100.0, 3)
+    queries = random_points(query_count, 100.0, 4)
+    index = rs.PointIndex(points)
+    cases = [
+        ("list, 100 queries", lambda: [rs.PointArrayClosestPoint(points, q) for q in queries[:100]]),
+        ("build PointIndex", lambda: rs.PointIndex(points)),
+        ("ClosestIndex batch", lambda: index.ClosestIndex(queries)),
+        ("ClosestIndices(8) batch", lambda: index.ClosestIndices(queries, 8)),
+        ("IndicesInSphere(1.0) batch", lambda: index.IndicesInSphere(queries, 1.0)),
+        ]
+    print("{} points, {} queries".format(count, query_count))
+    print("{:<28}{:>12}".format("case", "ms"))
+    for label, func in cases:
+        print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+
+
+def legacy_pointclosestobject(point, object_ids):
+    # exact closest point against every object, as PointClosestObject did
+    point = rs.coerce3dpoint(point, True)
+    closest = None
+    for id in object_ids:
+        curve = rs.coercegeometry(id, True)
+        rc, t = curve.ClosestPoint(point)
+        distance = point.DistanceTo(curve.PointAt(t))
+        if closest is None or distance<closest[0]: closest = distance, id, curve.PointAt(t)
+    return closest[1], closest[2]
+
+
+def cached(func):
+    with rs.objectcache():
+        return func()
+
+
+def run_closest_object(count=2000, query_count=50):
+    random.seed(5)
+    ids = [rs.AddLine((random.uniform(0, 100), random.uniform(0, 100), 0),
+                      (random.uniform(0, 100), random.uniform(0, 100), 1)) for i in range(count)]
+    queries = random_points(query_count, 100.0, 6)
+    cases = [
+        ("every object", lambda: [legacy_pointclosestobject(q, ids) for q in queries]),
+        ("bounding box broad phase", lambda: [rs.PointClosestObject(q, ids) for q in queries]),
+        ("batch", lambda: rs.PointClosestObject(queries, ids)),
+        ("objectcache", lambda: cached(lambda: [rs.PointClosestObject(q, ids) for q in queries])),
+        ]
+    try:
+        print("PointClosestObject, {} curves, {} test points".format(count, query_count))
+        print("{:<28}{:>12}".format("case", "ms"))
+        for label, func in cases:
+            print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+    finally:
+        rs.DeleteObjects(ids)
+
+
+def run():
+    run_matrix()
+    print("")
+    run_index()
+    print("")
+    run_closest_object()
+
+
+if __name__ == "__main__":
+    run()
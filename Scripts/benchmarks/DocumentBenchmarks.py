@@ -0,0 +1,56 @@
+import timeit
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+from rhinoscript import utility as rhutil
+
+
+SECTION = "DocumentBenchmarks"
+
+
+def per_call_ms(func, count):
+    seconds = min(timeit.repeat(func, number=count, repeat=3))
+    return seconds * 1000.0 / count
+
+
+def populate(point_count, layer_count):
+    layers = [rs.AddLayer("DocumentBenchmarks %d" % i) for i in range(layer_count)]
+    ids = rs.AddPoints([(i, i % 7, 0) for i in range(point_count)])
+    for i, id in enumerate(ids):
+        rs.ObjectLayer(id, layers[i % layer_count])
+        if i % 10==0: rs.ObjectName(id, "tagged")
+    for i in range(100):
+        rs.SetDocumentData(SECTION, "entry %d" % i, str(i))
+    return layers, ids
+
+
+def run(point_count=2000, layer_count=20, count=20):
+    layers, ids = populate(point_count, layer_count)
+    middle_id = ids[len(ids)//2]
+    cases = [
+        ("selection", "AllObjects", lambda: rs.AllObjects()),
+        ("selection", "ObjectsByType(point)", lambda: rs.ObjectsByType(1)),
+        ("selection", "ObjectsByLayer", lambda: rs.ObjectsByLayer(layers[-1])),
+        ("selection", "ObjectsByName", lambda: rs.ObjectsByName("tagged")),
+        ("table", "IsLayer", lambda: rs.IsLayer(layers[-1])),
+        ("table", "LayerNames", lambda: rs.LayerNames()),
+        ("table", "ObjectLayer", lambda: rs.ObjectLayer(middle_id)),
+        ("table", "GetDocumentData", lambda: rs.GetDocumentData(SECTION, "entry 50")),
+        ("table", "SetDocumentData", lambda: rs.SetDocumentData(SECTION, "entry 50", "50")),
+        ("coerce", "coercerhinoobject", lambda: rhutil.coercerhinoobject(middle_id)),
+        ("coerce", "coerce3dpoint(Guid)", lambda: rhutil.coerce3dpoint(middle_id)),
+        ]
+    try:
+        print("{} points on {} layers".format(point_count, layer_count))
+        print("{:<12}{:<24}{:>12}".format("path", "function", "ms/call"))
+        for path, label, func in cases:
+            print("{:<12}{:<24}{:>12.4f}".format(path, label, per_call_ms(func, count)))
+    finally:
+        rs.DeleteObjects(ids)
+        rs.DeleteDocumentData(SECTION)
+        for layer in layers: rs.DeleteLayer(layer)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,55 @@
+import sys
+import time
+import importlib
+
+
+def purge():
+    # drop the python modules so the next import runs them again. Assemblies
+    # loaded by the CLR stay loaded, so "cold" here means a fresh interpreter
+    # state for rhinoscriptsyntax on top of an already running Rhino
+    for name in list(sys.modules):
+        if name=="rhinoscriptsyntax" or name=="rhinoscript" or name.startswith("rhinoscript."):
+            del sys.modules[name]
+
+
+def timed_ms(func):
+    start = time.time()
+    func()
+    return (time.time() - start) * 1000.0
+
+
+def import_lazy():
+    importlib.import_module("rhinoscriptsyntax")
+
+
+def import_and_use():
+    rs = importlib.import_module("rhinoscriptsyntax")
+    rs.AddLine
+
+
+def import_everything():
+    rs = importlib.import_module("rhinoscriptsyntax")
+    for name in rs.__all__: getattr(rs, name)
+
+
+def run(repeat=5):
+    cases = [
+        ("import rhinoscriptsyntax", import_lazy),
+        ("import + rs.AddLine", import_and_use),
+        ("import + all names", import_everything),
+        ]
+    print("{:<28}{:>12}{:>12}".format("case", "cold ms", "warm ms"))
+    for label, func in cases:
+        cold = []
+        warm = []
+        for i in range(repeat):
+            purge()
+            cold.append(timed_ms(func))
+            warm.append(timed_ms(func))
+        print("{:<28}{:>12.2f}{:>12.2f}".format(label, min(cold), min(warm)))
+    purge()
+    importlib.import_module("rhinoscriptsyntax")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+import array
+import timeit
+
+import Rhino.Geometry as g
+
+import rhinoscriptsyntax as rs
+
+from rhinoscript import utility as rhutil
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def legacy_pointarraytransform(points, xform):
+    # the list comprehension PointArrayTransform used for every input
+    points = rhutil.coerce3dpointlist(points, True)
+    xform = rhutil.coercexform(xform, True)
+    return [xform*point for point in points]
+
+
+def best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000.0
+
+
+def run(count=200000):
+    xform = rs.XformRotation2(30.0, (1, 2, 3), (4, 5, 6))
+    flat = array.array('d', [float(i % 1000) for i in range(count*3)])
+    points = [g.Point3d(flat[i*3], flat[i*3+1], flat[i*3+2]) for i in range(count)]
+    cases = [
+        ("list of Point3d, before", lambda: legacy_pointarraytransform(points, xform)),
+        ("list of Point3d", lambda: rs.PointArrayTransform(points, xform)),
+        ("array('d')", lambda: rs.PointArrayTransform(flat, xform)),
+        ("array('d') in place", lambda: rs.PointArrayTransform(flat, xform, True)),
+        ]
+    if numpy is not None:
+        xyz = numpy.array(flat).reshape(-1, 3)
+        cases.append(("numpy (N,3)", lambda: rs.PointArrayTransform(xyz, xform)))
+        cases.append(("numpy (N,3) in place", lambda: rs.PointArrayTransform(xyz, xform, True)))
+    print("PointArrayTransform of {} points".format(count))
+    print("{:<28}{:>12}".format("input", "ms"))
+    for label, func in cases:
+        print("{:<28}{:>12.2f}".format(label, best_ms(func)))
+
+
+if __name__ == "__main__":
+    run()
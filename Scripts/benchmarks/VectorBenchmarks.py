@@ -0,0 +1,50 @@
+import array
+import random
+import timeit
+
+import Rhino.Geometry as g
+
+import rhinoscriptsyntax as rs
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def best_ms(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000.0
+
+
+def run(count=100000):
+    random.seed(8)
+    flat1 = array.array('d', [random.uniform(-1, 1) for i in range(count*3)])
+    flat2 = array.array('d', [random.uniform(-1, 1) for i in range(count*3)])
+    vectors1 = [g.Vector3d(flat1[i*3], flat1[i*3+1], flat1[i*3+2]) for i in range(count)]
+    vectors2 = [g.Vector3d(flat2[i*3], flat2[i*3+1], flat2[i*3+2]) for i in range(count)]
+    xform = rs.XformRotation2(30.0, (1, 2, 3), (0, 0, 0))
+    inputs = [("list", vectors1, vectors2), ("array('d')", flat1, flat2)]
+    if numpy is not None:
+        inputs.append(("numpy", numpy.array(flat1).reshape(-1, 3), numpy.array(flat2).reshape(-1, 3)))
+    operations = [
+        ("add", lambda a, b: [rs.VectorAdd(u, v) for u, v in zip(a, b)], lambda a, b: rs.VectorArrayAdd(a, b)),
+        ("subtract", lambda a, b: [rs.VectorSubtract(u, v) for u, v in zip(a, b)], lambda a, b: rs.VectorArraySubtract(a, b)),
+        ("dot", lambda a, b: [rs.VectorDotProduct(u, v) for u, v in zip(a, b)], lambda a, b: rs.VectorArrayDotProduct(a, b)),
+        ("cross", lambda a, b: [rs.VectorCrossProduct(u, v) for u, v in zip(a, b)], lambda a, b: rs.VectorArrayCrossProduct(a, b)),
+        ("length", lambda a, b: [rs.VectorLength(u) for u in a], lambda a, b: rs.VectorArrayLength(a)),
+        ("unitize", lambda a, b: [rs.VectorUnitize(u) for u in a], lambda a, b: rs.VectorArrayUnitize(a)),
+        ("angle", lambda a, b: [rs.VectorAngle(u, v) for u, v in zip(a, b)], lambda a, b: rs.VectorArrayAngle(a, b)),
+        ("rotate", lambda a, b: [rs.VectorRotate(u, 30.0, (0, 0, 1)) for u in a], lambda a, b: rs.VectorArrayRotate(a, 30.0, (0, 0, 1))),
+        ("transform", lambda a, b: [rs.VectorTransform(u, xform) for u in a], lambda a, b: rs.VectorArrayTransform(a, xform)),
+        ]
+    print("{} vectors, ms".format(count))
+    print("{:<12}{:>14}".format("operation", "scalar loop") + "".join("{:>14}".format(label) for label, a, b in inputs))
+    for name, scalar, batch in operations:
+        row = "{:<12}{:>14.2f}".format(name, best_ms(lambda: scalar(vectors1, vectors2), 1))
+        for label, a, b in inputs:
+            row += "{:>14.2f}".format(best_ms(lambda: batch(a, b)))
+        print(row)
+
+
+if __name__ == "__main__":
+    run()
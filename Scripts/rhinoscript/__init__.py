@@ -1,10 +1,51 @@
 # A collection of RhinoScript-like functions that can be called from Python
+import sys
+import types
+import importlib
+
 __all__ = ["application", "block", "curve", "dimension", "document", "geometry",
-           "grips", "group", "hatch", "layer", "line", "linetype", "light",
-           "mesh", "object", "plane", "pointvector", "selection", "surface",
+           "grips", "group", "hatch", "instrumentation", "layer", "line", "linetype",
+           "light", "mesh", "object", "plane", "pointvector", "selection", "surface",
            "toolbar", "transformation", "userdata", "userinterface", "utility", "view"]
 
 
-from rhinoscript import application, block, curve, dimension, document, geometry, grips, group
-from rhinoscript import hatch, layer, line, linetype, light, mesh, object, plane, pointvector
-from rhinoscript import selection, surface, toolbar, transformation, userdata, userinterface, utility, view
\ No newline at end of file
+class LazyModule(types.ModuleType):
+    """Module that imports a rhinoscript submodule the first time one of its
+    attributes is read, so scripts only pay for the submodules they use.
+    Parameters:
+      module = the module being replaced. Its globals are copied
+      names = dictionary of attribute name -> rhinoscript submodule name
+      submodules [opt] = if True, the attributes are the submodules themselves
+        instead of names defined in them
+    """
+    def __init__(self, module, names, submodules=False):
+        types.ModuleType.__init__(self, module.__name__, module.__doc__)
+        # bumped whenever a name that is not in names is set or deleted
+        self.__dict__["_version"] = 0
+        self.__dict__.update(module.__dict__)
+        # keep the replaced module alive, its functions still use its globals
+        self._module = module
+        self._names = names
+        self._submodules = submodules
+
+    def __setattr__(self, name, value):
+        types.ModuleType.__setattr__(self, name, value)
+        if name not in self.__dict__.get("_names", ()): self.__dict__["_version"] += 1
+
+    def __delattr__(self, name):
+        types.ModuleType.__delattr__(self, name)
+        if name not in self._names: self.__dict__["_version"] += 1
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name not in self._names:
+            raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__, name))
+        value = importlib.import_module("rhinoscript." + self._names[name])
+        if not self._submodules: value = getattr(value, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._names))
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], dict((name, name) for name in __all__), True)
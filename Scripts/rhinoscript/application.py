@@ -202,7 +202,7 @@ def AppearanceColor(item, color=None):
         rc = appearance.CommandPromptHypertextColor
         if color: appearance.CommandPromptHypertextColor = color
     if rc is None: raise ValueError("item is out of range")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
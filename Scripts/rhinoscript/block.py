@@ -63,7 +63,7 @@ def AddBlock(object_ids, base_point, name=None, delete_input=False):
         if rc>=0:
             if delete_input:
                 for obj in objects: scriptcontext.doc.Objects.Delete(obj, True)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return name
 
 
@@ -418,7 +418,7 @@ def DeleteBlock(block_name):
     idef = scriptcontext.doc.InstanceDefinitions.Find(block_name)
     if not idef: raise ValueError("%s does not exist in InstanceDefinitionsTable"%block_name)
     rc = scriptcontext.doc.InstanceDefinitions.Delete(idef.Index, True, False)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -442,7 +442,7 @@ def ExplodeBlockInstance(object_id, explode_nested_instances=False):
     instance = __InstanceObjectFromId(object_id, True)
     guids = scriptcontext.doc.Objects.AddExplodedInstancePieces(instance, explodeNestedInstances=explode_nested_instances, deleteInstance=True)
     if guids:
-      scriptcontext.doc.Views.Redraw()
+      scriptcontext.redraw()
     return guids
 
 
@@ -485,7 +485,7 @@ def InsertBlock2(block_name, xform):
     xform = rhutil.coercexform(xform, True)
     id = scriptcontext.doc.Objects.AddInstanceObject(idef.Index, xform )
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return id
 
 
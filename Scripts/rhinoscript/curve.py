@@ -1,4 +1,5 @@
 import math
+import array
 
 import System
 
@@ -8,6 +9,7 @@ import scriptcontext
 
 import rhinocompat as compat
 from rhinoscript import utility as rhutil
+from rhinoscript.utility import __floatlist, __parallelmap, __coordinatecolumns
 
 
 def AddArc(plane, radius, angle_degrees):
@@ -38,7 +40,7 @@ def AddArc(plane, radius, angle_degrees):
     arc = Rhino.Geometry.Arc(plane, radius, radians)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -72,7 +74,7 @@ def AddArc3Pt(start, end, point_on_arc):
     arc = Rhino.Geometry.Arc(start, pton, end)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -108,7 +110,7 @@ def AddArcPtTanPt(start, direction, end):
     arc = Rhino.Geometry.Arc(start, direction, end)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add arc to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -145,7 +147,7 @@ def AddBlendCurve(curves, parameters, reverses, continuities):
     curve = Rhino.Geometry.Curve.CreateBlendCurve(crv0, parameters[0], reverses[0], c0, crv1, parameters[1], reverses[1], c1)
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -182,7 +184,7 @@ def AddCircle(plane_or_center, radius):
         circle = Rhino.Geometry.Circle(plane, radius)
         rc = scriptcontext.doc.Objects.AddCircle(circle)
     if rc==System.Guid.Empty: raise Exception("Unable to add circle to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -214,7 +216,7 @@ def AddCircle3Pt(first, second, third):
     circle = Rhino.Geometry.Circle(start, end, third)
     rc = scriptcontext.doc.Objects.AddCircle(circle)
     if rc==System.Guid.Empty: raise Exception("Unable to add circle to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -238,7 +240,7 @@ def AddCurve(points, degree=3):
     if not curve: raise Exception("unable to create control point curve from given points")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -264,7 +266,7 @@ def AddEllipse(plane, radiusX, radiusY):
     ellipse = Rhino.Geometry.Ellipse(plane, radiusX, radiusY)
     rc = scriptcontext.doc.Objects.AddEllipse(ellipse)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -294,7 +296,7 @@ def AddEllipse3Pt(center, second, third):
     ellipse = Rhino.Geometry.Ellipse(center, second, third)
     rc = scriptcontext.doc.Objects.AddEllipse(ellipse)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -341,7 +343,7 @@ def AddFilletCurve(curve0id, curve1id, radius=1.0, base_point0=None, base_point1
     arc = Rhino.Geometry.Curve.CreateFillet(curve0, curve1, radius, crv0_t, crv1_t)
     rc = scriptcontext.doc.Objects.AddArc(arc)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -376,7 +378,7 @@ def AddInterpCrvOnSrf(surface_id, points):
     if not curve: raise Exception("unable to create InterpolatedCurveOnSurface")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -413,7 +415,7 @@ def AddInterpCrvOnSrfUV(surface_id, points):
     if not curve: raise Exception("unable to create InterpolatedCurveOnSurfaceUV")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -460,7 +462,7 @@ def AddInterpCurve(points, degree=3, knotstyle=0, start_tangent=None, end_tangen
     if not curve: raise Exception("unable to CreateInterpolatedCurve")
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -485,7 +487,7 @@ def AddLine(start, end):
     end = rhutil.coerce3dpoint(end, True)
     rc = scriptcontext.doc.Objects.AddLine(start, end)
     if rc==System.Guid.Empty: raise Exception("Unable to add line to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -533,7 +535,7 @@ def AddNurbsCurve(points, knots, degree, weights=None):
     for i in compat.RANGE(knotcount): nc.Knots[i] = knots[i]
     rc = scriptcontext.doc.Objects.AddCurve(nc)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -566,7 +568,7 @@ def AddPolyline(points, replace_id=None):
     else:
         rc = scriptcontext.doc.Objects.AddPolyline(pl)
     if rc==System.Guid.Empty: raise Exception("Unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -591,7 +593,7 @@ def AddRectangle(plane, width, height):
     poly = rect.ToPolyline()
     rc = scriptcontext.doc.Objects.AddPolyline(poly)
     if rc==System.Guid.Empty: raise Exception("Unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -628,7 +630,7 @@ def AddSpiral(point0, point1, pitch, turns, radius0, radius1=None):
     curve = Rhino.Geometry.NurbsCurve.CreateSpiral(point0, dir, point2, pitch, turns, radius0, radius1)
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -662,7 +664,7 @@ def AddSubCrv(curve_id, param0, param1):
     if not trimcurve: raise Exception("unable to trim curve")
     rc = scriptcontext.doc.Objects.AddCurve(trimcurve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -876,7 +878,7 @@ def CloseCurve(curve_id, tolerance=-1.0):
     if not curve.MakeClosed(tolerance): return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddCurve(curve)
     if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1071,7 +1073,7 @@ def CurveArrows(curve_id, arrow_style=None):
             attr.ObjectDecoration = Rhino.DocObjects.ObjectDecoration.BothArrowhead
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.ModifyAttributes(id, attr, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     if rc==none_obj_decor: return 0
     if rc==Rhino.DocObjects.ObjectDecoration.StartArrowhead: return 1
     if rc==Rhino.DocObjects.ObjectDecoration.EndArrowhead: return 2
@@ -1112,7 +1114,7 @@ def CurveBooleanDifference(curve_id_0, curve_id_1, tolerance=None):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return curves
 
 
@@ -1150,7 +1152,7 @@ def CurveBooleanIntersection(curve_id_0, curve_id_1, tolerance=None):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return curves
 
 
@@ -1185,7 +1187,7 @@ def CurveBooleanUnion(curve_id, tolerance=None):
                 curve.Dispose()
                 if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
                 curves.append(rc)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return curves
 
 
@@ -1229,7 +1231,7 @@ def CurveBrepIntersect(curve_id, brep_id, tolerance=None):
             rc = scriptcontext.doc.Objects.AddPoint(point)
             points.append(rc)
     if not curves and not points: return None
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return curves, points
 
 
@@ -1293,6 +1295,7 @@ def CurveClosestPoint(curve_id, test_point, segment_index=-1 ):
               param = rs.CurveClosestPoint(id, point)
               print("Curve parameter: {}".format(param))
     See Also:
+      CurveClosestPoints
       EvaluateCurve
       IsCurve
     """
@@ -1303,6 +1306,62 @@ def CurveClosestPoint(curve_id, test_point, segment_index=-1 ):
     return t
 
 
+def CurveClosestPoints(curve_id, points, maximum_distance=0.0, segment_index=-1, chunk_size=4096, threads=None):
+    """Returns the parameters of the points on a curve that are closest to many
+    test points. The curve is looked up once and large point sets are
+    queried in chunks on a pool of threads
+    Parameters:
+      curve_id (guid): identifier of a curve object
+      points ([point, ...]): test points, a list of points or an (N,3) NumPy
+        array or flat array('d') of x,y,z triples
+      maximum_distance (number, optional): only find closest points within
+        this distance. If omitted or 0, there is no limit
+      segment_index (number, optional): curve segment index if `curve_id` identifies a polycurve
+      chunk_size (number, optional): number of points per chunk of work
+      threads (number, optional): maximum number of threads, 1 to query on
+          the calling thread. If omitted, a thread pool default is used.
+    Returns:
+      tuple(array('d'), array('d')): the curve parameters and the distances
+        from the test points to the curve, one per test point. Both are NaN
+        for test points further than maximum_distance
+    Example:
+      import rhinoscriptsyntax as rs
+      id = rs.GetObject("Select a curve", rs.filter.curve)
+      points = rs.GetObjects("Select points", rs.filter.point)
+      if id and points:
+          coordinates = [rs.PointCoordinates(point) for point in points]
+          parameters, distances = rs.CurveClosestPoints(id, coordinates)
+          print("Largest distance: {}".format(max(d for d in distances if d==d)))
+    See Also:
+      CurveClosestPoint
+      EvaluateCurve
+    """
+    curve = rhutil.coercecurve(curve_id, segment_index, True)
+    x, y, z = __coordinatecolumns(points)
+    chunk_size = max(int(chunk_size), 1)
+    def closest(start):
+        nan = float("nan")
+        point3d, closestpoint, pointat = Rhino.Geometry.Point3d, curve.ClosestPoint, curve.PointAt
+        parameters = array.array('d')
+        distances = array.array('d')
+        for i in compat.RANGE(start, min(start+chunk_size, len(x))):
+            point = point3d(x[i], y[i], z[i])
+            rc, t = closestpoint(point, maximum_distance)
+            if rc:
+                parameters.append(t)
+                distances.append(point.DistanceTo(pointat(t)))
+            else:
+                parameters.append(nan)
+                distances.append(nan)
+        return parameters, distances
+    parameters = array.array('d')
+    distances = array.array('d')
+    for chunk in __parallelmap(closest, compat.RANGE(0, len(x), chunk_size), threads):
+        parameters.extend(chunk[0])
+        distances.extend(chunk[1])
+    return parameters, distances
+
+
 def CurveContourPoints(curve_id, start_point, end_point, interval=None):
     """Returns the 3D point locations calculated by contouring a curve object.
     Parameters:
@@ -1342,7 +1401,8 @@ def CurveCurvature(curve_id, parameter):
     details on curve curvature
     Parameters:
       curve_id (guid): identifier of the curve
-      parameter (number): parameter to evaluate
+      parameter (number|[number, ...]): parameter to evaluate, or a list,
+        array or NumPy array of parameters
     Returns:
       tuple[point, vector, point, number, vector]: of curvature information on success
         [0] = point at specified parameter
@@ -1351,6 +1411,11 @@ def CurveCurvature(curve_id, parameter):
         [3] = radius of curvature
         [4] = curvature vector
       None: on failure
+      array('d'): for a list of parameters, 13 numbers per parameter: the
+        point, tangent, center, radius and curvature vector as above. Where
+        a single parameter would return None, because the curve is straight
+        or the tangent is zero there, the row keeps the point, tangent and
+        curvature vector and has NaN for the center and radius
     Example:
       import rhinoscriptsyntax as rs
       obj = rs.GetObject("Select a curve")
@@ -1371,6 +1436,23 @@ def CurveCurvature(curve_id, parameter):
       SurfaceCurvature
     """
     curve = rhutil.coercecurve(curve_id, -1, True)
+    parameters = __parameterlist(parameter)
+    if parameters is not None:
+        nan = float("nan")
+        rc = array.array('d')
+        for t in parameters:
+            point = curve.PointAt(t)
+            tangent = curve.TangentAt(t)
+            cv = curve.CurvatureAt(t)
+            k = cv.Length
+            rc.extend((point.X, point.Y, point.Z, tangent.X, tangent.Y, tangent.Z))
+            if k<Rhino.RhinoMath.SqrtEpsilon or tangent.IsTiny(0):
+                rc.extend((nan, nan, nan, nan))
+            else:
+                rv = cv / (k*k)
+                rc.extend((point.X+rv.X, point.Y+rv.Y, point.Z+rv.Z, 1.0/k))
+            rc.extend((cv.X, cv.Y, cv.Z))
+        return rc
     point = curve.PointAt(parameter)
     tangent = curve.TangentAt(parameter)
     if tangent.IsTiny(0): return scriptcontext.errorhandler()
@@ -1459,16 +1541,94 @@ def CurveCurveIntersection(curveA, curveB=None, tolerance=-1):
         rc = Rhino.Geometry.Intersect.Intersection.CurveCurve(curveA, curveB, tolerance, 0.0)
     else:
         rc = Rhino.Geometry.Intersect.Intersection.CurveSelf(curveA, tolerance)
-    if rc:
-        events = []
-        for i in compat.RANGE(rc.Count):
-            event_type = 1
-            if( rc[i].IsOverlap ): event_type = 2
-            oa = rc[i].OverlapA
-            ob = rc[i].OverlapB
-            element = (event_type, rc[i].PointA, rc[i].PointA2, rc[i].PointB, rc[i].PointB2, oa[0], oa[1], ob[0], ob[1])
-            events.append(element)
-        return events
+    if rc: return __curveintersectionevents(rc)
+
+
+def __curveintersectionevents(rc):
+    """CurveIntersections as the tuples CurveCurveIntersection returns"""
+    events = []
+    for i in compat.RANGE(rc.Count):
+        event_type = 1
+        if( rc[i].IsOverlap ): event_type = 2
+        oa = rc[i].OverlapA
+        ob = rc[i].OverlapB
+        element = (event_type, rc[i].PointA, rc[i].PointA2, rc[i].PointB, rc[i].PointB2, oa[0], oa[1], ob[0], ob[1])
+        events.append(element)
+    return events
+
+
+def __overlappingboxes(boxes):
+    """Sweep and prune along x over (x0, y0, z0, x1, y1, z1) boxes, None for
+    boxes to skip. Returns the sorted index pairs (i, j), i<j, of the boxes
+    that overlap"""
+    order = sorted((box[0], i) for i, box in enumerate(boxes) if box is not None)
+    active = []
+    pairs = []
+    for x0, i in order:
+        box = boxes[i]
+        active = [j for j in active if boxes[j][3]>=x0]
+        for j in active:
+            other = boxes[j]
+            if other[1]<=box[4] and box[1]<=other[4] and other[2]<=box[5] and box[2]<=other[5]:
+                pairs.append((j, i) if j<i else (i, j))
+        active.append(i)
+    pairs.sort()
+    return pairs
+
+
+def CurveArrayIntersection(curve_ids, tolerance=-1, self_intersections=False, threads=None):
+    """Calculates the intersections between all pairs of curves in a list.
+    Only pairs of curves whose bounding boxes overlap are intersected, the
+    rest are pruned by a sweep over the bounding boxes. The exact
+    intersections run on a pool of threads
+    Parameters:
+      curve_ids ([guid, ...]): identifiers of the curve objects
+      tolerance (number, optional): absolute tolerance in drawing units. If omitted,
+                        the document's current absolute tolerance is used.
+      self_intersections (bool, optional): also find the self-intersections
+                        of every curve
+      threads (number, optional): maximum number of threads, 1 to intersect
+          on the calling thread. If omitted, a thread pool default is used.
+    Returns:
+      list of tuples: one row per intersection event, ordered by curve pair.
+      [n][0] and [n][1] are the indices into curve_ids of the first and
+      second curve, equal for self-intersections. [n][2] through [n][10] are
+      the event type, points and parameters in the order CurveCurveIntersection
+      returns them.
+    Example:
+      import rhinoscriptsyntax as rs
+      curves = rs.GetObjects("Select curves", rs.filter.curve)
+      if curves:
+          for event in rs.CurveArrayIntersection(curves):
+              if event[2]==1: rs.AddPoint(event[3])
+    See Also:
+      CurveCurveIntersection
+    """
+    curves = [rhutil.coercecurve(curve_id, -1, True) for curve_id in curve_ids]
+    if tolerance is None or tolerance<0.0:
+        tolerance = scriptcontext.doc.ModelAbsoluteTolerance
+    boxes = []
+    for curve in curves:
+        bbox = curve.GetBoundingBox(True)
+        if not bbox.IsValid:
+            boxes.append(None)
+            continue
+        bmin, bmax = bbox.Min, bbox.Max
+        boxes.append((bmin.X-tolerance, bmin.Y-tolerance, bmin.Z-tolerance, bmax.X+tolerance, bmax.Y+tolerance, bmax.Z+tolerance))
+    pairs = __overlappingboxes(boxes)
+    if self_intersections:
+        pairs = sorted(pairs + [(i, i) for i, box in enumerate(boxes) if box is not None])
+    def intersect(pair):
+        a, b = pair
+        if a==b:
+            rc = Rhino.Geometry.Intersect.Intersection.CurveSelf(curves[a], tolerance)
+        else:
+            rc = Rhino.Geometry.Intersect.Intersection.CurveCurve(curves[a], curves[b], tolerance, 0.0)
+        if rc: return [pair + event for event in __curveintersectionevents(rc)]
+    events = []
+    for rc in __parallelmap(intersect, pairs, threads):
+        if rc: events.extend(rc)
+    return events
 
 
 def CurveDegree(curve_id, segment_index=-1):
@@ -1981,10 +2141,14 @@ def CurvePerpFrame(curve_id, parameter):
     is relatively parallel (zero-twisting) plane
     Parameters:
       curve_id (guid): identifier of the curve object
-      parameter (number): parameter to evaluate
+      parameter (number|[number, ...]): parameter to evaluate, or a list,
+        array or NumPy array of parameters
     Returns:
       plane: Plane on success
       None: on error
+      array('d'): for a list of parameters, 12 numbers per parameter: the
+        origin, x axis, y axis and z axis of the plane. NaN where the
+        frame can not be evaluated
     Example:
       import rhinoscriptsyntax as rs
       crv = rs.GetCurveObject("Select a curve")
@@ -1995,6 +2159,16 @@ def CurvePerpFrame(curve_id, parameter):
       CurveFrame
     """
     curve = rhutil.coercecurve(curve_id, -1, True)
+    parameters = __parameterlist(parameter)
+    if parameters is not None:
+        rc = array.array('d')
+        for t in parameters:
+            success, plane = curve.PerpendicularFrameAt(t)
+            if not success:
+                rc.extend([float("nan")]*12)
+                continue
+            for v in (plane.Origin, plane.XAxis, plane.YAxis, plane.ZAxis): rc.extend((v.X, v.Y, v.Z))
+        return rc
     parameter = float(parameter)
     rc, plane = curve.PerpendicularFrameAt(parameter)
     if rc: return plane
@@ -2164,7 +2338,7 @@ def CurveStartPoint(curve_id, segment_index=-1, point=None):
         if point and curve.SetStartPoint(point):
             curve_id = rhutil.coerceguid(curve_id, True)
             scriptcontext.doc.Objects.Replace(curve_id, curve)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -2271,11 +2445,13 @@ def CurveTangent(curve_id, parameter, segment_index=-1):
     """Returns a 3D vector that is the tangent to a curve at a parameter.
     Parameters:
       curve_id (guid): identifier of the curve object
-      parameter (number) parameter to evaluate
+      parameter (number|[number, ...]) parameter to evaluate, or a list, array or NumPy array of parameters
       segment_index (number, optional) the curve segment index if `curve_id` identifies a polycurve
     Returns:
       vector: A 3D vector if successful.
       None: on error.
+      array('d'): for a list of parameters, the x,y,z of the tangents. NaN
+        for parameters outside of the curve domain
     Example:
       import rhinoscriptsyntax as rs
       obj = rs.GetObject("Select a curve", rs.filter.curve)
@@ -2290,6 +2466,17 @@ def CurveTangent(curve_id, parameter, segment_index=-1):
       CurveDomain
     """
     curve = rhutil.coercecurve(curve_id, segment_index, True)
+    parameters = __parameterlist(parameter)
+    if parameters is not None:
+        domain = curve.Domain
+        rc = array.array('d')
+        for t in parameters:
+            if not domain.IncludesParameter(t):
+                rc.extend([float("nan")]*3)
+                continue
+            tangent = curve.TangentAt(t)
+            rc.extend((tangent.X, tangent.Y, tangent.Z))
+        return rc
     rc = Rhino.Geometry.Point3d.Unset
     if curve.Domain.IncludesParameter(parameter):
         return curve.TangentAt(parameter)
@@ -2356,7 +2543,7 @@ def DivideCurve(curve_id, segments, create_points=False, return_points=True):
         if create_points:
             for point in outputpoints:
                 if point.IsValid: scriptcontext.doc.Objects.AddPoint(point)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -2385,7 +2572,7 @@ def DivideCurveEquidistant(curve_id, distance, create_points=False, return_point
     if not points: return scriptcontext.errorhandler()
     if create_points:
         for point in points: scriptcontext.doc.Objects.AddPoint(point)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     if return_points: return points
     tvals = []
     for point in points:
@@ -2430,6 +2617,121 @@ def DivideCurveLength(curve_id, length, create_points=False, return_points=True)
     return rc
 
 
+def __parameterlist(parameter):
+    """None for a single curve parameter, otherwise the list, array or NumPy
+    array of parameters as a list of floats"""
+    parameters = __floatlist(parameter)
+    if type(parameters) is list: return parameters
+
+
+def __dividecurves(curve_ids, divide, return_points, threads):
+    """Runs divide(curve), which returns curve parameters or points, for
+    every curve on a pool of threads and packs the ragged results into
+    offsets and one flat array. The curves are looked up on the calling
+    thread, the threads only do read-only geometry work"""
+    curves = [rhutil.coercecurve(curve_id, -1, True) for curve_id in curve_ids]
+    def values(curve):
+        rc = divide(curve)
+        if not rc: return None
+        if return_points:
+            if type(rc[0]) is not Rhino.Geometry.Point3d: rc = [curve.PointAt(t) for t in rc]
+            return [c for point in rc for c in (point.X, point.Y, point.Z)]
+        if type(rc[0]) is Rhino.Geometry.Point3d: rc = [curve.ClosestPoint(point)[1] for point in rc]
+        return list(rc)
+    stride = 3 if return_points else 1
+    # 'i' is a 32-bit signed int on every platform Rhino runs on, while the
+    # size of 'l' differs between Windows and macOS
+    offsets = array.array('i', [0])
+    flat = array.array('d')
+    for rc in __parallelmap(values, curves, threads):
+        if rc: flat.extend(rc)
+        offsets.append(len(flat)//stride)
+    return offsets, flat
+
+
+def DivideCurves(curve_ids, segments, return_points=True, threads=None):
+    """Divides many curve objects into a specified number of segments each,
+    dividing the curves in parallel. See DivideCurve
+    Parameters:
+      curve_ids ([guid, ...]): identifiers of the curve objects
+      segments (number): The number of segments.
+      return_points (bool, optional): If omitted or True, points are returned.
+          If False, then curve parameters are returned.
+      threads (number, optional): maximum number of threads, 1 to divide on
+          the calling thread. If omitted, a thread pool default is used.
+    Returns:
+      tuple(array('i'), array('d')): offsets and values. The offsets are
+        32-bit signed integers. The results of curve i are
+        values[offsets[i]:offsets[i+1]] for parameters, or the x,y,z
+        triples values[3*offsets[i]:3*offsets[i+1]] for points. Curves that
+        can not be divided get an empty range.
+    Example:
+      import rhinoscriptsyntax as rs
+      curves = rs.GetObjects("Select curves", rs.filter.curve)
+      if curves:
+          offsets, values = rs.DivideCurves(curves, 10)
+          for i, curve in enumerate(curves):
+              points = rs.UnflattenArray(values[3*offsets[i]:3*offsets[i+1]])
+    See Also:
+      DivideCurve
+      DivideCurvesEquidistant
+      DivideCurvesLength
+    """
+    return __dividecurves(curve_ids, lambda curve: curve.DivideByCount(segments, True), return_points, threads)
+
+
+def DivideCurvesEquidistant(curve_ids, distance, return_points=True, threads=None):
+    """Divides many curves such that the linear distance between the points is
+    equal, dividing the curves in parallel. See DivideCurveEquidistant
+    Parameters:
+      curve_ids ([guid, ...]): identifiers of the curve objects
+      distance (number): linear distance between division points
+      return_points (bool, optional): If True, return points.
+                                      If False, return curve parameters
+      threads (number, optional): maximum number of threads, 1 to divide on
+          the calling thread. If omitted, a thread pool default is used.
+    Returns:
+      tuple(array('i'), array('d')): offsets and values, as described in
+        DivideCurves
+    Example:
+      import rhinoscriptsyntax as rs
+      curves = rs.GetObjects("Select curves", rs.filter.curve)
+      if curves:
+          offsets, values = rs.DivideCurvesEquidistant(curves, 4)
+    See Also:
+      DivideCurveEquidistant
+      DivideCurves
+      DivideCurvesLength
+    """
+    return __dividecurves(curve_ids, lambda curve: curve.DivideEquidistant(distance), return_points, threads)
+
+
+def DivideCurvesLength(curve_ids, length, return_points=True, threads=None):
+    """Divides many curve objects into segments of a specified length,
+    dividing the curves in parallel. See DivideCurveLength
+    Parameters:
+      curve_ids ([guid, ...]): identifiers of the curve objects
+      length (number): The length of each segment.
+      return_points (bool, optional): If omitted or True, points are returned.
+          If False, then curve parameters are returned.
+      threads (number, optional): maximum number of threads, 1 to divide on
+          the calling thread. If omitted, a thread pool default is used.
+    Returns:
+      tuple(array('i'), array('d')): offsets and values, as described in
+        DivideCurves
+    Example:
+      import rhinoscriptsyntax as rs
+      curves = rs.GetObjects("Select curves", rs.filter.curve)
+      if curves:
+          offsets, values = rs.DivideCurvesLength(curves, 2.5, False)
+    See Also:
+      DivideCurveLength
+      DivideCurves
+      DivideCurvesEquidistant
+    """
+    return __dividecurves(curve_ids, lambda curve: curve.DivideByLength(length, True), return_points, threads)
+
+
 def EllipseCenterPoint(curve_id):
     """Returns the center point of an elliptical-shaped curve object.
     Parameters:
@@ -2476,14 +2778,20 @@ def EllipseQuadPoints(curve_id):
     return (origin-xaxis, origin+xaxis, origin-yaxis, origin+yaxis)
 
 
-def EvaluateCurve(curve_id, t, segment_index=-1):
+def EvaluateCurve(curve_id, t, segment_index=-1, derivative=0):
     """Evaluates a curve at a parameter and returns a 3D point
     Parameters:
       curve_id (guid): identifier of the curve object
-      t (number): the parameter to evaluate
+      t (number|[number, ...]): the parameter to evaluate, or a list, array or
+        NumPy array of parameters. The curve is looked up once for all of them
       segment_index (number, optional): the curve segment index if `curve_id` identifies a polycurve
+      derivative (number, optional): number of derivatives to evaluate
     Returns:
       point: a 3-D point if successful
+      list(point, vector, ...): the point followed by the derivatives if
+        derivative is greater than 0
+      array('d'): for a list of parameters, derivative+1 x,y,z triples per
+        parameter: the point followed by the derivatives
       None: if not successful
     Example:
       import rhinoscriptsyntax as rs
@@ -2498,7 +2806,20 @@ def EvaluateCurve(curve_id, t, segment_index=-1):
       IsCurve
     """
     curve = rhutil.coercecurve(curve_id, segment_index, True)
-    return curve.PointAt(t)
+    parameters = __parameterlist(t)
+    if parameters is None:
+        if not derivative: return curve.PointAt(t)
+        rc = curve.DerivativeAt(t, derivative)
+        return [Rhino.Geometry.Point3d(rc[0])] + list(rc)[1:]
+    rc = array.array('d')
+    if not derivative:
+        for t in parameters:
+            point = curve.PointAt(t)
+            rc.extend((point.X, point.Y, point.Z))
+        return rc
+    for t in parameters:
+        for v in curve.DerivativeAt(t, derivative): rc.extend((v.X, v.Y, v.Z))
+    return rc
 
 
 def ExplodeCurves(curve_ids, delete_input=False):
@@ -2532,7 +2853,7 @@ def ExplodeCurves(curve_ids, delete_input=False):
             if delete_input:
                 id = rhutil.coerceguid(id, True)
                 scriptcontext.doc.Objects.Delete(id, True)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -2582,7 +2903,7 @@ def ExtendCurve(curve_id, extension_type, side, boundary_object_ids):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -2630,7 +2951,7 @@ def ExtendCurveLength(curve_id, extension_type, side, length):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -2677,7 +2998,7 @@ def ExtendCurvePoint(curve_id, side, point, extension_type=2):
     if newcurve and newcurve.IsValid:
         curve_id = rhutil.coerceguid(curve_id, True)
         if scriptcontext.doc.Objects.Replace( curve_id, newcurve ):
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
             return curve_id
     return scriptcontext.errorhandler()
 
@@ -2710,7 +3031,7 @@ def FairCurve(curve_id, tolerance=1.0):
     if not newcurve: return False
     curve_id = rhutil.coerceguid(curve_id, True)
     if scriptcontext.doc.Objects.Replace(curve_id, newcurve):
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return True
     return False
 
@@ -2756,7 +3077,7 @@ def FitCurve(curve_id, degree=3, distance_tolerance=-1, angle_tolerance=-1):
         else:
             rc = scriptcontext.doc.Objects.AddCurve(nc)
         if rc==System.Guid.Empty: raise Exception("Unable to add curve to document")
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
     return scriptcontext.errorhandler()
 
@@ -2797,7 +3118,7 @@ def InsertCurveKnot(curve_id, parameter, symmetrical=False ):
         if rc:
             curve_id = rhutil.coerceguid(curve_id)
             rc = scriptcontext.doc.Objects.Replace(curve_id, nc)
-            if rc: scriptcontext.doc.Views.Redraw()
+            if rc: scriptcontext.redraw()
     return rc
 
 
@@ -3183,19 +3504,71 @@ def IsPolyline( object_id, segment_index=-1 ):
     return isinstance(curve, Rhino.Geometry.PolylineCurve)
 
 
-def JoinCurves(object_ids, delete_input=False, tolerance=None):
-    """Joins multiple curves together to form one or more curves or polycurves
+def __endpointchains(curves, tolerance):
+    """Groups curves whose end points are within tolerance of each other into
+    chains. The end points are hashed on a grid of tolerance sized cells so
+    each point is only compared with the points in the 27 cells around it.
+    Returns the chain index of every curve, chains numbered in the order of
+    their first curve, and the curve indices of every chain"""
+    parent = list(compat.RANGE(len(curves)))
+    def find(i):
+        while parent[i]!=i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    size = max(tolerance, Rhino.RhinoMath.ZeroTolerance)
+    cells = {}
+    for i, curve in enumerate(curves):
+        for point in (curve.PointAtStart, curve.PointAtEnd):
+            x, y, z = int(math.floor(point.X/size)), int(math.floor(point.Y/size)), int(math.floor(point.Z/size))
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        for j, other in cells.get((x+dx, y+dy, z+dz), ()):
+                            a, b = find(i), find(j)
+                            if a==b or point.DistanceTo(other)>tolerance: continue
+                            parent[max(a, b)] = min(a, b)
+            cells.setdefault((x, y, z), []).append((i, point))
+    membership = array.array('i')
+    chain_index = {}
+    chains = []
+    for i in compat.RANGE(len(curves)):
+        root = find(i)
+        k = chain_index.get(root)
+        if k is None:
+            k = chain_index[root] = len(chains)
+            chains.append([])
+        chains[k].append(i)
+        membership.append(k)
+    return membership, chains
+
+
+def JoinCurves(object_ids, delete_input=False, tolerance=None, return_chains=False, threads=None):
+    """Joins multiple curves together to form one or more curves or polycurves.
+    Curves are first grouped into chains of curves with touching end points,
+    then every chain is joined on its own on a pool of threads
     Parameters:
       object_ids (guid): list of multiple curves
       delete_input (bool, optional): delete input objects after joining
       tolerance (number, optional): join tolerance. If omitted, 2.1 * document absolute
           tolerance is used
+      return_chains (bool, optional): also return which chain every input
+          curve belongs to and which new curves every chain produced
+      threads (number, optional): maximum number of threads, 1 to join on
+          the calling thread. If omitted, a thread pool default is used.
     Returns:
       list(guid, ...): Object id representing the new curves
+      tuple(list(guid, ...), array('i'), array('i')): if return_chains is
+        True, the new curve ids, the chain index of every input curve and
+        chain offsets: the curves made from chain k are ids[offsets[k]:offsets[k+1]].
+        Chain indices and offsets are 32-bit signed integers
     Example:
       import rhinoscriptsyntax as rs
       objs = rs.GetObjects("Select curves to join", rs.filter.curve)
-      if objs: rs.JoinCurves(objs)
+      if objs:
+          ids, chains, offsets = rs.JoinCurves(objs, return_chains=True)
+          k = chains[0]
+          print("First curve was joined into {}".format(ids[offsets[k]:offsets[k+1]]))
     See Also:
       ExplodeCurves
       IsCurve
@@ -3205,15 +3578,21 @@ def JoinCurves(object_ids, delete_input=False, tolerance=None):
     curves = [rhutil.coercecurve(id, -1, True) for id in object_ids]
     if tolerance is None:
         tolerance = 2.1 * scriptcontext.doc.ModelAbsoluteTolerance
-    newcurves = Rhino.Geometry.Curve.JoinCurves(curves, tolerance)
+    membership, chains = __endpointchains(curves, tolerance)
+    def join(chain):
+        if len(chain)==1: return [curves[chain[0]].DuplicateCurve()]
+        return Rhino.Geometry.Curve.JoinCurves([curves[i] for i in chain], tolerance)
     rc = []
-    if newcurves:
-        rc = [scriptcontext.doc.Objects.AddCurve(crv) for crv in newcurves]
+    offsets = array.array('i', [0])
+    for newcurves in __parallelmap(join, chains, threads):
+        if newcurves: rc.extend(scriptcontext.doc.Objects.AddCurve(crv) for crv in newcurves)
+        offsets.append(len(rc))
     if rc and delete_input:
         for id in object_ids:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, False)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
+    if return_chains: return rc, membership, offsets
     return rc
 
 
@@ -3276,7 +3655,7 @@ def MakeCurveNonPeriodic(curve_id, delete_input=False):
             if rhobj: attrs = rhobj.Attributes
         rc = scriptcontext.doc.Objects.AddCurve(nc, attrs)
         if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3302,7 +3681,7 @@ def MeanCurve(curve0, curve1, tolerance=None):
     crv = Rhino.Geometry.Curve.CreateMeanCurve(curve0,curve1,tolerance)
     if crv:
         rc = scriptcontext.doc.Objects.AddCurve(crv)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -3330,7 +3709,7 @@ def MeshPolyline(polyline_id):
     mesh = Rhino.Geometry.Mesh.CreateFromClosedPolyline(polyline)
     if not mesh: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddMesh(mesh)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3371,7 +3750,7 @@ def OffsetCurve(object_id, direction, distance, normal=None, style=1):
     curves = curve.Offset(direction, normal, distance, tolerance, style)
     if curves is None: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddCurve(curve) for curve in curves]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3418,7 +3797,7 @@ def OffsetCurveOnSurface(curve_id, surface_id, distance_or_parameter):
     if curves is None: return scriptcontext.errorhandler()
     curves = [curve.ExtendOnSurface(Rhino.Geometry.CurveEnd.Both, surface) for curve in curves]
     rc = [scriptcontext.doc.Objects.AddCurve(curve) for curve in curves]
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -3616,7 +3995,7 @@ def ProjectCurveToMesh(curve_ids, mesh_ids, direction):
     tolerance = scriptcontext.doc.ModelAbsoluteTolerance
     newcurves = Rhino.Geometry.Curve.ProjectToMesh(curves, meshes, direction, tolerance)
     ids = [scriptcontext.doc.Objects.AddCurve(curve) for curve in newcurves]
-    if ids: scriptcontext.doc.Views.Redraw()
+    if ids: scriptcontext.redraw()
     return ids
 
 
@@ -3647,7 +4026,7 @@ def ProjectCurveToSurface(curve_ids, surface_ids, direction):
     tolerance = scriptcontext.doc.ModelAbsoluteTolerance
     newcurves = Rhino.Geometry.Curve.ProjectToBrep(curves, breps, direction, tolerance)
     ids = [scriptcontext.doc.Objects.AddCurve(curve) for curve in newcurves]
-    if ids: scriptcontext.doc.Views.Redraw()
+    if ids: scriptcontext.redraw()
     return ids
 
 
@@ -3672,7 +4051,7 @@ def RebuildCurve(curve_id, degree=3, point_count=10):
     newcurve = curve.Rebuild(point_count, degree, False)
     if not newcurve: return False
     scriptcontext.doc.Objects.Replace(curve_id, newcurve)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return True
 
 
@@ -3704,7 +4083,7 @@ def RemoveCurveKnot(curve, parameter):
     success = n_curve.Knots.RemoveKnotAt(n_param)
     if not success: return False
     scriptcontext.doc.Objects.Replace(curve, n_curve)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return True
 
 
@@ -3778,7 +4157,7 @@ def SimplifyCurve(curve_id, flags=0):
     if newcurve:
         curve_id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Replace(curve_id, newcurve)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return True
     return False
 
@@ -3788,7 +4167,8 @@ def SplitCurve(curve_id, parameter, delete_input=True):
     be in the interior of the curve's domain
     Parameters:
       curve_id (guid): the curve to split
-      parameter ({number, ...]) one or more parameters to split the curve at
+      parameter ({number, ...]) one or more parameters to split the curve at,
+        also as an array.array('d') or NumPy array
       delete_input (bool, optional): delete the input curve
     Returns:
       list(guid, ....): list of new curves on success
@@ -3804,7 +4184,7 @@ def SplitCurve(curve_id, parameter, delete_input=True):
       TrimCurve
     """
     curve = rhutil.coercecurve(curve_id, -1, True)
-    newcurves = curve.Split(parameter)
+    newcurves = curve.Split(__floatlist(parameter))
     if newcurves is None: return scriptcontext.errorhandler()
     att = None
     rhobj = rhutil.coercerhinoobject(curve_id)
@@ -3813,7 +4193,7 @@ def SplitCurve(curve_id, parameter, delete_input=True):
     if rc and delete_input:
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3851,7 +4231,7 @@ def TrimCurve(curve_id, interval, delete_input=True):
     if delete_input:
         id = rhutil.coerceguid(curve_id, True)
         scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3926,5 +4306,5 @@ def AddTweenCurves(from_curve_id, to_curve_id, number_of_curves = 1, method = 0,
             curve.Dispose()
             if rc==System.Guid.Empty: raise Exception("unable to add curve to document")
             curves.append(rc)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return curves
@@ -57,7 +57,7 @@ def AddAlignedDimension(start_point, end_point, point_on_dimension_line, style=N
         ldim.DimensionStyleId = ds.Id
     rc = scriptcontext.doc.Objects.AddLinearDimension(ldim)
     if rc==System.Guid.Empty: raise Exception("unable to add dimension to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -134,7 +134,7 @@ def AddLeader(points, view_or_plane=None, text=None):
             if not isinstance(text, str): text = str(text)
             rc = scriptcontext.doc.Objects.AddLeader(text, plane, points2d)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -177,7 +177,7 @@ def AddLinearDimension(plane, start_point, end_point, point_on_dimension_line):
     if not ldim: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddLinearDimension(ldim)
     if rc==System.Guid.Empty: raise Exception("unable to add dimension to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -305,7 +305,7 @@ def DimensionUserText(object_id, usertext=None):
     if usertext is not None:
         annotation_object.Geometry.Text = usertext
         annotation_object.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -360,7 +360,7 @@ def DimStyleAnglePrecision(dimstyle, precision=None):
     if precision is not None:
         ds.AngleResolution = precision
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -394,7 +394,7 @@ def DimStyleArrowSize(dimstyle, size=None):
     if size is not None:
         ds.ArrowLength = size
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -443,7 +443,7 @@ def DimStyleExtension(dimstyle, extension=None):
     if extension is not None:
         ds.ExtensionLineExtension = extension
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -478,7 +478,7 @@ def DimStyleFont(dimstyle, font=None):
         newindex = scriptcontext.doc.Fonts.FindOrCreate(font, False, False)
         ds.Font = scriptcontext.doc.Fonts[newindex]
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -513,7 +513,7 @@ def DimStyleLeaderArrowSize(dimstyle, size=None):
     if size is not None:
         ds.LeaderArrowLength = size
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -542,7 +542,7 @@ def DimStyleLengthFactor(dimstyle, factor=None):
     if factor is not None:
         ds.LengthFactor = factor
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -576,7 +576,7 @@ def DimStyleLinearPrecision(dimstyle, precision=None):
     if precision is not None:
         ds.LengthResolution = precision
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -635,7 +635,7 @@ def DimStyleNumberFormat(dimstyle, format=None):
         if format==1: ds.LengthFormat = Rhino.DocObjects.DistanceDisplayMode.Feet
         if format==2: ds.LengthFormat = Rhino.DocObjects.DistanceDisplayMode.FeetAndInches
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -669,7 +669,7 @@ def DimStyleOffset(dimstyle, offset=None):
     if offset is not None:
         ds.ExtensionLineOffset = offset
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -697,7 +697,7 @@ def DimStylePrefix(dimstyle, prefix=None):
     if prefix is not None:
         ds.Prefix = prefix
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -726,7 +726,7 @@ def DimStyleScale(dimstyle, scale=None):
     if scale is not None:
         ds.DimensionScale = scale
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -754,7 +754,7 @@ def DimStyleSuffix(dimstyle, suffix=None):
     if suffix is not None:
         ds.Suffix = suffix
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -795,7 +795,7 @@ def DimStyleTextAlignment(dimstyle, alignment=None):
         if alignment==2: ds.TextAlignment = Rhino.DocObjects.TextDisplayAlignment.AboveLine
         if alignment==3: ds.TextAlignment = Rhino.DocObjects.TextDisplayAlignment.InLine
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -830,7 +830,7 @@ def DimStyleTextGap(dimstyle, gap=None):
     if gap is not None:
         ds.TextGap = gap
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -864,7 +864,7 @@ def DimStyleTextHeight(dimstyle, height=None):
     if height:
         ds.TextHeight = height
         scriptcontext.doc.DimStyles.Modify(ds, ds.Id, False)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -1166,7 +1166,7 @@ def LeaderText(object_id, text=None):
     if text is not None:
         geom.RichText = text
         annotation_object.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
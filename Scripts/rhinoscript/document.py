@@ -11,6 +11,69 @@ import scriptcontext
 from rhinoscript import utility as rhutil
 
 
+class batch(object):
+    """Context manager that groups the document changes made inside a with
+    block into a single undo record. Redraws requested by rhinoscript functions
+    inside the block are suppressed and collapsed into one redraw at exit.
+    Nested batches are merged into the outermost one.
+    Parameters:
+      undo_name (str, optional): name of the undo record. If None, no undo
+        record is created
+      redraw (bool, optional): if True, redraw the views at exit when at least
+        one redraw was suppressed
+      cache (bool, optional): if True, object lookups by id are memoized inside
+        the block. See objectcache
+    Returns:
+      batch: the context manager. After exit, redraws_suppressed holds the
+        number of redraws that were skipped inside the block
+    Example:
+      import rhinoscriptsyntax as rs
+      with rs.batch("Add grid") as b:
+          for x in range(100):
+              for y in range(100): rs.AddPoint((x, y, 0))
+      print("Redraws suppressed: {}".format(b.redraws_suppressed))
+    See Also:
+      EnableRedraw
+      objectcache
+      Redraw
+    """
+    def __init__(self, undo_name="Script batch", redraw=True, cache=True):
+        self.undo_name = undo_name
+        self.redraw = redraw
+        self.cache = cache
+        self.redraws_suppressed = 0
+        self._nested = False
+        self._first_suppressed = 0
+        self._undo_record = 0
+        self._redraw_enabled = True
+
+    def __enter__(self):
+        self._nested = scriptcontext.batch_redraw
+        self._first_suppressed = scriptcontext.redraws_suppressed
+        if not self._nested:
+            views = scriptcontext.doc.Views
+            self._redraw_enabled = views.RedrawEnabled
+            views.RedrawEnabled = False
+            if self.undo_name:
+                self._undo_record = scriptcontext.doc.BeginUndoRecord(self.undo_name)
+            scriptcontext.batch_redraw = True
+        if self.cache: rhutil._enterobjectcache()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.redraws_suppressed = scriptcontext.redraws_suppressed - self._first_suppressed
+        if self.cache: rhutil._exitobjectcache()
+        if self._nested: return False
+        scriptcontext.batch_redraw = False
+        if self._undo_record:
+            scriptcontext.doc.EndUndoRecord(self._undo_record)
+            self._undo_record = 0
+        views = scriptcontext.doc.Views
+        views.RedrawEnabled = self._redraw_enabled
+        if self.redraw and self.redraws_suppressed: views.Redraw()
+        return False
+
+
 def _SetRenderMeshAndUpdateStyle(current):
     scriptcontext.doc.SetCustomMeshingParameters(current)
     scriptcontext.doc.MeshingParameterStyle = Rhino.Geometry.MeshingParameterStyle.Custom
@@ -121,6 +184,7 @@ def EnableRedraw(enable=True):
       import rhinoscriptsyntax as rs
       redraw = rs.EnableRedraw(True)
     See Also:
+      batch
       Redraw
     """
     old = scriptcontext.doc.Views.RedrawEnabled
@@ -209,8 +273,12 @@ def Redraw():
       import rhinoscriptsyntax as rs
       rs.Redraw()
     See Also:
+      batch
       EnableRedraw
     """
+    if scriptcontext.batch_redraw:
+        scriptcontext.redraw()
+        return
     old = scriptcontext.doc.Views.RedrawEnabled
     scriptcontext.doc.Views.RedrawEnabled = True
     scriptcontext.doc.Views.Redraw()
@@ -267,7 +335,7 @@ def RenderColor(item, color=None):
         if item==0: settings.AmbientLight = color
         else: settings.BackgroundColorTop = color
         scriptcontext.doc.RenderSettings = settings
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
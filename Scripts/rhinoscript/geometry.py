@@ -63,7 +63,7 @@ def AddClippingPlane(plane, u_magnitude, v_magnitude, views=None):
     if not viewlist: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddClippingPlane(plane, u_magnitude, v_magnitude, viewlist)
     if rc==System.Guid.Empty: raise Exception("unable to add clipping plane to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -90,7 +90,7 @@ def AddPictureFrame(plane, filename, width=0.0, height=0.0, self_illumination=Tr
   if type(filename) is not System.String or not System.IO.File.Exists(filename): raise Exception('\"{0}\" does not exist or is not a file name'.format(filename))
   rc = scriptcontext.doc.Objects.AddPictureFrame(plane, filename, make_mesh, width, height, self_illumination, embed) 
   if rc==System.Guid.Empty: raise Exception("unable to add picture frame to document")
-  scriptcontext.doc.Views.Redraw()
+  scriptcontext.redraw()
   return rc
 
 
@@ -111,7 +111,7 @@ def AddPoint(point, y=None, z=None):
     point = rhutil.coerce3dpoint(point, True)
     rc = scriptcontext.doc.Objects.AddPoint(point)
     if rc==System.Guid.Empty: raise Exception("unable to add point to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -140,7 +140,7 @@ def AddPointCloud(points, colors=None):
         points = pc
     rc = scriptcontext.doc.Objects.AddPointCloud(points)
     if rc==System.Guid.Empty: raise Exception("unable to add point cloud to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -160,7 +160,7 @@ def AddPoints(points):
     """
     points = rhutil.coerce3dpointlist(points, True)
     rc = [scriptcontext.doc.Objects.AddPoint(point) for point in points]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -259,7 +259,7 @@ def AddText(text, point_or_plane, height=1.0, font=None, font_style=0, justifica
 
     id = scriptcontext.doc.Objects.Add(te);
     if id==System.Guid.Empty: raise ValueError("unable to add text to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -280,7 +280,7 @@ def AddTextDot(text, point):
     if not isinstance(text, str): text = str(text)
     rc = scriptcontext.doc.Objects.AddTextDot(text, point)
     if rc==System.Guid.Empty: raise ValueError("unable to add text dot to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -417,7 +417,7 @@ def ExplodeText(text_id, delete=False):
     attr = rhobj.Attributes
     rc = [scriptcontext.doc.Objects.AddCurve(curve,attr) for curve in curves]
     if delete: scriptcontext.doc.Objects.Delete(rhobj,True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -618,7 +618,7 @@ def PointCloudHidePoints(object_id, hidden=[]):
             for i in range(pc.Count): pc[i].Hidden = hidden[i]
         if rhobj:
             rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -660,7 +660,7 @@ def PointCloudPointColors(object_id, colors=[]):
             for i in range(pc.Count): pc[i].Color = rhutil.coercecolor(colors[i])
         if rhobj:
             rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -788,7 +788,7 @@ def PointCoordinates(object_id, point=None):
             point = rhutil.coerce3dpoint(point, True)
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, point)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -819,7 +819,7 @@ def TextDotFont(object_id, fontface=None):
             textdot.FontFace = fontface
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -850,7 +850,7 @@ def TextDotHeight(object_id, height=None):
             textdot.FontHeight = height
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -882,7 +882,7 @@ def TextDotPoint(object_id, point=None):
             textdot.Point = rhutil.coerce3dpoint(point, True)
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -913,7 +913,7 @@ def TextDotText(object_id, text=None):
             textdot.Text = text
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, textdot)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
 
 
@@ -959,7 +959,7 @@ def TextObjectFont(object_id, font=None):
         annotation.Font = f
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -994,7 +994,7 @@ def TextObjectHeight(object_id, height=None):
         annotation.TextHeight = height
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -1030,7 +1030,7 @@ def TextObjectPlane(object_id, plane=None):
         annotation.Plane = rhutil.coerceplane(plane, True)
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -1067,7 +1067,7 @@ def TextObjectPoint(object_id, point=None):
         text.Plane = plane
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, text)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -1110,7 +1110,7 @@ def TextObjectStyle(object_id, style=None):
         annotation.Font = scriptcontext.doc.Fonts[index]
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -1151,5 +1151,5 @@ def TextObjectText(object_id, text=None):
         if isUnderlined: annotation.SetUnderline(True)
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, annotation)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
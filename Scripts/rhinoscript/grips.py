@@ -18,7 +18,7 @@ def __neighborgrip(i, object_id, index, direction, enable):
         next_grip = grip.NeighborGrip(0,i,0,False)
     if next_grip and enable:
         next_grip.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return next_grip
 
 
@@ -45,7 +45,7 @@ def EnableObjectGrips(object_id, enable=True):
     rhobj = rhutil.coercerhinoobject(object_id, True, True)
     if enable!=rhobj.GripsOn:
         rhobj.GripsOn = enable
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
 
 
 def GetObjectGrip(message=None, preselect=False, select=False):
@@ -72,12 +72,12 @@ def GetObjectGrip(message=None, preselect=False, select=False):
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     rc, grip = Rhino.Input.RhinoGet.GetGrip(message)
     if rc!=Rhino.Commands.Result.Success: return scriptcontext.errorhandler()
     if select:
         grip.Select(True, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return grip.OwnerId, grip.Index, grip.CurrentLocation
 
 
@@ -105,7 +105,7 @@ def GetObjectGrips(message=None, preselect=False, select=False):
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     getrc, grips = Rhino.Input.RhinoGet.GetGrips(message)
     if getrc!=Rhino.Commands.Result.Success or not grips:
         return scriptcontext.errorhandler()
@@ -116,7 +116,7 @@ def GetObjectGrips(message=None, preselect=False, select=False):
         location = grip.CurrentLocation
         rc.append((id, index, location))
         if select: grip.Select(True, True)
-    if select: scriptcontext.doc.Views.Redraw()
+    if select: scriptcontext.redraw()
     return rc
 
 
@@ -205,7 +205,7 @@ def ObjectGripLocation(object_id, index, point=None):
     if point:
         grip.CurrentLocation = rhutil.coerce3dpoint(point, True)
         scriptcontext.doc.Objects.GripUpdate(rhobj, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -245,7 +245,7 @@ def ObjectGripLocations(object_id, points=None):
             point = points[i]
             grip.CurrentLocation = point
         scriptcontext.doc.Objects.GripUpdate(rhobj, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -384,7 +384,7 @@ def SelectObjectGrip(object_id, index):
     if index<0 or index>=grips.Length: return False
     grip = grips[index]
     if grip.Select(True,True)>0:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return True
     return False
 
@@ -415,7 +415,7 @@ def SelectObjectGrips(object_id):
     for grip in grips:
         if grip.Select(True,True)>0: count+=1
     if count>0:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return count
     return scriptcontext.errorhandler()
 
@@ -448,7 +448,7 @@ def UnselectObjectGrip(object_id, index):
     if index<0 or index>=grips.Length: return False
     grip = grips[index]
     if grip.Select(False)==0:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return True
     return False
 
@@ -477,6 +477,6 @@ def UnselectObjectGrips(object_id):
     for grip in grips:
         if grip.Select(False)==0: count += 1
     if count>0:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return count
     return scriptcontext.errorhandler()
@@ -115,7 +115,7 @@ def AddHatches(curve_ids, hatch_pattern=None, scale=1.0, rotation=0.0, tolerance
         if id==System.Guid.Empty: continue
         ids.append(id)
     if not ids: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return ids
 
 
@@ -249,7 +249,7 @@ def HatchPattern(hatch_id, hatch_pattern=None):
         if new_patt is None: return scriptcontext.errorhandler()
         hatchobj.HatchGeometry.PatternIndex = new_patt.Index
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return scriptcontext.doc.HatchPatterns[old_index].Name
 
 
@@ -373,7 +373,7 @@ def HatchRotation(hatch_id, rotation=None):
         rotation = Rhino.RhinoMath.ToRadians(rotation)
         hatchobj.HatchGeometry.PatternRotation = rotation
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -406,7 +406,7 @@ def HatchScale(hatch_id, scale=None):
     if scale and scale!=rc:
         hatchobj.HatchGeometry.PatternScale = scale
         hatchobj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
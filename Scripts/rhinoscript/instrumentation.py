@@ -0,0 +1,293 @@
+import sys
+import json
+import time
+import types
+import marshal
+import functools
+import importlib
+import threading
+
+import scriptcontext
+
+import rhinocompat as compat
+
+
+__all__ = ["EnableInstrumentation", "ResetInstrumentation", "SaveInstrumentation"]
+
+
+__timer = time.perf_counter if compat.PY3 else time.clock
+
+
+class __FunctionStats(object):
+    """Call statistics of one instrumented function. Times are in seconds and
+    inclusive times only count the outermost call of recursive functions.
+    Every thread keeps its own call stack, so calls made on worker threads
+    are recorded without a caller.
+      name = full name, e.g. rhinoscript.curve.AddLine
+      calls = number of calls
+      primitive_calls = number of calls that were not recursive
+      total_time = time spent in the function and the functions it called
+      self_time = time spent in the function itself
+      coerce_time = time spent inside utility.coerce* functions during the calls
+      redraws = number of view redraws requested during the calls
+      callers = dictionary of calling function name ->
+        [primitive calls, calls, self time, total time]
+    """
+    def __init__(self, name, func):
+        self.name = name
+        code = func.__code__
+        self.filename = code.co_filename
+        self.line = code.co_firstlineno
+        self.function = func.__name__
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.primitive_calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.coerce_time = 0.0
+        self.redraws = 0
+        self.callers = {}
+
+    def __repr__(self):
+        return "<%s: %d calls, %.6fs total, %.6fs self>" % (self.name, self.calls, self.total_time, self.self_time)
+
+
+# per thread: stack = frames of the instrumented calls in progress, each
+# [stats, child time, coerce time, redraws], and depths = stats -> number of
+# calls of that function in progress, to tell recursive calls apart
+__local = threading.local()
+# serializes the updates of the shared statistics
+__lock = threading.Lock()
+
+__state = {
+    "enabled": False,
+    "stats": {},      # full name -> __FunctionStats of every wrapped function
+    "wrappers": {},   # original function -> instrumented function
+    "originals": {},  # instrumented function -> original function
+    "redraw": None,   # scriptcontext.redraw while instrumentation is enabled
+    "redraws": 0,
+    }
+
+
+def __threadstate():
+    local = __local
+    try:
+        return local.stack, local.depths
+    except AttributeError:
+        local.stack, local.depths = [], {}
+        return local.stack, local.depths
+
+
+def __record(frame, elapsed, caller, is_coerce, primitive):
+    stats, child_time, coerce_time, redraws = frame
+    self_time = elapsed - child_time
+    if is_coerce: coerce_time = elapsed
+    stats.calls += 1
+    stats.self_time += self_time
+    if primitive:
+        stats.primitive_calls += 1
+        stats.total_time += elapsed
+        stats.coerce_time += coerce_time
+        stats.redraws += redraws
+    results = scriptcontext.instrumentation
+    if results is not None and stats.name not in results: results[stats.name] = stats
+    if caller is None: return
+    caller[1] += elapsed
+    caller[2] += coerce_time
+    caller[3] += redraws
+    edge = stats.callers.get(caller[0].name)
+    if edge is None: edge = stats.callers[caller[0].name] = [0, 0, 0.0, 0.0]
+    edge[1] += 1
+    edge[2] += self_time
+    if primitive:
+        edge[0] += 1
+        edge[3] += elapsed
+
+
+def __wrap(func, stats, is_coerce):
+    threadstate = __threadstate
+    lock = __lock
+    timer = __timer
+    record = __record
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        stack, depths = threadstate()
+        caller = stack[-1] if stack else None
+        frame = [stats, 0.0, 0.0, 0]
+        depth = depths.get(stats, 0)
+        depths[stats] = depth + 1
+        stack.append(frame)
+        start = timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = timer() - start
+            stack.pop()
+            depths[stats] = depth
+            with lock: record(frame, elapsed, caller, is_coerce, depth==0)
+    return instrumented
+
+
+def __countredraws(redraw):
+    threadstate = __threadstate
+    lock = __lock
+    state = __state
+    @functools.wraps(redraw)
+    def counted():
+        stack = threadstate()[0]
+        with lock: state["redraws"] += 1
+        if stack: stack[-1][3] += 1
+        return redraw()
+    return counted
+
+
+def __createwrappers():
+    from rhinoscript import nameindex
+    this_module = __name__.split(".")[-1]
+    for module_name in sorted(set(nameindex.NAMES.values())):
+        if module_name==this_module: continue
+        module = importlib.import_module("rhinoscript." + module_name)
+        for name, value in compat.ITERATOR2LIST(vars(module).items()):
+            if name.startswith("_") or type(value) is not types.FunctionType: continue
+            if value.__module__!=module.__name__ or value in __state["wrappers"]: continue
+            stats = __FunctionStats(module.__name__ + "." + name, value)
+            is_coerce = module_name=="utility" and name.startswith("coerce")
+            wrapper = __wrap(value, stats, is_coerce)
+            __state["stats"][stats.name] = stats
+            __state["wrappers"][value] = wrapper
+            __state["originals"][wrapper] = value
+
+
+def __rebind(mapping):
+    """Replaces the functions in mapping wherever the rhinoscript modules and
+    rhinoscriptsyntax have bound them"""
+    for name, module in compat.ITERATOR2LIST(sys.modules.items()):
+        if module is None: continue
+        if name!="rhinoscriptsyntax" and not name.startswith("rhinoscript."): continue
+        namespace = vars(module)
+        for key, value in compat.ITERATOR2LIST(namespace.items()):
+            if type(value) is types.FunctionType and value in mapping:
+                setattr(module, key, mapping[value])
+
+
+def EnableInstrumentation(enable=True):
+    """Enables or disables call instrumentation of the rhinoscript functions.
+    While enabled, every public function records its call count, cumulative
+    and self time, the time spent converting arguments in utility.coerce*
+    functions and the number of view redraws it requested. The results are
+    available in scriptcontext.instrumentation, a dictionary of function name
+    to statistics, and are kept when instrumentation is disabled.
+    Instrumentation is off by default and costs nothing while it is off.
+    Parameters:
+      enable (bool, optional): True to enable, False to disable
+    Returns:
+      bool: previous instrumentation state
+    Example:
+      import rhinoscriptsyntax as rs
+      import scriptcontext
+      rs.EnableInstrumentation()
+      for i in range(100): rs.AddPoint((i, 0, 0))
+      rs.EnableInstrumentation(False)
+      stats = scriptcontext.instrumentation["rhinoscript.geometry.AddPoint"]
+      print("{} calls, {:.3f}s".format(stats.calls, stats.total_time))
+    See Also:
+      ResetInstrumentation
+      SaveInstrumentation
+    """
+    old = __state["enabled"]
+    enable = bool(enable)
+    if old==enable: return old
+    if enable:
+        __createwrappers()
+        __rebind(__state["wrappers"])
+        if scriptcontext.instrumentation is None: scriptcontext.instrumentation = {}
+        __state["redraw"] = scriptcontext.redraw
+        scriptcontext.redraw = __countredraws(scriptcontext.redraw)
+    else:
+        __rebind(__state["originals"])
+        scriptcontext.redraw = __state["redraw"]
+        __state["redraw"] = None
+    __state["enabled"] = enable
+    return old
+
+
+def ResetInstrumentation():
+    """Discards the statistics collected by the instrumented rhinoscript
+    functions
+    Returns:
+      None
+    Example:
+      import rhinoscriptsyntax as rs
+      rs.EnableInstrumentation()
+      rs.AllObjects()
+      rs.ResetInstrumentation()
+    See Also:
+      EnableInstrumentation
+      SaveInstrumentation
+    """
+    for stats in __state["stats"].values(): stats.reset()
+    __state["redraws"] = 0
+    if scriptcontext.instrumentation is not None: scriptcontext.instrumentation.clear()
+
+
+def __jsondata():
+    functions = {}
+    for name, stats in __state["stats"].items():
+        if not stats.calls: continue
+        functions[name] = {
+            "calls": stats.calls,
+            "primitive_calls": stats.primitive_calls,
+            "total_time": stats.total_time,
+            "self_time": stats.self_time,
+            "coerce_time": stats.coerce_time,
+            "redraws": stats.redraws,
+            "callers": dict((caller, {"calls": edge[1], "total_time": edge[3]}) for caller, edge in stats.callers.items()),
+            }
+    return {"functions": functions, "redraws": __state["redraws"]}
+
+
+def __pstatsdata():
+    all_stats = __state["stats"]
+    def key(stats): return (stats.filename, stats.line, stats.function)
+    data = {}
+    for stats in all_stats.values():
+        if not stats.calls: continue
+        callers = dict((key(all_stats[caller]), tuple(edge)) for caller, edge in stats.callers.items())
+        data[key(stats)] = (stats.primitive_calls, stats.calls, stats.self_time, stats.total_time, callers)
+    return data
+
+
+def SaveInstrumentation(filename, format=None):
+    """Writes the statistics collected by the instrumented rhinoscript
+    functions to a file
+    Parameters:
+      filename (str): name of the file to write
+      format (str, optional): "json", or "pstats" for a profile that can be
+        loaded with python's pstats module. If omitted, files ending in .json
+        are written as json and all others as pstats
+    Returns:
+      bool: True if successful
+    Example:
+      import pstats
+      import rhinoscriptsyntax as rs
+      rs.EnableInstrumentation()
+      rs.AllObjects()
+      rs.SaveInstrumentation("rs.prof")
+      pstats.Stats("rs.prof").sort_stats("tottime").print_stats(10)
+    See Also:
+      EnableInstrumentation
+      ResetInstrumentation
+    """
+    if format is None: format = "json" if filename.lower().endswith(".json") else "pstats"
+    format = format.lower()
+    if format=="json":
+        with open(filename, "w") as f:
+            json.dump(__jsondata(), f, indent=2, sort_keys=True)
+    elif format=="pstats":
+        with open(filename, "wb") as f:
+            marshal.dump(__pstatsdata(), f)
+    else:
+        raise ValueError("format must be 'json' or 'pstats'")
+    return True
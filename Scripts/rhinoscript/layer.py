@@ -526,7 +526,7 @@ def LayerColor(layer, color=None):
         color = rhutil.coercecolor(color)
         if color is not None:
           layer.Color = color
-          scriptcontext.doc.Views.Redraw()
+          scriptcontext.redraw()
     return rc
 
 
@@ -590,7 +590,7 @@ def LayerLinetype(layer, linetype=None):
           if lt == None: return scriptcontext.errorhandler()
           index = lt.LinetypeIndex
         layer.LinetypeIndex = index
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -616,7 +616,7 @@ def LayerLocked(layer, locked=None):
     if locked!=None and locked!=layer.GetPersistentLocking():
         layer.IsLocked = locked
         layer.SetPersistentLocking(locked)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -644,7 +644,7 @@ def LayerMaterialIndex(layer,index=None):
     rc = layer.RenderMaterialIndex
     if index is not None and index>=-1:
         layer.RenderMaterialIndex = index
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -755,7 +755,7 @@ def LayerPrintColor(layer, color=None):
     if color:
         color = rhutil.coercecolor(color)
         layer.PlotColor = color
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -783,7 +783,7 @@ def LayerPrintWidth(layer, width=None):
     rc = layer.PlotWeight
     if width is not None and width!=rc:
         layer.PlotWeight = width
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -815,7 +815,7 @@ def LayerVisible(layer, visible=None, forcevisible_or_donotpersist=False):
         if not visible and not forcevisible_or_donotpersist:
           if layer.ParentLayerId != System.Guid.Empty:
             layer.SetPersistentVisibility(visible)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -876,7 +876,7 @@ def PurgeLayer(layer):
     """
     layer = __getlayer(layer, True)
     rc = scriptcontext.doc.Layers.Purge( layer.LayerIndex, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
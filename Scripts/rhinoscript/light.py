@@ -39,7 +39,7 @@ def AddDirectionalLight(start_point, end_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -86,7 +86,7 @@ def AddLinearLight(start_point, end_point, width=None):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -110,7 +110,7 @@ def AddPointLight(point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -145,7 +145,7 @@ def AddRectangularLight(origin, width_point, height_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -181,7 +181,7 @@ def AddSpotLight(origin, radius, apex_point):
     index = scriptcontext.doc.Lights.Add(light)
     if index<0: raise Exception("unable to add light to LightTable")
     rc = scriptcontext.doc.Lights[index].Id
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -213,7 +213,7 @@ def EnableLight(object_id, enable=None):
         id = rhutil.coerceguid(object_id)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -418,7 +418,7 @@ def LightColor(object_id, color=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -465,7 +465,7 @@ def LightDirection(object_id, direction=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -494,7 +494,7 @@ def LightLocation(object_id, location=None):
             id = rhutil.coerceguid(object_id, True)
             if not scriptcontext.doc.Lights.Modify(id, light):
                 return scriptcontext.errorhandler()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -527,7 +527,7 @@ def LightName(object_id, name=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -614,7 +614,7 @@ def SpotLightHardness(object_id, hardness=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -647,7 +647,7 @@ def SpotLightRadius(object_id, radius=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -678,5 +678,5 @@ def SpotLightShadowIntensity(object_id, intensity=None):
         id = rhutil.coerceguid(object_id, True)
         if not scriptcontext.doc.Lights.Modify(id, light):
             return scriptcontext.errorhandler()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
@@ -29,7 +29,7 @@ def AddMaterialToLayer(layer):
     if layer.RenderMaterialIndex>-1: return layer.RenderMaterialIndex
     material_index = scriptcontext.doc.Materials.Add()
     layer.RenderMaterialIndex = material_index
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return material_index
     #return scriptcontext.errorhandler()
 
@@ -87,7 +87,7 @@ def CopyMaterial(source_index, destination_index):
     source = scriptcontext.doc.Materials[source_index]
     if source is None: return False
     rc = scriptcontext.doc.Materials.Modify(source, destination_index, True)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -178,7 +178,7 @@ def MatchMaterial(source, destination):
             rhobj.Attributes.MaterialSource = Rhino.DocObjects.ObjectMaterialSource.MaterialFromObject
             rhobj.CommitChanges()
             rc += 1
-    if rc>0: scriptcontext.doc.Views.Redraw()
+    if rc>0: scriptcontext.redraw()
     return rc
 
 
@@ -213,7 +213,7 @@ def MaterialBump(material_index, filename=None):
     if filename:
         mat.SetBumpTexture(filename)
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -248,7 +248,7 @@ def MaterialColor(material_index, color=None):
     if color:
         mat.DiffuseColor = color
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -280,7 +280,7 @@ def MaterialEnvironmentMap(material_index, filename=None):
     if filename:
         mat.SetEnvironmentTexture(filename)
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -348,7 +348,7 @@ def MaterialReflectiveColor(material_index, color=None):
     if color:
         mat.ReflectionColor = color
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -384,7 +384,7 @@ def MaterialShine(material_index, shine=None):
     if shine:
         mat.Shine = shine
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -419,7 +419,7 @@ def MaterialTexture(material_index, filename=None):
     if filename:
         mat.SetBitmapTexture(filename)
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -454,7 +454,7 @@ def MaterialTransparency(material_index, transparency=None):
     if transparency:
         mat.Transparency = transparency
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -486,7 +486,7 @@ def MaterialTransparencyMap(material_index, filename=None):
     if filename:
         mat.SetTransparencyTexture(filename)
         mat.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -509,5 +509,5 @@ def ResetMaterial(material_index):
     mat = scriptcontext.doc.Materials[material_index]
     if mat is None: return False
     rc = scriptcontext.doc.Materials.ResetMaterial(material_index)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
@@ -82,7 +82,7 @@ def AddMesh(vertices, face_vertices, vertex_normals=None, texture_coordinates=No
         mesh.VertexColors.SetColors(colors)
     rc = scriptcontext.doc.Objects.AddMesh(mesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -112,7 +112,7 @@ def AddPlanarMesh(object_id, delete_input=False):
     else:
         rc = scriptcontext.doc.Objects.AddMesh(mesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -198,7 +198,7 @@ def DuplicateMeshBorder(mesh_id):
         for polyline in polylines:
             id = scriptcontext.doc.Objects.AddPolyline(polyline)
             if id!=System.Guid.Empty: rc.append(id)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -234,7 +234,7 @@ def ExplodeMeshes(mesh_ids, delete=False):
             if delete:
                 scriptcontext.doc.Objects.Delete(mesh_id, True)
                 
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -358,7 +358,7 @@ def JoinMeshes(object_ids, delete_input=False):
         for id in object_ids:
             guid = rhutil.coerceguid(id)
             scriptcontext.doc.Objects.Delete(guid,True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -459,7 +459,7 @@ def MeshBooleanDifference(input0, input1, delete_input=True, tolerance=None):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -498,7 +498,7 @@ def MeshBooleanIntersection(input0, input1, delete_input=True):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -538,7 +538,7 @@ def MeshBooleanSplit(input0, input1, delete_input=True):
         for id in input:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -569,7 +569,7 @@ def MeshBooleanUnion(mesh_ids, delete_input=True):
         for id in mesh_ids:
             id = rhutil.coerceguid(id, True)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -912,7 +912,7 @@ def MeshOffset(mesh_id, distance):
     if offsetmesh is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddMesh(offsetmesh)
     if rc==System.Guid.Empty: raise Exception("unable to add mesh to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -942,7 +942,7 @@ def MeshOutline(object_ids, view=None):
         for polyline in polylines:
             id = scriptcontext.doc.Objects.AddPolyline(polyline)
             rc.append(id)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -986,7 +986,7 @@ def MeshQuadsToTriangles(object_id):
         if rc:
             id = rhutil.coerceguid(object_id, True)
             scriptcontext.doc.Objects.Replace(id, mesh)
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     return rc
 
 
@@ -1016,7 +1016,7 @@ def MeshToNurb(object_id, trimmed_triangles=True, delete_input=False):
     attr = rhobj.Attributes
     ids = [scriptcontext.doc.Objects.AddBrep(brep, attr) for brep in breps]
     if delete_input: scriptcontext.doc.Objects.Delete(rhobj, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return ids
 
 
@@ -1083,7 +1083,7 @@ def MeshVertexColors(mesh_id, colors=0):
         for c in colors: mesh.VertexColors.Add(c)
     id = rhutil.coerceguid(mesh_id, True)
     scriptcontext.doc.Objects.Replace(id, mesh)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1281,7 +1281,7 @@ def PullCurveToMesh(mesh_id, curve_id):
     if not polyline: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddCurve(polyline)
     if rc==System.Guid.Empty: raise Exception("unable to add polyline to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1306,7 +1306,7 @@ def SplitDisjointMesh(object_id, delete_input=False):
     if rc and delete_input:
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1328,5 +1328,5 @@ def UnifyMeshNormals(object_id):
     if rc>0:
         id = rhutil.coerceguid(object_id, True)
         scriptcontext.doc.Objects.Replace(id, mesh)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
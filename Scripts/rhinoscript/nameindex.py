@@ -0,0 +1,1902 @@
+# generated by tools/build_name_index.py - do not edit
+# public name -> rhinoscript submodule that provides it to rhinoscriptsyntax
+NAMES = {
+    'AddAlias': 'application',
+    'AddAlignedDimension': 'dimension',
+    'AddArc': 'curve',
+    'AddArc3Pt': 'curve',
+    'AddArcPtTanPt': 'curve',
+    'AddBlendCurve': 'curve',
+    'AddBlock': 'block',
+    'AddBox': 'surface',
+    'AddCircle': 'curve',
+    'AddCircle3Pt': 'curve',
+    'AddClippingPlane': 'geometry',
+    'AddCone': 'surface',
+    'AddCurve': 'curve',
+    'AddCutPlane': 'surface',
+    'AddCylinder': 'surface',
+    'AddDetail': 'view',
+    'AddDimStyle': 'dimension',
+    'AddDirectionalLight': 'light',
+    'AddEdgeSrf': 'surface',
+    'AddEllipse': 'curve',
+    'AddEllipse3Pt': 'curve',
+    'AddFilletCurve': 'curve',
+    'AddGroup': 'group',
+    'AddHatch': 'hatch',
+    'AddHatches': 'hatch',
+    'AddHatchPatterns': 'hatch',
+    'AddInterpCrvOnSrf': 'curve',
+    'AddInterpCrvOnSrfUV': 'curve',
+    'AddInterpCurve': 'curve',
+    'AddLayer': 'layer',
+    'AddLayout': 'view',
+    'AddLeader': 'dimension',
+    'AddLine': 'curve',
+    'AddLinearDimension': 'dimension',
+    'AddLinearLight': 'light',
+    'AddLoftSrf': 'surface',
+    'AddMaterialToLayer': 'material',
+    'AddMaterialToObject': 'material',
+    'AddMesh': 'mesh',
+    'AddNamedCPlane': 'view',
+    'AddNamedView': 'view',
+    'AddNetworkSrf': 'surface',
+    'AddNurbsCurve': 'curve',
+    'AddNurbsSurface': 'surface',
+    'AddObjectsToGroup': 'group',
+    'AddObjectToGroup': 'group',
+    'AddPatch': 'surface',
+    'AddPictureFrame': 'geometry',
+    'AddPipe': 'surface',
+    'AddPlanarMesh': 'mesh',
+    'AddPlanarSrf': 'surface',
+    'AddPlaneSurface': 'surface',
+    'AddPoint': 'geometry',
+    'AddPointCloud': 'geometry',
+    'AddPointLight': 'light',
+    'AddPoints': 'geometry',
+    'AddPolyline': 'curve',
+    'AddRailRevSrf': 'surface',
+    'AddRectangle': 'curve',
+    'AddRectangularLight': 'light',
+    'AddRevSrf': 'surface',
+    'AddSearchPath': 'application',
+    'AddSphere': 'surface',
+    'AddSpiral': 'curve',
+    'AddSpotLight': 'light',
+    'AddSrfContourCrvs': 'surface',
+    'AddSrfControlPtGrid': 'surface',
+    'AddSrfPt': 'surface',
+    'AddSrfPtGrid': 'surface',
+    'AddSubCrv': 'curve',
+    'AddSweep1': 'surface',
+    'AddSweep2': 'surface',
+    'AddText': 'geometry',
+    'AddTextDot': 'geometry',
+    'AddTorus': 'surface',
+    'AddTweenCurves': 'curve',
+    'AliasCount': 'application',
+    'AliasMacro': 'application',
+    'AliasNames': 'application',
+    'AllObjects': 'selection',
+    'Angle': 'utility',
+    'Angle2': 'utility',
+    'AppearanceColor': 'application',
+    'ArcAngle': 'curve',
+    'ArcCenterPoint': 'curve',
+    'ArcMidPoint': 'curve',
+    'ArcRadius': 'curve',
+    'Area': 'geometry',
+    'AutosaveFile': 'application',
+    'AutosaveInterval': 'application',
+    'batch': 'document',
+    'BlockContainerCount': 'block',
+    'BlockContainers': 'block',
+    'BlockCount': 'block',
+    'BlockDescription': 'block',
+    'BlockInstanceCount': 'block',
+    'BlockInstanceInsertPoint': 'block',
+    'BlockInstanceName': 'block',
+    'BlockInstances': 'block',
+    'BlockInstanceXform': 'block',
+    'BlockNames': 'block',
+    'BlockObjectCount': 'block',
+    'BlockObjects': 'block',
+    'BlockPath': 'block',
+    'BlockStatus': 'block',
+    'BooleanDifference': 'surface',
+    'BooleanIntersection': 'surface',
+    'BooleanUnion': 'surface',
+    'BoundingBox': 'geometry',
+    'BrepClosestPoint': 'surface',
+    'BrowseForFolder': 'userinterface',
+    'BuildDate': 'application',
+    'CapPlanarHoles': 'surface',
+    'ChangeCurveDegree': 'curve',
+    'ChangeSurfaceDegree': 'surface',
+    'CheckListBox': 'userinterface',
+    'CircleCenterPoint': 'curve',
+    'CircleCircumference': 'curve',
+    'CircleRadius': 'curve',
+    'clamp': 'utility',
+    'ClearCommandHistory': 'application',
+    'ClipboardText': 'utility',
+    'CloseCurve': 'curve',
+    'ClosedCurveOrientation': 'curve',
+    'CloseToolbarCollection': 'toolbar',
+    'coerce2dpoint': 'utility',
+    'coerce2dpointlist': 'utility',
+    'coerce3dpoint': 'utility',
+    'coerce3dpointlist': 'utility',
+    'coerce3dvector': 'utility',
+    'coerceboundingbox': 'utility',
+    'coercebrep': 'utility',
+    'coercecolor': 'utility',
+    'coercecurve': 'utility',
+    'coercegeometry': 'utility',
+    'coerceguid': 'utility',
+    'coerceguidlist': 'utility',
+    'coerceline': 'utility',
+    'coercemesh': 'utility',
+    'coerceplane': 'utility',
+    'coercerhinoobject': 'utility',
+    'coercesurface': 'utility',
+    'coercexform': 'utility',
+    'ColorAdjustLuma': 'utility',
+    'ColorBlueValue': 'utility',
+    'ColorGreenValue': 'utility',
+    'ColorHLSToRGB': 'utility',
+    'ColorRedValue': 'utility',
+    'ColorRGBToHLS': 'utility',
+    'ComboListBox': 'userinterface',
+    'Command': 'application',
+    'CommandHistory': 'application',
+    'CompareGeometry': 'geometry',
+    'ContextIsGrasshopper': 'utility',
+    'ContextIsRhino': 'utility',
+    'ConvertCurveToPolyline': 'curve',
+    'CopyMaterial': 'material',
+    'CopyObject': 'object',
+    'CopyObjects': 'object',
+    'CreateColor': 'utility',
+    'CreateInterval': 'utility',
+    'CreatePlane': 'utility',
+    'CreatePoint': 'utility',
+    'CreatePreviewImage': 'document',
+    'CreateVector': 'utility',
+    'CreateXform': 'utility',
+    'CullDuplicateNumbers': 'utility',
+    'CullDuplicatePoints': 'utility',
+    'CurrentDetail': 'view',
+    'CurrentDimStyle': 'dimension',
+    'CurrentHatchPattern': 'hatch',
+    'CurrentLayer': 'layer',
+    'CurrentView': 'view',
+    'CurveArcLengthPoint': 'curve',
+    'CurveArea': 'curve',
+    'CurveAreaCentroid': 'curve',
+    'CurveArrayIntersection': 'curve',
+    'CurveArrows': 'curve',
+    'CurveBooleanDifference': 'curve',
+    'CurveBooleanIntersection': 'curve',
+    'CurveBooleanUnion': 'curve',
+    'CurveBrepIntersect': 'curve',
+    'CurveClosestObject': 'curve',
+    'CurveClosestPoint': 'curve',
+    'CurveClosestPoints': 'curve',
+    'CurveContourPoints': 'curve',
+    'CurveCurvature': 'curve',
+    'CurveCurveIntersection': 'curve',
+    'CurveDegree': 'curve',
+    'CurveDeviation': 'curve',
+    'CurveDim': 'curve',
+    'CurveDirectionsMatch': 'curve',
+    'CurveDiscontinuity': 'curve',
+    'CurveDomain': 'curve',
+    'CurveEditPoints': 'curve',
+    'CurveEndPoint': 'curve',
+    'CurveFilletPoints': 'curve',
+    'CurveFrame': 'curve',
+    'CurveKnotCount': 'curve',
+    'CurveKnots': 'curve',
+    'CurveLength': 'curve',
+    'CurveMeshIntersection': 'mesh',
+    'CurveMidPoint': 'curve',
+    'CurveNormal': 'curve',
+    'CurveNormalizedParameter': 'curve',
+    'CurveParameter': 'curve',
+    'CurvePerpFrame': 'curve',
+    'CurvePlane': 'curve',
+    'CurvePointCount': 'curve',
+    'CurvePoints': 'curve',
+    'CurveRadius': 'curve',
+    'CurveSeam': 'curve',
+    'CurveStartPoint': 'curve',
+    'CurveSurfaceIntersection': 'curve',
+    'CurveTangent': 'curve',
+    'CurveWeights': 'curve',
+    'DefaultRenderer': 'application',
+    'DeleteAlias': 'application',
+    'DeleteBlock': 'block',
+    'DeleteDimStyle': 'dimension',
+    'DeleteDocumentData': 'userdata',
+    'DeleteGroup': 'group',
+    'DeleteLayer': 'layer',
+    'DeleteNamedCPlane': 'view',
+    'DeleteNamedView': 'view',
+    'DeleteObject': 'object',
+    'DeleteObjects': 'object',
+    'DeleteSearchPath': 'application',
+    'DetailLock': 'view',
+    'DetailScale': 'view',
+    'DimensionStyle': 'dimension',
+    'DimensionText': 'dimension',
+    'DimensionUserText': 'dimension',
+    'DimensionValue': 'dimension',
+    'DimStyleAnglePrecision': 'dimension',
+    'DimStyleArrowSize': 'dimension',
+    'DimStyleCount': 'dimension',
+    'DimStyleExtension': 'dimension',
+    'DimStyleFont': 'dimension',
+    'DimStyleLeaderArrowSize': 'dimension',
+    'DimStyleLengthFactor': 'dimension',
+    'DimStyleLinearPrecision': 'dimension',
+    'DimStyleNames': 'dimension',
+    'DimStyleNumberFormat': 'dimension',
+    'DimStyleOffset': 'dimension',
+    'DimStylePrefix': 'dimension',
+    'DimStyleScale': 'dimension',
+    'DimStyleSuffix': 'dimension',
+    'DimStyleTextAlignment': 'dimension',
+    'DimStyleTextGap': 'dimension',
+    'DimStyleTextHeight': 'dimension',
+    'DisjointMeshCount': 'mesh',
+    'DisplayOleAlerts': 'application',
+    'Distance': 'utility',
+    'DistanceMatrix': 'utility',
+    'DistanceToPlane': 'plane',
+    'DivideCurve': 'curve',
+    'DivideCurveEquidistant': 'curve',
+    'DivideCurveLength': 'curve',
+    'DivideCurves': 'curve',
+    'DivideCurvesEquidistant': 'curve',
+    'DivideCurvesLength': 'curve',
+    'DocumentDataCount': 'userdata',
+    'DocumentModified': 'document',
+    'DocumentName': 'document',
+    'DocumentPath': 'document',
+    'DocumentUserTextCount': 'userdata',
+    'DuplicateEdgeCurves': 'surface',
+    'DuplicateMeshBorder': 'mesh',
+    'DuplicateSurfaceBorder': 'surface',
+    'EdgeAnalysisColor': 'application',
+    'EdgeAnalysisMode': 'application',
+    'EditBox': 'userinterface',
+    'EllipseCenterPoint': 'curve',
+    'EllipseQuadPoints': 'curve',
+    'EnableAutosave': 'application',
+    'EnableInstrumentation': 'instrumentation',
+    'EnableLight': 'light',
+    'EnableObjectGrips': 'grips',
+    'EnablePlugIn': 'application',
+    'EnableRedraw': 'document',
+    'EvaluateCurve': 'curve',
+    'EvaluatePlane': 'plane',
+    'EvaluateSurface': 'surface',
+    'ExeFolder': 'application',
+    'ExePlatform': 'application',
+    'ExeServiceRelease': 'application',
+    'ExeVersion': 'application',
+    'Exit': 'application',
+    'ExpandLayer': 'layer',
+    'ExplodeBlockInstance': 'block',
+    'ExplodeCurves': 'curve',
+    'ExplodeHatch': 'hatch',
+    'ExplodeMeshes': 'mesh',
+    'ExplodePolysurfaces': 'surface',
+    'ExplodeText': 'geometry',
+    'ExtendCurve': 'curve',
+    'ExtendCurveLength': 'curve',
+    'ExtendCurvePoint': 'curve',
+    'ExtendSurface': 'surface',
+    'ExtractIsoCurve': 'surface',
+    'ExtractPreviewImage': 'document',
+    'ExtractSurface': 'surface',
+    'ExtrudeCurve': 'surface',
+    'ExtrudeCurvePoint': 'surface',
+    'ExtrudeCurveStraight': 'surface',
+    'ExtrudeSurface': 'surface',
+    'FairCurve': 'curve',
+    'FilletSurfaces': 'surface',
+    'filter': 'selection',
+    'FindFile': 'application',
+    'FirstObject': 'selection',
+    'FitCurve': 'curve',
+    'FlashObject': 'object',
+    'FlipSurface': 'surface',
+    'frange': 'utility',
+    'fxlinspace': 'utility',
+    'fxrange': 'utility',
+    'GetAngle': 'userinterface',
+    'GetBoolean': 'userinterface',
+    'GetBox': 'userinterface',
+    'GetColor': 'userinterface',
+    'GetCursorPos': 'userinterface',
+    'GetCurveObject': 'selection',
+    'GetDistance': 'userinterface',
+    'GetDocumentData': 'userdata',
+    'GetDocumentUserText': 'userdata',
+    'GetEdgeCurves': 'userinterface',
+    'GetInteger': 'userinterface',
+    'GetLayer': 'userinterface',
+    'GetLayers': 'userinterface',
+    'GetLine': 'userinterface',
+    'GetLinetype': 'userinterface',
+    'GetMeshFaces': 'userinterface',
+    'GetMeshVertices': 'userinterface',
+    'GetObject': 'selection',
+    'GetObjectEx': 'selection',
+    'GetObjectGrip': 'grips',
+    'GetObjectGrips': 'grips',
+    'GetObjects': 'selection',
+    'GetObjectsEx': 'selection',
+    'GetPlugInObject': 'application',
+    'GetPoint': 'userinterface',
+    'GetPointCoordinates': 'selection',
+    'GetPointOnCurve': 'userinterface',
+    'GetPointOnMesh': 'userinterface',
+    'GetPointOnSurface': 'userinterface',
+    'GetPoints': 'userinterface',
+    'GetPolyline': 'userinterface',
+    'GetReal': 'userinterface',
+    'GetRectangle': 'userinterface',
+    'GetSettings': 'utility',
+    'GetString': 'userinterface',
+    'GetSurfaceObject': 'selection',
+    'GetUserText': 'userdata',
+    'GroupCount': 'group',
+    'GroupNames': 'group',
+    'HatchPattern': 'hatch',
+    'HatchPatternCount': 'hatch',
+    'HatchPatternDescription': 'hatch',
+    'HatchPatternFillType': 'hatch',
+    'HatchPatternNames': 'hatch',
+    'HatchRotation': 'hatch',
+    'HatchScale': 'hatch',
+    'HiddenObjects': 'selection',
+    'HideGroup': 'group',
+    'HideObject': 'object',
+    'HideObjects': 'object',
+    'HideToolbar': 'toolbar',
+    'InCommand': 'application',
+    'InsertBlock': 'block',
+    'InsertBlock2': 'block',
+    'InsertCurveKnot': 'curve',
+    'InstallFolder': 'application',
+    'IntersectBreps': 'surface',
+    'IntersectPlanes': 'plane',
+    'IntersectSpheres': 'surface',
+    'InvertSelectedObjects': 'selection',
+    'IsAlias': 'application',
+    'IsAlignedDimension': 'dimension',
+    'IsAngularDimension': 'dimension',
+    'IsArc': 'curve',
+    'IsBlock': 'block',
+    'IsBlockEmbedded': 'block',
+    'IsBlockInstance': 'block',
+    'IsBlockInUse': 'block',
+    'IsBlockReference': 'block',
+    'IsBrep': 'surface',
+    'IsCircle': 'curve',
+    'IsClippingPlane': 'geometry',
+    'IsCommand': 'application',
+    'IsCone': 'surface',
+    'IsCurve': 'curve',
+    'IsCurveClosable': 'curve',
+    'IsCurveClosed': 'curve',
+    'IsCurveInPlane': 'curve',
+    'IsCurveLinear': 'curve',
+    'IsCurvePeriodic': 'curve',
+    'IsCurvePlanar': 'curve',
+    'IsCurveRational': 'curve',
+    'IsCylinder': 'surface',
+    'IsDetail': 'view',
+    'IsDiameterDimension': 'dimension',
+    'IsDimension': 'dimension',
+    'IsDimStyle': 'dimension',
+    'IsDimStyleReference': 'dimension',
+    'IsDirectionalLight': 'light',
+    'IsDocumentData': 'userdata',
+    'IsDocumentModified': 'document',
+    'IsDocumentUserText': 'userdata',
+    'IsEllipse': 'curve',
+    'IsGroup': 'group',
+    'IsGroupEmpty': 'group',
+    'IsHatch': 'hatch',
+    'IsHatchPattern': 'hatch',
+    'IsHatchPatternCurrent': 'hatch',
+    'IsHatchPatternReference': 'hatch',
+    'IsLayer': 'layer',
+    'IsLayerChangeable': 'layer',
+    'IsLayerChildOf': 'layer',
+    'IsLayerCurrent': 'layer',
+    'IsLayerEmpty': 'layer',
+    'IsLayerExpanded': 'layer',
+    'IsLayerLocked': 'layer',
+    'IsLayerOn': 'layer',
+    'IsLayerParentOf': 'layer',
+    'IsLayerReference': 'layer',
+    'IsLayerSelectable': 'layer',
+    'IsLayerVisible': 'layer',
+    'IsLayout': 'view',
+    'IsLayoutObject': 'object',
+    'IsLeader': 'dimension',
+    'IsLight': 'light',
+    'IsLightEnabled': 'light',
+    'IsLightReference': 'light',
+    'IsLine': 'curve',
+    'IsLinearDimension': 'dimension',
+    'IsLinearLight': 'light',
+    'IsLinetype': 'linetype',
+    'IsLinetypeReference': 'linetype',
+    'IsMaterialDefault': 'material',
+    'IsMaterialReference': 'material',
+    'IsMesh': 'mesh',
+    'IsMeshClosed': 'mesh',
+    'IsMeshManifold': 'mesh',
+    'IsObject': 'object',
+    'IsObjectHidden': 'object',
+    'IsObjectInBox': 'object',
+    'IsObjectInGroup': 'object',
+    'IsObjectLocked': 'object',
+    'IsObjectNormal': 'object',
+    'IsObjectReference': 'object',
+    'IsObjectSelectable': 'object',
+    'IsObjectSelected': 'object',
+    'IsObjectSolid': 'object',
+    'IsObjectValid': 'object',
+    'IsOrdinateDimension': 'dimension',
+    'IsPlaneSurface': 'surface',
+    'IsPlugIn': 'application',
+    'IsPoint': 'geometry',
+    'IsPointCloud': 'geometry',
+    'IsPointInSurface': 'surface',
+    'IsPointLight': 'light',
+    'IsPointOnCurve': 'curve',
+    'IsPointOnMesh': 'mesh',
+    'IsPointOnSurface': 'surface',
+    'IsPolyCurve': 'curve',
+    'IsPolyline': 'curve',
+    'IsPolysurface': 'surface',
+    'IsPolysurfaceClosed': 'surface',
+    'IsRadialDimension': 'dimension',
+    'IsRectangularLight': 'light',
+    'IsRunningOnWindows': 'application',
+    'IsSphere': 'surface',
+    'IsSpotLight': 'light',
+    'IsSurface': 'surface',
+    'IsSurfaceClosed': 'surface',
+    'IsSurfacePeriodic': 'surface',
+    'IsSurfacePlanar': 'surface',
+    'IsSurfaceRational': 'surface',
+    'IsSurfaceSingular': 'surface',
+    'IsSurfaceTrimmed': 'surface',
+    'IsText': 'geometry',
+    'IsTextDot': 'geometry',
+    'IsToolbar': 'toolbar',
+    'IsToolbarCollection': 'toolbar',
+    'IsToolbarDocked': 'toolbar',
+    'IsToolbarVisible': 'toolbar',
+    'IsTorus': 'surface',
+    'IsUserText': 'userdata',
+    'IsVectorParallelTo': 'pointvector',
+    'IsVectorPerpendicularTo': 'pointvector',
+    'IsVectorTiny': 'pointvector',
+    'IsVectorZero': 'pointvector',
+    'IsView': 'view',
+    'IsViewCurrent': 'view',
+    'IsViewMaximized': 'view',
+    'IsViewPerspective': 'view',
+    'IsViewTitleVisible': 'view',
+    'IsVisibleInView': 'object',
+    'IsWallpaper': 'view',
+    'IsXformIdentity': 'transformation',
+    'IsXformSimilarity': 'transformation',
+    'IsXformZero': 'transformation',
+    'IterSimplifyArray': 'utility',
+    'JoinCurves': 'curve',
+    'JoinMeshes': 'mesh',
+    'JoinSurfaces': 'surface',
+    'LastCommandName': 'application',
+    'LastCommandResult': 'application',
+    'LastCreatedObjects': 'selection',
+    'LastObject': 'selection',
+    'LayerChildCount': 'layer',
+    'LayerChildren': 'layer',
+    'LayerColor': 'layer',
+    'LayerCount': 'layer',
+    'LayerId': 'layer',
+    'LayerIds': 'layer',
+    'LayerLinetype': 'layer',
+    'LayerLocked': 'layer',
+    'LayerMaterialIndex': 'layer',
+    'LayerName': 'layer',
+    'LayerNames': 'layer',
+    'LayerOrder': 'layer',
+    'LayerPrintColor': 'layer',
+    'LayerPrintWidth': 'layer',
+    'LayerVisible': 'layer',
+    'LeaderText': 'dimension',
+    'LightColor': 'light',
+    'LightCount': 'light',
+    'LightDirection': 'light',
+    'LightLocation': 'light',
+    'LightName': 'light',
+    'LightObjects': 'light',
+    'LineClosestPoint': 'line',
+    'LineCylinderIntersection': 'line',
+    'LineFitFromPoints': 'curve',
+    'LineIsFartherThan': 'line',
+    'LineLineIntersection': 'line',
+    'LineMaxDistanceTo': 'line',
+    'LineMinDistanceTo': 'line',
+    'LinePlane': 'line',
+    'LinePlaneIntersection': 'line',
+    'LineSphereIntersection': 'line',
+    'LineTransform': 'line',
+    'LinetypeCount': 'linetype',
+    'LinetypeNames': 'linetype',
+    'linspace': 'utility',
+    'ListBox': 'userinterface',
+    'LocaleID': 'application',
+    'LockedObjects': 'selection',
+    'LockGroup': 'group',
+    'LockObject': 'object',
+    'LockObjects': 'object',
+    'MakeCurveNonPeriodic': 'curve',
+    'MakeSurfacePeriodic': 'surface',
+    'MatchMaterial': 'material',
+    'MatchObjectAttributes': 'object',
+    'MaterialBump': 'material',
+    'MaterialColor': 'material',
+    'MaterialEnvironmentMap': 'material',
+    'MaterialName': 'material',
+    'MaterialReflectiveColor': 'material',
+    'MaterialShine': 'material',
+    'MaterialTexture': 'material',
+    'MaterialTransparency': 'material',
+    'MaterialTransparencyMap': 'material',
+    'MaximizeRestoreView': 'view',
+    'MeanCurve': 'curve',
+    'MeshArea': 'mesh',
+    'MeshAreaCentroid': 'mesh',
+    'MeshBooleanDifference': 'mesh',
+    'MeshBooleanIntersection': 'mesh',
+    'MeshBooleanSplit': 'mesh',
+    'MeshBooleanUnion': 'mesh',
+    'MeshClosestPoint': 'mesh',
+    'MeshFaceCenters': 'mesh',
+    'MeshFaceCount': 'mesh',
+    'MeshFaceNormals': 'mesh',
+    'MeshFaces': 'mesh',
+    'MeshFaceVertices': 'mesh',
+    'MeshHasFaceNormals': 'mesh',
+    'MeshHasTextureCoordinates': 'mesh',
+    'MeshHasVertexColors': 'mesh',
+    'MeshHasVertexNormals': 'mesh',
+    'MeshMeshIntersection': 'mesh',
+    'MeshNakedEdgePoints': 'mesh',
+    'MeshOffset': 'mesh',
+    'MeshOutline': 'mesh',
+    'MeshPolyline': 'curve',
+    'MeshQuadCount': 'mesh',
+    'MeshQuadsToTriangles': 'mesh',
+    'MeshToNurb': 'mesh',
+    'MeshTriangleCount': 'mesh',
+    'MeshVertexColors': 'mesh',
+    'MeshVertexCount': 'mesh',
+    'MeshVertexFaces': 'mesh',
+    'MeshVertexNormals': 'mesh',
+    'MeshVertices': 'mesh',
+    'MeshVolume': 'mesh',
+    'MeshVolumeCentroid': 'mesh',
+    'MessageBox': 'userinterface',
+    'MirrorObject': 'object',
+    'MirrorObjects': 'object',
+    'MoveObject': 'object',
+    'MoveObjects': 'object',
+    'MovePlane': 'plane',
+    'MultiListBox': 'userinterface',
+    'NamedCPlane': 'view',
+    'NamedCPlanes': 'view',
+    'NamedViews': 'view',
+    'NextObject': 'selection',
+    'NextObjectGrip': 'grips',
+    'NormalObjects': 'selection',
+    'Notes': 'document',
+    'objectcache': 'utility',
+    'ObjectColor': 'object',
+    'ObjectColorSource': 'object',
+    'ObjectDescription': 'object',
+    'ObjectGripCount': 'grips',
+    'ObjectGripLocation': 'grips',
+    'ObjectGripLocations': 'grips',
+    'ObjectGripsOn': 'grips',
+    'ObjectGripsSelected': 'grips',
+    'ObjectGroups': 'object',
+    'ObjectLayer': 'object',
+    'ObjectLayout': 'object',
+    'ObjectLinetype': 'object',
+    'ObjectLinetypeSource': 'object',
+    'ObjectMaterialIndex': 'object',
+    'ObjectMaterialSource': 'object',
+    'ObjectName': 'object',
+    'ObjectPrintColor': 'object',
+    'ObjectPrintColorSource': 'object',
+    'ObjectPrintWidth': 'object',
+    'ObjectPrintWidthSource': 'object',
+    'ObjectsByColor': 'selection',
+    'ObjectsByGroup': 'selection',
+    'ObjectsByLayer': 'selection',
+    'ObjectsByName': 'selection',
+    'ObjectsByType': 'selection',
+    'ObjectTopGroup': 'group',
+    'ObjectType': 'object',
+    'OffsetCurve': 'curve',
+    'OffsetCurveOnSurface': 'curve',
+    'OffsetSurface': 'surface',
+    'OpenFileName': 'userinterface',
+    'OpenFileNames': 'userinterface',
+    'OpenToolbarCollection': 'toolbar',
+    'OrientObject': 'object',
+    'Ortho': 'application',
+    'Osnap': 'application',
+    'OsnapDialog': 'application',
+    'OsnapMode': 'application',
+    'ParentLayer': 'layer',
+    'Planar': 'application',
+    'PlanarClosedCurveContainment': 'curve',
+    'PlanarCurveCollision': 'curve',
+    'PlaneClosestPoint': 'plane',
+    'PlaneCurveIntersection': 'plane',
+    'PlaneEquation': 'plane',
+    'PlaneFitAccumulator': 'pointvector',
+    'PlaneFitFromPoints': 'plane',
+    'PlaneFromFrame': 'plane',
+    'PlaneFromNormal': 'plane',
+    'PlaneFromPoints': 'plane',
+    'PlanePlaneIntersection': 'plane',
+    'PlaneSphereIntersection': 'plane',
+    'PlaneTransform': 'plane',
+    'PlugInId': 'application',
+    'PlugIns': 'application',
+    'PointAdd': 'pointvector',
+    'PointArrayBoundingBox': 'pointvector',
+    'PointArrayClosestPoint': 'pointvector',
+    'PointArrayTransform': 'pointvector',
+    'PointClosestObject': 'pointvector',
+    'PointCloudClosestPoints': 'geometry',
+    'PointCloudCount': 'geometry',
+    'PointCloudHasHiddenPoints': 'geometry',
+    'PointCloudHasPointColors': 'geometry',
+    'PointCloudHidePoints': 'geometry',
+    'PointCloudKNeighbors': 'geometry',
+    'PointCloudPointColors': 'geometry',
+    'PointCloudPoints': 'geometry',
+    'PointCompare': 'pointvector',
+    'PointCoordinates': 'geometry',
+    'PointDivide': 'pointvector',
+    'PointIndex': 'pointvector',
+    'PointInPlanarClosedCurve': 'curve',
+    'PointsAreCoplanar': 'pointvector',
+    'PointScale': 'pointvector',
+    'PointSubtract': 'pointvector',
+    'PointTransform': 'pointvector',
+    'Polar': 'utility',
+    'PolyCurveCount': 'curve',
+    'PolylineVertices': 'curve',
+    'PopupMenu': 'userinterface',
+    'PrevObjectGrip': 'grips',
+    'ProjectCurveToMesh': 'curve',
+    'ProjectCurveToSurface': 'curve',
+    'ProjectOsnaps': 'application',
+    'ProjectPointToMesh': 'pointvector',
+    'ProjectPointToSurface': 'pointvector',
+    'Prompt': 'application',
+    'PropertyListBox': 'userinterface',
+    'PullCurve': 'surface',
+    'PullCurveToMesh': 'mesh',
+    'PullPoints': 'pointvector',
+    'PurgeLayer': 'layer',
+    'ReadFileVersion': 'document',
+    'RealBox': 'userinterface',
+    'RebuildCurve': 'curve',
+    'RebuildSurface': 'surface',
+    'RectangularLightPlane': 'light',
+    'Redraw': 'document',
+    'RemoveCurveKnot': 'curve',
+    'RemoveObjectFromAllGroups': 'group',
+    'RemoveObjectFromGroup': 'group',
+    'RemoveObjectsFromGroup': 'group',
+    'RemoveSurfaceKnot': 'surface',
+    'RenameBlock': 'block',
+    'RenameDimStyle': 'dimension',
+    'RenameGroup': 'group',
+    'RenameLayer': 'layer',
+    'RenameView': 'view',
+    'RenderAntialias': 'document',
+    'RenderColor': 'document',
+    'RenderMeshDensity': 'document',
+    'RenderMeshMaxAngle': 'document',
+    'RenderMeshMaxAspectRatio': 'document',
+    'RenderMeshMaxDistEdgeToSrf': 'document',
+    'RenderMeshMaxEdgeLength': 'document',
+    'RenderMeshMinEdgeLength': 'document',
+    'RenderMeshMinInitialGridQuads': 'document',
+    'RenderMeshQuality': 'document',
+    'RenderMeshSettings': 'document',
+    'RenderResolution': 'document',
+    'RenderSettings': 'document',
+    'ResetInstrumentation': 'instrumentation',
+    'ResetMaterial': 'material',
+    'RestoreNamedCPlane': 'view',
+    'RestoreNamedView': 'view',
+    'ReverseCurve': 'curve',
+    'ReverseSurface': 'surface',
+    'RotateCamera': 'view',
+    'RotateObject': 'object',
+    'RotateObjects': 'object',
+    'RotatePlane': 'plane',
+    'RotateView': 'view',
+    'SaveFileName': 'userinterface',
+    'SaveInstrumentation': 'instrumentation',
+    'SaveToolbarCollection': 'toolbar',
+    'SaveToolbarCollectionAs': 'toolbar',
+    'ScaleObject': 'object',
+    'ScaleObjects': 'object',
+    'ScreenSize': 'application',
+    'SdkVersion': 'application',
+    'SearchPathCount': 'application',
+    'SearchPathList': 'application',
+    'SelectedObjectGrips': 'grips',
+    'SelectedObjects': 'selection',
+    'SelectObject': 'object',
+    'SelectObjectGrip': 'grips',
+    'SelectObjectGrips': 'grips',
+    'SelectObjects': 'object',
+    'SendKeystrokes': 'application',
+    'SetDocumentData': 'userdata',
+    'SetDocumentUserText': 'userdata',
+    'SetUserText': 'userdata',
+    'ShearObject': 'object',
+    'ShearObjects': 'object',
+    'ShootRay': 'surface',
+    'ShortPath': 'surface',
+    'ShowGrid': 'view',
+    'ShowGridAxes': 'view',
+    'ShowGroup': 'group',
+    'ShowObject': 'object',
+    'ShowObjects': 'object',
+    'ShowToolbar': 'toolbar',
+    'ShowViewTitle': 'view',
+    'ShowWorldAxes': 'view',
+    'ShrinkTrimmedSurface': 'surface',
+    'SimplifyArray': 'utility',
+    'SimplifyCurve': 'curve',
+    'Sleep': 'utility',
+    'Snap': 'application',
+    'SortPointList': 'utility',
+    'SortPoints': 'utility',
+    'SplitBrep': 'surface',
+    'SplitCurve': 'curve',
+    'SplitDisjointMesh': 'mesh',
+    'SpotLightHardness': 'light',
+    'SpotLightRadius': 'light',
+    'SpotLightShadowIntensity': 'light',
+    'StatusBarDistance': 'application',
+    'StatusBarMessage': 'application',
+    'StatusBarPoint': 'application',
+    'StatusBarProgressMeterHide': 'application',
+    'StatusBarProgressMeterShow': 'application',
+    'StatusBarProgressMeterUpdate': 'application',
+    'Str2Pt': 'utility',
+    'StringBox': 'userinterface',
+    'SurfaceArea': 'surface',
+    'SurfaceAreaCentroid': 'surface',
+    'SurfaceAreaMoments': 'surface',
+    'SurfaceClosestPoint': 'surface',
+    'SurfaceCone': 'surface',
+    'SurfaceCurvature': 'surface',
+    'SurfaceCylinder': 'surface',
+    'SurfaceDegree': 'surface',
+    'SurfaceDomain': 'surface',
+    'SurfaceEditPoints': 'surface',
+    'SurfaceEvaluate': 'surface',
+    'SurfaceFrame': 'surface',
+    'SurfaceIsocurveDensity': 'surface',
+    'SurfaceKnotCount': 'surface',
+    'SurfaceKnots': 'surface',
+    'SurfaceNormal': 'surface',
+    'SurfaceNormalizedParameter': 'surface',
+    'SurfaceParameter': 'surface',
+    'SurfacePointCount': 'surface',
+    'SurfacePoints': 'surface',
+    'SurfaceSphere': 'surface',
+    'SurfaceTorus': 'surface',
+    'SurfaceVolume': 'surface',
+    'SurfaceVolumeCentroid': 'surface',
+    'SurfaceVolumeMoments': 'surface',
+    'SurfaceWeights': 'surface',
+    'TemplateFile': 'application',
+    'TemplateFolder': 'application',
+    'TextDotFont': 'geometry',
+    'TextDotHeight': 'geometry',
+    'TextDotPoint': 'geometry',
+    'TextDotText': 'geometry',
+    'TextObjectFont': 'geometry',
+    'TextObjectHeight': 'geometry',
+    'TextObjectPlane': 'geometry',
+    'TextObjectPoint': 'geometry',
+    'TextObjectStyle': 'geometry',
+    'TextObjectText': 'geometry',
+    'TextOut': 'userinterface',
+    'TiltView': 'view',
+    'ToolbarCollectionCount': 'toolbar',
+    'ToolbarCollectionNames': 'toolbar',
+    'ToolbarCollectionPath': 'toolbar',
+    'ToolbarCount': 'toolbar',
+    'ToolbarNames': 'toolbar',
+    'TransformObject': 'object',
+    'TransformObjects': 'object',
+    'TrimBrep': 'surface',
+    'TrimCurve': 'curve',
+    'TrimSurface': 'surface',
+    'UnflattenArray': 'utility',
+    'UnifyMeshNormals': 'mesh',
+    'UnitAbsoluteTolerance': 'document',
+    'UnitAngleTolerance': 'document',
+    'UnitDistanceDisplayPrecision': 'document',
+    'UnitRelativeTolerance': 'document',
+    'UnitScale': 'document',
+    'UnitSystem': 'document',
+    'UnitSystemName': 'document',
+    'UnlockGroup': 'group',
+    'UnlockObject': 'object',
+    'UnlockObjects': 'object',
+    'UnrollSurface': 'surface',
+    'UnselectAllObjects': 'selection',
+    'UnselectObject': 'object',
+    'UnselectObjectGrip': 'grips',
+    'UnselectObjectGrips': 'grips',
+    'UnselectObjects': 'object',
+    'VectorAdd': 'pointvector',
+    'VectorAngle': 'pointvector',
+    'VectorArrayAdd': 'pointvector',
+    'VectorArrayAngle': 'pointvector',
+    'VectorArrayCrossProduct': 'pointvector',
+    'VectorArrayDotProduct': 'pointvector',
+    'VectorArrayLength': 'pointvector',
+    'VectorArrayRotate': 'pointvector',
+    'VectorArraySubtract': 'pointvector',
+    'VectorArrayTransform': 'pointvector',
+    'VectorArrayUnitize': 'pointvector',
+    'VectorCompare': 'pointvector',
+    'VectorCreate': 'pointvector',
+    'VectorCrossProduct': 'pointvector',
+    'VectorDivide': 'pointvector',
+    'VectorDotProduct': 'pointvector',
+    'VectorLength': 'pointvector',
+    'VectorMultiply': 'pointvector',
+    'VectorReverse': 'pointvector',
+    'VectorRotate': 'pointvector',
+    'VectorScale': 'pointvector',
+    'VectorSubtract': 'pointvector',
+    'VectorTransform': 'pointvector',
+    'VectorUnitize': 'pointvector',
+    'ViewCamera': 'view',
+    'ViewCameraLens': 'view',
+    'ViewCameraPlane': 'view',
+    'ViewCameraTarget': 'view',
+    'ViewCameraUp': 'view',
+    'ViewCPlane': 'dimension',
+    'ViewDisplayMode': 'view',
+    'ViewDisplayModeId': 'view',
+    'ViewDisplayModeName': 'view',
+    'ViewDisplayModes': 'view',
+    'ViewNames': 'view',
+    'ViewNearCorners': 'view',
+    'ViewProjection': 'view',
+    'ViewRadius': 'view',
+    'ViewSize': 'view',
+    'ViewSpeedTest': 'view',
+    'ViewTarget': 'view',
+    'ViewTitle': 'view',
+    'VisibleObjects': 'selection',
+    'Wallpaper': 'view',
+    'WallpaperGrayScale': 'view',
+    'WallpaperHidden': 'view',
+    'WindowHandle': 'application',
+    'WindowPick': 'selection',
+    'WorkingFolder': 'application',
+    'WorldXYPlane': 'plane',
+    'WorldYZPlane': 'plane',
+    'WorldZXPlane': 'plane',
+    'XformChangeBasis': 'transformation',
+    'XformChangeBasis2': 'transformation',
+    'XformCompare': 'transformation',
+    'XformCPlaneToWorld': 'transformation',
+    'XformDeterminant': 'transformation',
+    'XformDiagonal': 'transformation',
+    'XformIdentity': 'transformation',
+    'XformInverse': 'transformation',
+    'XformMirror': 'transformation',
+    'XformMultiply': 'transformation',
+    'XformPlanarProjection': 'transformation',
+    'XformRotation1': 'transformation',
+    'XformRotation2': 'transformation',
+    'XformRotation3': 'transformation',
+    'XformRotation4': 'transformation',
+    'XformScale': 'transformation',
+    'XformScreenToWorld': 'transformation',
+    'XformShear': 'transformation',
+    'XformTranslation': 'transformation',
+    'XformWorldToCPlane': 'transformation',
+    'XformWorldToScreen': 'transformation',
+    'XformZero': 'transformation',
+    'ZoomBoundingBox': 'view',
+    'ZoomExtents': 'view',
+    'ZoomSelected': 'view',
+}
+
+# function or class name -> rhinoscript submodule that defines it
+DEFINED = {
+    'AddAlias': 'application',
+    'AddAlignedDimension': 'dimension',
+    'AddArc': 'curve',
+    'AddArc3Pt': 'curve',
+    'AddArcPtTanPt': 'curve',
+    'AddBlendCurve': 'curve',
+    'AddBlock': 'block',
+    'AddBox': 'surface',
+    'AddCircle': 'curve',
+    'AddCircle3Pt': 'curve',
+    'AddClippingPlane': 'geometry',
+    'AddCone': 'surface',
+    'AddCurve': 'curve',
+    'AddCutPlane': 'surface',
+    'AddCylinder': 'surface',
+    'AddDetail': 'view',
+    'AddDimStyle': 'dimension',
+    'AddDirectionalLight': 'light',
+    'AddEdgeSrf': 'surface',
+    'AddEllipse': 'curve',
+    'AddEllipse3Pt': 'curve',
+    'AddFilletCurve': 'curve',
+    'AddGroup': 'group',
+    'AddHatch': 'hatch',
+    'AddHatches': 'hatch',
+    'AddHatchPatterns': 'hatch',
+    'AddInterpCrvOnSrf': 'curve',
+    'AddInterpCrvOnSrfUV': 'curve',
+    'AddInterpCurve': 'curve',
+    'AddLayer': 'layer',
+    'AddLayout': 'view',
+    'AddLeader': 'dimension',
+    'AddLine': 'curve',
+    'AddLinearDimension': 'dimension',
+    'AddLinearLight': 'light',
+    'AddLoftSrf': 'surface',
+    'AddMaterialToLayer': 'material',
+    'AddMaterialToObject': 'material',
+    'AddMesh': 'mesh',
+    'AddNamedCPlane': 'view',
+    'AddNamedView': 'view',
+    'AddNetworkSrf': 'surface',
+    'AddNurbsCurve': 'curve',
+    'AddNurbsSurface': 'surface',
+    'AddObjectsToGroup': 'group',
+    'AddObjectToGroup': 'group',
+    'AddPatch': 'surface',
+    'AddPictureFrame': 'geometry',
+    'AddPipe': 'surface',
+    'AddPlanarMesh': 'mesh',
+    'AddPlanarSrf': 'surface',
+    'AddPlaneSurface': 'surface',
+    'AddPoint': 'geometry',
+    'AddPointCloud': 'geometry',
+    'AddPointLight': 'light',
+    'AddPoints': 'geometry',
+    'AddPolyline': 'curve',
+    'AddRailRevSrf': 'surface',
+    'AddRectangle': 'curve',
+    'AddRectangularLight': 'light',
+    'AddRevSrf': 'surface',
+    'AddSearchPath': 'application',
+    'AddSphere': 'surface',
+    'AddSpiral': 'curve',
+    'AddSpotLight': 'light',
+    'AddSrfContourCrvs': 'surface',
+    'AddSrfControlPtGrid': 'surface',
+    'AddSrfPt': 'surface',
+    'AddSrfPtGrid': 'surface',
+    'AddSubCrv': 'curve',
+    'AddSweep1': 'surface',
+    'AddSweep2': 'surface',
+    'AddText': 'geometry',
+    'AddTextDot': 'geometry',
+    'AddTorus': 'surface',
+    'AddTweenCurves': 'curve',
+    'AliasCount': 'application',
+    'AliasMacro': 'application',
+    'AliasNames': 'application',
+    'AllObjects': 'selection',
+    'Angle': 'utility',
+    'Angle2': 'utility',
+    'AppearanceColor': 'application',
+    'ArcAngle': 'curve',
+    'ArcCenterPoint': 'curve',
+    'ArcMidPoint': 'curve',
+    'ArcRadius': 'curve',
+    'Area': 'geometry',
+    'AutosaveFile': 'application',
+    'AutosaveInterval': 'application',
+    'batch': 'document',
+    'BlockContainerCount': 'block',
+    'BlockContainers': 'block',
+    'BlockCount': 'block',
+    'BlockDescription': 'block',
+    'BlockInstanceCount': 'block',
+    'BlockInstanceInsertPoint': 'block',
+    'BlockInstanceName': 'block',
+    'BlockInstances': 'block',
+    'BlockInstanceXform': 'block',
+    'BlockNames': 'block',
+    'BlockObjectCount': 'block',
+    'BlockObjects': 'block',
+    'BlockPath': 'block',
+    'BlockStatus': 'block',
+    'BooleanDifference': 'surface',
+    'BooleanIntersection': 'surface',
+    'BooleanUnion': 'surface',
+    'BoundingBox': 'geometry',
+    'BrepClosestPoint': 'surface',
+    'BrowseForFolder': 'userinterface',
+    'BuildDate': 'application',
+    'CapPlanarHoles': 'surface',
+    'ChangeCurveDegree': 'curve',
+    'ChangeSurfaceDegree': 'surface',
+    'CheckListBox': 'userinterface',
+    'CircleCenterPoint': 'curve',
+    'CircleCircumference': 'curve',
+    'CircleRadius': 'curve',
+    'clamp': 'utility',
+    'ClearCommandHistory': 'application',
+    'ClipboardText': 'utility',
+    'CloseCurve': 'curve',
+    'ClosedCurveOrientation': 'curve',
+    'CloseToolbarCollection': 'toolbar',
+    'coerce2dpoint': 'utility',
+    'coerce2dpointlist': 'utility',
+    'coerce3dpoint': 'utility',
+    'coerce3dpointlist': 'utility',
+    'coerce3dvector': 'utility',
+    'coerceboundingbox': 'utility',
+    'coercebrep': 'utility',
+    'coercecolor': 'utility',
+    'coercecurve': 'utility',
+    'coercegeometry': 'utility',
+    'coerceguid': 'utility',
+    'coerceguidlist': 'utility',
+    'coerceline': 'utility',
+    'coercemesh': 'utility',
+    'coerceplane': 'utility',
+    'coercerhinoobject': 'utility',
+    'coercesurface': 'utility',
+    'coercexform': 'utility',
+    'ColorAdjustLuma': 'utility',
+    'ColorBlueValue': 'utility',
+    'ColorGreenValue': 'utility',
+    'ColorHLSToRGB': 'utility',
+    'ColorRedValue': 'utility',
+    'ColorRGBToHLS': 'utility',
+    'ComboListBox': 'userinterface',
+    'Command': 'application',
+    'CommandHistory': 'application',
+    'CompareGeometry': 'geometry',
+    'ContextIsGrasshopper': 'utility',
+    'ContextIsRhino': 'utility',
+    'ConvertCurveToPolyline': 'curve',
+    'CopyMaterial': 'material',
+    'CopyObject': 'object',
+    'CopyObjects': 'object',
+    'CreateColor': 'utility',
+    'CreateInterval': 'utility',
+    'CreatePlane': 'utility',
+    'CreatePoint': 'utility',
+    'CreatePreviewImage': 'document',
+    'CreateVector': 'utility',
+    'CreateXform': 'utility',
+    'CullDuplicateNumbers': 'utility',
+    'CullDuplicatePoints': 'utility',
+    'CurrentDetail': 'view',
+    'CurrentDimStyle': 'dimension',
+    'CurrentHatchPattern': 'hatch',
+    'CurrentLayer': 'layer',
+    'CurrentView': 'view',
+    'CurveArcLengthPoint': 'curve',
+    'CurveArea': 'curve',
+    'CurveAreaCentroid': 'curve',
+    'CurveArrayIntersection': 'curve',
+    'CurveArrows': 'curve',
+    'CurveBooleanDifference': 'curve',
+    'CurveBooleanIntersection': 'curve',
+    'CurveBooleanUnion': 'curve',
+    'CurveBrepIntersect': 'curve',
+    'CurveClosestObject': 'curve',
+    'CurveClosestPoint': 'curve',
+    'CurveClosestPoints': 'curve',
+    'CurveContourPoints': 'curve',
+    'CurveCurvature': 'curve',
+    'CurveCurveIntersection': 'curve',
+    'CurveDegree': 'curve',
+    'CurveDeviation': 'curve',
+    'CurveDim': 'curve',
+    'CurveDirectionsMatch': 'curve',
+    'CurveDiscontinuity': 'curve',
+    'CurveDomain': 'curve',
+    'CurveEditPoints': 'curve',
+    'CurveEndPoint': 'curve',
+    'CurveFilletPoints': 'curve',
+    'CurveFrame': 'curve',
+    'CurveKnotCount': 'curve',
+    'CurveKnots': 'curve',
+    'CurveLength': 'curve',
+    'CurveMeshIntersection': 'mesh',
+    'CurveMidPoint': 'curve',
+    'CurveNormal': 'curve',
+    'CurveNormalizedParameter': 'curve',
+    'CurveParameter': 'curve',
+    'CurvePerpFrame': 'curve',
+    'CurvePlane': 'curve',
+    'CurvePointCount': 'curve',
+    'CurvePoints': 'curve',
+    'CurveRadius': 'curve',
+    'CurveSeam': 'curve',
+    'CurveStartPoint': 'curve',
+    'CurveSurfaceIntersection': 'curve',
+    'CurveTangent': 'curve',
+    'CurveWeights': 'curve',
+    'DefaultRenderer': 'application',
+    'DeleteAlias': 'application',
+    'DeleteBlock': 'block',
+    'DeleteDimStyle': 'dimension',
+    'DeleteDocumentData': 'userdata',
+    'DeleteGroup': 'group',
+    'DeleteLayer': 'layer',
+    'DeleteNamedCPlane': 'view',
+    'DeleteNamedView': 'view',
+    'DeleteObject': 'object',
+    'DeleteObjects': 'object',
+    'DeleteSearchPath': 'application',
+    'DetailLock': 'view',
+    'DetailScale': 'view',
+    'DimensionStyle': 'dimension',
+    'DimensionText': 'dimension',
+    'DimensionUserText': 'dimension',
+    'DimensionValue': 'dimension',
+    'DimStyleAnglePrecision': 'dimension',
+    'DimStyleArrowSize': 'dimension',
+    'DimStyleCount': 'dimension',
+    'DimStyleExtension': 'dimension',
+    'DimStyleFont': 'dimension',
+    'DimStyleLeaderArrowSize': 'dimension',
+    'DimStyleLengthFactor': 'dimension',
+    'DimStyleLinearPrecision': 'dimension',
+    'DimStyleNames': 'dimension',
+    'DimStyleNumberFormat': 'dimension',
+    'DimStyleOffset': 'dimension',
+    'DimStylePrefix': 'dimension',
+    'DimStyleScale': 'dimension',
+    'DimStyleSuffix': 'dimension',
+    'DimStyleTextAlignment': 'dimension',
+    'DimStyleTextGap': 'dimension',
+    'DimStyleTextHeight': 'dimension',
+    'DisjointMeshCount': 'mesh',
+    'DisplayOleAlerts': 'application',
+    'Distance': 'utility',
+    'DistanceMatrix': 'utility',
+    'DistanceToPlane': 'plane',
+    'DivideCurve': 'curve',
+    'DivideCurveEquidistant': 'curve',
+    'DivideCurveLength': 'curve',
+    'DivideCurves': 'curve',
+    'DivideCurvesEquidistant': 'curve',
+    'DivideCurvesLength': 'curve',
+    'DocumentDataCount': 'userdata',
+    'DocumentModified': 'document',
+    'DocumentName': 'document',
+    'DocumentPath': 'document',
+    'DocumentUserTextCount': 'userdata',
+    'DuplicateEdgeCurves': 'surface',
+    'DuplicateMeshBorder': 'mesh',
+    'DuplicateSurfaceBorder': 'surface',
+    'EdgeAnalysisColor': 'application',
+    'EdgeAnalysisMode': 'application',
+    'EditBox': 'userinterface',
+    'EllipseCenterPoint': 'curve',
+    'EllipseQuadPoints': 'curve',
+    'EnableAutosave': 'application',
+    'EnableInstrumentation': 'instrumentation',
+    'EnableLight': 'light',
+    'EnableObjectGrips': 'grips',
+    'EnablePlugIn': 'application',
+    'EnableRedraw': 'document',
+    'EvaluateCurve': 'curve',
+    'EvaluatePlane': 'plane',
+    'EvaluateSurface': 'surface',
+    'ExeFolder': 'application',
+    'ExePlatform': 'application',
+    'ExeServiceRelease': 'application',
+    'ExeVersion': 'application',
+    'Exit': 'application',
+    'ExpandLayer': 'layer',
+    'ExplodeBlockInstance': 'block',
+    'ExplodeCurves': 'curve',
+    'ExplodeHatch': 'hatch',
+    'ExplodeMeshes': 'mesh',
+    'ExplodePolysurfaces': 'surface',
+    'ExplodeText': 'geometry',
+    'ExtendCurve': 'curve',
+    'ExtendCurveLength': 'curve',
+    'ExtendCurvePoint': 'curve',
+    'ExtendSurface': 'surface',
+    'ExtractIsoCurve': 'surface',
+    'ExtractPreviewImage': 'document',
+    'ExtractSurface': 'surface',
+    'ExtrudeCurve': 'surface',
+    'ExtrudeCurvePoint': 'surface',
+    'ExtrudeCurveStraight': 'surface',
+    'ExtrudeSurface': 'surface',
+    'FairCurve': 'curve',
+    'FilletSurfaces': 'surface',
+    'filter': 'selection',
+    'FindFile': 'application',
+    'FirstObject': 'selection',
+    'FitCurve': 'curve',
+    'FlashObject': 'object',
+    'FlipSurface': 'surface',
+    'frange': 'utility',
+    'fxlinspace': 'utility',
+    'fxrange': 'utility',
+    'GetAngle': 'userinterface',
+    'GetBoolean': 'userinterface',
+    'GetBox': 'userinterface',
+    'GetColor': 'userinterface',
+    'GetCursorPos': 'userinterface',
+    'GetCurveObject': 'selection',
+    'GetDistance': 'userinterface',
+    'GetDocumentData': 'userdata',
+    'GetDocumentUserText': 'userdata',
+    'GetEdgeCurves': 'userinterface',
+    'GetInteger': 'userinterface',
+    'GetLayer': 'userinterface',
+    'GetLayers': 'userinterface',
+    'GetLine': 'userinterface',
+    'GetLinetype': 'userinterface',
+    'GetMeshFaces': 'userinterface',
+    'GetMeshVertices': 'userinterface',
+    'GetObject': 'selection',
+    'GetObjectEx': 'selection',
+    'GetObjectGrip': 'grips',
+    'GetObjectGrips': 'grips',
+    'GetObjects': 'selection',
+    'GetObjectsEx': 'selection',
+    'GetPlugInObject': 'application',
+    'GetPoint': 'userinterface',
+    'GetPointCoordinates': 'selection',
+    'GetPointOnCurve': 'userinterface',
+    'GetPointOnMesh': 'userinterface',
+    'GetPointOnSurface': 'userinterface',
+    'GetPoints': 'userinterface',
+    'GetPolyline': 'userinterface',
+    'GetReal': 'userinterface',
+    'GetRectangle': 'userinterface',
+    'GetSettings': 'utility',
+    'GetString': 'userinterface',
+    'GetSurfaceObject': 'selection',
+    'GetUserText': 'userdata',
+    'GroupCount': 'group',
+    'GroupNames': 'group',
+    'HatchPattern': 'hatch',
+    'HatchPatternCount': 'hatch',
+    'HatchPatternDescription': 'hatch',
+    'HatchPatternFillType': 'hatch',
+    'HatchPatternNames': 'hatch',
+    'HatchRotation': 'hatch',
+    'HatchScale': 'hatch',
+    'HiddenObjects': 'selection',
+    'HideGroup': 'group',
+    'HideObject': 'object',
+    'HideObjects': 'object',
+    'HideToolbar': 'toolbar',
+    'InCommand': 'application',
+    'InsertBlock': 'block',
+    'InsertBlock2': 'block',
+    'InsertCurveKnot': 'curve',
+    'InstallFolder': 'application',
+    'IntersectBreps': 'surface',
+    'IntersectPlanes': 'plane',
+    'IntersectSpheres': 'surface',
+    'InvertSelectedObjects': 'selection',
+    'IsAlias': 'application',
+    'IsAlignedDimension': 'dimension',
+    'IsAngularDimension': 'dimension',
+    'IsArc': 'curve',
+    'IsBlock': 'block',
+    'IsBlockEmbedded': 'block',
+    'IsBlockInstance': 'block',
+    'IsBlockInUse': 'block',
+    'IsBlockReference': 'block',
+    'IsBrep': 'surface',
+    'IsCircle': 'curve',
+    'IsClippingPlane': 'geometry',
+    'IsCommand': 'application',
+    'IsCone': 'surface',
+    'IsCurve': 'curve',
+    'IsCurveClosable': 'curve',
+    'IsCurveClosed': 'curve',
+    'IsCurveInPlane': 'curve',
+    'IsCurveLinear': 'curve',
+    'IsCurvePeriodic': 'curve',
+    'IsCurvePlanar': 'curve',
+    'IsCurveRational': 'curve',
+    'IsCylinder': 'surface',
+    'IsDetail': 'view',
+    'IsDiameterDimension': 'dimension',
+    'IsDimension': 'dimension',
+    'IsDimStyle': 'dimension',
+    'IsDimStyleReference': 'dimension',
+    'IsDirectionalLight': 'light',
+    'IsDocumentData': 'userdata',
+    'IsDocumentModified': 'document',
+    'IsDocumentUserText': 'userdata',
+    'IsEllipse': 'curve',
+    'IsGroup': 'group',
+    'IsGroupEmpty': 'group',
+    'IsHatch': 'hatch',
+    'IsHatchPattern': 'hatch',
+    'IsHatchPatternCurrent': 'hatch',
+    'IsHatchPatternReference': 'hatch',
+    'IsLayer': 'layer',
+    'IsLayerChangeable': 'layer',
+    'IsLayerChildOf': 'layer',
+    'IsLayerCurrent': 'layer',
+    'IsLayerEmpty': 'layer',
+    'IsLayerExpanded': 'layer',
+    'IsLayerLocked': 'layer',
+    'IsLayerOn': 'layer',
+    'IsLayerParentOf': 'layer',
+    'IsLayerReference': 'layer',
+    'IsLayerSelectable': 'layer',
+    'IsLayerVisible': 'layer',
+    'IsLayout': 'view',
+    'IsLayoutObject': 'object',
+    'IsLeader': 'dimension',
+    'IsLight': 'light',
+    'IsLightEnabled': 'light',
+    'IsLightReference': 'light',
+    'IsLine': 'curve',
+    'IsLinearDimension': 'dimension',
+    'IsLinearLight': 'light',
+    'IsLinetype': 'linetype',
+    'IsLinetypeReference': 'linetype',
+    'IsMaterialDefault': 'material',
+    'IsMaterialReference': 'material',
+    'IsMesh': 'mesh',
+    'IsMeshClosed': 'mesh',
+    'IsMeshManifold': 'mesh',
+    'IsObject': 'object',
+    'IsObjectHidden': 'object',
+    'IsObjectInBox': 'object',
+    'IsObjectInGroup': 'object',
+    'IsObjectLocked': 'object',
+    'IsObjectNormal': 'object',
+    'IsObjectReference': 'object',
+    'IsObjectSelectable': 'object',
+    'IsObjectSelected': 'object',
+    'IsObjectSolid': 'object',
+    'IsObjectValid': 'object',
+    'IsOrdinateDimension': 'dimension',
+    'IsPlaneSurface': 'surface',
+    'IsPlugIn': 'application',
+    'IsPoint': 'geometry',
+    'IsPointCloud': 'geometry',
+    'IsPointInSurface': 'surface',
+    'IsPointLight': 'light',
+    'IsPointOnCurve': 'curve',
+    'IsPointOnMesh': 'mesh',
+    'IsPointOnSurface': 'surface',
+    'IsPolyCurve': 'curve',
+    'IsPolyline': 'curve',
+    'IsPolysurface': 'surface',
+    'IsPolysurfaceClosed': 'surface',
+    'IsRadialDimension': 'dimension',
+    'IsRectangularLight': 'light',
+    'IsRunningOnWindows': 'application',
+    'IsSphere': 'surface',
+    'IsSpotLight': 'light',
+    'IsSurface': 'surface',
+    'IsSurfaceClosed': 'surface',
+    'IsSurfacePeriodic': 'surface',
+    'IsSurfacePlanar': 'surface',
+    'IsSurfaceRational': 'surface',
+    'IsSurfaceSingular': 'surface',
+    'IsSurfaceTrimmed': 'surface',
+    'IsText': 'geometry',
+    'IsTextDot': 'geometry',
+    'IsToolbar': 'toolbar',
+    'IsToolbarCollection': 'toolbar',
+    'IsToolbarDocked': 'toolbar',
+    'IsToolbarVisible': 'toolbar',
+    'IsTorus': 'surface',
+    'IsUserText': 'userdata',
+    'IsVectorParallelTo': 'pointvector',
+    'IsVectorPerpendicularTo': 'pointvector',
+    'IsVectorTiny': 'pointvector',
+    'IsVectorZero': 'pointvector',
+    'IsView': 'view',
+    'IsViewCurrent': 'view',
+    'IsViewMaximized': 'view',
+    'IsViewPerspective': 'view',
+    'IsViewTitleVisible': 'view',
+    'IsVisibleInView': 'object',
+    'IsWallpaper': 'view',
+    'IsXformIdentity': 'transformation',
+    'IsXformSimilarity': 'transformation',
+    'IsXformZero': 'transformation',
+    'IterSimplifyArray': 'utility',
+    'JoinCurves': 'curve',
+    'JoinMeshes': 'mesh',
+    'JoinSurfaces': 'surface',
+    'LastCommandName': 'application',
+    'LastCommandResult': 'application',
+    'LastCreatedObjects': 'selection',
+    'LastObject': 'selection',
+    'LayerChildCount': 'layer',
+    'LayerChildren': 'layer',
+    'LayerColor': 'layer',
+    'LayerCount': 'layer',
+    'LayerId': 'layer',
+    'LayerIds': 'layer',
+    'LayerLinetype': 'layer',
+    'LayerLocked': 'layer',
+    'LayerMaterialIndex': 'layer',
+    'LayerName': 'layer',
+    'LayerNames': 'layer',
+    'LayerOrder': 'layer',
+    'LayerPrintColor': 'layer',
+    'LayerPrintWidth': 'layer',
+    'LayerVisible': 'layer',
+    'LeaderText': 'dimension',
+    'LightColor': 'light',
+    'LightCount': 'light',
+    'LightDirection': 'light',
+    'LightLocation': 'light',
+    'LightName': 'light',
+    'LightObjects': 'light',
+    'LineClosestPoint': 'line',
+    'LineCylinderIntersection': 'line',
+    'LineFitFromPoints': 'curve',
+    'LineIsFartherThan': 'line',
+    'LineLineIntersection': 'line',
+    'LineMaxDistanceTo': 'line',
+    'LineMinDistanceTo': 'line',
+    'LinePlane': 'line',
+    'LinePlaneIntersection': 'line',
+    'LineSphereIntersection': 'line',
+    'LineTransform': 'line',
+    'LinetypeCount': 'linetype',
+    'LinetypeNames': 'linetype',
+    'linspace': 'utility',
+    'ListBox': 'userinterface',
+    'LocaleID': 'application',
+    'LockedObjects': 'selection',
+    'LockGroup': 'group',
+    'LockObject': 'object',
+    'LockObjects': 'object',
+    'MakeCurveNonPeriodic': 'curve',
+    'MakeSurfacePeriodic': 'surface',
+    'MatchMaterial': 'material',
+    'MatchObjectAttributes': 'object',
+    'MaterialBump': 'material',
+    'MaterialColor': 'material',
+    'MaterialEnvironmentMap': 'material',
+    'MaterialName': 'material',
+    'MaterialReflectiveColor': 'material',
+    'MaterialShine': 'material',
+    'MaterialTexture': 'material',
+    'MaterialTransparency': 'material',
+    'MaterialTransparencyMap': 'material',
+    'MaximizeRestoreView': 'view',
+    'MeanCurve': 'curve',
+    'MeshArea': 'mesh',
+    'MeshAreaCentroid': 'mesh',
+    'MeshBooleanDifference': 'mesh',
+    'MeshBooleanIntersection': 'mesh',
+    'MeshBooleanSplit': 'mesh',
+    'MeshBooleanUnion': 'mesh',
+    'MeshClosestPoint': 'mesh',
+    'MeshFaceCenters': 'mesh',
+    'MeshFaceCount': 'mesh',
+    'MeshFaceNormals': 'mesh',
+    'MeshFaces': 'mesh',
+    'MeshFaceVertices': 'mesh',
+    'MeshHasFaceNormals': 'mesh',
+    'MeshHasTextureCoordinates': 'mesh',
+    'MeshHasVertexColors': 'mesh',
+    'MeshHasVertexNormals': 'mesh',
+    'MeshMeshIntersection': 'mesh',
+    'MeshNakedEdgePoints': 'mesh',
+    'MeshOffset': 'mesh',
+    'MeshOutline': 'mesh',
+    'MeshPolyline': 'curve',
+    'MeshQuadCount': 'mesh',
+    'MeshQuadsToTriangles': 'mesh',
+    'MeshToNurb': 'mesh',
+    'MeshTriangleCount': 'mesh',
+    'MeshVertexColors': 'mesh',
+    'MeshVertexCount': 'mesh',
+    'MeshVertexFaces': 'mesh',
+    'MeshVertexNormals': 'mesh',
+    'MeshVertices': 'mesh',
+    'MeshVolume': 'mesh',
+    'MeshVolumeCentroid': 'mesh',
+    'MessageBox': 'userinterface',
+    'MirrorObject': 'object',
+    'MirrorObjects': 'object',
+    'MoveObject': 'object',
+    'MoveObjects': 'object',
+    'MovePlane': 'plane',
+    'MultiListBox': 'userinterface',
+    'NamedCPlane': 'view',
+    'NamedCPlanes': 'view',
+    'NamedViews': 'view',
+    'NextObject': 'selection',
+    'NextObjectGrip': 'grips',
+    'NormalObjects': 'selection',
+    'Notes': 'document',
+    'objectcache': 'utility',
+    'ObjectColor': 'object',
+    'ObjectColorSource': 'object',
+    'ObjectDescription': 'object',
+    'ObjectGripCount': 'grips',
+    'ObjectGripLocation': 'grips',
+    'ObjectGripLocations': 'grips',
+    'ObjectGripsOn': 'grips',
+    'ObjectGripsSelected': 'grips',
+    'ObjectGroups': 'object',
+    'ObjectLayer': 'object',
+    'ObjectLayout': 'object',
+    'ObjectLinetype': 'object',
+    'ObjectLinetypeSource': 'object',
+    'ObjectMaterialIndex': 'object',
+    'ObjectMaterialSource': 'object',
+    'ObjectName': 'object',
+    'ObjectPrintColor': 'object',
+    'ObjectPrintColorSource': 'object',
+    'ObjectPrintWidth': 'object',
+    'ObjectPrintWidthSource': 'object',
+    'ObjectsByColor': 'selection',
+    'ObjectsByGroup': 'selection',
+    'ObjectsByLayer': 'selection',
+    'ObjectsByName': 'selection',
+    'ObjectsByType': 'selection',
+    'ObjectTopGroup': 'group',
+    'ObjectType': 'object',
+    'OffsetCurve': 'curve',
+    'OffsetCurveOnSurface': 'curve',
+    'OffsetSurface': 'surface',
+    'OpenFileName': 'userinterface',
+    'OpenFileNames': 'userinterface',
+    'OpenToolbarCollection': 'toolbar',
+    'OrientObject': 'object',
+    'Ortho': 'application',
+    'Osnap': 'application',
+    'OsnapDialog': 'application',
+    'OsnapMode': 'application',
+    'ParentLayer': 'layer',
+    'Planar': 'application',
+    'PlanarClosedCurveContainment': 'curve',
+    'PlanarCurveCollision': 'curve',
+    'PlaneClosestPoint': 'plane',
+    'PlaneCurveIntersection': 'plane',
+    'PlaneEquation': 'plane',
+    'PlaneFitAccumulator': 'plane',
+    'PlaneFitFromPoints': 'plane',
+    'PlaneFromFrame': 'plane',
+    'PlaneFromNormal': 'plane',
+    'PlaneFromPoints': 'plane',
+    'PlanePlaneIntersection': 'plane',
+    'PlaneSphereIntersection': 'plane',
+    'PlaneTransform': 'plane',
+    'PlugInId': 'application',
+    'PlugIns': 'application',
+    'PointAdd': 'pointvector',
+    'PointArrayBoundingBox': 'pointvector',
+    'PointArrayClosestPoint': 'pointvector',
+    'PointArrayTransform': 'pointvector',
+    'PointClosestObject': 'pointvector',
+    'PointCloudClosestPoints': 'geometry',
+    'PointCloudCount': 'geometry',
+    'PointCloudHasHiddenPoints': 'geometry',
+    'PointCloudHasPointColors': 'geometry',
+    'PointCloudHidePoints': 'geometry',
+    'PointCloudKNeighbors': 'geometry',
+    'PointCloudPointColors': 'geometry',
+    'PointCloudPoints': 'geometry',
+    'PointCompare': 'pointvector',
+    'PointCoordinates': 'geometry',
+    'PointDivide': 'pointvector',
+    'PointIndex': 'pointvector',
+    'PointInPlanarClosedCurve': 'curve',
+    'PointsAreCoplanar': 'pointvector',
+    'PointScale': 'pointvector',
+    'PointSubtract': 'pointvector',
+    'PointTransform': 'pointvector',
+    'Polar': 'utility',
+    'PolyCurveCount': 'curve',
+    'PolylineVertices': 'curve',
+    'PopupMenu': 'userinterface',
+    'PrevObjectGrip': 'grips',
+    'ProjectCurveToMesh': 'curve',
+    'ProjectCurveToSurface': 'curve',
+    'ProjectOsnaps': 'application',
+    'ProjectPointToMesh': 'pointvector',
+    'ProjectPointToSurface': 'pointvector',
+    'Prompt': 'application',
+    'PropertyListBox': 'userinterface',
+    'PullCurve': 'surface',
+    'PullCurveToMesh': 'mesh',
+    'PullPoints': 'pointvector',
+    'PurgeLayer': 'layer',
+    'ReadFileVersion': 'document',
+    'RealBox': 'userinterface',
+    'RebuildCurve': 'curve',
+    'RebuildSurface': 'surface',
+    'RectangularLightPlane': 'light',
+    'Redraw': 'document',
+    'RemoveCurveKnot': 'curve',
+    'RemoveObjectFromAllGroups': 'group',
+    'RemoveObjectFromGroup': 'group',
+    'RemoveObjectsFromGroup': 'group',
+    'RemoveSurfaceKnot': 'surface',
+    'RenameBlock': 'block',
+    'RenameDimStyle': 'dimension',
+    'RenameGroup': 'group',
+    'RenameLayer': 'layer',
+    'RenameView': 'view',
+    'RenderAntialias': 'document',
+    'RenderColor': 'document',
+    'RenderMeshDensity': 'document',
+    'RenderMeshMaxAngle': 'document',
+    'RenderMeshMaxAspectRatio': 'document',
+    'RenderMeshMaxDistEdgeToSrf': 'document',
+    'RenderMeshMaxEdgeLength': 'document',
+    'RenderMeshMinEdgeLength': 'document',
+    'RenderMeshMinInitialGridQuads': 'document',
+    'RenderMeshQuality': 'document',
+    'RenderMeshSettings': 'document',
+    'RenderResolution': 'document',
+    'RenderSettings': 'document',
+    'ResetInstrumentation': 'instrumentation',
+    'ResetMaterial': 'material',
+    'RestoreNamedCPlane': 'view',
+    'RestoreNamedView': 'view',
+    'ReverseCurve': 'curve',
+    'ReverseSurface': 'surface',
+    'RotateCamera': 'view',
+    'RotateObject': 'object',
+    'RotateObjects': 'object',
+    'RotatePlane': 'plane',
+    'RotateView': 'view',
+    'SaveFileName': 'userinterface',
+    'SaveInstrumentation': 'instrumentation',
+    'SaveToolbarCollection': 'toolbar',
+    'SaveToolbarCollectionAs': 'toolbar',
+    'ScaleObject': 'object',
+    'ScaleObjects': 'object',
+    'ScreenSize': 'application',
+    'SdkVersion': 'application',
+    'SearchPathCount': 'application',
+    'SearchPathList': 'application',
+    'SelectedObjectGrips': 'grips',
+    'SelectedObjects': 'selection',
+    'SelectObject': 'object',
+    'SelectObjectGrip': 'grips',
+    'SelectObjectGrips': 'grips',
+    'SelectObjects': 'object',
+    'SendKeystrokes': 'application',
+    'SetDocumentData': 'userdata',
+    'SetDocumentUserText': 'userdata',
+    'SetUserText': 'userdata',
+    'ShearObject': 'object',
+    'ShearObjects': 'object',
+    'ShootRay': 'surface',
+    'ShortPath': 'surface',
+    'ShowGrid': 'view',
+    'ShowGridAxes': 'view',
+    'ShowGroup': 'group',
+    'ShowObject': 'object',
+    'ShowObjects': 'object',
+    'ShowToolbar': 'toolbar',
+    'ShowViewTitle': 'view',
+    'ShowWorldAxes': 'view',
+    'ShrinkTrimmedSurface': 'surface',
+    'SimplifyArray': 'utility',
+    'SimplifyCurve': 'curve',
+    'Sleep': 'utility',
+    'Snap': 'application',
+    'SortPointList': 'utility',
+    'SortPoints': 'utility',
+    'SplitBrep': 'surface',
+    'SplitCurve': 'curve',
+    'SplitDisjointMesh': 'mesh',
+    'SpotLightHardness': 'light',
+    'SpotLightRadius': 'light',
+    'SpotLightShadowIntensity': 'light',
+    'StatusBarDistance': 'application',
+    'StatusBarMessage': 'application',
+    'StatusBarPoint': 'application',
+    'StatusBarProgressMeterHide': 'application',
+    'StatusBarProgressMeterShow': 'application',
+    'StatusBarProgressMeterUpdate': 'application',
+    'Str2Pt': 'utility',
+    'StringBox': 'userinterface',
+    'SurfaceArea': 'surface',
+    'SurfaceAreaCentroid': 'surface',
+    'SurfaceAreaMoments': 'surface',
+    'SurfaceClosestPoint': 'surface',
+    'SurfaceCone': 'surface',
+    'SurfaceCurvature': 'surface',
+    'SurfaceCylinder': 'surface',
+    'SurfaceDegree': 'surface',
+    'SurfaceDomain': 'surface',
+    'SurfaceEditPoints': 'surface',
+    'SurfaceEvaluate': 'surface',
+    'SurfaceFrame': 'surface',
+    'SurfaceIsocurveDensity': 'surface',
+    'SurfaceKnotCount': 'surface',
+    'SurfaceKnots': 'surface',
+    'SurfaceNormal': 'surface',
+    'SurfaceNormalizedParameter': 'surface',
+    'SurfaceParameter': 'surface',
+    'SurfacePointCount': 'surface',
+    'SurfacePoints': 'surface',
+    'SurfaceSphere': 'surface',
+    'SurfaceTorus': 'surface',
+    'SurfaceVolume': 'surface',
+    'SurfaceVolumeCentroid': 'surface',
+    'SurfaceVolumeMoments': 'surface',
+    'SurfaceWeights': 'surface',
+    'TemplateFile': 'application',
+    'TemplateFolder': 'application',
+    'TextDotFont': 'geometry',
+    'TextDotHeight': 'geometry',
+    'TextDotPoint': 'geometry',
+    'TextDotText': 'geometry',
+    'TextObjectFont': 'geometry',
+    'TextObjectHeight': 'geometry',
+    'TextObjectPlane': 'geometry',
+    'TextObjectPoint': 'geometry',
+    'TextObjectStyle': 'geometry',
+    'TextObjectText': 'geometry',
+    'TextOut': 'userinterface',
+    'TiltView': 'view',
+    'ToolbarCollectionCount': 'toolbar',
+    'ToolbarCollectionNames': 'toolbar',
+    'ToolbarCollectionPath': 'toolbar',
+    'ToolbarCount': 'toolbar',
+    'ToolbarNames': 'toolbar',
+    'TransformObject': 'object',
+    'TransformObjects': 'object',
+    'TrimBrep': 'surface',
+    'TrimCurve': 'curve',
+    'TrimSurface': 'surface',
+    'UnflattenArray': 'utility',
+    'UnifyMeshNormals': 'mesh',
+    'UnitAbsoluteTolerance': 'document',
+    'UnitAngleTolerance': 'document',
+    'UnitDistanceDisplayPrecision': 'document',
+    'UnitRelativeTolerance': 'document',
+    'UnitScale': 'document',
+    'UnitSystem': 'document',
+    'UnitSystemName': 'document',
+    'UnlockGroup': 'group',
+    'UnlockObject': 'object',
+    'UnlockObjects': 'object',
+    'UnrollSurface': 'surface',
+    'UnselectAllObjects': 'selection',
+    'UnselectObject': 'object',
+    'UnselectObjectGrip': 'grips',
+    'UnselectObjectGrips': 'grips',
+    'UnselectObjects': 'object',
+    'VectorAdd': 'pointvector',
+    'VectorAngle': 'pointvector',
+    'VectorArrayAdd': 'pointvector',
+    'VectorArrayAngle': 'pointvector',
+    'VectorArrayCrossProduct': 'pointvector',
+    'VectorArrayDotProduct': 'pointvector',
+    'VectorArrayLength': 'pointvector',
+    'VectorArrayRotate': 'pointvector',
+    'VectorArraySubtract': 'pointvector',
+    'VectorArrayTransform': 'pointvector',
+    'VectorArrayUnitize': 'pointvector',
+    'VectorCompare': 'pointvector',
+    'VectorCreate': 'pointvector',
+    'VectorCrossProduct': 'pointvector',
+    'VectorDivide': 'pointvector',
+    'VectorDotProduct': 'pointvector',
+    'VectorLength': 'pointvector',
+    'VectorMultiply': 'pointvector',
+    'VectorReverse': 'pointvector',
+    'VectorRotate': 'pointvector',
+    'VectorScale': 'pointvector',
+    'VectorSubtract': 'pointvector',
+    'VectorTransform': 'pointvector',
+    'VectorUnitize': 'pointvector',
+    'ViewCamera': 'view',
+    'ViewCameraLens': 'view',
+    'ViewCameraPlane': 'view',
+    'ViewCameraTarget': 'view',
+    'ViewCameraUp': 'view',
+    'ViewCPlane': 'view',
+    'ViewDisplayMode': 'view',
+    'ViewDisplayModeId': 'view',
+    'ViewDisplayModeName': 'view',
+    'ViewDisplayModes': 'view',
+    'ViewNames': 'view',
+    'ViewNearCorners': 'view',
+    'ViewProjection': 'view',
+    'ViewRadius': 'view',
+    'ViewSize': 'view',
+    'ViewSpeedTest': 'view',
+    'ViewTarget': 'view',
+    'ViewTitle': 'view',
+    'VisibleObjects': 'selection',
+    'Wallpaper': 'view',
+    'WallpaperGrayScale': 'view',
+    'WallpaperHidden': 'view',
+    'WindowHandle': 'application',
+    'WindowPick': 'selection',
+    'WorkingFolder': 'application',
+    'WorldXYPlane': 'plane',
+    'WorldYZPlane': 'plane',
+    'WorldZXPlane': 'plane',
+    'XformChangeBasis': 'transformation',
+    'XformChangeBasis2': 'transformation',
+    'XformCompare': 'transformation',
+    'XformCPlaneToWorld': 'transformation',
+    'XformDeterminant': 'transformation',
+    'XformDiagonal': 'transformation',
+    'XformIdentity': 'transformation',
+    'XformInverse': 'transformation',
+    'XformMirror': 'transformation',
+    'XformMultiply': 'transformation',
+    'XformPlanarProjection': 'transformation',
+    'XformRotation1': 'transformation',
+    'XformRotation2': 'transformation',
+    'XformRotation3': 'transformation',
+    'XformRotation4': 'transformation',
+    'XformScale': 'transformation',
+    'XformScreenToWorld': 'transformation',
+    'XformShear': 'transformation',
+    'XformTranslation': 'transformation',
+    'XformWorldToCPlane': 'transformation',
+    'XformWorldToScreen': 'transformation',
+    'XformZero': 'transformation',
+    'ZoomBoundingBox': 'view',
+    'ZoomExtents': 'view',
+    'ZoomSelected': 'view',
+}
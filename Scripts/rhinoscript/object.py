@@ -93,7 +93,7 @@ def DeleteObject(object_id):
     """
     object_id = rhutil.coerceguid(object_id, True)
     rc = scriptcontext.doc.Objects.Delete(object_id, True)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -116,7 +116,7 @@ def DeleteObjects(object_ids):
     for id in object_ids:
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.Delete(id, True): rc+=1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -186,7 +186,7 @@ def HideObjects(object_ids):
     for id in object_ids:
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.Hide(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -604,7 +604,7 @@ def LockObjects(object_ids):
     for id in object_ids:
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.Lock(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -637,7 +637,7 @@ def MatchObjectAttributes(target_ids, source_id=None):
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.ModifyAttributes(id, source_attr, True):
             rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -793,14 +793,14 @@ def ObjectColor(object_ids, color=None):
             attr.ObjectColor = color
             attr.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
             scriptcontext.doc.Objects.ModifyAttributes( rh_obj, attr, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return len(rhino_objects)
     rc = rhino_object.Attributes.DrawColor(scriptcontext.doc)
     attr = rhino_object.Attributes
     attr.ObjectColor = color
     attr.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
     scriptcontext.doc.Objects.ModifyAttributes( rhino_object, attr, True )
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -832,7 +832,7 @@ def ObjectColorSource(object_ids, source=None):
         if source is not None:
             rhobj.Attributes.ColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectColorSource, source)
             rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
     else:
         rc = 0
@@ -842,7 +842,7 @@ def ObjectColorSource(object_ids, source=None):
             rhobj.Attributes.ColorSource = source
             rhobj.CommitChanges()
             rc += 1
-        if rc: scriptcontext.doc.Views.Redraw()
+        if rc: scriptcontext.redraw()
         return rc
 
 
@@ -913,7 +913,7 @@ def ObjectLayer(object_id, layer=None):
             obj = rhutil.coercerhinoobject(id, True, True)
             obj.Attributes.LayerIndex = index
             obj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return len(object_id)
     obj = rhutil.coercerhinoobject(object_id, True, True)
     if obj is None: return scriptcontext.errorhandler()
@@ -924,7 +924,7 @@ def ObjectLayer(object_id, layer=None):
         index = layer.LayerIndex
         obj.Attributes.LayerIndex = index
         obj.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -962,7 +962,7 @@ def ObjectLayout(object_id, layout=None, return_name=True):
             rhobj.Attributes.Space = Rhino.DocObjects.ActiveSpace.ModelSpace
             rhobj.Attributes.ViewportId = System.Guid.Empty
             rhobj.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
     else:
         if layout:
             layout = scriptcontext.doc.Views.Find(layout, False)
@@ -970,7 +970,7 @@ def ObjectLayout(object_id, layout=None, return_name=True):
                 rhobj.Attributes.ViewportId = layout.MainViewport.Id
                 rhobj.Attributes.Space = Rhino.DocObjects.ActiveSpace.PageSpace
                 rhobj.CommitChanges()
-                scriptcontext.doc.Views.Redraw()
+                scriptcontext.redraw()
     return rc
 
 
@@ -1001,7 +1001,7 @@ def ObjectLinetype(object_ids, linetype=None):
             rhino_object.Attributes.LinetypeSource = Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject
             rhino_object.Attributes.LinetypeIndex = newindex
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return scriptcontext.doc.Linetypes[oldindex].Name
 
     newindex = scriptcontext.doc.Linetypes.Find(linetype)
@@ -1011,7 +1011,7 @@ def ObjectLinetype(object_ids, linetype=None):
         rhino_object.Attributes.LinetypeSource = Rhino.DocObjects.ObjectLinetypeSource.LinetypeFromObject
         rhino_object.Attributes.LinetypeIndex = newindex
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1044,14 +1044,14 @@ def ObjectLinetypeSource(object_ids, source=None):
             source = System.Enum.ToObject(Rhino.DocObjects.ObjectLinetypeSource, source)
             rhino_object.Attributes.LinetypeSource = source
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return int(oldsource)
     source = System.Enum.ToObject(Rhino.DocObjects.ObjectLinetypeSource, source)
     for id in object_ids:
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rhino_object.Attributes.LinetypeSource = source
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1209,7 +1209,7 @@ def ObjectPrintColor(object_ids, color=None):
             rhino_object.Attributes.PlotColorSource = Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
             rhino_object.Attributes.PlotColor = rhutil.coercecolor(color, True)
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
     for id in object_ids:
         color = rhutil.coercecolor(color, True)
@@ -1217,7 +1217,7 @@ def ObjectPrintColor(object_ids, color=None):
         rhino_object.Attributes.PlotColorSource = Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
         rhino_object.Attributes.PlotColor = color
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1248,13 +1248,13 @@ def ObjectPrintColorSource(object_ids, source=None):
         if source is not None:
             rhino_object.Attributes.PlotColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
     for id in object_ids:
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rhino_object.Attributes.PlotColorSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotColorSource, source)
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1285,14 +1285,14 @@ def ObjectPrintWidth(object_ids, width=None):
             rhino_object.Attributes.PlotWeightSource = Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject
             rhino_object.Attributes.PlotWeight = width
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
     for id in object_ids:
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rhino_object.Attributes.PlotWeightSource = Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject
         rhino_object.Attributes.PlotWeight = width
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1323,13 +1323,13 @@ def ObjectPrintWidthSource(object_ids, source=None):
         if source is not None:
             rhino_object.Attributes.PlotWeightSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
             rhino_object.CommitChanges()
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
         return rc
     for id in object_ids:
         rhino_object = rhutil.coercerhinoobject(id, True, True)
         rhino_object.Attributes.PlotWeightSource = System.Enum.ToObject(Rhino.DocObjects.ObjectPlotWeightSource, source)
         rhino_object.CommitChanges()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return len(object_ids)
 
 
@@ -1446,7 +1446,7 @@ def OrientObject(object_id, reference, target, flags=0):
         xform_final = xform_move * xform_scale * xform_rotate
     rc = scriptcontext.doc.Objects.Transform(object_id, xform_final, not copy)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1592,7 +1592,7 @@ def SelectObject(object_id, redraw=True):
     """
     rhobj = rhutil.coercerhinoobject(object_id, True, True)
     rhobj.Select(True)
-    if redraw: scriptcontext.doc.Views.Redraw()
+    if redraw: scriptcontext.redraw()
     return True
 
 
@@ -1621,7 +1621,7 @@ def SelectObjects( object_ids):
     rc = 0
     for id in object_ids:
         if SelectObject(id, False)==True: rc += 1
-    if rc > 0: scriptcontext.doc.Views.Redraw()
+    if rc > 0: scriptcontext.redraw()
     return rc
 
 
@@ -1739,7 +1739,7 @@ def ShowObjects(object_ids):
     for id in object_ids:
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.Show(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -1823,7 +1823,7 @@ def TransformObjects(object_ids, matrix, copy=False):
             else:
                 raise Exception("The {0} cannot be tranformed. A Guid or geometry types are expected.".format(type_of_id))
         if id!=System.Guid.Empty: rc.append(id)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -1874,7 +1874,7 @@ def UnlockObjects(object_ids):
     for id in object_ids:
         id = rhutil.coerceguid(id, True)
         if scriptcontext.doc.Objects.Unlock(id, False): rc += 1
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -1925,5 +1925,5 @@ def UnselectObjects(object_ids):
     for id in object_ids:
         obj = rhutil.coercerhinoobject(id, True, True)
         obj.Select(False)
-    if count: scriptcontext.doc.Views.Redraw()
+    if count: scriptcontext.redraw()
     return count
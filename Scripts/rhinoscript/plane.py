@@ -1,10 +1,13 @@
+import sys
 import math
+import itertools
 
 import Rhino.Geometry
 
 import scriptcontext
 
 from rhinoscript import utility as rhutil
+from rhinoscript.utility import __doublearray, __ispointstream
 
 
 def DistanceToPlane(plane, point):
@@ -248,10 +251,192 @@ def PlaneEquation(plane):
     return rc[0], rc[1], rc[2], rc[3]
 
 
+class PlaneFitAccumulator(object):
+    """Fits a plane to points that are added one chunk at a time, so point
+    sets that do not fit in memory can be streamed from generators or files.
+    Only the point count, the centroid and the covariance of the points are
+    kept, and accumulators filled by different workers can be merged.
+    Parameters:
+      points ([point, ...], optional): first chunk of points
+    Example:
+      import rhinoscriptsyntax as rs
+      fit = rs.PlaneFitAccumulator()
+      for chunk in chunks: fit.Add(chunk)
+      plane = fit.Plane()
+      print("rms deviation {}".format(fit.Deviation()))
+    See Also:
+      PlaneFitFromPoints
+      PointsAreCoplanar
+    """
+    def __init__(self, points=None):
+        self.Count = 0
+        self.mean = (0.0, 0.0, 0.0)
+        # sums of the products of deviations from the mean: xx, xy, xz, yy, yz, zz
+        self.moments = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        if points is not None: self.Add(points)
+
+    @staticmethod
+    def __chunk(points):
+        """Returns count, mean and moments of a chunk of points"""
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(points, numpy.ndarray):
+            xyz = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+            if not len(xyz): return 0, (0.0, 0.0, 0.0), (0.0,)*6
+            mean = xyz.mean(axis=0)
+            d = xyz - mean
+            m = d.T.dot(d)
+            return len(xyz), tuple(mean.tolist()), (m[0,0], m[0,1], m[0,2], m[1,1], m[1,2], m[2,2])
+        values = rhutil.SimplifyArray(points, True)
+        count = len(values)//3
+        if not count: return 0, (0.0, 0.0, 0.0), (0.0,)*6
+        xs, ys, zs = values[0::3], values[1::3], values[2::3]
+        mx, my, mz = sum(xs)/count, sum(ys)/count, sum(zs)/count
+        dx = [x-mx for x in xs]
+        dy = [y-my for y in ys]
+        dz = [z-mz for z in zs]
+        def dot(a, b): return sum(u*v for u, v in zip(a, b))
+        return count, (mx, my, mz), (dot(dx, dx), dot(dx, dy), dot(dx, dz), dot(dy, dy), dot(dy, dz), dot(dz, dz))
+
+    def __merge(self, count, mean, moments):
+        if not count: return self
+        total = self.Count + count
+        delta = [b-a for a, b in zip(self.mean, mean)]
+        f = float(self.Count)*count/total
+        dx, dy, dz = delta
+        cross = (dx*dx, dx*dy, dx*dz, dy*dy, dy*dz, dz*dz)
+        self.moments = tuple(a + b + c*f for a, b, c in zip(self.moments, moments, cross))
+        self.mean = tuple(a + d*count/total for a, d in zip(self.mean, delta))
+        self.Count = total
+        return self
+
+    def Add(self, points):
+        """Adds a chunk of points, a list of points or a float64 buffer of
+        x,y,z triples such as a NumPy (N,3) array
+        Returns:
+          PlaneFitAccumulator: this accumulator"""
+        return self.__merge(*PlaneFitAccumulator.__chunk(points))
+
+    def Merge(self, other):
+        """Adds the points accumulated by another PlaneFitAccumulator
+        Returns:
+          PlaneFitAccumulator: this accumulator"""
+        return self.__merge(other.Count, other.mean, other.moments)
+
+    def Centroid(self):
+        """Returns the average of the points as a Point3d"""
+        return Rhino.Geometry.Point3d(*self.mean)
+
+    @staticmethod
+    def __eigen(moments, sweeps=50):
+        """Jacobi eigen decomposition of the symmetric covariance matrix.
+        Returns the eigenvalues in increasing order and their eigenvectors"""
+        xx, xy, xz, yy, yz, zz = moments
+        a = [[xx, xy, xz], [xy, yy, yz], [xz, yz, zz]]
+        v = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        for sweep in range(sweeps):
+            if a[0][1]**2 + a[0][2]**2 + a[1][2]**2 < 1e-30*max(1.0, xx*xx + yy*yy + zz*zz): break
+            for p, q in ((0, 1), (0, 2), (1, 2)):
+                if a[p][q]==0.0: continue
+                theta = (a[q][q]-a[p][p])/(2.0*a[p][q])
+                t = math.copysign(1.0, theta)/(abs(theta)+math.sqrt(theta*theta+1.0))
+                c = 1.0/math.sqrt(t*t+1.0)
+                s = t*c
+                for k in range(3):
+                    akp, akq = a[k][p], a[k][q]
+                    a[k][p] = c*akp - s*akq
+                    a[k][q] = s*akp + c*akq
+                for k in range(3):
+                    apk, aqk = a[p][k], a[q][k]
+                    a[p][k] = c*apk - s*aqk
+                    a[q][k] = s*apk + c*aqk
+                for k in range(3):
+                    vkp, vkq = v[k][p], v[k][q]
+                    v[k][p] = c*vkp - s*vkq
+                    v[k][q] = s*vkp + c*vkq
+        order = sorted(range(3), key=lambda i: a[i][i])
+        return [max(0.0, a[i][i]) for i in order], [Rhino.Geometry.Vector3d(v[0][i], v[1][i], v[2][i]) for i in order]
+
+    @staticmethod
+    def __orient(vector):
+        """Flips vector so that its largest component is positive, which makes
+        the axes independent of the order in which points were added"""
+        components = (vector.X, vector.Y, vector.Z)
+        largest = max(components, key=abs)
+        if largest<0.0: vector.Reverse()
+        return vector
+
+    def Plane(self):
+        """Returns the plane fit through the points. The plane's origin is the
+        centroid, its x axis follows the direction in which the points spread
+        the most and its z axis the direction in which they spread the least.
+        Both axes are oriented so that their largest component is positive
+        Returns:
+          plane: the plane if successful
+          None: if there are fewer than 3 points or they are colinear"""
+        if self.Count<3: return None
+        values, vectors = PlaneFitAccumulator.__eigen(self.moments)
+        # colinear when the second spread is negligible next to the largest,
+        # which does not depend on the number of points or their scale
+        if values[2]<=0.0 or values[1]<=Rhino.RhinoMath.ZeroTolerance*values[2]: return None
+        normal = PlaneFitAccumulator.__orient(vectors[0])
+        x_axis = PlaneFitAccumulator.__orient(vectors[2])
+        y_axis = Rhino.Geometry.Vector3d.CrossProduct(normal, x_axis)
+        return Rhino.Geometry.Plane(self.Centroid(), x_axis, y_axis)
+
+    def Deviation(self):
+        """Returns the root mean square distance of the points to the fitted
+        plane, computed from the accumulated covariance"""
+        if self.Count<3: return 0.0
+        values, vectors = PlaneFitAccumulator.__eigen(self.moments)
+        return math.sqrt(values[0]/self.Count)
+
+    def MaximumDeviation(self, points):
+        """Returns the largest distance of a chunk of points to the fitted
+        plane. Call it again for every chunk, e.g. in a second pass over a
+        file, and take the maximum of the results
+        Returns:
+          number: the largest distance, 0 for an empty chunk"""
+        values, vectors = PlaneFitAccumulator.__eigen(self.moments)
+        normal = vectors[0]
+        nx, ny, nz = normal.X, normal.Y, normal.Z
+        cx, cy, cz = self.mean
+        offset = nx*cx + ny*cy + nz*cz
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(points, numpy.ndarray):
+            xyz = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+            if not len(xyz): return 0.0
+            return float(numpy.abs(xyz.dot([nx, ny, nz]) - offset).max())
+        values = rhutil.SimplifyArray(points, True)
+        if not values: return 0.0
+        return max(abs(nx*x + ny*y + nz*z - offset) for x, y, z in zip(values[0::3], values[1::3], values[2::3]))
+
+
+def __fitstreamed(points, chunk_size=65536):
+    """Runs a NumPy array, float64 buffer or iterable of points through a
+    PlaneFitAccumulator, reading iterables chunk_size points at a time"""
+    fit = PlaneFitAccumulator()
+    numpy = sys.modules.get("numpy")
+    if (numpy is not None and isinstance(points, numpy.ndarray)) or __doublearray(points) is not None:
+        return fit.Add(points)
+    iterator = iter(points)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk: return fit
+        fit.Add(chunk)
+
+
 def PlaneFitFromPoints(points):
     """Returns a plane that was fit through an array of 3D points.
+    Point3d arrays, other collections and lists of up to 65536 points are
+    fit by Rhino. Buffers, such as NumPy (N,3) arrays, generators and longer
+    lists are streamed through a PlaneFitAccumulator instead, so the points
+    never have to be held as Point3d. The streamed plane has the same origin
+    and the same normal up to its sign: its axes are oriented as described
+    in PlaneFitAccumulator.Plane, while Rhino's normal may point either way.
+    Its x axis follows the direction in which the points spread the most.
     Parameters:
-    points (point): An array of 3D points.
+    points (point): An array of 3D points, a float64 buffer of x,y,z triples
+      or an iterable of points
     Returns: 
       plane: The plane if successful
       None: if not successful
@@ -265,10 +450,13 @@ def PlaneFitFromPoints(points):
               magY = plane.YAxis.Length
               rs.AddPlaneSurface( plane, magX, magY )
     See Also:
+      PlaneFitAccumulator
       PlaneFromFrame
       PlaneFromNormal
       PlaneFromPoints
     """
+    if __ispointstream(points) or (type(points) in (list, tuple) and len(points)>65536):
+        return __fitstreamed(points).Plane()
     points = rhutil.coerce3dpointlist(points, True)
     rc, plane = Rhino.Geometry.Plane.FitPlaneToPoints(points)
     if rc==Rhino.Geometry.PlaneFitResult.Success: return plane
@@ -1,10 +1,17 @@
 import math
+import array
+
+import System
 
 import Rhino
 
 import scriptcontext
 
+import rhinocompat as compat
 from rhinoscript import utility as rhutil
+from rhinoscript.utility import __numpyarray, __doublearray, __objectboundingbox, __floatlist, __ispointstream
+from rhinoscript.utility import __point3darrayfrombuffer, __point3darraytodoubles
+from rhinoscript.plane import PlaneFitAccumulator
 
 
 def IsVectorParallelTo(vector1, vector2):
@@ -122,13 +129,251 @@ def PointAdd(point1, point2):
     return point1+point2
 
 
+class PointIndex(object):
+    """Spatial index of 3D points for repeated closest point queries. Build it
+    once and use it for any number of nearest, k-nearest and radius queries,
+    each of which only visits the grid cells around the query point. Points
+    can be inserted and removed after the index is built; indices of the
+    remaining points never change. The cells are sized for the points given
+    when the index is built. A query far out in empty space, such as between
+    a cluster and a distant outlier, visits every occupied cell once.
+    Parameters:
+      points ([point, ...], optional): points to index. Point i gets index i
+      cell_size (number, optional): width of the grid cells. If omitted, it is
+        chosen from the density of the points so that an occupied cell holds
+        about one point, also when the points are clustered
+    Example:
+      import rhinoscriptsyntax as rs
+      cloud = rs.PointCloudPoints(rs.GetObject("Select point cloud"))
+      index = rs.PointIndex(cloud)
+      print(index.ClosestIndex((0,0,0)))
+      print(index.ClosestIndices(rs.GetPoints(), 3))
+    See Also:
+      PointArrayClosestPoint
+    """
+    def __init__(self, points=None, cell_size=None):
+        self.xs = []
+        self.ys = []
+        self.zs = []
+        self.cells = {}
+        self.count = 0
+        self.bounds = None
+        points = rhutil.coerce3dpointlist(points, True) if points is not None else []
+        if cell_size is None: cell_size = self.__cellsize(points)
+        if cell_size<=0: raise ValueError("cell_size must be larger than 0")
+        self.cell_size = float(cell_size)
+        for point in points: self.Insert(point)
+
+    @staticmethod
+    def __cellsize(points):
+        """Cell width for about one point per occupied cell. The first guess
+        spreads the points evenly over their bounding box; while clustered
+        points still crowd into few cells it is shrunk by the occupancy, so
+        the cells follow the density of the points rather than their extent"""
+        if not points: return 1.0
+        box = Rhino.Geometry.BoundingBox(points)
+        extents = [e for e in (box.Max.X-box.Min.X, box.Max.Y-box.Min.Y, box.Max.Z-box.Min.Z) if e>Rhino.RhinoMath.ZeroTolerance]
+        if not extents: return 1.0
+        volume = 1.0
+        for extent in extents: volume *= extent
+        dimension = 1.0/len(extents)
+        size = (volume/len(points))**dimension
+        floor = math.floor
+        for attempt in compat.RANGE(8):
+            occupied = len(set((floor(p.X/size), floor(p.Y/size), floor(p.Z/size)) for p in points))
+            occupancy = float(len(points))/occupied
+            if occupancy<=2.0: break
+            size /= occupancy**dimension
+        return size
+
+    def __len__(self):
+        return self.count
+
+    def __cell(self, x, y, z):
+        size = self.cell_size
+        return (int(math.floor(x/size)), int(math.floor(y/size)), int(math.floor(z/size)))
+
+    def Insert(self, point):
+        """Adds a point to the index
+        Returns:
+          number: index of the new point"""
+        point = rhutil.coerce3dpoint(point, True)
+        index = len(self.xs)
+        self.xs.append(point.X)
+        self.ys.append(point.Y)
+        self.zs.append(point.Z)
+        key = self.__cell(point.X, point.Y, point.Z)
+        cell = self.cells.get(key)
+        if cell is None: self.cells[key] = [index]
+        else: cell.append(index)
+        if self.bounds is None: self.bounds = [list(key), list(key)]
+        else:
+            low, high = self.bounds
+            for axis in compat.RANGE(3):
+                if key[axis]<low[axis]: low[axis] = key[axis]
+                elif key[axis]>high[axis]: high[axis] = key[axis]
+        self.count += 1
+        return index
+
+    def Remove(self, index):
+        """Removes the point with the given index from the index
+        Returns:
+          bool: True if the point was removed, False if there was no such point"""
+        if index<0 or index>=len(self.xs) or self.xs[index] is None: return False
+        key = self.__cell(self.xs[index], self.ys[index], self.zs[index])
+        cell = self.cells[key]
+        cell.remove(index)
+        if not cell: del self.cells[key]
+        self.xs[index] = self.ys[index] = self.zs[index] = None
+        self.count -= 1
+        return True
+
+    def Point(self, index):
+        """Returns the point with the given index, or None if it was removed"""
+        if self.xs[index] is None: return None
+        return Rhino.Geometry.Point3d(self.xs[index], self.ys[index], self.zs[index])
+
+    def __rings(self, key):
+        """Yields the radius and the occupied cells of the square rings of
+        cells around key, up to the last ring that touches an occupied cell.
+        Once a ring spans more cells than are occupied, as it does across the
+        empty space between clusters, the remaining occupied cells are sorted
+        by ring instead and only the rings that hold any are yielded"""
+        if self.bounds is None: return
+        low, high = self.bounds
+        cx, cy, cz = key
+        outside = max(low[0]-cx, cx-high[0], low[1]-cy, cy-high[1], low[2]-cz, cz-high[2], 0)
+        last = max(cx-low[0], high[0]-cx, cy-low[1], high[1]-cy, cz-low[2], high[2]-cz)
+        cells = self.cells
+        for r in compat.RANGE(outside, last+1):
+            spans = [min(c+r, h)-max(c-r, l)+1 for c, l, h in zip(key, low, high)]
+            if spans[0]*spans[1]*spans[2]>len(cells):
+                rings = {}
+                for k, cell in cells.items():
+                    d = max(abs(k[0]-cx), abs(k[1]-cy), abs(k[2]-cz))
+                    if d>=r: rings.setdefault(d, []).append(cell)
+                for d in sorted(rings): yield d, rings[d]
+                return
+            found = []
+            for ix in compat.RANGE(max(cx-r, low[0]), min(cx+r, high[0])+1):
+                edge_x = ix==cx-r or ix==cx+r
+                for iy in compat.RANGE(max(cy-r, low[1]), min(cy+r, high[1])+1):
+                    if edge_x or iy==cy-r or iy==cy+r:
+                        zs = compat.RANGE(max(cz-r, low[2]), min(cz+r, high[2])+1)
+                    else:
+                        zs = [iz for iz in (cz-r, cz+r) if low[2]<=iz<=high[2]]
+                    for iz in zs:
+                        cell = cells.get((ix, iy, iz))
+                        if cell is not None: found.append(cell)
+            yield r, found
+
+    def __nearest(self, point, count):
+        point = rhutil.coerce3dpoint(point, True)
+        x, y, z = point.X, point.Y, point.Z
+        xs, ys, zs = self.xs, self.ys, self.zs
+        best = []
+        for r, cells in self.__rings(self.__cell(x, y, z)):
+            for cell in cells:
+                for i in cell:
+                    dx = xs[i]-x
+                    dy = ys[i]-y
+                    dz = zs[i]-z
+                    best.append((dx*dx+dy*dy+dz*dz, i))
+            if len(best)>=count:
+                best.sort()
+                del best[count:]
+                # points in the next rings are at least r cells away
+                limit = r*self.cell_size
+                if best[-1][0]<=limit*limit: break
+        best.sort()
+        return [i for d, i in best[:count]]
+
+    def __batch(self, points, query):
+        point = rhutil.coerce3dpoint(points)
+        if point is not None: return query(point)
+        return [query(point) for point in rhutil.coerce3dpointlist(points, True)]
+
+    def ClosestIndex(self, points):
+        """Finds the indexed point closest to a test point
+        Parameters:
+          points (point|[point, ...]): the test point, or a list of test points
+        Returns:
+          number: index of the closest point, None if the index is empty
+          list(number, ...): the index for each test point, if points is a list"""
+        def query(point):
+            rc = self.__nearest(point, 1)
+            if rc: return rc[0]
+        return self.__batch(points, query)
+
+    def ClosestIndices(self, points, count):
+        """Finds the indexed points closest to a test point
+        Parameters:
+          points (point|[point, ...]): the test point, or a list of test points
+          count (number): number of points to find
+        Returns:
+          list(number, ...): indices of the closest points, nearest first
+          list(list(number, ...), ...): the indices for each test point, if
+            points is a list"""
+        return self.__batch(points, lambda point: self.__nearest(point, count))
+
+    def IndicesInSphere(self, points, radius):
+        """Finds the indexed points that are no farther than radius from a
+        test point
+        Parameters:
+          points (point|[point, ...]): the test point, or a list of test points
+          radius (number): the search radius
+        Returns:
+          list(number, ...): indices of the points in the sphere, nearest first
+          list(list(number, ...), ...): the indices for each test point, if
+            points is a list"""
+        xs, ys, zs = self.xs, self.ys, self.zs
+        cells = self.cells
+        radius2 = radius*radius
+        def candidates(low, high):
+            # the cells of the sphere's box, clamped to the occupied cells. When
+            # the box spans more cells than are occupied, scan those instead
+            low = [max(low[axis], self.bounds[0][axis]) for axis in compat.RANGE(3)]
+            high = [min(high[axis], self.bounds[1][axis]) for axis in compat.RANGE(3)]
+            spans = [high[axis]-low[axis]+1 for axis in compat.RANGE(3)]
+            if min(spans)<=0: return
+            if spans[0]*spans[1]*spans[2]>len(cells):
+                for key, cell in cells.items():
+                    if low[0]<=key[0]<=high[0] and low[1]<=key[1]<=high[1] and low[2]<=key[2]<=high[2]:
+                        yield cell
+                return
+            for ix in compat.RANGE(low[0], high[0]+1):
+                for iy in compat.RANGE(low[1], high[1]+1):
+                    for iz in compat.RANGE(low[2], high[2]+1):
+                        cell = cells.get((ix, iy, iz))
+                        if cell is not None: yield cell
+        def query(point):
+            if self.bounds is None: return []
+            x, y, z = point.X, point.Y, point.Z
+            low = self.__cell(x-radius, y-radius, z-radius)
+            high = self.__cell(x+radius, y+radius, z+radius)
+            found = []
+            for cell in candidates(low, high):
+                for i in cell:
+                    dx = xs[i]-x
+                    dy = ys[i]-y
+                    dz = zs[i]-z
+                    d = dx*dx+dy*dy+dz*dz
+                    if d<=radius2: found.append((d, i))
+            found.sort()
+            return [i for d, i in found]
+        return self.__batch(points, query)
+
+
 def PointArrayClosestPoint(points, test_point):
     """Finds the point in a list of 3D points that is closest to a test point
     Parameters:
-      points ([point, ...]): list of points
-      test_point (point): the point to compare against
+      points ([point, ...]): list of points, or a PointIndex built from them,
+        which makes repeated queries against the same points much faster
+      test_point (point): the point to compare against, or with a PointIndex
+        a list of points to compare against
     Returns:
       number: index of the element in the point list that is closest to the test point
+      list(number, ...): the index for each test point if test_point is a list
     Example:
       import rhinoscriptsyntax as rs
       cloud = rs.GetObject("Select point cloud")
@@ -142,21 +387,74 @@ def PointArrayClosestPoint(points, test_point):
                   rs.SelectObject( point_id )
     See Also:
       CurveClosestPoint
+      PointIndex
       SurfaceClosestPoint
     """
+    if isinstance(points, PointIndex): return points.ClosestIndex(test_point)
     points = rhutil.coerce3dpointlist(points, True)
     test_point = rhutil.coerce3dpoint(test_point, True)
     index = Rhino.Collections.Point3dList.ClosestIndexInList(points, test_point)
     if index>=0: return index
 
 
-def PointArrayTransform(points, xform):
+def __xformmatrix(xform):
+    "Returns the 16 values of a transform in row major order"
+    return [xform[i,j] for i in compat.RANGE(4) for j in compat.RANGE(4)]
+
+
+def __transformnumpy(numpy, points, m, in_place):
+    if points.size%3 or not (points.ndim==1 or points.shape[-1]==3):
+        raise ValueError("points must be an (N,3) array or a flat array of x,y,z triples")
+    if in_place and points.dtype.kind!='f':
+        raise TypeError("in_place requires a floating point array, not %s" % points.dtype)
+    matrix = numpy.array(m, dtype=numpy.float64).reshape(4, 4)
+    xyz = points.reshape(-1, 3)
+    rc = xyz.dot(matrix[:3,:3].T)
+    rc += matrix[:3,3]
+    if matrix[3].tolist()!=[0.0, 0.0, 0.0, 1.0]:
+        w = xyz.dot(matrix[3,:3]) + matrix[3,3]
+        nonzero = w!=0.0
+        scale = numpy.zeros_like(w)
+        numpy.divide(1.0, w, out=scale, where=nonzero)
+        rc *= scale[:,None]
+    if not in_place: return rc.reshape(points.shape)
+    points[...] = rc.reshape(points.shape)
+    return points
+
+
+def __transformbuffer(points, xform, in_place):
+    """Transforms a float64 buffer of x,y,z triples by copying it into a
+    Point3d[] and transforming that in one RhinoCommon call, so no python
+    code runs per point. Returns None if points is not such a buffer"""
+    transformed = __point3darrayfrombuffer(points)
+    if transformed is None: return None
+    transformed = xform.TransformList(transformed)
+    if not in_place: return __point3darraytodoubles(transformed)
+    if isinstance(points, array.array) or isinstance(points, System.Array[System.Double]):
+        return __point3darraytodoubles(transformed, points)
+    view = memoryview(points)
+    if view.readonly: raise ValueError("in_place requires a writable buffer")
+    __point3darraytodoubles(transformed, view)
+    return points
+
+
+def PointArrayTransform(points, xform, in_place=False):
     """Transforms a list of 3D points
+    Large point sets can be passed as contiguous float64 buffers of x,y,z
+    triples: NumPy arrays of shape (N,3) or (3N,), array.array('d'),
+    memoryviews or double[]. These are transformed in one operation without
+    running python code per point.
     Parameters:
-      points ([point, ...]): list of 3D points
+      points ([point, ...]): list of 3D points or a float64 buffer
       xform (transform): transformation to apply
+      in_place (bool, optional): if True, the transformed points are written
+        back into points, which must then be a list, a writable buffer or a
+        NumPy array of floating point numbers
     Returns:
       list(point, ...): transformed points on success
+      NumPy array: transformed coordinates if points is a NumPy array
+      array('d'): transformed coordinates if points is any other buffer
+      points: the same object, when in_place is True
     Example:
       import rhinoscriptsyntax as rs
       obj = rs.GetObject("Select object")
@@ -166,19 +464,78 @@ def PointArrayTransform(points, xform):
       rs.AddPoints(points)
     See Also:
       PointArrayClosestPoint
+      PointTransform
     """
-    points = rhutil.coerce3dpointlist(points, True)
     xform = rhutil.coercexform(xform, True)
-    return [xform*point for point in points]
+    numpy = __numpyarray(points)
+    if numpy is not None: return __transformnumpy(numpy, points, __xformmatrix(xform), in_place)
+    rc = __transformbuffer(points, xform, in_place)
+    if rc is not None: return rc
+    if in_place and type(points) is not list:
+        raise ValueError("in_place requires a list or a writable buffer")
+    rc = [xform*point for point in rhutil.coerce3dpointlist(points, True)]
+    if not in_place: return rc
+    points[:] = rc
+    return points
+
+
+def __geometryclosestpoint(point, geometry):
+    """Returns the point on geometry closest to point, or None"""
+    if isinstance(geometry, Rhino.Geometry.Point): return geometry.Location
+    if isinstance(geometry, Rhino.Geometry.PointCloud):
+        index = geometry.ClosestPoint(point)
+        if index>=0: return geometry[index].Location
+        return None
+    if isinstance(geometry, Rhino.Geometry.Curve):
+        rc, t = geometry.ClosestPoint(point)
+        if rc: return geometry.PointAt(t)
+        return None
+    if isinstance(geometry, Rhino.Geometry.Brep) or isinstance(geometry, Rhino.Geometry.Mesh):
+        return geometry.ClosestPoint(point)
+    return None
+
+
+def __closestobject(point, candidates):
+    """Finds the closest of candidates, a list of (id, geometry, bounds) where
+    bounds are the min and max x, y and z of the object's bounding box.
+    Candidates are visited by increasing bounding box distance and the exact
+    closest point is only computed while a box is nearer than the best
+    object found so far. Ties go to the earlier candidate, as if all of them
+    had been tested in order"""
+    x, y, z = point.X, point.Y, point.Z
+    order = []
+    for i, (id, geometry, (x0, y0, z0, x1, y1, z1)) in enumerate(candidates):
+        dx = x0-x if x<x0 else (x-x1 if x>x1 else 0.0)
+        dy = y0-y if y<y0 else (y-y1 if y>y1 else 0.0)
+        dz = z0-z if z<z0 else (z-z1 if z>z1 else 0.0)
+        order.append((dx*dx+dy*dy+dz*dz, i))
+    order.sort()
+    closest = None
+    for lower_bound, i in order:
+        if closest is not None and lower_bound>closest[0]*closest[0]: break
+        id, geometry, bounds = candidates[i]
+        location = __geometryclosestpoint(point, geometry)
+        if location is None: continue
+        distance = point.DistanceTo(location)
+        if closest is None or distance<closest[0] or (distance==closest[0] and i<closest[1]):
+            closest = distance, i, id, location
+    if closest: return closest[2], closest[3]
 
 
 def PointClosestObject(point, object_ids):
     """Finds the object that is closest to a test point
+    Objects are pruned by bounding box distance first, so the exact closest
+    point is only computed for objects that can be closer than the best one
+    found so far. Inside an objectcache or batch block the bounding boxes are
+    cached per object.
     Parameters:
-      point (point): point to test
+      point (point): point to test, or a list of points to test against the
+        same objects
       object_id ([guid, ...]): identifiers of one or more objects
     Returns:
       list(guid, point): closest [0] object_id and [1] point on object on success
+      list(list(guid, point), ...): the closest object and point for each test
+        point, if point is a list of points
       None: on failure
     Example:
       import rhinoscriptsyntax as rs
@@ -194,47 +551,15 @@ def PointClosestObject(point, object_ids):
       CurveClosestObject
     """
     object_ids = rhutil.coerceguidlist(object_ids)
-    point = rhutil.coerce3dpoint(point, True)
-    closest = None
+    candidates = []
     for id in object_ids:
-        geom = rhutil.coercegeometry(id, True)
-        point_geometry = geom
-        if isinstance(point_geometry, Rhino.Geometry.Point):
-            distance = point.DistanceTo( point_geometry.Location )
-            if closest is None or distance<closest[0]:
-                closest = distance, id, point_geometry.Location
-            continue
-        point_cloud = geom
-        if isinstance(point_cloud, Rhino.Geometry.PointCloud):
-            index = point_cloud.ClosestPoint(point)
-            if index>=0:
-                distance = point.DistanceTo( point_cloud[index].Location )
-                if closest is None or distance<closest[0]:
-                    closest = distance, id, point_cloud[index].Location
-            continue
-        curve = geom
-        if isinstance(curve, Rhino.Geometry.Curve):
-            rc, t = curve.ClosestPoint(point)
-            if rc:
-                distance = point.DistanceTo( curve.PointAt(t) )
-                if closest is None or distance<closest[0]:
-                    closest = distance, id, curve.PointAt(t)
-            continue
-        brep = geom
-        if isinstance(brep, Rhino.Geometry.Brep):
-            brep_closest = brep.ClosestPoint(point)
-            distance = point.DistanceTo( brep_closest )
-            if closest is None or distance<closest[0]:
-                closest = distance, id, brep_closest
-            continue
-        mesh = geom
-        if isinstance(mesh, Rhino.Geometry.Mesh):
-            mesh_closest = mesh.ClosestPoint(point)
-            distance = point.DistanceTo( mesh_closest )
-            if closest is None or distance<closest[0]:
-                closest = distance, id, mesh_closest
-            continue
-    if closest: return closest[1], closest[2]
+        geometry = rhutil.coercegeometry(id, True)
+        bbox = __objectboundingbox(id, geometry)
+        bounds = bbox.Min.X, bbox.Min.Y, bbox.Min.Z, bbox.Max.X, bbox.Max.Y, bbox.Max.Z
+        candidates.append((id, geometry, bounds))
+    test_point = rhutil.coerce3dpoint(point)
+    if test_point is not None: return __closestobject(test_point, candidates)
+    return [__closestobject(test_point, candidates) for test_point in rhutil.coerce3dpointlist(point, True)]
 
 
 def PointCompare(point1, point2, tolerance=None):
@@ -289,7 +614,8 @@ def PointDivide(point, divide):
 def PointsAreCoplanar(points, tolerance=1.0e-12):
     """Verifies that a list of 3D points are coplanar
     Parameters:
-      points ([point, ...]): 3D points to test
+      points ([point, ...]): 3D points to test, a float64 buffer of x,y,z
+        triples such as a NumPy (N,3) array, or an iterable of points
       tolerance (number, optional): tolerance to use when verifying
     Returns:
       bool: True or False
@@ -310,8 +636,17 @@ def PointsAreCoplanar(points, tolerance=1.0e-12):
     See Also:
       IsPoint
       IsPointCloud
+      PlaneFitAccumulator
       PointCoordinates
     """
+    if __ispointstream(points):
+        # fit and check the coordinates directly, generators are read once
+        # into a flat array of doubles instead of a list of Point3d
+        if __numpyarray(points) is None and __doublearray(points) is None:
+            points = rhutil.SimplifyArray(points, True)
+        fit = PlaneFitAccumulator(points)
+        if fit.Count<3: return True
+        return fit.MaximumDeviation(points)<=tolerance
     points = rhutil.coerce3dpointlist(points, True)
     return Rhino.Geometry.Point3d.ArePointsCoplanar(points, tolerance)
 
@@ -366,10 +701,12 @@ def PointSubtract(point1, point2):
 def PointTransform(point, xform):
     """Transforms a 3D point
     Parameters:
-      point (point): the point to transform
+      point (point): the point to transform. A NumPy array of shape (N,3) is
+        transformed row by row in one operation, see PointArrayTransform
       xform (transform): a valid 4x4 transformation matrix
     Returns:
       vector: transformed vector on success
+      NumPy array: transformed rows if point is an (N,3) NumPy array
     Example:
       # Translate (move) objects by (10,10,0)
       import rhinoscriptsyntax as rs
@@ -381,9 +718,13 @@ def PointTransform(point, xform):
       PointAdd
       PointCompare
       PointDivide
+      PointArrayTransform
       PointScale
       PointSubtract
     """
+    numpy = __numpyarray(point)
+    if numpy is not None and point.ndim==2:
+        return __transformnumpy(numpy, point, __xformmatrix(rhutil.coercexform(xform, True)), False)
     point = rhutil.coerce3dpoint(point, True)
     xform = rhutil.coercexform(xform, True)
     return xform*point
@@ -823,11 +1164,398 @@ def VectorUnitize(vector):
     if rc.Unitize(): return rc
 
 
-def PointArrayBoundingBox(points, view_or_plane=None, in_world_coords=True):
+def __batchinput(vectors):
+    """Returns (numpy, kind, data) for a list of vectors or a float64 buffer of
+    x,y,z triples. data is an (N,3) array for NumPy input, otherwise x, y and
+    z columns and kind tells whether the result should be a "buffer" or a
+    "list"
+    """
+    numpy = __numpyarray(vectors)
+    if numpy is not None:
+        if vectors.size%3: raise ValueError("vectors must be an (N,3) array")
+        return numpy, "numpy", numpy.asarray(vectors, dtype=numpy.float64).reshape(-1, 3)
+    values = __doublearray(vectors)
+    if values is not None:
+        if len(values)%3: raise ValueError("buffer length must be a multiple of 3")
+        return None, "buffer", (values[0::3], values[1::3], values[2::3])
+    Vector3d = Rhino.Geometry.Vector3d
+    vectors = [v if type(v) is Vector3d else rhutil.coerce3dvector(v, True) for v in vectors]
+    return None, "list", ([v.X for v in vectors], [v.Y for v in vectors], [v.Z for v in vectors])
+
+
+def __batchoperand(vector, numpy, count):
+    """Returns the second operand of a batch function like the first one. A
+    single vector is repeated for every vector of the first operand"""
+    single = None
+    if __numpyarray(vector) is not None:
+        if vector.ndim==1 and vector.size==3: single = Rhino.Geometry.Vector3d(*vector.tolist())
+    elif type(vector) is list or type(vector) is tuple or __doublearray(vector) is None:
+        single = rhutil.coerce3dvector(vector)
+    if single is not None:
+        if numpy is not None: return numpy.array([single.X, single.Y, single.Z])
+        return [single.X]*count, [single.Y]*count, [single.Z]*count
+    if numpy is not None:
+        if __numpyarray(vector) is None: vector = rhutil.SimplifyArray(vector)
+        rc = numpy.asarray(vector, dtype=numpy.float64).reshape(-1, 3)
+    else:
+        rc = __batchinput(vector)[2]
+        if __numpyarray(rc) is not None: rc = rc[:,0].tolist(), rc[:,1].tolist(), rc[:,2].tolist()
+    if len(rc[0] if numpy is None else rc)!=count: raise ValueError("vector arrays must have the same length")
+    return rc
+
+
+def __batchvectors(kind, xs, ys, zs):
+    if kind=="list":
+        Vector3d = Rhino.Geometry.Vector3d
+        return [Vector3d(x, y, z) for x, y, z in zip(xs, ys, zs)]
+    rc = array.array('d', [0.0])*(3*len(xs))
+    rc[0::3] = array.array('d', xs)
+    rc[1::3] = array.array('d', ys)
+    rc[2::3] = array.array('d', zs)
+    return rc
+
+
+def __batchnumbers(kind, values):
+    if kind=="list": return values
+    return array.array('d', [float('nan') if v is None else v for v in values])
+
+
+def VectorArrayAdd(vectors1, vectors2):
+    """Adds 3D vectors pairwise in one call. See VectorAdd
+    The vectors can be lists of vectors or float64 buffers of x,y,z triples,
+    like NumPy (N,3) arrays and array.array('d'), which are processed one
+    coordinate column at a time instead of creating a Vector3d per vector.
+    This holds for all VectorArray functions
+    Parameters:
+      vectors1 ([vector, ...]): the first vectors
+      vectors2 ([vector, ...]|vector): the vectors to add, the same number
+        as vectors1, or a single vector to add to each of them
+    Returns:
+      list(vector, ...): the sums if vectors1 is a list
+      NumPy array: (N,3) sums if vectors1 is a NumPy array
+      array('d'): the sums if vectors1 is any other buffer
+    Example:
+      import rhinoscriptsyntax as rs
+      vectors = rs.VectorArrayAdd([(1,0,0), (0,1,0)], (0,0,1))
+      print(vectors)
+    See Also:
+      VectorAdd
+      VectorArraySubtract
+    """
+    numpy, kind, a = __batchinput(vectors1)
+    b = __batchoperand(vectors2, numpy, len(a[0]) if numpy is None else len(a))
+    if numpy is not None: return a + b
+    return __batchvectors(kind, [x+u for x, u in zip(a[0], b[0])], [y+v for y, v in zip(a[1], b[1])],
+        [z+w for z, w in zip(a[2], b[2])])
+
+
+def VectorArraySubtract(vectors1, vectors2):
+    """Subtracts 3D vectors pairwise in one call. See VectorSubtract
+    Parameters:
+      vectors1 ([vector, ...]): the vectors to subtract from
+      vectors2 ([vector, ...]|vector): the vectors to subtract, the same
+        number as vectors1, or a single vector to subtract from each of them
+    Returns:
+      list(vector, ...)|NumPy array|array('d'): the differences, in the form
+        of vectors1 as described in VectorArrayAdd
+    Example:
+      import rhinoscriptsyntax as rs
+      vectors = rs.VectorArraySubtract([(1,0,0), (0,1,0)], (0,0,1))
+      print(vectors)
+    See Also:
+      VectorArrayAdd
+      VectorSubtract
+    """
+    numpy, kind, a = __batchinput(vectors1)
+    b = __batchoperand(vectors2, numpy, len(a[0]) if numpy is None else len(a))
+    if numpy is not None: return a - b
+    return __batchvectors(kind, [x-u for x, u in zip(a[0], b[0])], [y-v for y, v in zip(a[1], b[1])],
+        [z-w for z, w in zip(a[2], b[2])])
+
+
+def VectorArrayDotProduct(vectors1, vectors2):
+    """Calculates the dot products of 3D vectors pairwise in one call. See
+    VectorDotProduct
+    Parameters:
+      vectors1 ([vector, ...]): the first vectors
+      vectors2 ([vector, ...]|vector): the second vectors, the same number as
+        vectors1, or a single vector
+    Returns:
+      list(number, ...): the dot products if vectors1 is a list
+      NumPy array: 1-D array of dot products if vectors1 is a NumPy array
+      array('d'): the dot products if vectors1 is any other buffer
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayDotProduct([(1,0,0), (1,1,0)], (1,0,0)))
+    See Also:
+      VectorArrayCrossProduct
+      VectorDotProduct
+    """
+    numpy, kind, a = __batchinput(vectors1)
+    b = __batchoperand(vectors2, numpy, len(a[0]) if numpy is None else len(a))
+    if numpy is not None: return (a*b).sum(axis=1)
+    return __batchnumbers(kind, [x*u+y*v+z*w for x, y, z, u, v, w in zip(a[0], a[1], a[2], b[0], b[1], b[2])])
+
+
+def VectorArrayCrossProduct(vectors1, vectors2):
+    """Calculates the cross products of 3D vectors pairwise in one call. See
+    VectorCrossProduct
+    Parameters:
+      vectors1 ([vector, ...]): the first vectors
+      vectors2 ([vector, ...]|vector): the second vectors, the same number as
+        vectors1, or a single vector
+    Returns:
+      list(vector, ...)|NumPy array|array('d'): the cross products, in the
+        form of vectors1 as described in VectorArrayAdd
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayCrossProduct([(1,0,0), (0,1,0)], (0,0,1)))
+    See Also:
+      VectorArrayDotProduct
+      VectorCrossProduct
+    """
+    numpy, kind, a = __batchinput(vectors1)
+    b = __batchoperand(vectors2, numpy, len(a[0]) if numpy is None else len(a))
+    if numpy is not None: return numpy.cross(a, b)
+    xs, ys, zs = a
+    us, vs, ws = b
+    return __batchvectors(kind, [y*w-z*v for y, z, v, w in zip(ys, zs, vs, ws)],
+        [z*u-x*w for x, z, u, w in zip(xs, zs, us, ws)], [x*v-y*u for x, y, u, v in zip(xs, ys, us, vs)])
+
+
+def VectorArrayLength(vectors):
+    """Returns the lengths of 3D vectors in one call. See VectorLength
+    Parameters:
+      vectors ([vector, ...]): the vectors
+    Returns:
+      list(number, ...)|NumPy array|array('d'): the lengths, in the form of
+        vectors as described in VectorArrayDotProduct
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayLength([(3,4,0), (0,0,2)]))
+    See Also:
+      VectorArrayUnitize
+      VectorLength
+    """
+    numpy, kind, a = __batchinput(vectors)
+    if numpy is not None: return numpy.sqrt((a*a).sum(axis=1))
+    sqrt = math.sqrt
+    return __batchnumbers(kind, [sqrt(x*x+y*y+z*z) for x, y, z in zip(*a)])
+
+
+def VectorArrayUnitize(vectors):
+    """Unitizes 3D vectors in one call. See VectorUnitize. Zero vectors can
+    not be unitized and are returned unchanged
+    Parameters:
+      vectors ([vector, ...]): the vectors to unitize
+    Returns:
+      list(vector, ...)|NumPy array|array('d'): the unitized vectors, in the
+        form of vectors as described in VectorArrayAdd
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayUnitize([(3,4,0), (0,0,2)]))
+    See Also:
+      VectorArrayLength
+      VectorUnitize
+    """
+    numpy, kind, a = __batchinput(vectors)
+    if numpy is not None:
+        length = numpy.sqrt((a*a).sum(axis=1))
+        scale = numpy.ones_like(length)
+        numpy.divide(1.0, length, out=scale, where=length>0.0)
+        return a*scale[:,None]
+    sqrt = math.sqrt
+    scales = [sqrt(x*x+y*y+z*z) for x, y, z in zip(*a)]
+    scales = [1.0/length if length>0.0 else 1.0 for length in scales]
+    return __batchvectors(kind, [x*f for x, f in zip(a[0], scales)], [y*f for y, f in zip(a[1], scales)],
+        [z*f for z, f in zip(a[2], scales)])
+
+
+def VectorArrayAngle(vectors1, vectors2):
+    """Returns the angles, in degrees, between 3D vectors pairwise in one
+    call. See VectorAngle
+    Parameters:
+      vectors1 ([vector, ...]): the first vectors
+      vectors2 ([vector, ...]|vector): the second vectors, the same number as
+        vectors1, or a single vector
+    Returns:
+      list(number, ...)|NumPy array|array('d'): the angles, in the form of
+        vectors1 as described in VectorArrayDotProduct. The angle is None in
+        lists, and nan in arrays, where either vector can not be unitized
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayAngle([(1,0,0), (1,1,0)], (0,1,0)))
+    See Also:
+      VectorAngle
+      VectorArrayDotProduct
+    """
+    numpy, kind, a = __batchinput(vectors1)
+    b = __batchoperand(vectors2, numpy, len(a[0]) if numpy is None else len(a))
+    if numpy is not None:
+        b = numpy.broadcast_to(b, a.shape)
+        lengths = numpy.sqrt((a*a).sum(axis=1)*(b*b).sum(axis=1))
+        valid = lengths>0.0
+        dot = numpy.full(len(a), numpy.nan)
+        numpy.divide((a*b).sum(axis=1), lengths, out=dot, where=valid)
+        return numpy.degrees(numpy.arccos(numpy.clip(dot, -1.0, 1.0)))
+    sqrt = math.sqrt
+    acos = math.acos
+    degrees = math.degrees
+    rc = []
+    for x, y, z, u, v, w in zip(a[0], a[1], a[2], b[0], b[1], b[2]):
+        lengths = sqrt((x*x+y*y+z*z)*(u*u+v*v+w*w))
+        if lengths>0.0: rc.append(degrees(acos(max(-1.0, min(1.0, (x*u+y*v+z*w)/lengths)))))
+        else: rc.append(None)
+    return __batchnumbers(kind, rc)
+
+
+def VectorArrayRotate(vectors, angle_degrees, axis):
+    """Rotates 3D vectors about an axis in one call. See VectorRotate
+    Parameters:
+      vectors ([vector, ...]): the vectors to rotate
+      angle_degrees (number|[number, ...]): rotation angle, or one angle for
+        each vector. A ValueError is raised if the number of angles differs
+        from the number of vectors
+      axis (vector): axis of rotation
+    Returns:
+      list(vector, ...)|NumPy array|array('d'): the rotated vectors, in the
+        form of vectors as described in VectorArrayAdd
+    Example:
+      import rhinoscriptsyntax as rs
+      print(rs.VectorArrayRotate([(1,0,0), (0,1,0)], 90.0, (0,0,1)))
+    See Also:
+      VectorArrayTransform
+      VectorRotate
+    """
+    numpy, kind, a = __batchinput(vectors)
+    axis = rhutil.coerce3dvector(axis, True)
+    axis = Rhino.Geometry.Vector3d(axis.X, axis.Y, axis.Z)
+    if not axis.Unitize(): raise ValueError("unable to unitize axis")
+    kx, ky, kz = axis.X, axis.Y, axis.Z
+    if numpy is not None:
+        angles = numpy.radians(numpy.asarray(angle_degrees, dtype=numpy.float64))
+        if angles.ndim:
+            if angles.shape!=(len(a),): raise ValueError("expected one angle for each vector")
+            angles = angles[:,None]
+        k = numpy.array([kx, ky, kz])
+        return a*numpy.cos(angles) + numpy.cross(k, a)*numpy.sin(angles) + numpy.outer(a.dot(k), k)*(1.0-numpy.cos(angles))
+    count = len(a[0])
+    if isinstance(angle_degrees, (int, float)): angles = [angle_degrees]*count
+    else:
+        angles = __floatlist(angle_degrees)
+        if len(angles)!=count: raise ValueError("expected one angle for each vector")
+    xs, ys, zs = [], [], []
+    for x, y, z, angle in zip(a[0], a[1], a[2], angles):
+        # Rodrigues' rotation formula
+        radians = math.radians(angle)
+        c = math.cos(radians)
+        s = math.sin(radians)
+        d = (kx*x+ky*y+kz*z)*(1.0-c)
+        xs.append(x*c + (ky*z-kz*y)*s + kx*d)
+        ys.append(y*c + (kz*x-kx*z)*s + ky*d)
+        zs.append(z*c + (kx*y-ky*x)*s + kz*d)
+    return __batchvectors(kind, xs, ys, zs)
+
+
+def VectorArrayTransform(vectors, xform):
+    """Transforms 3D vectors in one call. See VectorTransform. Like
+    VectorTransform, the translation part of the transformation is ignored
+    Parameters:
+      vectors ([vector, ...]): the vectors to transform
+      xform (transform): the transformation matrix
+    Returns:
+      list(vector, ...)|NumPy array|array('d'): the transformed vectors, in
+        the form of vectors as described in VectorArrayAdd
+    Example:
+      import rhinoscriptsyntax as rs
+      xform = rs.XformRotation2(90.0, (0,0,1), (0,0,0))
+      print(rs.VectorArrayTransform([(1,0,0), (0,1,0)], xform))
+    See Also:
+      PointArrayTransform
+      VectorTransform
+    """
+    numpy, kind, a = __batchinput(vectors)
+    xform = rhutil.coercexform(xform, True)
+    m = __xformmatrix(xform)
+    if numpy is not None:
+        matrix = numpy.array(m, dtype=numpy.float64).reshape(4, 4)
+        return a.dot(matrix[:3,:3].T)
+    m00, m01, m02, m03, m10, m11, m12, m13, m20, m21, m22, m23 = m[:12]
+    xs, ys, zs = a
+    return __batchvectors(kind, [m00*x + m01*y + m02*z for x, y, z in zip(xs, ys, zs)],
+        [m10*x + m11*y + m12*z for x, y, z in zip(xs, ys, zs)], [m20*x + m21*y + m22*z for x, y, z in zip(xs, ys, zs)])
+
+
+def __pointchunks(points, chunk_size):
+    """Yields the points as chunks of at most chunk_size points. A chunk is an
+    (N,3) NumPy array, a flat array.array('d') or a list of Point3d. points
+    can be a list of points, a float64 buffer, or an iterable of points,
+    chunks and numbers. The numbers of an iterable are read as a flat stream
+    of x,y,z coordinates, like a buffer"""
+    numpy = __numpyarray(points)
+    if numpy is not None:
+        xyz = points.reshape(-1, 3)
+        for start in compat.RANGE(0, len(xyz), chunk_size): yield xyz[start:start+chunk_size]
+        return
+    if type(points) is list or type(points) is tuple:
+        points = rhutil.coerce3dpointlist(points)
+        if points: yield points
+        return
+    values = __doublearray(points)
+    if values is not None:
+        if len(values)%3: raise ValueError("buffer length must be a multiple of 3")
+        for start in compat.RANGE(0, len(values), 3*chunk_size): yield values[start:start+3*chunk_size]
+        return
+    pending = []
+    coordinates = array.array('d')
+    count = 0
+    for item in points:
+        if isinstance(item, (int, float)):
+            coordinates.append(item)
+            count += 1
+            if len(coordinates)<3*chunk_size: continue
+            yield coordinates
+            coordinates = array.array('d')
+            continue
+        point = rhutil.coerce3dpoint(item)
+        if point is not None:
+            pending.append(point)
+            if len(pending)<chunk_size: continue
+            yield pending
+            pending = []
+            continue
+        for chunk in __pointchunks(item, chunk_size): yield chunk
+    if count%3: raise ValueError("number of coordinates must be a multiple of 3")
+    if coordinates: yield coordinates
+    if pending: yield pending
+
+
+def __chunkbounds(chunk):
+    """Returns [min x, min y, min z, max x, max y, max z] of a chunk"""
+    numpy = __numpyarray(chunk)
+    if numpy is not None:
+        if not len(chunk): return None
+        return chunk.min(axis=0).tolist() + chunk.max(axis=0).tolist()
+    if not chunk: return None
+    if isinstance(chunk, array.array):
+        xs, ys, zs = chunk[0::3], chunk[1::3], chunk[2::3]
+        return [min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)]
+    bbox = Rhino.Geometry.BoundingBox(chunk)
+    return [bbox.Min.X, bbox.Min.Y, bbox.Min.Z, bbox.Max.X, bbox.Max.Y, bbox.Max.Z]
+
+
+def PointArrayBoundingBox(points, view_or_plane=None, in_world_coords=True, chunk_size=65536):
     """Returns either a world axis-aligned or a construction plane axis-aligned 
     bounding box of an array of 3-D point locations.
+    The points are reduced chunk_size points at a time, so iterators and
+    buffers larger than memory allows for Point3d lists can be measured. The
+    world axis-aligned boxes of separate shards of points combine exactly:
+    passing the corners of all of them gives the box of all points, and
+    passing them with a plane gives the plane-aligned box.
     Parameters:
-      points ([point, ...]): A list of 3-D points
+      points ([point, ...]): A list of 3-D points, a float64 buffer of x,y,z
+          triples such as a NumPy (N,3) array, or an iterable of points,
+          chunks of points (lists of points or buffers) or x,y,z coordinates
       view_or_plane (str|plane, optional): Title or id of the view that contains the
           construction plane to which the bounding box should be aligned -or-
           user defined plane. If omitted, a world axis-aligned bounding box
@@ -835,19 +1563,29 @@ def PointArrayBoundingBox(points, view_or_plane=None, in_world_coords=True):
       in_world_coords (bool, optional): return the bounding box as world coordinates or
           construction plane coordinates. Note, this option does not apply to
           world axis-aligned bounding boxes.
+      chunk_size (number, optional): number of points reduced at a time
     Returns:
       list(point, ....): Eight points that define the bounding box. Points returned in counter-
       clockwise order starting with the bottom rectangle of the box.
       None: on error
     Example:
-      
+      import rhinoscriptsyntax as rs
+      def read_points(filename):
+          with open(filename) as f:
+              for line in f: yield [float(c) for c in line.split(",")]
+      box = rs.PointArrayBoundingBox(read_points("scan.xyz"))
     See Also:
       BoundingBox
     """
-    points = rhutil.coerce3dpointlist(points)
-    if not points:
-      return None
-    bbox = Rhino.Geometry.BoundingBox(points)
+    if isinstance(points, compat.STRING_TYPE): return None
+    bounds = None
+    for chunk in __pointchunks(points, chunk_size):
+        chunk_bounds = __chunkbounds(chunk)
+        if chunk_bounds is None: continue
+        if bounds is None: bounds = chunk_bounds
+        else: bounds = [min(a, b) for a, b in zip(bounds[:3], chunk_bounds[:3])] + [max(a, b) for a, b in zip(bounds[3:], chunk_bounds[3:])]
+    if bounds is None: return None
+    bbox = Rhino.Geometry.BoundingBox(*bounds)
 
     xform = None
     plane = rhutil.coerceplane(view_or_plane)
@@ -872,4 +1610,4 @@ def PointArrayBoundingBox(points, view_or_plane=None, in_world_coords=True):
     if in_world_coords and plane is not None:
         plane_to_world = Rhino.Geometry.Transform.ChangeBasis(plane, Rhino.Geometry.Plane.WorldXY)
         for pt in corners: pt.Transform(plane_to_world)
-    return corners
\ No newline at end of file
+    return corners
@@ -63,7 +63,7 @@ def AllObjects(select=False, include_lights=False, include_grips=False, include_
     for object in e:
         if select: object.Select(True)
         object_ids.append(object.Id)
-    if object_ids and select: scriptcontext.doc.Views.Redraw()
+    if object_ids and select: scriptcontext.redraw()
     return object_ids
 
 
@@ -176,7 +176,7 @@ def GetCurveObject(message=None, preselect=False, select=False):
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     go = Rhino.Input.Custom.GetObject()
     if message: go.SetCommandPrompt(message)
     go.GeometryFilter = Rhino.DocObjects.ObjectType.Curve
@@ -200,7 +200,7 @@ def GetCurveObject(message=None, preselect=False, select=False):
     go.Dispose()
     if not select and not presel:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     obj.Select(select)
     return id, presel, selmethod, point, curve_parameter, viewname
 
@@ -237,7 +237,7 @@ def GetObject(message=None, filter=0, preselect=False, select=False, custom_filt
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     
     class CustomGetObject(Rhino.Input.Custom.GetObject):
         def __init__(self, filter_function):
@@ -265,7 +265,7 @@ def GetObject(message=None, filter=0, preselect=False, select=False, custom_filt
     go.Dispose()
     if not select and not presel:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     if subobjects: return objref
     obj.Select(select)
     return obj.Id
@@ -326,7 +326,7 @@ def GetObjectEx(message=None, filter=0, preselect=False, select=False, objects=N
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     go = None
     if objects:
         ids = [rhutil.coerceguid(id, True) for id in objects]
@@ -353,7 +353,7 @@ def GetObjectEx(message=None, filter=0, preselect=False, select=False, objects=N
     go.Dispose()
     if not select and not presel:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     obj.Select(select)
     return id, presel, selmethod, point, viewname
 
@@ -408,7 +408,7 @@ def GetObjects(message=None, filter=0, group=True, preselect=False, select=False
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
 
     objects = rhutil.coerceguidlist(objects)
     class CustomGetObject(Rhino.Input.Custom.GetObject):
@@ -434,7 +434,7 @@ def GetObjects(message=None, filter=0, group=True, preselect=False, select=False
     if go.GetMultiple(minimum_count,maximum_count)!=Rhino.Input.GetResult.Object: return None
     if not select and not go.ObjectsWerePreselected:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     rc = []
     count = go.ObjectCount
     for i in compat.RANGE(count):
@@ -493,7 +493,7 @@ def GetObjectsEx(message=None, filter=0, group=True, preselect=False, select=Fal
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     go = None
     if objects:
         ids = [rhutil.coerceguid(id) for id in objects]
@@ -508,7 +508,7 @@ def GetObjectsEx(message=None, filter=0, group=True, preselect=False, select=Fal
     if go.GetMultiple(1,0)!=Rhino.Input.GetResult.Object: return []
     if not select and not go.ObjectsWerePreselected:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     rc = []
     count = go.ObjectCount
     for i in compat.RANGE(count):
@@ -582,7 +582,7 @@ def GetSurfaceObject(message="Select surface", preselect=False, select=False):
     """
     if not preselect:
         scriptcontext.doc.Objects.UnselectAll()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     go = Rhino.Input.Custom.GetObject()
     go.SetCommandPrompt(message)
     go.GeometryFilter = Rhino.DocObjects.ObjectType.Surface
@@ -594,7 +594,7 @@ def GetSurfaceObject(message="Select surface", preselect=False, select=False):
     objref = go.Object(0)
     rhobj = objref.Object()
     rhobj.Select(select)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
 
     id = rhobj.Id
     prepicked = go.ObjectsWerePreselected
@@ -610,7 +610,7 @@ def GetSurfaceObject(message="Select surface", preselect=False, select=False):
     go.Dispose()
     if not select and not prepicked:
       scriptcontext.doc.Objects.UnselectAll()
-      scriptcontext.doc.Views.Redraw()
+      scriptcontext.redraw()
     return id, prepicked, selmethod, point, uv, name
 
 
@@ -703,7 +703,7 @@ def InvertSelectedObjects(include_lights=False, include_grips=False, include_ref
             obj.Select(True)
         else:
             obj.Select(False)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -739,7 +739,7 @@ def LastCreatedObjects(select=False):
             rc.append(obj.Id)
             if select: obj.Select(True)
         serial_number += 1
-    if select==True and rc: scriptcontext.doc.Views.Redraw()
+    if select==True and rc: scriptcontext.redraw()
     return rc
 
 
@@ -772,7 +772,7 @@ def LastObject(select=False, include_lights=False, include_grips=False):
     rc = firstobj.Id
     if select:
         firstobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -855,7 +855,7 @@ def ObjectsByColor(color, select=False, include_lights=False):
     rhino_objects = scriptcontext.doc.Objects.FindByDrawColor(color, include_lights)
     if select:
         for obj in rhino_objects: obj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return [obj.Id for obj in rhino_objects]
 
 
@@ -879,7 +879,7 @@ def ObjectsByGroup(group_name, select=False):
     if not rhino_objects: return []
     if select:
         for obj in rhino_objects: obj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return [obj.Id for obj in rhino_objects]
 
 
@@ -904,7 +904,7 @@ def ObjectsByLayer(layer_name, select=False):
     if not rhino_objects: return []
     if select:
         for rhobj in rhino_objects: rhobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return [rhobj.Id for rhobj in rhino_objects]
 
 
@@ -936,7 +936,7 @@ def ObjectsByName(name, select=False, include_lights=False, include_references=F
     if ids and select:
         objects = scriptcontext.doc.Objects.GetObjectList(settings)
         for rhobj in objects: rhobj.Select(True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return ids
    
 
@@ -1040,7 +1040,7 @@ def ObjectsByType(geometry_type, select=False, state=0):
             if select: object.Select(True)
             object_ids.append(object.Id)
 
-    if object_ids and select: scriptcontext.doc.Views.Redraw()
+    if object_ids and select: scriptcontext.redraw()
     return object_ids
   
 
@@ -1076,7 +1076,7 @@ def UnselectAllObjects():
       SelectedObjects
     """
     rc = scriptcontext.doc.Objects.UnselectAll()
-    if rc>0: scriptcontext.doc.Views.Redraw()
+    if rc>0: scriptcontext.redraw()
     return rc
 
 
@@ -1116,7 +1116,7 @@ def VisibleObjects(view=None, select=False, include_lights=False, include_grips=
             if select: object.Select(True)
             object_ids.append(object.Id)
 
-    if object_ids and select: scriptcontext.doc.Views.Redraw()
+    if object_ids and select: scriptcontext.redraw()
     return object_ids
 
 
@@ -1168,5 +1168,5 @@ def WindowPick(corner1, corner2, view=None, select=False, in_window=True):
             o = rhobj.Object()
             rc.append(o.Id)
             if select: o.Select(True)
-        if select: scriptcontext.doc.Views.Redraw()
+        if select: scriptcontext.redraw()
         return rc
@@ -34,7 +34,7 @@ def AddBox(corners):
     if not brep: raise ValueError("unable to create brep from box")
     rc = scriptcontext.doc.Objects.AddBrep(brep)
     if rc==System.Guid.Empty: raise Exception("unable to add brep to document")
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -75,7 +75,7 @@ def AddCone(base, height, radius, cap=True):
     cone = Rhino.Geometry.Cone(plane, height, radius)
     brep = Rhino.Geometry.Brep.CreateFromCone(cone, cap)
     rc = scriptcontext.doc.Objects.AddBrep(brep)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -139,7 +139,7 @@ def AddCutPlane(object_ids, start_point, end_point, normal=None):
     if surface is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surface)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -188,7 +188,7 @@ def AddCylinder(base, height, radius, cap=True):
     brep = cylinder.ToBrep(cap, cap)
     id = scriptcontext.doc.Objects.AddBrep(brep)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -214,7 +214,7 @@ def AddEdgeSrf(curve_ids):
     if brep is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddBrep(brep)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -241,7 +241,7 @@ def AddNetworkSrf(curves, continuity=1, edge_tolerance=0, interior_tolerance=0,
     surf, err = Rhino.Geometry.NurbsSurface.CreateNetworkSurface(curves, continuity, edge_tolerance, interior_tolerance, angle_tolerance)
     if surf:
         rc = scriptcontext.doc.Objects.AddSurface(surf)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -305,7 +305,7 @@ def AddNurbsSurface(point_count, points, knots_u, knots_v, degree, weights=None)
     if not ns.IsValid: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(ns)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -366,7 +366,7 @@ def AddPatch(object_ids, uv_spans_tuple_OR_surface_object_id, tolerance=None, tr
     brep = Rhino.Geometry.Brep.CreatePatch(geometry, surface, u_span, v_span, trim, False, point_spacing, flexibility, surface_pull, b, tolerance)
     if brep:
       rc = scriptcontext.doc.Objects.AddBrep(brep)
-      scriptcontext.doc.Views.Redraw()
+      scriptcontext.redraw()
     return rc
 
 
@@ -399,7 +399,7 @@ def AddPipe(curve_id, parameters, radii, blend_type=0, cap=0, fit=False):
     cap = System.Enum.ToObject(Rhino.Geometry.PipeCapMode, cap)
     breps = Rhino.Geometry.Brep.CreatePipe(rail, parameters, radii, blend_type==0, cap, fit, abs_tol, ang_tol)
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -427,7 +427,7 @@ def AddPlanarSrf(object_ids):
     breps = Rhino.Geometry.Brep.CreatePlanarBreps(curves, tolerance)
     if breps:
         rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -458,7 +458,7 @@ def AddPlaneSurface(plane, u_dir, v_dir):
     if plane_surface is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(plane_surface)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -543,7 +543,7 @@ def AddLoftSrf(object_ids, start=None, end=None, loft_type=0, simplify_method=0,
     for brep in breps:
         id = scriptcontext.doc.Objects.AddBrep(brep)
         if id!=System.Guid.Empty: idlist.append(id)
-    if idlist: scriptcontext.doc.Views.Redraw()
+    if idlist: scriptcontext.redraw()
     return idlist
 
 
@@ -572,7 +572,7 @@ def AddRevSrf(curve_id, axis, start_angle=0.0, end_angle=360.0):
     ns = srf.ToNurbsSurface()
     if not ns: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(ns)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -603,7 +603,7 @@ def AddSphere(center_or_plane, radius):
     sphere = Rhino.Geometry.Sphere(c_or_p, radius)
     rc = scriptcontext.doc.Objects.AddSphere(sphere)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -646,7 +646,7 @@ def AddSrfContourCrvs(object_id, points_or_plane, interval=None):
     for crv in curves:
         id = scriptcontext.doc.Objects.AddCurve(crv)
         if id!=System.Guid.Empty: rc.append(id)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -667,7 +667,7 @@ def AddSrfControlPtGrid(count, points, degree=(3,3)):
     if not surf: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surf)
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return id
 
 
@@ -696,7 +696,7 @@ def AddSrfPt(points):
     if surface is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(surface)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -718,7 +718,7 @@ def AddSrfPtGrid(count, points, degree=(3,3), closed=(False,False)):
     if not surf: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddSurface(surf)
     if id!=System.Guid.Empty:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return id
 
 
@@ -749,7 +749,7 @@ def AddSweep1(rail, shapes, closed=False):
     breps = Rhino.Geometry.Brep.CreateFromSweep(rail, shapes, closed, tolerance)
     if not breps: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -781,7 +781,7 @@ def AddSweep2(rails, shapes, closed=False):
     breps = Rhino.Geometry.Brep.CreateFromSweep(rail1, rail2, shapes, closed, tolerance)
     if not breps: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -818,7 +818,7 @@ def AddRailRevSrf(profile, rail, axis, scale_height=False):
 
     if not surface: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddSurface(surface)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -860,7 +860,7 @@ def AddTorus(base, major_radius, minor_radius, direction=None):
     torus = Rhino.Geometry.Torus(baseplane, major_radius, minor_radius)
     revsurf = torus.ToRevSurface()
     rc = scriptcontext.doc.Objects.AddSurface(revsurf)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -902,7 +902,7 @@ def BooleanDifference(input0, input1, delete_input=True):
     if delete_input:
         for id in input0: scriptcontext.doc.Objects.Delete(id, True)
         for id in input1: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -942,7 +942,7 @@ def BooleanIntersection(input0, input1, delete_input=True):
     if delete_input:
         for id in input0: scriptcontext.doc.Objects.Delete(id, True)
         for id in input1: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -973,7 +973,7 @@ def BooleanUnion(input, delete_input=True):
     rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in newbreps]
     if delete_input:
         for id in input: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1046,7 +1046,7 @@ def CapPlanarHoles(surface_id):
             newbrep.Flip()
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id and scriptcontext.doc.Objects.Replace(surface_id, newbrep):
-            scriptcontext.doc.Views.Redraw()
+            scriptcontext.redraw()
             return True
     return False
 
@@ -1084,7 +1084,7 @@ def DuplicateEdgeCurves(object_id, select=False):
             if select: 
                 rhobject = rhutil.coercerhinoobject(rc)
                 rhobject.Select(True)
-    if curves: scriptcontext.doc.Views.Redraw()
+    if curves: scriptcontext.redraw()
     return curves
 
 
@@ -1116,7 +1116,7 @@ def DuplicateSurfaceBorder(surface_id, type=0):
     curves = Rhino.Geometry.Curve.JoinCurves(curves, tolerance)
     if curves is None: return scriptcontext.errorhandler()
     rc = [scriptcontext.doc.Objects.AddCurve(c) for c in curves]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1175,7 +1175,7 @@ def ExtendSurface(surface_id, parameter, length, smooth=True):
     if newsrf:
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id: scriptcontext.doc.Objects.Replace(surface_id, newsrf)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return newsrf is not None
 
 
@@ -1207,7 +1207,7 @@ def ExplodePolysurfaces(object_ids, delete_input=False):
                 face_id = scriptcontext.doc.Objects.AddBrep(copyface)
                 if face_id!=System.Guid.Empty: ids.append(face_id)
             if delete_input: scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return ids
 
 
@@ -1254,7 +1254,7 @@ def ExtractIsoCurve(surface_id, parameter, direction):
             for curve in curves:
                 id = scriptcontext.doc.Objects.AddCurve(curve)
                 if id!=System.Guid.Empty: ids.append(id)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return ids
 
 
@@ -1289,7 +1289,7 @@ def ExtractSurface(object_id, face_indices, copy=False):
         for index in face_indices: brep.Faces.RemoveAt(index)
         id = rhutil.coerceguid(object_id)
         scriptcontext.doc.Objects.Replace(id, brep)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1316,7 +1316,7 @@ def ExtrudeCurve(curve_id, path_id):
     srf = Rhino.Geometry.SumSurface.Create(curve1, curve2)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1343,7 +1343,7 @@ def ExtrudeCurvePoint(curve_id, point):
     srf = Rhino.Geometry.Surface.CreateExtrusionToPoint(curve, point)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1371,7 +1371,7 @@ def ExtrudeCurveStraight(curve_id, start_point, end_point):
     srf = Rhino.Geometry.Surface.CreateExtrusion(curve, vec)
     rc = scriptcontext.doc.Objects.AddSurface(srf)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1398,7 +1398,7 @@ def ExtrudeSurface(surface, curve, cap=True):
     newbrep = brep.Faces[0].CreateExtrusion(curve, cap)
     if newbrep:
         rc = scriptcontext.doc.Objects.AddBrep(newbrep)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -1437,7 +1437,7 @@ def FilletSurfaces(surface0, surface1, radius, uvparam0=None, uvparam1=None):
     rc = []
     for surf in surfaces:
         rc.append( scriptcontext.doc.Objects.AddSurface(surf) )
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -1468,7 +1468,7 @@ def FlipSurface(surface_id, flip=None):
         brep.Flip()
         surface_id = rhutil.coerceguid(surface_id)
         if surface_id: scriptcontext.doc.Objects.Replace(surface_id, brep)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return old_reverse
 
 
@@ -1522,7 +1522,7 @@ def IntersectBreps(brep1, brep2, tolerance=None):
         if rc==System.Guid.Empty: return scriptcontext.errorhandler()
         ids.append(rc)
     if ids:
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return ids
 
 
@@ -2068,7 +2068,7 @@ def JoinSurfaces(object_ids, delete_input=False, return_all=False):
         for id in object_ids:
             id = rhutil.coerceguid(id)
             scriptcontext.doc.Objects.Delete(id, True)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc if return_all else rc[0]
 
 
@@ -2098,7 +2098,7 @@ def MakeSurfacePeriodic(surface_id, direction, delete_input=False):
         scriptcontext.doc.Objects.Replace(id, newsurf)
     else:
         id = scriptcontext.doc.Objects.AddSurface(newsurf)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -2132,7 +2132,7 @@ def OffsetSurface(surface_id, distance, tolerance=None, both_sides=False, create
     if newbrep is None: return scriptcontext.errorhandler()
     rc = scriptcontext.doc.Objects.AddBrep(newbrep)
     if rc==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -2162,7 +2162,7 @@ def PullCurve(surface, curve, delete_input=False):
     if rc:
         if delete_input and crvobj:
             scriptcontext.doc.Objects.Delete(crvobj, True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -2183,7 +2183,7 @@ def RebuildSurface(object_id, degree=(3,3), pointcount=(10,10)):
     if newsurf is None: return False
     object_id = rhutil.coerceguid(object_id)
     rc = scriptcontext.doc.Objects.Replace(object_id, newsurf)
-    if rc: scriptcontext.doc.Views.Redraw()
+    if rc: scriptcontext.redraw()
     return rc
 
 
@@ -2218,7 +2218,7 @@ def RemoveSurfaceKnot(surface, uv_parameter, v_direction):
     success = knots.RemoveKnotsAt(n_u_param, n_v_param)
     if not success: return False
     scriptcontext.doc.Objects.Replace(surface, n_srf)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return True
 
 
@@ -2253,7 +2253,7 @@ def ReverseSurface(surface_id, direction):
     if direction & 4:
         face.Transpose(True)
     scriptcontext.doc.Objects.Replace(surface_id, brep)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return True
 
 
@@ -2344,7 +2344,7 @@ def ShortPath(surface_id, start_point, end_point):
     if curve is None: return scriptcontext.errorhandler()
     id = scriptcontext.doc.Objects.AddCurve(curve)
     if id==System.Guid.Empty: return scriptcontext.errorhandler()
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return id
 
 
@@ -2376,7 +2376,7 @@ def ShrinkTrimmedSurface(object_id, create_copy=False):
         rc = scriptcontext.doc.Objects.AddBrep(brep, attr)
     else:
         rc = scriptcontext.doc.Objects.Replace(object_id, brep)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -2416,7 +2416,7 @@ def SplitBrep(brep_id, cutter_id, delete_input=False):
         brep_id = rhutil.coerceguid(brep_id)
         scriptcontext.doc.Objects.Delete(brep_id, True)
     rc = [scriptcontext.doc.Objects.AddBrep(piece) for piece in pieces]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -2856,7 +2856,7 @@ def SurfaceIsocurveDensity(surface_id, density=None):
         if density<0: density = -1
         rhino_object.Attributes.WireDensity = density
         rhino_object.CommitChanges()
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
     return rc
 
 
@@ -3246,7 +3246,7 @@ def TrimBrep(object_id, cutter, tolerance=None):
                 rc.append(scriptcontext.doc.Objects.AddBrep(breps[i], attrs))
     else:
         rc = [scriptcontext.doc.Objects.AddBrep(brep) for brep in breps]
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     return rc
 
 
@@ -3288,7 +3288,7 @@ def TrimSurface( surface_id, direction, interval, delete_input=False):
     if new_surface:
         rc = scriptcontext.doc.Objects.AddSurface(new_surface)
         if delete_input: scriptcontext.doc.Objects.Delete(rhutil.coerceguid(surface_id), True)
-        scriptcontext.doc.Views.Redraw()
+        scriptcontext.redraw()
         return rc
 
 
@@ -3335,7 +3335,7 @@ def UnrollSurface(surface_id, explode=False, following_geometry=None, absolute_t
     for dot in dots:
         id = scriptcontext.doc.Objects.AddTextDot(dot)
         new_following.append(id)
-    scriptcontext.doc.Views.Redraw()
+    scriptcontext.redraw()
     if following_geometry: return rc, new_following
     return rc
 
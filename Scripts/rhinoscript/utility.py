@@ -1,5 +1,7 @@
+import sys
 import time
 import math
+import array
 import string
 import numbers
 
@@ -289,13 +291,20 @@ def ColorRGBToHLS(rgb):
     return hsl.H, hsl.S, hsl.L
 
 
-def CullDuplicateNumbers(numbers, tolerance=None):
+def CullDuplicateNumbers(numbers, tolerance=None, return_indices=False):
     """Removes duplicates from an array of numbers.
+    The numbers are sorted and swept once, a number is discarded if it is
+    within tolerance of the last number that was kept.
     Parameters:
-      numbers ([number, ...]): list or tuple
-      tolerance (number, optional): The minimum distance between numbers.  Numbers that fall within this tolerance will be discarded.  If omitted, Rhino's internal zero tolerance is used.
+      numbers ([number, ...]): list or tuple, array.array or one-dimensional
+        NumPy array
+      tolerance (number, optional): The minimum distance between numbers.  Numbers that fall within this tolerance will be discarded.  If omitted, the document's absolute tolerance is used.
+      return_indices (bool, optional): if True, return the indices in numbers
+        of the numbers that were kept instead of the numbers themselves
     Returns:
-      list(number, ...): numbers with duplicates removed if successful.
+      list(number, ...): sorted numbers with duplicates removed if successful.
+        array.array and NumPy arrays are returned as the same type.
+      list(int, ...): indices of the kept numbers, if return_indices is True.
     Example:
       import rhinoscriptsyntax as rs
       arr = [1,1,2,2,3,3,4,4,5,5]
@@ -304,31 +313,144 @@ def CullDuplicateNumbers(numbers, tolerance=None):
     See Also:
       CullDuplicatePoints
     """
+    numpy = __numpyarray(numbers)
+    if numpy is not None and numbers.ndim!=1:
+        raise ValueError("expected a one-dimensional array of numbers, got shape {}".format(numbers.shape))
     count = len(numbers)
-    if count < 2: return numbers
+    if count < 2:
+        if return_indices: return numpy.arange(count) if numpy is not None else list(compat.RANGE(count))
+        return numbers
     if tolerance is None: tolerance = scriptcontext.doc.ModelAbsoluteTolerance
-    numbers = sorted(numbers)
-    d = numbers[0]
-    index = 1
-    for step in range(1,count):
-        test_value = numbers[index]
-        if math.fabs(d-test_value)<=tolerance:
-            numbers.pop(index)
-        else:
+    if numpy is not None:
+        order = numpy.argsort(numbers, kind="stable")
+        values = numbers[order].tolist()
+    else:
+        order = sorted(compat.RANGE(count), key=numbers.__getitem__)
+        values = [numbers[i] for i in order]
+    kept = [0]
+    d = values[0]
+    for i in compat.RANGE(1, count):
+        test_value = values[i]
+        if math.fabs(d-test_value)>tolerance:
             d = test_value
-            index += 1
-    return numbers
+            kept.append(i)
+    if numpy is not None:
+        kept = order[kept]
+        if return_indices: return kept
+        return numbers[kept]
+    if return_indices: return [order[i] for i in kept]
+    rc = [values[i] for i in kept]
+    if isinstance(numbers, array.array): return array.array(numbers.typecode, rc)
+    return rc
 
 
-def CullDuplicatePoints(points, tolerance=-1):
+def __clusterpoints(xs, ys, zs, tolerance):
+    """Groups points that are within tolerance of an earlier point. Points are
+    visited in order and each one joins the first cluster whose first point is
+    within tolerance of it, or starts a new cluster. Candidates are found in a
+    grid of cells twice the tolerance wide, so only the 8 cells next to a point
+    are searched and the expected time is linear.
+    Returns:
+      tuple(list, list): index of the first point of each cluster, and the
+        cluster index of every point
+    """
+    count = len(xs)
+    owner = [0]*count
+    firsts = []
+    if tolerance<=0:
+        clusters = {}
+        for i in compat.RANGE(count):
+            key = (xs[i], ys[i], zs[i])
+            cluster = clusters.get(key)
+            if cluster is None:
+                cluster = clusters[key] = len(firsts)
+                firsts.append(i)
+            owner[i] = cluster
+        return firsts, owner
+    size = 2.0*tolerance
+    tolerance2 = tolerance*tolerance
+    floor = math.floor
+    grid = {}
+    for i in compat.RANGE(count):
+        x = xs[i]
+        y = ys[i]
+        z = zs[i]
+        fx = x/size
+        fy = y/size
+        fz = z/size
+        cx = int(floor(fx))
+        cy = int(floor(fy))
+        cz = int(floor(fz))
+        # the neighbor cell on the side of the cell the point is closest to
+        nx = cx+1 if fx-cx>=0.5 else cx-1
+        ny = cy+1 if fy-cy>=0.5 else cy-1
+        nz = cz+1 if fz-cz>=0.5 else cz-1
+        found = -1
+        for key in ((cx,cy,cz), (nx,cy,cz), (cx,ny,cz), (nx,ny,cz), (cx,cy,nz), (nx,cy,nz), (cx,ny,nz), (nx,ny,nz)):
+            cell = grid.get(key)
+            if cell is None: continue
+            for cluster in cell:
+                if found>=0 and cluster>found: continue
+                j = firsts[cluster]
+                dx = xs[j]-x
+                dy = ys[j]-y
+                dz = zs[j]-z
+                if dx*dx+dy*dy+dz*dz<=tolerance2: found = cluster
+        if found<0:
+            found = len(firsts)
+            firsts.append(i)
+            cell = grid.get((cx,cy,cz))
+            if cell is None: grid[(cx,cy,cz)] = [found]
+            else: cell.append(found)
+        owner[i] = found
+    return firsts, owner
+
+
+def __clusterrepresentatives(xs, ys, zs, firsts, owner, keep):
+    """Returns the index of the point kept for each cluster, or for keep ==
+    "centroid" the average x, y and z coordinates of each cluster
+    """
+    if keep=="first": return firsts
+    if keep=="last":
+        rc = list(firsts)
+        for i, cluster in enumerate(owner): rc[cluster] = i
+        return rc
+    count = len(firsts)
+    sx = [0.0]*count
+    sy = [0.0]*count
+    sz = [0.0]*count
+    n = [0]*count
+    for i, cluster in enumerate(owner):
+        sx[cluster] += xs[i]
+        sy[cluster] += ys[i]
+        sz[cluster] += zs[i]
+        n[cluster] += 1
+    return ([sx[c]/n[c] for c in compat.RANGE(count)], [sy[c]/n[c] for c in compat.RANGE(count)],
+            [sz[c]/n[c] for c in compat.RANGE(count)])
+
+
+def CullDuplicatePoints(points, tolerance=-1, keep="first", return_indices=False):
     """Removes duplicates from a list of 3D points.
+    Points are visited in order. A point that is within tolerance of the first
+    point of an earlier cluster joins that cluster, otherwise it starts a new
+    one. Each cluster is replaced by one point, in the order the clusters were
+    started. Runs in expected linear time, so it scales to millions of points.
     Parameters:
-      points ([point, ...]): A list of 3D points.
-      tolerance (number): Minimum distance between points. Points within this
-        tolerance will be discarded. If omitted, Rhino's internal zero tolerance
-        is used.
+      points ([point, ...]): A list of 3D points, or a float64 buffer of
+        x,y,z triples such as a NumPy (N,3) array or array.array('d').
+      tolerance (number, optional): Minimum distance between points. Points
+        within this tolerance will be discarded. If None, the document's
+        absolute tolerance is used. If omitted or negative, Rhino's internal
+        zero tolerance is used.
+      keep (str, optional): the point that represents a cluster, "first",
+        "last" or "centroid" of the cluster's points.
+      return_indices (bool, optional): if True, also return the index in the
+        result of the point that each input point was merged into.
     Returns:
       list(point, ...): of 3D points with duplicates removed if successful.
+      NumPy array or array('d'): the remaining coordinates if points is a buffer.
+      tuple(points, list(int, ...)): the points and, for every input point, the
+        index of its cluster in the result, if return_indices is True.
       None: if not successful
     Example:
       import rhinoscriptsyntax as rs
@@ -339,21 +461,57 @@ def CullDuplicatePoints(points, tolerance=-1):
     See Also:
       CullDuplicateNumbers
     """
-    points = coerce3dpointlist(points, True)
-    if tolerance is None or tolerance < 0:
-        tolerance = Rhino.RhinoMath.ZeroTolerance
-    return list(Rhino.Geometry.Point3d.CullDuplicates(points, tolerance))
+    if keep not in ("first", "last", "centroid"):
+        raise ValueError("keep must be 'first', 'last' or 'centroid'")
+    if tolerance is None: tolerance = scriptcontext.doc.ModelAbsoluteTolerance
+    elif tolerance < 0: tolerance = Rhino.RhinoMath.ZeroTolerance
+    numpy = __numpyarray(points)
+    values = None
+    if numpy is not None:
+        xyz = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        xs, ys, zs = xyz[:,0].tolist(), xyz[:,1].tolist(), xyz[:,2].tolist()
+    else:
+        values = __doublearray(points)
+        if values is not None:
+            if len(values)%3: raise ValueError("buffer length must be a multiple of 3")
+            xs, ys, zs = values[0::3], values[1::3], values[2::3]
+        else:
+            points = coerce3dpointlist(points, True)
+            xs = [point.X for point in points]
+            ys = [point.Y for point in points]
+            zs = [point.Z for point in points]
+    firsts, owner = __clusterpoints(xs, ys, zs, tolerance)
+    kept = __clusterrepresentatives(xs, ys, zs, firsts, owner, keep)
+    if numpy is not None:
+        if keep=="centroid": rc = numpy.array(kept, dtype=numpy.float64).T.copy()
+        else: rc = xyz[kept]
+        if return_indices: return rc, numpy.array(owner, dtype=numpy.intp)
+        return rc
+    if values is not None:
+        rc = array.array('d')
+        if keep=="centroid":
+            for point in zip(*kept): rc.extend(point)
+        else:
+            for i in kept: rc.extend((xs[i], ys[i], zs[i]))
+    elif keep=="centroid":
+        rc = [Rhino.Geometry.Point3d(x, y, z) for x, y, z in zip(*kept)]
+    else:
+        rc = [points[i] for i in kept]
+    if return_indices: return rc, owner
+    return rc
 
 
 def Distance(point1, point2):
     """Measures distance between two 3D points, or between a 3D point and
     an array of 3D points.
     Parameters:
-      point1 (point): The first 3D point.
+      point1 (point): The first 3D point, or a list of 3-D points.
       point2 (point): The second 3D point or list of 3-D points.
     Returns:
       point: If point2 is a 3D point then the distance if successful.
       point: If point2 is a list of points, then an list of distances if successful.
+      list(list(number, ...), ...): If both are lists of points, the distance
+        matrix as returned by DistanceMatrix.
       None: if not successful
     Example:
       import rhinoscriptsyntax as rs
@@ -365,8 +523,13 @@ def Distance(point1, point2):
     See Also:
       Angle
       Angle2
+      DistanceMatrix
     """
-    from_pt = coerce3dpoint(point1, True)
+    from_pt = coerce3dpoint(point1)
+    if from_pt is None:
+        if type(point1) is list or type(point1) is tuple or __doublearray(point1) is not None:
+            return DistanceMatrix(point1, point2)
+        from_pt = coerce3dpoint(point1, True)
     to_pt = coerce3dpoint(point2)
     if to_pt: return (to_pt - from_pt).Length
     # check if we have a list of points
@@ -375,6 +538,156 @@ def Distance(point1, point2):
     if distances: return distances
 
 
+def __distancerows(columns1, columns2, squared, start, stop):
+    """Yields the rows start to stop of the distance matrix of two sets of
+    point coordinates"""
+    points2 = list(zip(*columns2))
+    xs, ys, zs = columns1
+    sqrt = math.sqrt
+    for i in compat.RANGE(start, stop):
+        x = xs[i]
+        y = ys[i]
+        z = zs[i]
+        if squared:
+            yield [(x-u)*(x-u)+(y-v)*(y-v)+(z-w)*(z-w) for u, v, w in points2]
+        else:
+            yield [sqrt((x-u)*(x-u)+(y-v)*(y-v)+(z-w)*(z-w)) for u, v, w in points2]
+
+
+def __distancepairs(columns1, columns2, cutoff, squared):
+    """Returns the (i, j, d) triples of points no farther apart than cutoff.
+    The second set of points is put in a grid of cells cutoff wide, so each
+    point of the first set is only compared with the 27 cells around it.
+    If columns2 is None, pairs within columns1 with i < j are returned"""
+    same = columns2 is None
+    if same: columns2 = columns1
+    xs2, ys2, zs2 = columns2
+    size = cutoff
+    floor = math.floor
+    grid = {}
+    for j in compat.RANGE(len(xs2)):
+        key = (int(floor(xs2[j]/size)), int(floor(ys2[j]/size)), int(floor(zs2[j]/size)))
+        cell = grid.get(key)
+        if cell is None: grid[key] = [j]
+        else: cell.append(j)
+    cutoff2 = cutoff*cutoff
+    sqrt = math.sqrt
+    xs, ys, zs = columns1
+    rc = []
+    for i in compat.RANGE(len(xs)):
+        x = xs[i]
+        y = ys[i]
+        z = zs[i]
+        cx = int(floor(x/size))
+        cy = int(floor(y/size))
+        cz = int(floor(z/size))
+        found = []
+        for ix in (cx-1, cx, cx+1):
+            for iy in (cy-1, cy, cy+1):
+                for iz in (cz-1, cz, cz+1):
+                    cell = grid.get((ix, iy, iz))
+                    if cell is None: continue
+                    for j in cell:
+                        if same and j<=i: continue
+                        dx = xs2[j]-x
+                        dy = ys2[j]-y
+                        dz = zs2[j]-z
+                        d = dx*dx+dy*dy+dz*dz
+                        if d<=cutoff2: found.append((j, d))
+        found.sort()
+        for j, d in found: rc.append((i, j, d if squared else sqrt(d)))
+    return rc
+
+
+def __numpydistances(numpy, points1, points2, squared, cutoff, block_size):
+    a = numpy.asarray(points1, dtype=numpy.float64).reshape(-1, 3)
+    b = a if points2 is None else numpy.asarray(points2, dtype=numpy.float64).reshape(-1, 3)
+    if not block_size: block_size = max(1, (1<<22)//max(1, len(b)))
+    def block(start):
+        stop = min(start+block_size, len(a))
+        d = ((a[start:stop,None,:] - b[None,:,:])**2).sum(axis=2)
+        return stop, d
+    if cutoff is None:
+        def blocks():
+            for start in compat.RANGE(0, len(a), block_size):
+                stop, d = block(start)
+                yield start, d if squared else numpy.sqrt(d)
+        return blocks()
+    rows, columns, distances = [], [], []
+    for start in compat.RANGE(0, len(a), block_size):
+        stop, d = block(start)
+        mask = d<=cutoff*cutoff
+        if points2 is None: mask &= numpy.arange(len(b))[None,:] > numpy.arange(start, stop)[:,None]
+        i, j = numpy.nonzero(mask)
+        rows.append(i + start)
+        columns.append(j)
+        distances.append(d[i, j])
+    rows = numpy.concatenate(rows) if rows else numpy.zeros(0, dtype=numpy.intp)
+    columns = numpy.concatenate(columns) if columns else numpy.zeros(0, dtype=numpy.intp)
+    distances = numpy.concatenate(distances) if distances else numpy.zeros(0)
+    return rows, columns, distances if squared else numpy.sqrt(distances)
+
+
+def DistanceMatrix(points1, points2=None, squared=False, cutoff=None, block_size=None):
+    """Measures the distances between every point of one set and every point
+    of another set
+    Parameters:
+      points1 ([point, ...]): the first set of 3-D points, or a float64 buffer
+        of x,y,z triples such as a NumPy (N,3) array
+      points2 ([point, ...], optional): the second set of 3-D points. If
+        omitted, the distances between the points of points1 are measured
+      squared (bool, optional): return squared distances, which saves a
+        square root per pair
+      cutoff (number, optional): only return the pairs of points that are no
+        farther apart than cutoff, as a sparse list of (i, j, distance)
+        triples sorted by i and j. If points2 is omitted, only pairs with
+        i < j are returned. Must be greater than 0
+      block_size (number, optional): compute the matrix block_size rows at a
+        time and return an iterator of (first row index, rows) blocks, so
+        memory stays bounded for large sets
+    Returns:
+      list(list(number, ...), ...): the matrix, one row of distances to the
+        points of points2 for each point of points1. A 2-D NumPy array if
+        either set is a NumPy array
+      iterator: of (row index, rows) blocks if block_size is specified
+      list((int, int, number), ...): the (i, j, distance) triples if cutoff is
+        specified. If either set is a NumPy array, a tuple of i, j and
+        distance arrays
+    Example:
+      import rhinoscriptsyntax as rs
+      points1 = rs.GetPoints()
+      points2 = rs.GetPoints()
+      if points1 and points2:
+          for i, j, d in rs.DistanceMatrix(points1, points2, cutoff=1.0):
+              print("{} to {}: {}".format(i, j, d))
+    See Also:
+      Distance
+      PointArrayClosestPoint
+    """
+    if cutoff is not None and not cutoff>0: raise ValueError("cutoff must be greater than 0")
+    numpy = __numpyarray(points1)
+    if numpy is None and points2 is not None: numpy = __numpyarray(points2)
+    if numpy is not None:
+        if __numpyarray(points1) is None: points1 = SimplifyArray(points1, True)
+        if points2 is not None and __numpyarray(points2) is None: points2 = SimplifyArray(points2, True)
+        rc = __numpydistances(numpy, points1, points2, squared, cutoff, block_size)
+        if cutoff is None and not block_size:
+            blocks = [rows for start, rows in rc]
+            return numpy.concatenate(blocks) if blocks else numpy.zeros((0, 0))
+        return rc
+    columns1 = __coordinatecolumns(points1)
+    columns2 = None if points2 is None else __coordinatecolumns(points2)
+    if cutoff is not None: return __distancepairs(columns1, columns2, cutoff, squared)
+    if columns2 is None: columns2 = columns1
+    count = len(columns1[0])
+    if not block_size: return list(__distancerows(columns1, columns2, squared, 0, count))
+    def blocks():
+        for start in compat.RANGE(0, count, block_size):
+            stop = min(start+block_size, count)
+            yield start, list(__distancerows(columns1, columns2, squared, start, stop))
+    return blocks()
+
+
 def GetSettings(filename, section=None, entry=None):
     """Returns string from a specified section in a initialization file.
     Parameters:
@@ -417,6 +730,31 @@ def GetSettings(filename, section=None, entry=None):
     return scriptcontext.errorhandler()
 
 
+def IterSimplifyArray(points):
+    """Flattens an array of 3-D points into a stream of real numbers, like
+    SimplifyArray but without building the list, e.g. for writing millions
+    of points to a file
+    Parameters:
+      points ([point, ...]): Points to flatten
+    Returns:
+      generator: the x, y and z coordinates of each point in turn
+    Example:
+      import rhinoscriptsyntax as rs
+      points = rs.GetPoints()
+      if points:
+          with open("points.txt", "w") as f:
+              for n in rs.IterSimplifyArray(points): f.write("%f\\n" % n)
+    See Also:
+      SimplifyArray
+      UnflattenArray
+    """
+    for point in points:
+        if type(point) not in __pointtypes: point = coerce3dpoint(point, True)
+        yield point.X
+        yield point.Y
+        yield point.Z
+
+
 def Polar(point, angle_degrees, distance, plane=None):
     """Returns 3D point that is a specified angle and distance from a 3D point
     Parameters:
@@ -451,12 +789,16 @@ def Polar(point, angle_degrees, distance, plane=None):
     return rc
 
 
-def SimplifyArray(points):
+def SimplifyArray(points, as_buffer=False):
     """Flattens an array of 3-D points into a one-dimensional list of real numbers. For example, if you had an array containing three 3-D points, this method would return a one-dimensional array containing nine real numbers.
     Parameters:
-      points ([point, ...]): Points to flatten
+      points ([point, ...]): Points to flatten, or a float64 buffer of x,y,z
+        triples such as a NumPy (N,3) array
+      as_buffer (bool, optional): if True, return an array.array('d'), which
+        supports the buffer protocol and can be wrapped in a memoryview
     Returns:
       list(number, ...): A one-dimensional list containing real numbers, if successful, otherwise None
+      array('d'): the same numbers, if as_buffer is True
     Example:
       import rhinoscriptsyntax as rs
       points = rs.GetPoints()
@@ -464,14 +806,29 @@ def SimplifyArray(points):
           numbers = rs.SimplifyArray(points)
           for n in numbers: print(n)
     See Also:
-      
+      IterSimplifyArray
+      UnflattenArray
     """
+    numpy = __numpyarray(points)
+    if numpy is not None:
+        values = numpy.ascontiguousarray(points, dtype=numpy.float64).ravel()
+        if not as_buffer: return values.tolist()
+        rc = array.array('d')
+        if compat.PY3: rc.frombytes(values.tobytes())
+        else: rc.fromstring(values.tobytes())
+        return rc
+    values = __doublearray(points)
+    if values is not None:
+        if as_buffer: return array.array('d', values)
+        return values.tolist()
     rc = []
+    append = rc.append
     for point in points:
-        point = coerce3dpoint(point, True)
-        rc.append(point.X)
-        rc.append(point.Y)
-        rc.append(point.Z)
+        if type(point) not in __pointtypes: point = coerce3dpoint(point, True)
+        append(point.X)
+        append(point.Y)
+        append(point.Z)
+    if as_buffer: return array.array('d', rc)
     return rc
 
 
@@ -521,10 +878,15 @@ def SortPointList(points, tolerance=None):
     return list(Rhino.Geometry.Point3d.SortAndCullPointList(points, tolerance))
 
 
-def SortPoints(points, ascending=True, order=0):
+# coordinate columns compared first, second and third for each SortPoints order
+__sortaxes = ((0,1,2), (0,2,1), (1,0,2), (1,2,0), (2,0,1), (2,1,0))
+
+
+def SortPoints(points, ascending=True, order=0, return_indices=False):
     """Sorts the components of an array of 3D points
     Parameters:
-      points ([point, ...]): points to sort
+      points ([point, ...]): points to sort, or a float64 buffer of x,y,z
+        triples such as a NumPy (N,3) array or array.array('d')
       ascending (bool, optional: ascending if omitted (True) or True, descending if False.
       order (number, optional): the component sort order
         Value       Component Sort Order
@@ -534,8 +896,13 @@ def SortPoints(points, ascending=True, order=0):
         3           Y, Z, X
         4           Z, X, Y
         5           Z, Y, X
+      return_indices (bool, optional): if True, also return the permutation
+        that sorts the points, so arrays parallel to points can be reordered
     Returns:
       list(point, ...): sorted 3-D points if successful
+      NumPy array or array('d'): the sorted coordinates if points is a buffer
+      tuple(points, list(int, ...)): the sorted points and the index in points
+        of each of them, if return_indices is True
       None: if not successful
     Example:
       import rhinoscriptsyntax as rs
@@ -544,40 +911,35 @@ def SortPoints(points, ascending=True, order=0):
           points = rs.SortPoints(points)
           for p in points: print(p)
     See Also:
-      
+      SortPointList
     """
-    def __cmpXYZ( a, b ):
-        rc = cmp(a.X, b.X)
-        if rc==0: rc = cmp(a.Y, b.Y)
-        if rc==0: rc = cmp(a.Z, b.Z)
-        return rc
-    def __cmpXZY( a, b ):
-        rc = cmp(a.X, b.X)
-        if rc==0: rc = cmp(a.Z, b.Z)
-        if rc==0: rc = cmp(a.Y, b.Y)
-        return rc
-    def __cmpYXZ( a, b ):
-        rc = cmp(a.Y, b.Y)
-        if rc==0: rc = cmp(a.X, b.X)
-        if rc==0: rc = cmp(a.Z, b.Z)
-        return rc
-    def __cmpYZX( a, b ):
-        rc = cmp(a.Y, b.Y)
-        if rc==0: rc = cmp(a.Z, b.Z)
-        if rc==0: rc = cmp(a.X, b.X)
-        return rc
-    def __cmpZXY( a, b ):
-        rc = cmp(a.Z, b.Z)
-        if rc==0: rc = cmp(a.X, b.X)
-        if rc==0: rc = cmp(a.Y, b.Y)
-        return rc
-    def __cmpZYX( a, b ):
-        rc = cmp(a.Z, b.Z)
-        if rc==0: rc = cmp(a.Y, b.Y)
-        if rc==0: rc = cmp(a.X, b.X)
+    axes = __sortaxes[order]
+    numpy = __numpyarray(points)
+    if numpy is not None:
+        xyz = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        # lexsort compares the last key first, negated keys keep ties stable
+        keys = [xyz[:,axis] for axis in reversed(axes)]
+        if not ascending: keys = [-key for key in keys]
+        indices = numpy.lexsort(keys)
+        rc = xyz[indices]
+        if return_indices: return rc, indices
         return rc
-    sortfunc = (__cmpXYZ, __cmpXZY, __cmpYXZ, __cmpYZX, __cmpZXY, __cmpZYX)[order]
-    return sorted(points, sortfunc, None, not ascending)
+    values = __doublearray(points)
+    if values is not None:
+        if len(values)%3: raise ValueError("buffer length must be a multiple of 3")
+        columns = (values[0::3], values[1::3], values[2::3])
+    else:
+        points = coerce3dpointlist(points, True)
+        columns = ([point.X for point in points], [point.Y for point in points], [point.Z for point in points])
+    keys = list(zip(*[columns[axis] for axis in axes]))
+    indices = sorted(compat.RANGE(len(keys)), key=keys.__getitem__, reverse=not ascending)
+    if values is not None:
+        rc = array.array('d')
+        for i in indices: rc.extend(values[i*3:i*3+3])
+    else:
+        rc = [points[i] for i in indices]
+    if return_indices: return rc, indices
+    return rc
 
 
 def Str2Pt(point):
@@ -597,6 +959,84 @@ def Str2Pt(point):
     return coerce3dpoint(point, True)
 
 
+class __PointView(object):
+    """Sequence of Point3d read from, and written to, a flat buffer of x,y,z
+    values without copying it"""
+    def __init__(self, values, start=0, count=None):
+        self.values = values
+        self.start = start
+        self.count = len(values)//3 - start if count is None else count
+
+    def __len__(self):
+        return self.count
+
+    def __index(self, index):
+        if index<0: index += self.count
+        if index<0 or index>=self.count: raise IndexError("point index out of range")
+        return (self.start + index)*3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            begin, end, step = index.indices(self.count)
+            if step!=1: return [self[i] for i in compat.RANGE(begin, end, step)]
+            return self.__class__(self.values, self.start + begin, max(0, end - begin))
+        i = self.__index(index)
+        values = self.values
+        return Rhino.Geometry.Point3d(float(values[i]), float(values[i+1]), float(values[i+2]))
+
+    def __setitem__(self, index, point):
+        i = self.__index(index)
+        point = coerce3dpoint(point, True)
+        values = self.values
+        values[i] = point.X
+        values[i+1] = point.Y
+        values[i+2] = point.Z
+
+    def __iter__(self):
+        for index in compat.RANGE(self.count): yield self[index]
+
+    def __repr__(self):
+        return "<point view of %d points>" % self.count
+
+
+def UnflattenArray(numbers, as_view=False):
+    """Converts a one-dimensional array of real numbers into 3-D points, the
+    inverse of SimplifyArray
+    Parameters:
+      numbers ([number, ...]): x,y,z values, a list or tuple, array.array('d'),
+        memoryview, double[] or NumPy array
+      as_view (bool, optional): if True, return a read/write sequence that
+        creates each point from the numbers when it is accessed instead of
+        copying all of them. On Python 2 a memoryview is copied first
+    Returns:
+      list(point, ...): the points if successful
+      sequence: a view of the numbers as points, if as_view is True
+    Example:
+      import rhinoscriptsyntax as rs
+      numbers = rs.SimplifyArray(rs.GetPoints())
+      points = rs.UnflattenArray(numbers)
+    See Also:
+      IterSimplifyArray
+      SimplifyArray
+    """
+    numpy = __numpyarray(numbers)
+    if numpy is not None: count = numbers.size
+    else: count = len(numbers)
+    if count%3: raise ValueError("number of values must be a multiple of 3")
+    if as_view:
+        if numpy is not None: numbers = numbers.reshape(-1)
+        elif type(numbers) is memoryview:
+            # memoryview.cast only exists on Python 3, elsewhere view a copy
+            if compat.PY3: numbers = numbers.cast('B').cast('d')
+            else: numbers = __doublearray(numbers)
+        return __PointView(numbers)
+    if type(numbers) is not list and type(numbers) is not tuple:
+        rc = __point3darrayfrombuffer(numbers)
+        if rc is not None: return list(rc)
+    Point3d = Rhino.Geometry.Point3d
+    return [Point3d(x, y, z) for x, y, z in zip(numbers[0::3], numbers[1::3], numbers[2::3])]
+
+
 def clamp(lowvalue, highvalue, value):
     if lowvalue>=highvalue: raise Exception("lowvalue must be less than highvalue")
     if value<lowvalue: return lowvalue
@@ -604,59 +1044,218 @@ def clamp(lowvalue, highvalue, value):
     return value
 
 
-def fxrange(start, stop, step):
-    "float version of the xrange function"
+def __rangecount(start, stop, step):
+    """Number of values fxrange yields. stop is included when it is within
+    rounding error of start + n*step"""
     if step==0: raise ValueError("step must not equal 0")
-    x = start
+    if start==stop: return 1
     if start<stop:
         if step<0: raise ValueError("step must be greater than 0")
-        while x<=stop:
-            yield x
-            x+=step
-    else:
-        if step>0: raise ValueError("step must be less than 0")
-        while x>=stop:
-            yield x
-            x+=step
+    elif step>0: raise ValueError("step must be less than 0")
+    span = (stop-start)/float(step)
+    return int(math.floor(span + 1e-10*max(1.0, span))) + 1
+
+
+def fxrange(start, stop, step):
+    """float version of the xrange function. Each value is computed as
+    start + i*step, so long ranges do not accumulate rounding errors"""
+    for i in compat.RANGE(__rangecount(start, stop, step)):
+        yield start + i*step
+
+
+def frange(start, stop, step, as_buffer=False):
+    """float version of the range function
+    Parameters:
+      start, stop, step (number): the first value, the last value to include
+        and the increment
+      as_buffer (bool, optional): if True, return an array.array('d').
+        numpy.frombuffer(rc) views it as a NumPy array without copying
+    Returns:
+      list(number, ...): start, start+step, ... up to and including stop
+      array('d'): the same values, if as_buffer is True
+    """
+    values = [start + i*step for i in compat.RANGE(__rangecount(start, stop, step))]
+    if as_buffer: return array.array('d', values)
+    return values
+
+
+def fxlinspace(start, stop, count, endpoint=True):
+    """Yields count evenly spaced numbers from start to stop"""
+    if count<=0: return
+    if count==1:
+        yield float(start)
+        return
+    step = (stop-start)/float(count-1 if endpoint else count)
+    for i in compat.RANGE(count-1):
+        yield start + i*step
+    yield float(stop) if endpoint else start + (count-1)*step
+
+
+def linspace(start, stop, count, endpoint=True, as_buffer=False):
+    """Evenly spaced numbers over an interval, e.g. curve parameters to
+    evaluate
+    Parameters:
+      start, stop (number): the interval
+      count (number): number of values
+      endpoint (bool, optional): if True, stop is the last value. If False,
+        the interval is divided in count steps and stop is left out
+      as_buffer (bool, optional): if True, return an array.array('d').
+        numpy.frombuffer(rc) views it as a NumPy array without copying
+    Returns:
+      list(number, ...): the numbers
+      array('d'): the same numbers, if as_buffer is True
+    """
+    values = list(fxlinspace(start, stop, count, endpoint))
+    if as_buffer: return array.array('d', values)
+    return values
+
+
+def __floatlist(values):
+    """Returns a single number as is, and a list, array.array, NumPy array or
+    other iterable of numbers as a list of floats for RhinoCommon methods"""
+    if isinstance(values, numbers.Number): return values
+    numpy = __numpyarray(values)
+    if numpy is not None:
+        if values.ndim==0: return float(values)
+        return values.astype(numpy.float64).ravel().tolist()
+    return [float(value) for value in values]
+
+
+def __parallelmap(func, items, threads=None):
+    """Calls func for every item on a pool of threads and returns the results
+    in order. Uses Parallel.For on IronPython, which has no global interpreter
+    lock, and a ThreadPoolExecutor elsewhere. func must not touch the
+    document, that is only safe on the calling thread.
+    Parameters:
+      threads [opt] = maximum number of threads, None for the default of the
+        pool and 1 to call func on the calling thread
+    """
+    items = list(items)
+    if threads==1 or len(items)<2: return [func(item) for item in items]
+    if compat.IRONPY2:
+        import System.Threading.Tasks
+        results = [None]*len(items)
+        def body(i): results[i] = func(items[i])
+        options = System.Threading.Tasks.ParallelOptions()
+        if threads: options.MaxDegreeOfParallelism = threads
+        System.Threading.Tasks.Parallel.For(0, len(items), options, System.Action[int](body))
+        return results
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+        return list(pool.map(func, items))
+
+
+def __typedispatch(handlers, resolve=None):
+    """Builds a converter that calls the handler registered for the exact type
+    of its input. The first time an unregistered type is seen, resolve(type)
+    picks the handler and the choice is cached, so every later value of that
+    type costs a single dictionary lookup.
+    Parameters:
+      handlers = dictionary of type -> handler(value)
+      resolve [opt] = function of type returning a handler, or None when
+        values of that type can not be converted
+    Returns:
+      function(value) that returns the converted value or None
+    """
+    cache = dict(handlers)
+    def dispatch(value):
+        value_type = type(value)
+        try:
+            handler = cache[value_type]
+        except KeyError:
+            handler = resolve(value_type) if resolve else None
+            cache[value_type] = handler
+        if handler is None: return None
+        return handler(value)
+    return dispatch
+
+
+def __issequencetype(value_type):
+    return hasattr(value_type, "__len__") and hasattr(value_type, "__getitem__")
+
 
+def __point3dfromfloats(point):
+    if len(point)==3: return Rhino.Geometry.Point3d(float(point[0]), float(point[1]), float(point[2]))
+    return Rhino.Geometry.Point3d(float(point[0]), float(point[1]), 0.0)
 
-def frange(start, stop, step):
-    "float version of the range function"
-    return [x for x in fxrange(start, stop, step)]
+
+def __point3dfromenumerable(point):
+    rc = compat.GET_HOST().Coerce3dPointFromEnumerables(point)
+    if rc is not None: return rc
+    if __issequencetype(type(point)):
+        length = len(point)
+        if length==3 or length==2:
+            try:
+                return __point3dfromfloats(point)
+            except (TypeError, ValueError):
+                return None
+
+
+def __point3dfromsequence(point):
+    # lists and tuples of 2 or 3 numbers give the same point as the host
+    # conversion, so the host is only asked about everything else
+    length = len(point)
+    if length==3 or length==2:
+        try:
+            return __point3dfromfloats(point)
+        except (TypeError, ValueError):
+            pass
+    return compat.GET_HOST().Coerce3dPointFromEnumerables(point)
+
+
+def __point3dfromstring(point):
+    point = point.split(',')
+    return Rhino.Geometry.Point3d( float(point[0]), float(point[1]), float(point[2]) )
+
+
+def __point3dfromguid(id):
+    found, pt = scriptcontext.doc.Objects.TryFindPoint(id)
+    if found: return pt
+
+
+def __point3dfromxyz(point):
+    return Rhino.Geometry.Point3d(point.X, point.Y, point.Z)
+
+
+def __resolvepoint3d(value_type):
+    if issubclass(value_type, compat.STRING_TYPE): return __point3dfromstring
+    if __issequencetype(value_type): return __point3dfromsequence
+    return __point3dfromenumerable
+
+
+__coerce3dpoint = __typedispatch({
+    Rhino.Geometry.Point3d: lambda point: point,
+    Rhino.Geometry.Vector3d: __point3dfromxyz,
+    Rhino.Geometry.Point3f: __point3dfromxyz,
+    Rhino.Geometry.Vector3f: __point3dfromxyz,
+    System.Guid: __point3dfromguid,
+    list: __point3dfromsequence,
+    tuple: __point3dfromsequence,
+    str: __point3dfromstring,
+    }, __resolvepoint3d)
 
 
 def coerce3dpoint(point, raise_on_error=False):
     """Converts input into a Rhino.Geometry.Point3d if possible.
+    Lists and tuples of 2 or 3 numbers are converted directly, other
+    enumerables are passed to the script host
     Parameters:
       point = Point3d, Vector3d, Point3f, Vector3f, str, uuid
       raise_on_error [opt] = True or False
     Returns:
-      a Rhino.Geometry.Point3d
+      a Rhino.Geometry.Point3d. A sequence of 2 or 3 items that are not
+      numbers raises the conversion error, and a string that is not "x,y,z"
+      raises even if raise_on_error is False
     Example:
     See Also:
     """
     if type(point) is Rhino.Geometry.Point3d: return point
-    enumerable = compat.GET_HOST().Coerce3dPointFromEnumerables(point)
-    if enumerable is not None: return enumerable
-    if type(point) is System.Guid:
-        found, pt = scriptcontext.doc.Objects.TryFindPoint(point)
-        if found: return pt
-    if hasattr(point, "__len__") and len(point)==3 and hasattr(point, "__getitem__"):
-        try:
-            return Rhino.Geometry.Point3d(float(point[0]), float(point[1]), float(point[2]))
-        except:
-            if raise_on_error: raise
-    if type(point) is Rhino.Geometry.Vector3d or type(point) is Rhino.Geometry.Point3f or type(point) is Rhino.Geometry.Vector3f:
-        return Rhino.Geometry.Point3d(point.X, point.Y, point.Z)
-    if type(point) is str:
-        point = point.split(',')
-        return Rhino.Geometry.Point3d( float(point[0]), float(point[1]), float(point[2]) )
-    if hasattr(point, "__len__") and len(point)==2 and hasattr(point, "__getitem__"):
-        try:
-            return Rhino.Geometry.Point3d(float(point[0]), float(point[1]), 0.0)
-        except:
-            if raise_on_error: raise
-    if raise_on_error: raise ValueError("Could not convert %s to a Point3d" % point)
+    rc = __coerce3dpoint(point)
+    if rc is None and raise_on_error:
+        # sequences of 2 or 3 items raise the error of the failed conversion
+        if __issequencetype(type(point)) and len(point) in (2, 3): __point3dfromfloats(point)
+        raise ValueError("Could not convert %s to a Point3d" % point)
+    return rc
 
 
 def CreatePoint(point, y=None, z=None):
@@ -680,6 +1279,26 @@ def CreatePoint(point, y=None, z=None):
     return coerce3dpoint(point, True)
 
 
+def __point2dfromsequence(point):
+    if len(point)==2 and type(point[0]) is not list and type(point[0]) is not Rhino.Geometry.Point2d:
+        return Rhino.Geometry.Point2d(point[0], point[1])
+
+
+def __point2dfromstring(point):
+    point = point.split(',')
+    return Rhino.Geometry.Point2d( float(point[0]), float(point[1]) )
+
+
+__coerce2dpoint = __typedispatch({
+    Rhino.Geometry.Point2d: lambda point: point,
+    Rhino.Geometry.Vector3d: lambda point: Rhino.Geometry.Point2d(point.X, point.Y),
+    Rhino.Geometry.Point3d: lambda point: Rhino.Geometry.Point2d(point.X, point.Y),
+    list: __point2dfromsequence,
+    tuple: __point2dfromsequence,
+    str: __point2dfromstring,
+    })
+
+
 def coerce2dpoint(point, raise_on_error=False):
     """Convert input into a Rhino.Geometry.Point2d if possible.
     Parameters:
@@ -691,16 +1310,20 @@ def coerce2dpoint(point, raise_on_error=False):
     See Also:
     """
     if type(point) is Rhino.Geometry.Point2d: return point
-    if type(point) is list or type(point) is tuple:
-        length = len(point)
-        if length==2 and type(point[0]) is not list and type(point[0]) is not Rhino.Geometry.Point2d:
-            return Rhino.Geometry.Point2d(point[0], point[1])
-    if type(point) is Rhino.Geometry.Vector3d or type(point) is Rhino.Geometry.Point3d:
-        return Rhino.Geometry.Point2d(point.X, point.Y)
-    if type(point) is str:
-        point = point.split(',')
-        return Rhino.Geometry.Point2d( float(point[0]), float(point[1]) )
-    if raise_on_error: raise ValueError("Could not convert %s to a Point2d" % point)
+    rc = __coerce2dpoint(point)
+    if rc is None and raise_on_error: raise ValueError("Could not convert %s to a Point2d" % point)
+    return rc
+
+
+def __vector3dfrompoint(vector):
+    point = __coerce3dpoint(vector)
+    if point is not None: return Rhino.Geometry.Vector3d(point.X, point.Y, point.Z)
+
+
+__coerce3dvector = __typedispatch({
+    Rhino.Geometry.Vector3d: lambda vector: vector,
+    Rhino.Geometry.Point3d: lambda point: Rhino.Geometry.Vector3d(point),
+    }, lambda value_type: __vector3dfrompoint)
 
 
 def coerce3dvector(vector, raise_on_error=False):
@@ -714,9 +1337,9 @@ def coerce3dvector(vector, raise_on_error=False):
     See Also:
     """
     if type(vector) is Rhino.Geometry.Vector3d: return vector
-    point = coerce3dpoint(vector, False)
-    if point: return Rhino.Geometry.Vector3d(point.X, point.Y, point.Z)
-    if raise_on_error: raise ValueError("Could not convert %s to a Vector3d" % vector)
+    rc = __coerce3dvector(vector)
+    if rc is None and raise_on_error: raise ValueError("Could not convert %s to a Vector3d" % vector)
+    return rc
 
 
 def CreateVector(vector, y=None, z=None):
@@ -739,17 +1362,211 @@ def CreateVector(vector, y=None, z=None):
     return coerce3dvector(vector, True)
 
 
+def __point3darrayfill(count, fill):
+    """Creates a Point3d[] for count packed x,y,z coordinates and calls
+    fill(address) with the address of the pinned array so the coordinates can
+    be copied in with one block copy. Point3d is a sequential struct of three
+    doubles, so the pinned array has the same memory layout as the packed
+    coordinates.
+    """
+    rc = System.Array.CreateInstance(Rhino.Geometry.Point3d, count // 3)
+    if count==0: return rc
+    handle = System.Runtime.InteropServices.GCHandle.Alloc(rc, System.Runtime.InteropServices.GCHandleType.Pinned)
+    try:
+        fill(handle.AddrOfPinnedObject())
+    finally:
+        handle.Free()
+    return rc
+
+
+def __point3darrayfromdoubles(values):
+    """Copies a double[] of packed x,y,z coordinates into a new Point3d[]"""
+    count = values.Length
+    return __point3darrayfill(count, lambda address: System.Runtime.InteropServices.Marshal.Copy(values, 0, address, count))
+
+
+def __point3darrayfromaddress(address, count):
+    """Copies count packed float64 x,y,z coordinates at a native address
+    straight into a new Point3d[]"""
+    import ctypes
+    return __point3darrayfill(count, lambda target: ctypes.memmove(target.ToInt64(), address, count*8))
+
+
+def __point3darrayfrombuffer(points):
+    """Converts a contiguous buffer of float64 x,y,z triples into a Point3d[]
+    without touching the individual coordinates from python. Accepts objects
+    exposing __array_interface__ (NumPy arrays of shape (N,3) or (3N,)),
+    array.array('d'), double[] and any other object supporting the buffer
+    protocol. The coordinates are copied once, except for read-only buffers
+    and, on IronPython, array.array and memoryviews, which take one more copy
+    through a managed array.
+    Returns:
+      a System.Array[Point3d] or None if points does not expose such a buffer
+    Raises:
+      ValueError if the buffer length is not a multiple of 3
+    """
+    if isinstance(points, compat.STRING_TYPE): return None
+    if isinstance(points, System.Array[System.Double]):
+        if points.Length%3: raise ValueError("buffer length must be a multiple of 3")
+        return __point3darrayfromdoubles(points)
+    interface = getattr(points, "__array_interface__", None)
+    if interface is not None:
+        shape = interface.get("shape", ())
+        if interface.get("typestr")!="<f8" or interface.get("strides") is not None:
+            return None
+        if not (len(shape)==1 or (len(shape)==2 and shape[1]==3)): return None
+        count = shape[0] * (3 if len(shape)==2 else 1)
+        if count%3: raise ValueError("buffer length must be a multiple of 3")
+        return __point3darrayfromaddress(interface["data"][0], count)
+    if isinstance(points, array.array):
+        if points.typecode!='d': return None
+        if len(points)%3: raise ValueError("buffer length must be a multiple of 3")
+        if compat.IRONPY2:
+            # IronPython arrays are managed, so let the runtime copy the values
+            return __point3darrayfromdoubles(System.Array[System.Double](points))
+        address, count = points.buffer_info()
+        return __point3darrayfromaddress(address, count)
+    try:
+        view = memoryview(points)
+    except TypeError:
+        return None
+    if view.format!='d' or not getattr(view, "c_contiguous", True): return None
+    if compat.PY3:
+        count = view.nbytes // 8
+        if count%3: raise ValueError("buffer length must be a multiple of 3")
+        if count==0: return __point3darrayfromaddress(0, 0)
+        if not view.readonly:
+            import ctypes
+            start = ctypes.c_char.from_buffer(view)
+            return __point3darrayfromaddress(ctypes.addressof(start), count)
+        values = array.array('d')
+        values.frombytes(view.cast('B'))
+        return __point3darrayfromaddress(values.buffer_info()[0], count)
+    # latin-1 maps every character of the byte string to one byte, so the
+    # runtime fills the Byte[] in a single call
+    data = System.Text.Encoding.GetEncoding(28591).GetBytes(view.tobytes())
+    if (data.Length // 8)%3: raise ValueError("buffer length must be a multiple of 3")
+    return __point3darrayfill(data.Length // 8, lambda address: System.Runtime.InteropServices.Marshal.Copy(data, 0, address, data.Length))
+
+
+def __point3darraytodoubles(points, target=None):
+    """Copies the coordinates of a Point3d[] as packed x,y,z values into
+    target, an array.array('d'), double[] or writable float64 buffer of
+    3*points.Length values, with one block copy. If target is omitted a new
+    array.array('d') is created.
+    Returns:
+      target
+    """
+    count = points.Length * 3
+    if target is None: target = array.array('d', [0.0]) * count
+    if count==0: return target
+    handle = System.Runtime.InteropServices.GCHandle.Alloc(points, System.Runtime.InteropServices.GCHandleType.Pinned)
+    try:
+        address = handle.AddrOfPinnedObject()
+        if isinstance(target, System.Array[System.Double]):
+            System.Runtime.InteropServices.Marshal.Copy(address, target, 0, count)
+        elif compat.IRONPY2:
+            # IronPython buffers are managed, copy through a double[]
+            values = System.Array.CreateInstance(System.Double, count)
+            System.Runtime.InteropServices.Marshal.Copy(address, values, 0, count)
+            target[:] = array.array('d', values)
+        else:
+            import ctypes
+            if isinstance(target, array.array): start = target.buffer_info()[0]
+            else: start = ctypes.addressof(ctypes.c_char.from_buffer(target))
+            ctypes.memmove(start, address.ToInt64(), count*8)
+    finally:
+        handle.Free()
+    return target
+
+
+# point types SimplifyArray reads without coercing each point
+__pointtypes = (Rhino.Geometry.Point3d, Rhino.Geometry.Point3f, Rhino.Geometry.Vector3d)
+
+
+def __coordinatecolumns(points):
+    """Returns the x, y and z coordinates of a list of points or a float64
+    buffer of x,y,z triples as three sequences"""
+    values = __doublearray(points)
+    if values is not None:
+        if len(values)%3: raise ValueError("buffer length must be a multiple of 3")
+        return values[0::3], values[1::3], values[2::3]
+    points = coerce3dpointlist(points, True)
+    return [point.X for point in points], [point.Y for point in points], [point.Z for point in points]
+
+
+def __numpyarray(value):
+    """Returns the numpy module if value is a NumPy array, otherwise None.
+    numpy is never imported here, an array cannot exist before its module
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray): return numpy
+
+
+def __ispointstream(points):
+    """True for point inputs that are streamed as coordinates instead of being
+    converted to a list of Point3d: NumPy arrays, float64 buffers and
+    iterators that are not sequences, such as generators. Lists, tuples,
+    Point3d[], Point3dList and other collections are not streamed"""
+    if type(points) is list or type(points) is tuple: return False
+    if __numpyarray(points) is not None: return True
+    if not hasattr(points, "__len__"): return hasattr(points, "__iter__")
+    return __doublearray(points) is not None
+
+
+def __doublearray(values):
+    """Returns the values of a float64 buffer as a flat array.array('d').
+    array.array('d') input is returned as is, double[] and contiguous
+    memoryviews are copied. Returns None for lists, tuples and anything that
+    is not a float64 buffer
+    """
+    if isinstance(values, array.array): return values if values.typecode=='d' else None
+    if isinstance(values, System.Array[System.Double]): return array.array('d', values)
+    if type(values) is list or type(values) is tuple or isinstance(values, compat.STRING_TYPE):
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.format!='d' or not getattr(view, "c_contiguous", True): return None
+    rc = array.array('d')
+    if compat.PY3: rc.frombytes(view.cast('B'))
+    else: rc.fromstring(view.tobytes())
+    return rc
+
+
 def coerce3dpointlist(points, raise_on_error=False):
+    """Convert input into a list of Rhino.Geometry.Point3d if possible.
+    Contiguous float64 buffers of x,y,z triples, such as NumPy (N,3) arrays,
+    array.array('d') and memoryviews, are copied into a Point3d[] in bulk.
+    Parameters:
+      points = list of points, Point3d array, Point3dList, flat list of
+        numbers or a float64 buffer
+      raise_on_error [opt] = True or False
+    Returns:
+      a list of Rhino.Geometry.Point3d. For a float64 buffer, the Point3d[]
+      the buffer was copied into, so the points are never boxed one by one.
+      A buffer whose length is not a multiple of 3 is an error
+    Example:
+    See Also:
+    """
     if isinstance(points, System.Array[Rhino.Geometry.Point3d]):
         return list(points)
     if isinstance(points, Rhino.Collections.Point3dList): return list(points)
+    if type(points) is not list and type(points) is not tuple:
+        try:
+            rc = __point3darrayfrombuffer(points)
+        except ValueError:
+            if raise_on_error: raise
+            return None
+        if rc is not None: return rc
     if type(points) is list or type(points) is tuple:
         count = len(points)
         if count>10 and type(points[0]) is Rhino.Geometry.Point3d: return points
         if count>0 and (coerce3dpoint(points[0]) is not None):
             return [coerce3dpoint(points[i], raise_on_error) for i in compat.RANGE(count)]
         elif count>2 and type(points[0]) is not list:
-            point_count = count/3
+            point_count = count//3
             rc = []
             for i in compat.RANGE(point_count):
                 pt = Rhino.Geometry.Point3d(points[i*3], points[i*3+1], points[i*3+2])
@@ -786,6 +1603,37 @@ def coerce2dpointlist(points):
     return None
 
 
+def __planefromsequence(plane):
+    length = len(plane)
+    if length == 1:
+        point = coerce3dpoint(plane, False)
+        if point: plane = point; length = 3
+        elif plane[0] is list or plane[0] is tuple: return coerceplane(plane[0])
+    if length==3 and type(plane[0]) is not list:
+        rc = Rhino.Geometry.Plane.WorldXY
+        rc.Origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
+        return rc
+    if length==9 and type(plane[0]) is not list:
+        origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
+        xpoint = Rhino.Geometry.Point3d(plane[3],plane[4],plane[5])
+        ypoint = Rhino.Geometry.Point3d(plane[6],plane[7],plane[8])
+        rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
+        return rc
+    if (length==3 or length==4) and (type(plane[0]) is list or type(plane[0]) is tuple):
+        origin = Rhino.Geometry.Point3d(plane[0][0],plane[0][1],plane[0][2])
+        xpoint = Rhino.Geometry.Point3d(plane[1][0],plane[1][1],plane[1][2])
+        ypoint = Rhino.Geometry.Point3d(plane[2][0],plane[2][1],plane[2][2])
+        rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
+        return rc
+
+
+__coerceplane = __typedispatch({
+    Rhino.Geometry.Plane: lambda plane: plane,
+    list: __planefromsequence,
+    tuple: __planefromsequence,
+    })
+
+
 def coerceplane(plane, raise_on_bad_input=False):
     """Convert input into a Rhino.Geometry.Plane if possible.
     Parameters:
@@ -796,29 +1644,9 @@ def coerceplane(plane, raise_on_bad_input=False):
     See Also:
     """
     if type(plane) is Rhino.Geometry.Plane: return plane
-    if type(plane) is list or type(plane) is tuple:
-        length = len(plane)
-        if length == 1:
-            point = coerce3dpoint(plane, False)
-            if point: plane = point; length = 3
-            elif plane[0] is list or plane[0] is tuple: return coerceplane(plane[0])
-        if length==3 and type(plane[0]) is not list:
-            rc = Rhino.Geometry.Plane.WorldXY
-            rc.Origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
-            return rc
-        if length==9 and type(plane[0]) is not list:
-            origin = Rhino.Geometry.Point3d(plane[0],plane[1],plane[2])
-            xpoint = Rhino.Geometry.Point3d(plane[3],plane[4],plane[5])
-            ypoint = Rhino.Geometry.Point3d(plane[6],plane[7],plane[8])
-            rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
-            return rc
-        if (length==3 or length==4) and (type(plane[0]) is list or type(plane[0]) is tuple):
-            origin = Rhino.Geometry.Point3d(plane[0][0],plane[0][1],plane[0][2])
-            xpoint = Rhino.Geometry.Point3d(plane[1][0],plane[1][1],plane[1][2])
-            ypoint = Rhino.Geometry.Point3d(plane[2][0],plane[2][1],plane[2][2])
-            rc     = Rhino.Geometry.Plane(origin, xpoint, ypoint)
-            return rc
-    if raise_on_bad_input: raise TypeError("%s can not be converted to a Plane"%plane)
+    rc = __coerceplane(plane)
+    if rc is None and raise_on_bad_input: raise TypeError("%s can not be converted to a Plane"%plane)
+    return rc
 
 
 def CreatePlane(plane_or_origin, x_axis=None, y_axis=None, ignored=None):
@@ -844,6 +1672,22 @@ def CreatePlane(plane_or_origin, x_axis=None, y_axis=None, ignored=None):
     return coerceplane(plane_or_origin, True)
 
 
+def __xformfromsequence(xform):
+    if len(xform)==4 and len(xform[0])==4:
+        xf = Rhino.Geometry.Transform()
+        for i in range(4):
+            for j in range(4):
+                xf[i,j] = xform[i][j]
+        return xf
+
+
+__coercexform = __typedispatch({
+    Rhino.Geometry.Transform: lambda xform: xform,
+    list: __xformfromsequence,
+    tuple: __xformfromsequence,
+    })
+
+
 def coercexform(xform, raise_on_bad_input=False):
     """Convert input into a Rhino.Transform if possible.
     Parameters:
@@ -852,15 +1696,10 @@ def coercexform(xform, raise_on_bad_input=False):
     Example:
     See Also:
     """
-    t = type(xform)
-    if t is Rhino.Geometry.Transform: return xform
-    if( (t is list or t is tuple) and len(xform)==4 and len(xform[0])==4):
-        xf = Rhino.Geometry.Transform()
-        for i in range(4):
-            for j in range(4):
-                xf[i,j] = xform[i][j]
-        return xf
-    if raise_on_bad_input: raise TypeError("%s can not be converted to a Transform"%xform)
+    if type(xform) is Rhino.Geometry.Transform: return xform
+    rc = __coercexform(xform)
+    if rc is None and raise_on_bad_input: raise TypeError("%s can not be converted to a Transform"%xform)
+    return rc
 
 
 def CreateXform(xform):
@@ -912,13 +1751,24 @@ def coerceboundingbox(bbox, raise_on_bad_input=False):
     if raise_on_bad_input: raise TypeError("%s can not be converted to a BoundingBox"%bbox)
 
 
+def __colorfromsequence(c):
+    if len(c)==3: return System.Drawing.Color.FromArgb(c[0], c[1], c[2])
+    elif len(c)==4: return System.Drawing.Color.FromArgb(c[3], c[0], c[1], c[2])
+
+
+__coercecolor = __typedispatch({
+    System.Drawing.Color: lambda c: c,
+    list: __colorfromsequence,
+    tuple: __colorfromsequence,
+    int: System.Drawing.Color.FromArgb,
+    })
+
+
 def coercecolor(c, raise_if_bad_input=False):
     if type(c) is System.Drawing.Color: return c
-    if type(c) is list or type(c) is tuple:
-        if len(c)==3: return System.Drawing.Color.FromArgb(c[0], c[1], c[2])
-        elif len(c)==4: return System.Drawing.Color.FromArgb(c[3], c[0], c[1], c[2])
-    if type(c)==type(1): return System.Drawing.Color.FromArgb(c)
-    if raise_if_bad_input: raise TypeError("%s can not be converted to a Color"%c)
+    rc = __coercecolor(c)
+    if rc is None and raise_if_bad_input: raise TypeError("%s can not be converted to a Color"%c)
+    return rc
 
 
 def CreateColor(color, g=None, b=None, a=None):
@@ -943,7 +1793,7 @@ def CreateColor(color, g=None, b=None, a=None):
 def coerceline(line, raise_if_bad_input=False):
     if type(line) is Rhino.Geometry.Line: return line
     guid = coerceguid(line, False)
-    if guid: line = scriptcontext.doc.Objects.Find(guid).Geometry
+    if guid: line = __findgeometry(guid)
     if isinstance(line, Rhino.Geometry.Curve) and line.IsLinear:
         return Rhino.Geometry.Line(line.PointAtStart, line.PointAtEnd)
     points = coerce3dpointlist(line, raise_if_bad_input)
@@ -951,6 +1801,128 @@ def coerceline(line, raise_if_bad_input=False):
     if raise_if_bad_input: raise TypeError("%s can not be converted to a Line"%line)
 
 
+# RhinoObject and geometry lookups memoized by id while an objectcache is
+# active. Document events evict the ids they affect
+__object_cache = {"depth": 0, "doc": None, "objects": {}, "geometry": {}, "bbox": {}}
+
+
+def __clearobjectcache(sender=None, e=None):
+    __object_cache["objects"].clear()
+    __object_cache["geometry"].clear()
+    __object_cache["bbox"].clear()
+
+
+def __evictobject(sender, e):
+    __object_cache["objects"].pop(e.ObjectId, None)
+    __object_cache["geometry"].pop(e.ObjectId, None)
+    __object_cache["bbox"].pop(e.ObjectId, None)
+
+
+def __evictmodifiedobject(sender, e):
+    object_id = e.RhinoObject.Id
+    __object_cache["objects"].pop(object_id, None)
+    __object_cache["geometry"].pop(object_id, None)
+    __object_cache["bbox"].pop(object_id, None)
+
+
+def __cachedobjects(kind):
+    cache = __object_cache
+    if not cache["depth"]: return None
+    if cache["doc"] is not scriptcontext.doc:
+        __clearobjectcache()
+        cache["doc"] = scriptcontext.doc
+    return cache[kind]
+
+
+def __findobject(object_id):
+    objects = __cachedobjects("objects")
+    if objects is None: return scriptcontext.doc.Objects.Find(object_id)
+    rhobj = objects.get(object_id)
+    if rhobj is None:
+        rhobj = scriptcontext.doc.Objects.Find(object_id)
+        if rhobj is not None: objects[object_id] = rhobj
+    return rhobj
+
+
+def __findgeometry(object_id):
+    geometries = __cachedobjects("geometry")
+    if geometries is None:
+        rhobj = scriptcontext.doc.Objects.Find(object_id)
+        if rhobj: return rhobj.Geometry
+        return None
+    geometry = geometries.get(object_id)
+    if geometry is None:
+        rhobj = __findobject(object_id)
+        if rhobj is None: return None
+        geometry = rhobj.Geometry
+        if geometry is not None: geometries[object_id] = geometry
+    return geometry
+
+
+def __objectboundingbox(object_id, geometry):
+    """Returns a bounding box that contains the geometry of an object. The
+    box is not necessarily tight, so it only gives distance lower bounds"""
+    boxes = __cachedobjects("bbox")
+    if boxes is None: return geometry.GetBoundingBox(False)
+    bbox = boxes.get(object_id)
+    if bbox is None: bbox = boxes[object_id] = geometry.GetBoundingBox(False)
+    return bbox
+
+
+def _enterobjectcache():
+    cache = __object_cache
+    if cache["depth"]==0:
+        cache["doc"] = scriptcontext.doc
+        Rhino.RhinoDoc.AddRhinoObject += __evictobject
+        Rhino.RhinoDoc.DeleteRhinoObject += __evictobject
+        Rhino.RhinoDoc.UndeleteRhinoObject += __evictobject
+        Rhino.RhinoDoc.ReplaceRhinoObject += __evictobject
+        Rhino.RhinoDoc.ModifyObjectAttributes += __evictmodifiedobject
+        Rhino.RhinoDoc.CloseDocument += __clearobjectcache
+        Rhino.RhinoDoc.BeginOpenDocument += __clearobjectcache
+    cache["depth"] += 1
+
+
+def _exitobjectcache():
+    cache = __object_cache
+    cache["depth"] -= 1
+    if cache["depth"]==0:
+        Rhino.RhinoDoc.AddRhinoObject -= __evictobject
+        Rhino.RhinoDoc.DeleteRhinoObject -= __evictobject
+        Rhino.RhinoDoc.UndeleteRhinoObject -= __evictobject
+        Rhino.RhinoDoc.ReplaceRhinoObject -= __evictobject
+        Rhino.RhinoDoc.ModifyObjectAttributes -= __evictmodifiedobject
+        Rhino.RhinoDoc.CloseDocument -= __clearobjectcache
+        Rhino.RhinoDoc.BeginOpenDocument -= __clearobjectcache
+        __clearobjectcache()
+        cache["doc"] = None
+
+
+class objectcache(object):
+    """Context manager that memoizes the RhinoObject and geometry found for
+    each object id by the coerce functions, so repeated queries on the same
+    objects skip the object table. Adding, deleting, replacing or modifying an
+    object evicts its entry, so lookups stay correct while the cache is
+    active. rhinoscriptsyntax.batch enables the cache for its block
+    Example:
+      import rhinoscriptsyntax as rs
+      curves = rs.ObjectsByType(4)
+      with rs.objectcache():
+          for curve in curves:
+              length = rs.CurveLength(curve)
+              start = rs.CurveStartPoint(curve)
+    See Also:
+      batch
+    """
+    def __enter__(self):
+        _enterobjectcache()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _exitobjectcache()
+        return False
+
+
 def coercegeometry(id, raise_if_missing=False):
     """attempt to get GeometryBase class from given input
     Parameters:
@@ -964,8 +1936,8 @@ def coercegeometry(id, raise_if_missing=False):
     if isinstance(id, Rhino.DocObjects.RhinoObject): return id.Geometry
     id = coerceguid(id, raise_if_missing)
     if id:
-        rhobj = scriptcontext.doc.Objects.Find(id)
-        if rhobj: return rhobj.Geometry
+        geometry = __findgeometry(id)
+        if geometry: return geometry
     if raise_if_missing: raise ValueError("unable to convert %s into geometry"%id)
 
 
@@ -997,10 +1969,9 @@ def coercecurve(id, segment_index=-1, raise_if_missing=False):
     if isinstance(id, Rhino.Geometry.Curve): return id
     if type(id) is Rhino.DocObjects.ObjRef: return id.Curve()
     id = coerceguid(id, True)
-    crvObj = scriptcontext.doc.Objects.Find(id)
-    if crvObj:
-        curve = crvObj.Geometry
-        if curve and segment_index>=0 and type(curve) is Rhino.Geometry.PolyCurve:
+    curve = __findgeometry(id)
+    if curve:
+        if segment_index>=0 and type(curve) is Rhino.Geometry.PolyCurve:
             curve = curve.SegmentCurve(segment_index)
         if isinstance(curve, Rhino.Geometry.Curve): return curve
     if raise_if_missing: raise ValueError("unable to convert %s into Curve geometry"%id)
@@ -1020,9 +1991,8 @@ def coercesurface(object_id, raise_if_missing=False):
     if isinstance(object_id, Rhino.Geometry.Brep) and object_id.Faces.Count==1: return object_id.Faces[0]
     if type(object_id) is Rhino.DocObjects.ObjRef: return object_id.Face()
     object_id = coerceguid(object_id, True)
-    srfObj = scriptcontext.doc.Objects.Find(object_id)
-    if srfObj:
-        srf = srfObj.Geometry
+    srf = __findgeometry(object_id)
+    if srf:
         if isinstance(srf, Rhino.Geometry.Surface): return srf
         #single face breps are considered surfaces in the context of scripts
         if isinstance(srf, Rhino.Geometry.Brep) and srf.Faces.Count==1:
@@ -1044,10 +2014,8 @@ def coercemesh(object_id, raise_if_missing=False):
     if isinstance(object_id, Rhino.Geometry.Mesh): return object_id
     object_id = coerceguid(object_id, raise_if_missing)
     if object_id: 
-        meshObj = scriptcontext.doc.Objects.Find(object_id)
-        if meshObj:
-            mesh = meshObj.Geometry
-            if isinstance(mesh, Rhino.Geometry.Mesh): return mesh
+        mesh = __findgeometry(object_id)
+        if isinstance(mesh, Rhino.Geometry.Mesh): return mesh
     if raise_if_missing: raise ValueError("unable to convert %s into Mesh geometry"%object_id)
 
 
@@ -1065,7 +2033,7 @@ def coercerhinoobject(object_id, raise_if_bad_input=False, raise_if_missing=Fals
     if isinstance(object_id, Rhino.DocObjects.RhinoObject): return object_id
     object_id = coerceguid(object_id, raise_if_bad_input)
     if object_id is None: return None
-    rc = scriptcontext.doc.Objects.Find(object_id)
+    rc = __findobject(object_id)
     if not rc and raise_if_missing: raise ValueError("%s does not exist in ObjectTable" % object_id)
     return rc
 
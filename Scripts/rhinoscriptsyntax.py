@@ -1,42 +1,116 @@
-from rhinoscript import compat
+import re
+import sys
+import types
+import bisect
+
+import rhinocompat as compat
 # this is not the best python scripting practice, but if you want everything in one big list
-from rhinoscript.application import *
-from rhinoscript.curve import *
-from rhinoscript.document import *
-from rhinoscript.geometry import *
-from rhinoscript.layer import *
-from rhinoscript.object import *
-from rhinoscript.plane import *
-from rhinoscript.selection import *
-from rhinoscript.surface import *
-from rhinoscript.userinterface import *
-from rhinoscript.view import *
-from rhinoscript.utility import *
-from rhinoscript.block import *
-from rhinoscript.group import *
-from rhinoscript.mesh import *
-from rhinoscript.line import *
-from rhinoscript.transformation import *
-from rhinoscript.grips import *
-from rhinoscript.pointvector import *
-from rhinoscript.userdata import *
-from rhinoscript.material import *
-from rhinoscript.dimension import *
-from rhinoscript.light import *
-from rhinoscript.hatch import *
-from rhinoscript.linetype import *
-from rhinoscript.toolbar import *
+# every public name of the rhinoscript submodules is available here. Names are looked up in
+# a prebuilt index and their submodule is only imported the first time one of them is used
+from rhinoscript import LazyModule, nameindex
+
+__all__ = sorted(nameindex.NAMES)
+
+
+# case-insensitive name index shared by the search functions below. It is
+# rebuilt only when a script adds, rebinds or removes a name that is not in
+# the prebuilt index, names the module resolves itself never change it
+__name_index = None
+
+
+def __module_name(name, value):
+    if name in nameindex.DEFINED: return "rhinoscript." + nameindex.DEFINED[name]
+    if value is None: return None
+    try:
+        return value.__module__
+    except:
+        return None
+
+
+def __get_name_index():
+    global __name_index
+    module = sys.modules[__name__]
+    version = getattr(module, "_version", None)
+    if __name_index is not None and version is not None and __name_index["key"]==version:
+        return __name_index
+    module_dict = module.__dict__
+    own = globals()
+    by_lower = {}
+    for name in nameindex.NAMES:
+        by_lower[name.lower()] = (name, __module_name(name, None))
+    # add the public names a script assigned, but not modules or the imports
+    # and helpers of this file
+    for name, value in compat.ITERATOR2LIST(module_dict.items()):
+        if name in nameindex.NAMES or name.startswith("_"): continue
+        if isinstance(value, types.ModuleType) or own.get(name) is value: continue
+        by_lower[name.lower()] = (name, __module_name(name, value))
+    lower_names = sorted(by_lower)
+    __name_index = {
+        "key": version,
+        "by_lower": by_lower,
+        "lower_names": lower_names,
+        "text": "\n".join(lower_names),
+        }
+    return __name_index
+
 
 def __reverse_module_search(func_name):
     if func_name is None: return None
     if not compat.IS_STRING_INSTANCE(func_name): return None
-    g_lower = dict((k.lower(),(k,v)) for k,v in compat.ITERATOR2LIST(globals().items()))
-    f_lower = func_name.lower()
-    if f_lower in g_lower:
-        f_data = g_lower[f_lower]
-        if f_data[1]:
-            try:
-                full_module_name = f_data[1].__module__
-                if full_module_name: return (f_data[0],full_module_name)
-            except:
-                return None
+    f_data = __get_name_index()["by_lower"].get(func_name.lower())
+    if f_data and f_data[1]: return f_data
+
+
+def __prefix_search(prefix, limit=None):
+    """Returns the names that start with prefix, ignoring case, in alphabetical
+    order. Used by editors for autocompletion
+    """
+    if not compat.IS_STRING_INSTANCE(prefix): return []
+    index = __get_name_index()
+    lower_names = index["lower_names"]
+    prefix = prefix.lower()
+    rc = []
+    i = bisect.bisect_left(lower_names, prefix)
+    while i<len(lower_names) and lower_names[i].startswith(prefix):
+        rc.append(index["by_lower"][lower_names[i]][0])
+        if limit and len(rc)>=limit: break
+        i += 1
+    return rc
+
+
+def __shortest_span(lower_name, text):
+    """Returns the length of the shortest part of lower_name that contains the
+    characters of text in order, or None if it does not contain them"""
+    best = None
+    start = lower_name.find(text[0])
+    while start>=0:
+        end = start
+        for c in text[1:]:
+            end = lower_name.find(c, end+1)
+            if end<0: return best
+        if best is None or end-start<best: best = end-start
+        start = lower_name.find(text[0], start+1)
+    return best
+
+
+def __fuzzy_search(text, limit=20):
+    """Returns the names that contain the characters of text in order, ignoring
+    case, so "adl" finds AddLine. Names that start with the first character
+    come first, then names with the shortest span that contains the
+    characters, then shorter names
+    """
+    if not compat.IS_STRING_INSTANCE(text) or not text: return []
+    index = __get_name_index()
+    text = text.lower()
+    pattern = "^[^\n]*?" + "[^\n]*?".join(re.escape(c) for c in text) + "[^\n]*$"
+    scored = []
+    for match in re.finditer(pattern, index["text"], re.MULTILINE):
+        lower_name = match.group(0)
+        span = __shortest_span(lower_name, text)
+        scored.append((lower_name[0]!=text[0], span, len(lower_name), lower_name))
+    scored.sort()
+    if limit: scored = scored[:limit]
+    return [index["by_lower"][item[3]][0] for item in scored]
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], nameindex.NAMES)
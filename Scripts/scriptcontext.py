@@ -15,6 +15,30 @@ doc = None
 id = 1
 
 
+'''When True, functions in the rhinoscript package do not redraw the views after
+changing the document. Each skipped redraw is counted in redraws_suppressed.
+This switch is normally managed by rhinoscriptsyntax.batch
+'''
+batch_redraw = False
+redraws_suppressed = 0
+
+
+def redraw():
+    "Redraws the views of the document unless redraws are being batched"
+    global redraws_suppressed
+    if batch_redraw:
+        redraws_suppressed += 1
+        return
+    doc.Views.Redraw()
+
+
+'''Statistics of the rhinoscript function calls as a dictionary of function
+name -> call statistics, or None if instrumentation was never enabled. This
+variable is managed by rhinoscriptsyntax.EnableInstrumentation
+'''
+instrumentation = None
+
+
 class __Py2StickyWrapper(dict):
     '''A dictionary of values that can be reused between execution of scripts
     '''
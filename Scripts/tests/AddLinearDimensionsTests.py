@@ -13,6 +13,7 @@ def coerceannotation(object_id):
     return annotation_object
 
 
+@unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "needs RhinoCommon annotations")
 class AddLinearDimensionsTests(unittest.TestCase):
   def test_CurrentCPlaneWithPointsOnPlane(self):
     plane = rs.WorldXYPlane()
@@ -1,6 +1,7 @@
 import unittest
 import uuid
 
+import Rhino
 import Rhino.Geometry as g
 
 import rhinoscriptsyntax as rs
@@ -18,6 +19,7 @@ class AddPatchTests(unittest.TestCase):
   def test_InvalidArgumentsReturnsNone(self):
     self.assertTrue(rs.AddPatch(uniquestr(), uniquestr()) == None)
     
+  @unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "needs RhinoCommon circles and Breps")
   def test_SimpleWithSurfaceAndDefaults(self):
     id = rs.AddCircle((0,0,0), 20)
     srf_id = rs.AddPlanarSrf(id)
@@ -26,6 +28,7 @@ class AddPatchTests(unittest.TestCase):
     brep = rs.coercebrep(id, True)
     self.assertTrue(brep.IsSurface)
 
+  @unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "needs RhinoCommon Breps")
   def test_SimpleWithUVSpansAndDefaults(self):
     pt_ids = rs.AddPoints([(-20,0,0), (0,20,0), (20,0,0)])
     id = rs.AddPatch(pt_ids, (10,10))
@@ -0,0 +1,44 @@
+import unittest
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+class BatchTests(unittest.TestCase):
+  def tearDown(self):
+    sc.batch_redraw = False
+
+  def test_RedrawsAreSuppressedInsideBlock(self):
+    with rs.batch() as b:
+      ids = [rs.AddPoint((i, 0, 0)) for i in range(5)]
+      self.assertTrue(sc.batch_redraw)
+    self.assertFalse(sc.batch_redraw)
+    self.assertEqual(b.redraws_suppressed, 5)
+    rs.DeleteObjects(ids)
+
+  def test_RedrawEnabledIsRestored(self):
+    enabled = sc.doc.Views.RedrawEnabled
+    with rs.batch():
+      self.assertFalse(sc.doc.Views.RedrawEnabled)
+    self.assertEqual(sc.doc.Views.RedrawEnabled, enabled)
+
+  def test_NestedBatchIsMergedIntoOuter(self):
+    with rs.batch() as outer:
+      with rs.batch() as inner:
+        id = rs.AddPoint((0, 0, 0))
+      self.assertTrue(sc.batch_redraw)
+      rs.DeleteObject(id)
+    self.assertEqual(inner.redraws_suppressed, 1)
+    self.assertEqual(outer.redraws_suppressed, 2)
+
+  def test_StateIsRestoredOnException(self):
+    try:
+      with rs.batch():
+        raise ValueError()
+    except ValueError:
+      pass
+    self.assertFalse(sc.batch_redraw)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(BatchTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -12,6 +12,7 @@ def newGuidStr():
     return str(uuid.uuid4())
 
 
+@unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "needs RhinoCommon NURBS surfaces")
 class ChangeSurfaceDegreeTests(unittest.TestCase):
   def setUp(self):
     points = Rhino.Collections.Point3dList(5)
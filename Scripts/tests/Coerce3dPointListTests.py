@@ -0,0 +1,65 @@
+import sys
+import array
+import unittest
+
+import System
+import Rhino.Geometry as g
+import rhinoscriptsyntax as rs
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+
+def xyz(points):
+  return [(p.X, p.Y, p.Z) for p in points]
+
+
+class Coerce3dPointListTests(unittest.TestCase):
+  def setUp(self):
+    self.values = [0,1,2, 3.5,4,5, -6,7,8e3]
+    self.expected = [(0,1,2), (3.5,4,5), (-6,7,8e3)]
+
+  def assertPointArray(self, rc):
+    self.assertTrue(isinstance(rc, System.Array[g.Point3d]))
+    self.assertEqual(xyz(rc), self.expected)
+
+  def test_ArrayOfDoubles(self):
+    self.assertPointArray(rs.coerce3dpointlist(array.array('d', self.values)))
+
+  def test_DoubleArray(self):
+    self.assertPointArray(rs.coerce3dpointlist(System.Array[System.Double](self.values)))
+
+  def test_WritableMemoryview(self):
+    self.assertPointArray(rs.coerce3dpointlist(memoryview(array.array('d', self.values))))
+
+  @unittest.skipIf(sys.version_info[0]<3, "memoryview.cast needs Python 3")
+  def test_ReadOnlyMemoryview(self):
+    data = array.array('d', self.values).tobytes()
+    self.assertPointArray(rs.coerce3dpointlist(memoryview(data).cast('d')))
+
+  @unittest.skipIf(numpy is None, "numpy is not installed")
+  def test_NumpyArrays(self):
+    self.assertPointArray(rs.coerce3dpointlist(numpy.array(self.values).reshape(-1, 3)))
+    self.assertPointArray(rs.coerce3dpointlist(numpy.array(self.values)))
+
+  def test_EmptyBuffer(self):
+    self.assertEqual(len(rs.coerce3dpointlist(array.array('d'))), 0)
+
+  def test_LengthNotMultipleOfThreeIsRejected(self):
+    bad = [array.array('d', self.values[:4]), memoryview(array.array('d', self.values[:8])),
+      System.Array[System.Double](self.values[:2])]
+    if numpy is not None: bad.append(numpy.array(self.values[:5]))
+    for values in bad:
+      self.assertIsNone(rs.coerce3dpointlist(values))
+      self.assertRaises(ValueError, rs.coerce3dpointlist, values, True)
+
+  def test_ListsStayLists(self):
+    rc = rs.coerce3dpointlist([(0,1,2), (3.5,4,5), (-6,7,8e3)])
+    self.assertEqual(type(rc), list)
+    self.assertEqual(xyz(rc), self.expected)
+    self.assertEqual(xyz(rs.coerce3dpointlist(self.values)), self.expected)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(Coerce3dPointListTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
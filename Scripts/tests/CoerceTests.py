@@ -0,0 +1,59 @@
+import unittest
+
+import Rhino.Geometry as g
+import rhinoscriptsyntax as rs
+
+
+def xyz(point):
+  return (point.X, point.Y, point.Z)
+
+
+class Coerce3dPointTests(unittest.TestCase):
+  def test_Point3dIsReturned(self):
+    point = g.Point3d(1,2,3)
+    self.assertTrue(rs.coerce3dpoint(point) is point)
+
+  def test_SequencesAndXyzTypes(self):
+    self.assertEqual(xyz(rs.coerce3dpoint((1,2,3))), (1,2,3))
+    self.assertEqual(xyz(rs.coerce3dpoint([1,2,3])), (1,2,3))
+    self.assertEqual(xyz(rs.coerce3dpoint([1,2])), (1,2,0))
+    self.assertEqual(xyz(rs.coerce3dpoint(("1", 2.5, 3))), (1,2.5,3))
+    self.assertEqual(xyz(rs.coerce3dpoint(g.Vector3d(4,5,6))), (4,5,6))
+
+  def test_String(self):
+    self.assertEqual(xyz(rs.coerce3dpoint("1,2,3")), (1,2,3))
+    self.assertEqual(xyz(rs.coerce3dpoint("1, 2.5 ,-3")), (1,2.5,-3))
+
+  def test_MalformedStringRaises(self):
+    self.assertRaises(IndexError, rs.coerce3dpoint, "1,2")
+    self.assertRaises(ValueError, rs.coerce3dpoint, "a,b,c")
+
+  def test_Guid(self):
+    point = rs.AddPoint((7,8,9))
+    line = rs.AddLine((0,0,0), (1,0,0))
+    try:
+      self.assertEqual(xyz(rs.coerce3dpoint(point)), (7,8,9))
+      self.assertIsNone(rs.coerce3dpoint(line))
+      self.assertRaises(ValueError, rs.coerce3dpoint, line, True)
+    finally:
+      rs.DeleteObjects([point, line])
+
+  def test_BadInput(self):
+    for bad in (None, 5, [1,2,3,4], ["a","b","c"], [None,1,2]):
+      self.assertIsNone(rs.coerce3dpoint(bad))
+    self.assertRaises(ValueError, rs.coerce3dpoint, None, True)
+    self.assertRaises(ValueError, rs.coerce3dpoint, [1,2,3,4], True)
+
+  def test_BadItemRaisesConversionError(self):
+    self.assertRaises(ValueError, rs.coerce3dpoint, ["a","b","c"], True)
+    self.assertRaises(TypeError, rs.coerce3dpoint, [None,1,2], True)
+    self.assertRaises(TypeError, rs.coerce3dpoint, (1,None), True)
+
+  def test_VectorFollowsPoint(self):
+    self.assertEqual(xyz(rs.coerce3dvector([1,2,3])), (1,2,3))
+    self.assertEqual(xyz(rs.coerce3dvector(g.Point3d(1,2,3))), (1,2,3))
+    self.assertIsNone(rs.coerce3dvector(["a","b","c"]))
+    self.assertRaises(ValueError, rs.coerce3dvector, ["a","b","c"], True)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(Coerce3dPointTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
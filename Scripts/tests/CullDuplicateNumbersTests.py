@@ -0,0 +1,44 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+
+class CullDuplicateNumbersTests(unittest.TestCase):
+  def test_ComparesWithLastKeptNumber(self):
+    # 0.4 is within tolerance of 0, 0.8 is not, so a chain of close numbers
+    # does not collapse into its first number
+    self.assertEqual(rs.CullDuplicateNumbers([1.2, 0.8, 0.4, 0.0], 0.5), [0.0, 0.8])
+
+  def test_ToleranceIsInclusive(self):
+    self.assertEqual(rs.CullDuplicateNumbers([0.0, 0.5, 1.0], 0.5), [0.0, 1.0])
+
+  def test_ReturnsIndicesOfFirstOccurrence(self):
+    self.assertEqual(rs.CullDuplicateNumbers([3, 1, 1, 2, 3], 0.1, True), [1, 3, 0])
+
+  def test_ArrayReturnsArray(self):
+    rc = rs.CullDuplicateNumbers(array.array('d', [2, 1, 2, 1]), 0.1)
+    self.assertEqual(rc, array.array('d', [1, 2]))
+
+  def test_ShortInputIsReturnedAsIs(self):
+    self.assertEqual(rs.CullDuplicateNumbers([5]), [5])
+
+  @unittest.skipIf(numpy is None, "requires numpy")
+  def test_NumpyArrayReturnsArray(self):
+    values = numpy.array([2.0, 1.0, 2.0, 1.0, 3.0])
+    self.assertEqual(rs.CullDuplicateNumbers(values, 0.1).tolist(), [1.0, 2.0, 3.0])
+    self.assertEqual(rs.CullDuplicateNumbers(values, 0.1, True).tolist(), [1, 0, 4])
+
+  @unittest.skipIf(numpy is None, "requires numpy")
+  def test_RejectsMultidimensionalNumpyArray(self):
+    # len() of a 2-D array is its row count, not its number of values
+    values = numpy.array([[2.0, 1.0, 2.0], [1.0, 3.0, 3.0]])
+    self.assertRaises(ValueError, rs.CullDuplicateNumbers, values, 0.1)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(CullDuplicateNumbersTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,43 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+class CullDuplicatePointsTests(unittest.TestCase):
+  def setUp(self):
+    self.points = [(0,0,0), (0.5,0,0), (3,0,0), (0,0.5,0), (3,0.25,0)]
+
+  def test_KeepsFirstPointOfEachCluster(self):
+    rc = rs.CullDuplicatePoints(self.points, 0.6)
+    self.assertEqual([(p.X, p.Y, p.Z) for p in rc], [(0,0,0), (3,0,0)])
+
+  def test_ToleranceIsInclusive(self):
+    self.assertEqual(len(rs.CullDuplicatePoints(self.points, 0.5)), 2)
+    self.assertEqual(len(rs.CullDuplicatePoints(self.points, 0.49)), 4)
+
+  def test_KeepLastAndCentroid(self):
+    rc = rs.CullDuplicatePoints(self.points, 0.6, "last")
+    self.assertEqual([(p.X, p.Y, p.Z) for p in rc], [(0,0.5,0), (3,0.25,0)])
+    rc = rs.CullDuplicatePoints(self.points, 0.6, "centroid")
+    self.assertAlmostEqual(rc[0].X, 0.5/3)
+    self.assertAlmostEqual(rc[1].Y, 0.125)
+
+  def test_ReturnsIndices(self):
+    rc, indices = rs.CullDuplicatePoints(self.points, 0.6, return_indices=True)
+    self.assertEqual(indices, [0, 0, 1, 0, 1])
+
+  def test_NoneUsesDocumentTolerance(self):
+    tolerance = sc.doc.ModelAbsoluteTolerance
+    points = [(0,0,0), (tolerance*0.5,0,0), (tolerance*2,0,0)]
+    self.assertEqual(len(rs.CullDuplicatePoints(points, None)), 2)
+    self.assertEqual(len(rs.CullDuplicatePoints(points)), 3)
+
+  def test_Buffer(self):
+    flat = array.array('d', [c for p in self.points for c in p])
+    rc = rs.CullDuplicatePoints(flat, 0.6)
+    self.assertEqual(list(rc), [0,0,0, 3,0,0])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(CullDuplicatePointsTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,52 @@
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def rows(events):
+  # points as coordinate tuples so rows compare by value
+  return [tuple((v.X, v.Y, v.Z) if hasattr(v, "X") else v for v in event) for event in events]
+
+
+class CurveArrayIntersectionTests(unittest.TestCase):
+  def setUp(self):
+    self.ids = [
+      rs.AddLine((0,0,0), (4,0,0)),
+      rs.AddLine((2,0,0), (6,0,0)),     # overlaps the first
+      rs.AddLine((4,-1,0), (4,1,0)),    # crosses both at an end point
+      rs.AddLine((1,-2,0), (3,2,0)),
+      rs.AddLine((10,10,0), (11,11,0)), # far from the rest
+      ]
+
+  def tearDown(self):
+    rs.DeleteObjects(self.ids)
+
+  def allPairs(self, self_intersections=False):
+    events = []
+    for i in range(len(self.ids)):
+      for j in range(i, len(self.ids)):
+        if i==j:
+          rc = rs.CurveCurveIntersection(self.ids[i]) if self_intersections else None
+        else:
+          rc = rs.CurveCurveIntersection(self.ids[i], self.ids[j])
+        if rc: events.extend((i, j) + event for event in rc)
+    return rows(events)
+
+  def test_MatchesAllPairs(self):
+    rc = rows(rs.CurveArrayIntersection(self.ids))
+    self.assertEqual(rc, self.allPairs())
+    self.assertIn(2, [event[2] for event in rc])
+
+  def test_SelfIntersectionsMatchAllPairs(self):
+    rc = rows(rs.CurveArrayIntersection(self.ids, self_intersections=True))
+    self.assertEqual(rc, self.allPairs(True))
+
+  def test_OneThreadMatchesPool(self):
+    self.assertEqual(rows(rs.CurveArrayIntersection(self.ids, threads=1)),
+      rows(rs.CurveArrayIntersection(self.ids)))
+
+  def test_DisjointCurvesHaveNoEvents(self):
+    self.assertEqual(rs.CurveArrayIntersection(self.ids[-1:] + self.ids[:1]), [])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(CurveArrayIntersectionTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
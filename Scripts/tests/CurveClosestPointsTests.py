@@ -0,0 +1,49 @@
+import array
+import math
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+class CurveClosestPointsTests(unittest.TestCase):
+  def setUp(self):
+    self.id = rs.AddLine((0,0,0), (10,5,0))
+    self.points = [(1,2,0), (5,0,3), (-2,-1,0), (12,4,1), (6,3,0)]
+
+  def tearDown(self):
+    rs.DeleteObject(self.id)
+
+  def assertMatchesScalar(self, rc):
+    parameters, distances = rc
+    self.assertEqual(len(parameters), len(self.points))
+    self.assertEqual(len(distances), len(self.points))
+    for point, t, d in zip(self.points, parameters, distances):
+      expected = rs.CurveClosestPoint(self.id, point)
+      self.assertAlmostEqual(t, expected)
+      self.assertAlmostEqual(d, rs.Distance(point, rs.EvaluateCurve(self.id, expected)))
+
+  def test_ListMatchesCurveClosestPoint(self):
+    self.assertMatchesScalar(rs.CurveClosestPoints(self.id, self.points))
+
+  def test_FlatArrayMatchesCurveClosestPoint(self):
+    flat = array.array('d', [c for point in self.points for c in point])
+    self.assertMatchesScalar(rs.CurveClosestPoints(self.id, flat))
+
+  def test_ChunksAndThreadsMatch(self):
+    self.assertMatchesScalar(rs.CurveClosestPoints(self.id, self.points, chunk_size=2, threads=1))
+    self.assertMatchesScalar(rs.CurveClosestPoints(self.id, self.points, chunk_size=2))
+
+  def test_NanBeyondMaximumDistance(self):
+    parameters, distances = rs.CurveClosestPoints(self.id, self.points, 2.5)
+    for point, t, d in zip(self.points, parameters, distances):
+      expected = rs.Distance(point, rs.EvaluateCurve(self.id, rs.CurveClosestPoint(self.id, point)))
+      if expected > 2.5:
+        self.assertTrue(math.isnan(t))
+        self.assertTrue(math.isnan(d))
+      else:
+        self.assertAlmostEqual(d, expected)
+    self.assertTrue(any(math.isnan(d) for d in distances))
+    self.assertFalse(all(math.isnan(d) for d in distances))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(CurveClosestPointsTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
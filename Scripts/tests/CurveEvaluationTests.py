@@ -0,0 +1,81 @@
+import math
+import unittest
+
+import Rhino
+import rhinoscriptsyntax as rs
+
+
+def xyz(items):
+  return [c for v in items for c in (v.X, v.Y, v.Z)]
+
+
+class CurveEvaluationTests(unittest.TestCase):
+  def setUp(self):
+    self.id = rs.AddLine((0,0,0), (10,5,1))
+    end = rs.CurveDomain(self.id)[1]
+    self.parameters = [0.0, end / 3.0, end / 2.0, end]
+
+  def tearDown(self):
+    rs.DeleteObject(self.id)
+
+  def assertNumbersAlmostEqual(self, rc, expected):
+    self.assertEqual(len(rc), len(expected))
+    for a, b in zip(rc, expected):
+      if math.isnan(b): self.assertTrue(math.isnan(a))
+      else: self.assertAlmostEqual(a, b)
+
+  def test_EvaluateCurveMatchesScalar(self):
+    self.assertNumbersAlmostEqual(rs.EvaluateCurve(self.id, self.parameters),
+      xyz(rs.EvaluateCurve(self.id, t) for t in self.parameters))
+
+  def test_EvaluateCurveDerivativesMatchScalar(self):
+    expected = []
+    for t in self.parameters: expected.extend(xyz(rs.EvaluateCurve(self.id, t, derivative=2)))
+    self.assertNumbersAlmostEqual(rs.EvaluateCurve(self.id, self.parameters, derivative=2), expected)
+
+  def test_CurveTangentMatchesScalar(self):
+    self.assertNumbersAlmostEqual(rs.CurveTangent(self.id, self.parameters),
+      xyz(rs.CurveTangent(self.id, t) for t in self.parameters))
+
+  def test_CurveTangentIsNanOutsideDomain(self):
+    outside = rs.CurveDomain(self.id)[1] + 1.0
+    self.assertIsNone(rs.CurveTangent(self.id, outside))
+    rc = rs.CurveTangent(self.id, [self.parameters[1], outside])
+    self.assertEqual(len(rc), 6)
+    self.assertFalse(any(math.isnan(c) for c in rc[:3]))
+    self.assertTrue(all(math.isnan(c) for c in rc[3:]))
+
+  def test_CurvePerpFrameMatchesScalar(self):
+    expected = []
+    for t in self.parameters:
+      plane = rs.CurvePerpFrame(self.id, t)
+      expected.extend(xyz((plane.Origin, plane.XAxis, plane.YAxis, plane.ZAxis)))
+    self.assertNumbersAlmostEqual(rs.CurvePerpFrame(self.id, self.parameters), expected)
+
+  def test_CurveCurvatureIsNanWhereScalarFails(self):
+    # a line has no curvature, the scalar path returns None
+    rc = rs.CurveCurvature(self.id, self.parameters)
+    self.assertEqual(len(rc), 13 * len(self.parameters))
+    for i, t in enumerate(self.parameters):
+      self.assertIsNone(rs.CurveCurvature(self.id, t))
+      row = rc[13*i:13*i+13]
+      self.assertNumbersAlmostEqual(row[:3], xyz([rs.EvaluateCurve(self.id, t)]))
+      self.assertNumbersAlmostEqual(row[3:6], xyz([rs.CurveTangent(self.id, t)]))
+      self.assertTrue(all(math.isnan(c) for c in row[6:10]))
+
+  @unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "arcs are not available outside of Rhino")
+  def test_CurveCurvatureMatchesScalar(self):
+    id = rs.AddCircle(rs.WorldXYPlane(), 2.0)
+    try:
+      end = rs.CurveDomain(id)[1]
+      parameters = [0.0, end / 3.0, end / 2.0]
+      expected = []
+      for t in parameters:
+        point, tangent, center, radius, cv = rs.CurveCurvature(id, t)
+        expected.extend(xyz((point, tangent, center)) + [radius] + xyz([cv]))
+      self.assertNumbersAlmostEqual(rs.CurveCurvature(id, parameters), expected)
+    finally:
+      rs.DeleteObject(id)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(CurveEvaluationTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,61 @@
+import array
+import math
+import random
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def distance(a, b):
+  return math.sqrt(sum((a[k]-b[k])**2 for k in range(3)))
+
+
+class DistanceMatrixTests(unittest.TestCase):
+  def setUp(self):
+    r = random.Random(2)
+    self.points1 = [(r.uniform(0,10), r.uniform(0,10), r.uniform(0,1)) for i in range(40)]
+    self.points2 = [(r.uniform(0,10), r.uniform(0,10), r.uniform(0,1)) for i in range(30)]
+
+  def test_MatrixMatchesBruteForce(self):
+    rc = rs.DistanceMatrix(self.points1, self.points2)
+    self.assertEqual(len(rc), 40)
+    for i, a in enumerate(self.points1):
+      for j, b in enumerate(self.points2):
+        self.assertAlmostEqual(rc[i][j], distance(a, b))
+
+  def test_Squared(self):
+    rc = rs.DistanceMatrix(self.points1, self.points2, squared=True)
+    self.assertAlmostEqual(rc[3][4], distance(self.points1[3], self.points2[4])**2)
+
+  def test_CutoffMatchesBruteForce(self):
+    rc = rs.DistanceMatrix(self.points1, self.points2, cutoff=2.0)
+    expected = [(i, j) for i, a in enumerate(self.points1) for j, b in enumerate(self.points2) if distance(a, b)<=2.0]
+    self.assertEqual([(i, j) for i, j, d in rc], expected)
+    for i, j, d in rc: self.assertAlmostEqual(d, distance(self.points1[i], self.points2[j]))
+
+  def test_CutoffWithinOneSet(self):
+    rc = rs.DistanceMatrix(self.points1, cutoff=2.0)
+    expected = [(i, j) for i, a in enumerate(self.points1) for j, b in enumerate(self.points1) if i<j and distance(a, b)<=2.0]
+    self.assertEqual([(i, j) for i, j, d in rc], expected)
+
+  def test_InvalidCutoffRaises(self):
+    self.assertRaises(ValueError, rs.DistanceMatrix, self.points1, self.points2, False, 0)
+    self.assertRaises(ValueError, rs.DistanceMatrix, self.points1, self.points2, False, -1.0)
+
+  def test_Blocks(self):
+    rows = []
+    for start, block in rs.DistanceMatrix(self.points1, self.points2, block_size=16):
+      self.assertEqual(start, len(rows))
+      rows.extend(block)
+    self.assertEqual(rows, rs.DistanceMatrix(self.points1, self.points2))
+
+  def test_Buffer(self):
+    flat = array.array('d', [c for p in self.points1 for c in p])
+    self.assertEqual(rs.DistanceMatrix(flat, self.points2), rs.DistanceMatrix(self.points1, self.points2))
+
+  def test_DistanceForwardsListsAndRaisesOnBadPoint(self):
+    self.assertEqual(rs.Distance(self.points1, self.points2), rs.DistanceMatrix(self.points1, self.points2))
+    self.assertRaises(Exception, rs.Distance, "not a point", (0,0,0))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(DistanceMatrixTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
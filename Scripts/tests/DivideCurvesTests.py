@@ -0,0 +1,48 @@
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def xyz(points):
+  return [c for p in points for c in (p.X, p.Y, p.Z)]
+
+
+class DivideCurvesTests(unittest.TestCase):
+  def setUp(self):
+    self.ids = [rs.AddLine((0,i,0), (4+i,i,1)) for i in range(4)]
+
+  def tearDown(self):
+    rs.DeleteObjects(self.ids)
+
+  def assertMatchesPerCurve(self, rc, expected, width):
+    offsets, values = rc
+    self.assertEqual((offsets.typecode, offsets.itemsize), ('i', 4))
+    self.assertEqual(len(offsets), len(self.ids) + 1)
+    self.assertEqual(offsets[0], 0)
+    for i, items in enumerate(expected):
+      self.assertEqual(offsets[i+1] - offsets[i], len(items) // width)
+      chunk = values[width*offsets[i]:width*offsets[i+1]]
+      for a, b in zip(chunk, items): self.assertAlmostEqual(a, b)
+
+  def test_DivideCurvesMatchesDivideCurve(self):
+    self.assertMatchesPerCurve(rs.DivideCurves(self.ids, 5),
+      [xyz(rs.DivideCurve(id, 5)) for id in self.ids], 3)
+
+  def test_ParametersMatchDivideCurve(self):
+    self.assertMatchesPerCurve(rs.DivideCurves(self.ids, 5, False),
+      [rs.DivideCurve(id, 5, return_points=False) for id in self.ids], 1)
+
+  def test_DivideCurvesLengthMatchesDivideCurveLength(self):
+    self.assertMatchesPerCurve(rs.DivideCurvesLength(self.ids, 0.7),
+      [xyz(rs.DivideCurveLength(id, 0.7)) for id in self.ids], 3)
+
+  def test_OneThreadMatchesPool(self):
+    self.assertEqual(rs.DivideCurves(self.ids, 7, threads=1), rs.DivideCurves(self.ids, 7))
+
+  def test_UndividableCurveHasEmptyRange(self):
+    offsets, values = rs.DivideCurvesLength(self.ids, 100.0, False)
+    self.assertEqual(list(offsets), [0] * (len(self.ids) + 1))
+    self.assertEqual(len(values), 0)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(DivideCurvesTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
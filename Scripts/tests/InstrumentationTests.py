@@ -0,0 +1,79 @@
+import json
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+class InstrumentationTests(unittest.TestCase):
+  def setUp(self):
+    rs.EnableInstrumentation()
+    rs.ResetInstrumentation()
+
+  def tearDown(self):
+    rs.EnableInstrumentation(False)
+
+  def test_CountsCallsAndCoerceTime(self):
+    id = rs.AddLine((0,0,0), (10,0,0))
+    rs.CurveLength(id)
+    rs.CurveLength(id)
+    rs.DeleteObject(id)
+    stats = sc.instrumentation["rhinoscript.curve.CurveLength"]
+    self.assertEqual(stats.calls, 2)
+    self.assertTrue(stats.total_time >= stats.coerce_time > 0)
+    self.assertTrue("rhinoscript.curve.CurveLength" in sc.instrumentation["rhinoscript.utility.coercecurve"].callers)
+
+  def test_CountsRedraws(self):
+    with rs.batch():
+      id = rs.AddPoint((1,2,3))
+    rs.DeleteObject(id)
+    self.assertEqual(sc.instrumentation["rhinoscript.geometry.AddPoint"].redraws, 1)
+
+  def test_DisableRestoresFunctions(self):
+    rs.EnableInstrumentation(False)
+    self.assertEqual(rs.AddPoint.__code__.co_name, "AddPoint")
+    rs.AddPoint((0,0,0))
+    self.assertTrue("rhinoscript.geometry.AddPoint" not in sc.instrumentation)
+
+  def test_SaveJsonAndPstats(self):
+    rs.AllObjects()
+    folder = tempfile.mkdtemp()
+    json_file = os.path.join(folder, "rs.json")
+    prof_file = os.path.join(folder, "rs.prof")
+    self.assertTrue(rs.SaveInstrumentation(json_file))
+    self.assertTrue(rs.SaveInstrumentation(prof_file))
+    with open(json_file) as f:
+      self.assertEqual(json.load(f)["functions"]["rhinoscript.selection.AllObjects"]["calls"], 1)
+    self.assertEqual(pstats.Stats(prof_file).total_calls, 1)
+
+  def test_ThreadsKeepTheirOwnStack(self):
+    # two overlapping calls on different threads are neither nested in each
+    # other nor recursive
+    start = threading.Event()
+    def sleep():
+      start.wait()
+      rs.Sleep(50)
+    threads = [threading.Thread(target=sleep) for i in range(2)]
+    for thread in threads: thread.start()
+    start.set()
+    for thread in threads: thread.join()
+    stats = sc.instrumentation["rhinoscript.utility.Sleep"]
+    self.assertEqual(stats.calls, 2)
+    self.assertEqual(stats.primitive_calls, 2)
+    self.assertEqual(stats.callers, {})
+    self.assertTrue(stats.self_time >= 0.09)
+    self.assertAlmostEqual(stats.self_time, stats.total_time)
+
+  def test_StarImportExportsOnlyFunctions(self):
+    namespace = {}
+    exec("from rhinoscript.instrumentation import *", namespace)
+    self.assertEqual(sorted(name for name in namespace if name!="__builtins__"),
+      ["EnableInstrumentation", "ResetInstrumentation", "SaveInstrumentation"])
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(InstrumentationTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
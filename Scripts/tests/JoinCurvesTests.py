@@ -0,0 +1,94 @@
+import random
+import unittest
+
+import Rhino
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+def key(curve):
+  # end points in either direction and length, rounded to compare joins
+  ends = sorted(tuple(round(c, 6) for c in (p.X, p.Y, p.Z)) for p in (curve.PointAtStart, curve.PointAtEnd))
+  return tuple(ends), round(curve.GetLength(), 6)
+
+
+class JoinCurvesTests(unittest.TestCase):
+  def setUp(self):
+    self.polylines = [
+      [(0,0,0), (1,0,0), (2,1,0), (3,1,0)],
+      [(0,5,0), (1,6,0), (2,5,0), (3,6,0), (4,5,0), (5,6,0)],
+      [(10,0,0), (10,1,0), (10,2,1)],
+      [(20,20,0), (21,20,0)],  # a single segment
+      ]
+    self.segments = []
+    for k, points in enumerate(self.polylines):
+      self.segments.extend((rs.AddLine(a, b), k) for a, b in zip(points, points[1:]))
+    random.Random(1).shuffle(self.segments)
+    self.ids = [id for id, k in self.segments]
+    self.tolerance = 2.1 * sc.doc.ModelAbsoluteTolerance
+    self.joined = []
+
+  def tearDown(self):
+    rs.DeleteObjects(self.ids + self.joined)
+
+  def join(self, **kwargs):
+    rc = rs.JoinCurves(self.ids, return_chains=True, **kwargs)
+    self.joined.extend(rc[0])
+    return rc
+
+  def test_MembershipFollowsPolylines(self):
+    ids, membership, offsets = self.join()
+    self.assertEqual(len(membership), len(self.ids))
+    chain_of = {}
+    for (id, k), chain in zip(self.segments, membership):
+      self.assertEqual(chain_of.setdefault(k, chain), chain)
+    self.assertEqual(len(set(chain_of.values())), len(self.polylines))
+    # chains are numbered in the order of their first curve
+    first = []
+    for chain in membership:
+      if chain not in first: first.append(chain)
+    self.assertEqual(first, list(range(len(self.polylines))))
+
+  def test_OffsetsAndOutputs(self):
+    ids, membership, offsets = self.join()
+    self.assertEqual(list(offsets), list(range(len(self.polylines) + 1)))
+    for (id, k), chain in zip(self.segments, membership):
+      curve = rs.coercecurve(ids[offsets[chain]])
+      self.assertAlmostEqual(curve.GetLength(), sum(rs.Distance(a, b) for a, b in zip(self.polylines[k], self.polylines[k][1:])))
+
+  def test_ChainsEndAtPolylineEnds(self):
+    # checked against the input polylines, not against a joiner
+    ids, membership, offsets = self.join()
+    self.assertEqual((membership.typecode, offsets.typecode), ('i', 'i'))
+    for (id, k), chain in zip(self.segments, membership):
+      self.assertEqual(offsets[chain+1] - offsets[chain], 1)
+      curve = rs.coercecurve(ids[offsets[chain]])
+      points = self.polylines[k]
+      ends = sorted(tuple(round(c, 6) for c in (p.X, p.Y, p.Z)) for p in (curve.PointAtStart, curve.PointAtEnd))
+      self.assertEqual(ends, sorted([tuple(float(c) for c in points[0]), tuple(float(c) for c in points[-1])]))
+      self.assertAlmostEqual(curve.GetLength(), sum(rs.Distance(a, b) for a, b in zip(points, points[1:])))
+
+  @unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "compares with RhinoCommon's joiner")
+  def test_MatchesOneShotJoin(self):
+    ids, membership, offsets = self.join()
+    curves = [rs.coercecurve(id) for id in self.ids]
+    expected = Rhino.Geometry.Curve.JoinCurves(curves, self.tolerance)
+    self.assertEqual(sorted(key(rs.coercecurve(id)) for id in ids), sorted(key(curve) for curve in expected))
+
+  def test_SingleCurveChainIsCopied(self):
+    ids, membership, offsets = self.join()
+    i = [k for id, k in self.segments].index(3)
+    chain = membership[i]
+    self.assertEqual(offsets[chain+1] - offsets[chain], 1)
+    self.assertNotEqual(ids[offsets[chain]], self.ids[i])
+    self.assertEqual(key(rs.coercecurve(ids[offsets[chain]])), key(rs.coercecurve(self.ids[i])))
+
+  def test_OneThreadMatchesPool(self):
+    ids1, membership1, offsets1 = self.join(threads=1)
+    ids2, membership2, offsets2 = self.join()
+    self.assertEqual(membership1, membership2)
+    self.assertEqual(offsets1, offsets2)
+    self.assertEqual([key(rs.coercecurve(id)) for id in ids1], [key(rs.coercecurve(id)) for id in ids2])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(JoinCurvesTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
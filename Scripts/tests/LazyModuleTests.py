@@ -0,0 +1,53 @@
+import importlib
+import types
+import unittest
+
+import rhinoscript
+import rhinoscript.nameindex as nameindex
+import rhinoscriptsyntax as rs
+
+
+class LazyModuleTests(unittest.TestCase):
+  def test_AttributeLoadsDefiningFunction(self):
+    import rhinoscript.curve
+    self.assertTrue(rs.AddLine is rhinoscript.curve.AddLine)
+    self.assertEqual(nameindex.NAMES["PointIndex"], "pointvector")
+    self.assertEqual(rs.PointIndex.__module__, "rhinoscript.pointvector")
+
+  def test_IndexMatchesSubmodules(self):
+    for name, module in nameindex.NAMES.items():
+      self.assertTrue(hasattr(importlib.import_module("rhinoscript." + module), name), name)
+
+  def test_IndexHasNoForeignModules(self):
+    for name in ("sys", "math", "json", "time", "System", "Rhino", "scriptcontext", "compat", "rhutil"):
+      self.assertFalse(name in nameindex.NAMES, name)
+
+  def test_Dir(self):
+    names = dir(rs)
+    for name in ("AddLine", "JoinCurves", "PointIndex", "batch"):
+      self.assertTrue(name in names, name)
+    self.assertEqual(names, sorted(names))
+
+  def test_StarImport(self):
+    namespace = {}
+    exec("from rhinoscriptsyntax import *", namespace)
+    self.assertTrue(namespace["AddLine"] is rs.AddLine)
+    self.assertTrue("CurveArrayIntersection" in namespace)
+    for name in ("sys", "json", "System"):
+      self.assertFalse(name in namespace, name)
+
+  def test_UnknownNameRaises(self):
+    self.assertRaises(AttributeError, getattr, rs, "NoSuchFunction")
+    self.assertFalse(hasattr(rs, "__no_such_dunder__"))
+
+  def test_StaleIndexRaises(self):
+    module = rhinoscript.LazyModule(types.ModuleType("stale"), {"NoSuchFunction": "curve"})
+    self.assertTrue("NoSuchFunction" in dir(module))
+    self.assertRaises(AttributeError, getattr, module, "NoSuchFunction")
+
+  def test_SubmodulesLoadOnAccess(self):
+    self.assertTrue(rhinoscript.curve is importlib.import_module("rhinoscript.curve"))
+    self.assertRaises(AttributeError, getattr, rhinoscript, "nosuchmodule")
+
+suite = unittest.TestLoader().loadTestsFromTestCase(LazyModuleTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
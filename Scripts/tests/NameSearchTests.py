@@ -0,0 +1,53 @@
+import types
+import unittest
+
+import rhinoscript.nameindex as nameindex
+import rhinoscriptsyntax as rs
+
+prefix_search = getattr(rs, "__prefix_search")
+fuzzy_search = getattr(rs, "__fuzzy_search")
+
+
+class NameSearchTests(unittest.TestCase):
+  def tearDown(self):
+    for name in ("MyScriptHelper", "QaaaaaaaaWxQW", "QbbbW", "myscriptmodule"):
+      if name in rs.__dict__: delattr(rs, name)
+
+  def test_PrefixOrder(self):
+    expected = sorted((name for name in nameindex.NAMES if name.lower().startswith("addl")), key=str.lower)
+    self.assertEqual(prefix_search("addl"), expected)
+    self.assertEqual(prefix_search("ADDL"), expected)
+    self.assertTrue("AddLine" in expected)
+
+  def test_PrefixLimit(self):
+    self.assertEqual(prefix_search("add", 3), prefix_search("add")[:3])
+    self.assertEqual(len(prefix_search("add", 3)), 3)
+
+  def test_ImplementationNamesAreHidden(self):
+    self.assertEqual(prefix_search("_"), [])
+    for name in ("bisect", "re", "sys", "compat", "nameindex", "LazyModule", "types"):
+      self.assertFalse(name in prefix_search(name[0]), name)
+    self.assertFalse("bisect" in fuzzy_search("bisect"))
+
+  def test_FuzzyFindsAddLine(self):
+    self.assertEqual(fuzzy_search("adl")[0], "AddLine")
+    self.assertTrue(len(fuzzy_search("adl", 5)) == 5)
+    self.assertEqual(fuzzy_search(""), [])
+
+  def test_FuzzyRanksShortestSpan(self):
+    # the leftmost match of "qw" in QaaaaaaaaWxQW spans 10 characters, the
+    # shortest one only 2
+    rs.QaaaaaaaaWxQW = 1
+    rs.QbbbW = 2
+    self.assertEqual(fuzzy_search("qw")[:2], ["QaaaaaaaaWxQW", "QbbbW"])
+
+  def test_IndexRebuildsAfterSetAndDelete(self):
+    self.assertEqual(prefix_search("myscript"), [])
+    rs.MyScriptHelper = lambda: None
+    rs.myscriptmodule = types.ModuleType("myscriptmodule")
+    self.assertEqual(prefix_search("myscript"), ["MyScriptHelper"])
+    del rs.MyScriptHelper
+    self.assertEqual(prefix_search("myscript"), [])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(NameSearchTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,41 @@
+import unittest
+
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+
+
+class ObjectCacheTests(unittest.TestCase):
+  def setUp(self):
+    self.id = rs.AddLine((0,0,0), (10,0,0))
+
+  def tearDown(self):
+    rs.DeleteObject(self.id)
+
+  def test_RepeatedLookupReturnsSameObject(self):
+    with rs.objectcache():
+      a = rs.coercerhinoobject(self.id)
+      b = rs.coercerhinoobject(self.id)
+    self.assertTrue(a is b)
+
+  def test_ReplacedGeometryIsNotStale(self):
+    with rs.objectcache():
+      self.assertEqual(rs.CurveLength(self.id), 10)
+      rs.ScaleObject(self.id, (0,0,0), (2,2,2))
+      self.assertEqual(rs.CurveLength(self.id), 20)
+
+  def test_DeletedObjectIsEvicted(self):
+    id = rs.AddPoint((0,0,0))
+    with rs.objectcache():
+      self.assertTrue(rs.coercerhinoobject(id) is not None)
+      rs.DeleteObject(id)
+      self.assertTrue(rs.coercerhinoobject(id) is None)
+
+  def test_BatchEnablesCache(self):
+    with rs.batch():
+      a = rs.coercecurve(self.id)
+      b = rs.coercecurve(self.id)
+    self.assertTrue(a is b)
+
+
+suite = unittest.TestLoader().loadTestsFromTestCase(ObjectCacheTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
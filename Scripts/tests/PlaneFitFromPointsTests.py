@@ -0,0 +1,63 @@
+import array
+import unittest
+
+import System
+import Rhino
+import Rhino.Geometry as g
+
+import rhinoscriptsyntax as rs
+
+
+class PlaneFitFromPointsTests(unittest.TestCase):
+  def setUp(self):
+    self.points = [g.Point3d(x, y, 0.3*x + 0.1*y*y) for x, y in ((0,0), (4,1), (1,3), (5,5), (2,-1), (3,2))]
+
+  def assertSamePlane(self, a, b):
+    for u, v in ((a.Origin, b.Origin), (a.XAxis, b.XAxis), (a.YAxis, b.YAxis), (a.ZAxis, b.ZAxis)):
+      self.assertAlmostEqual(u.DistanceTo(v) if isinstance(u, g.Point3d) else (u-v).Length, 0.0)
+
+  def test_CollectionsAreFitLikeLists(self):
+    plane = rs.PlaneFitFromPoints(self.points)
+    self.assertSamePlane(rs.PlaneFitFromPoints(tuple(self.points)), plane)
+    self.assertSamePlane(rs.PlaneFitFromPoints(System.Array[g.Point3d](self.points)), plane)
+    self.assertSamePlane(rs.PlaneFitFromPoints(Rhino.Collections.Point3dList(self.points)), plane)
+
+  def test_StreamedInputsHaveSameOriginAndNormal(self):
+    plane = rs.PlaneFitFromPoints(self.points)
+    flat = array.array('d', [c for p in self.points for c in (p.X, p.Y, p.Z)])
+    for streamed in (rs.PlaneFitFromPoints(flat), rs.PlaneFitFromPoints(p for p in self.points)):
+      self.assertAlmostEqual(streamed.Origin.DistanceTo(plane.Origin), 0.0)
+      self.assertAlmostEqual(abs(streamed.ZAxis*plane.ZAxis), 1.0)
+
+  def test_StreamedAxesDoNotDependOnOrder(self):
+    forward = rs.PlaneFitAccumulator(self.points).Plane()
+    backward = rs.PlaneFitAccumulator()
+    for point in reversed(self.points): backward.Add([point])
+    self.assertSamePlane(backward.Plane(), forward)
+    flipped = rs.PlaneFitAccumulator([g.Point3d(-p.X, -p.Y, -p.Z) for p in self.points]).Plane()
+    self.assertAlmostEqual((flipped.ZAxis-forward.ZAxis).Length, 0.0)
+
+  def test_ColinearTestDoesNotDependOnScale(self):
+    triangle = [(0,0,0), (1,0,0), (0,1,0)]
+    for scale in (1.0e-6, 1.0, 1.0e6):
+      points = [(x*scale, y*scale, z) for x, y, z in triangle]
+      self.assertTrue(rs.PlaneFitAccumulator(points).Plane() is not None)
+    # many colinear points with a rounding sized wobble are still colinear
+    line = [(i, 2.0*i + (1.0e-9 if i%2 else 0.0), 0.0) for i in range(10000)]
+    self.assertTrue(rs.PlaneFitAccumulator(line).Plane() is None)
+
+  def test_LongListsAreStreamed(self):
+    points = [(i%300, i//300, 0.01*(i%7)) for i in range(70000)]
+    self.assertSamePlane(rs.PlaneFitFromPoints(points), rs.PlaneFitFromPoints(p for p in points))
+
+  def test_PointsAreCoplanarForAllInputs(self):
+    flat = array.array('d', [c for p in self.points for c in (p.X, p.Y, p.Z)])
+    planar = [g.Point3d(p.X, p.Y, 0) for p in self.points]
+    for points, expected in ((self.points, False), (planar, True)):
+      self.assertEqual(rs.PointsAreCoplanar(points), expected)
+      self.assertEqual(rs.PointsAreCoplanar(System.Array[g.Point3d](points)), expected)
+      self.assertEqual(rs.PointsAreCoplanar(p for p in points), expected)
+    self.assertFalse(rs.PointsAreCoplanar(flat))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(PlaneFitFromPointsTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
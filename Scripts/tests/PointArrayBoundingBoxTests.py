@@ -1,3 +1,5 @@
+import array
+import random
 import unittest
 
 import Rhino.Geometry as g
@@ -5,6 +7,11 @@ import Rhino.Geometry as g
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 
 class PointArrayBoundingBoxTests(unittest.TestCase):
   def test_FirstParamNotPointsReturnsNone(self):
@@ -27,6 +34,46 @@ class PointArrayBoundingBoxTests(unittest.TestCase):
     self.assertTrue(any(pt.EpsilonEquals(g.Point3d(7.5, 0.5, 4), 0.001) for pt in corners))
     self.assertTrue(any(pt.EpsilonEquals(g.Point3d(-6.5, 0.5, -3), 0.001) for pt in corners))
 
+  def assertSameBox(self, corners, expected):
+    self.assertEqual(len(corners), 8)
+    for a, b in zip(corners, expected):
+      self.assertEqual((a.X, a.Y, a.Z), (b.X, b.Y, b.Z))
+
+  def random_points(self, count=10):
+    r = random.Random(11)
+    return [(r.uniform(-5,5), r.uniform(-5,5), r.uniform(-5,5)) for i in range(count)]
+
+  def test_ChunksMatchUnchunked(self):
+    # 10 points in chunks of 3 and 4 leave a partial last chunk
+    points = self.random_points()
+    plane = g.Plane(g.Point3d(1,2,3), g.Vector3d(1,1,1))
+    for view_or_plane in (None, plane):
+      expected = rs.PointArrayBoundingBox(points, view_or_plane)
+      flat = array.array('d', [c for point in points for c in point])
+      for chunk_size in (1, 3, 4, 10, 65536):
+        self.assertSameBox(rs.PointArrayBoundingBox(flat, view_or_plane, chunk_size=chunk_size), expected)
+        self.assertSameBox(rs.PointArrayBoundingBox((p for p in points), view_or_plane, chunk_size=chunk_size), expected)
+        self.assertSameBox(rs.PointArrayBoundingBox(iter([points[:7], flat[21:]]), view_or_plane, chunk_size=chunk_size), expected)
+
+  @unittest.skipIf(numpy is None, "requires numpy")
+  def test_NumpyChunksMatchUnchunked(self):
+    points = self.random_points()
+    expected = rs.PointArrayBoundingBox(points)
+    for chunk_size in (3, 4, 65536):
+      self.assertSameBox(rs.PointArrayBoundingBox(numpy.array(points), chunk_size=chunk_size), expected)
+
+  def test_FlatCoordinateGenerator(self):
+    points = self.random_points()
+    expected = rs.PointArrayBoundingBox(points)
+    for chunk_size in (3, 4, 65536):
+      rc = rs.PointArrayBoundingBox((c for point in points for c in point), chunk_size=chunk_size)
+      self.assertSameBox(rc, expected)
+    self.assertRaises(ValueError, rs.PointArrayBoundingBox, (c for c in (0.0, 1.0, 2.0, 3.0)))
+
+  def test_EmptyPointsReturnNoneBeforeView(self):
+    self.assertTrue(rs.PointArrayBoundingBox([], "notplaneorview") is None)
+    self.assertTrue(rs.PointArrayBoundingBox((p for p in []), "notplaneorview") is None)
+
 
 suite = unittest.TestLoader().loadTestsFromTestCase(PointArrayBoundingBoxTests)
 unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
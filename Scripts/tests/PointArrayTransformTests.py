@@ -0,0 +1,89 @@
+import sys
+import array
+import unittest
+
+import System
+import Rhino.Geometry as g
+import rhinoscriptsyntax as rs
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+
+def flat(points):
+  return [c for p in points for c in (p.X, p.Y, p.Z)]
+
+
+class PointArrayTransformTests(unittest.TestCase):
+  def setUp(self):
+    self.points = [(0,0,0), (1,2,3), (-4,5,0.5), (-10,1,1)]
+    self.values = [c for point in self.points for c in point]
+    self.xform = rs.XformRotation2(30.0, (1,2,3), (4,5,6))
+    # projective, w is 0 for the last point
+    self.projective = g.Transform(1.0)
+    self.projective[3,0] = 0.1
+
+  def expected(self, xform):
+    return flat(rs.PointTransform(point, xform) for point in self.points)
+
+  def assertValuesAlmostEqual(self, rc, expected):
+    self.assertEqual(len(rc), len(expected))
+    for a, b in zip(rc, expected): self.assertAlmostEqual(a, b)
+
+  def test_ListMatchesPointTransform(self):
+    for xform in (self.xform, self.projective):
+      self.assertValuesAlmostEqual(flat(rs.PointArrayTransform(self.points, xform)), self.expected(xform))
+
+  def test_BuffersMatchPointTransform(self):
+    for xform in (self.xform, self.projective):
+      expected = self.expected(xform)
+      for points in (array.array('d', self.values), System.Array[System.Double](self.values),
+          memoryview(array.array('d', self.values))):
+        rc = rs.PointArrayTransform(points, xform)
+        self.assertTrue(isinstance(rc, array.array))
+        self.assertValuesAlmostEqual(rc, expected)
+
+  def test_ProjectiveDivideByZero(self):
+    rc = rs.PointArrayTransform(array.array('d', self.values), self.projective)
+    self.assertEqual(list(rc[9:]), [0.0, 0.0, 0.0])
+
+  def test_InPlace(self):
+    expected = self.expected(self.xform)
+    values = array.array('d', self.values)
+    self.assertTrue(rs.PointArrayTransform(values, self.xform, True) is values)
+    self.assertValuesAlmostEqual(values, expected)
+    doubles = System.Array[System.Double](self.values)
+    self.assertTrue(rs.PointArrayTransform(doubles, self.xform, True) is doubles)
+    self.assertValuesAlmostEqual(list(doubles), expected)
+    backing = array.array('d', self.values)
+    rs.PointArrayTransform(memoryview(backing), self.xform, True)
+    self.assertValuesAlmostEqual(backing, expected)
+    points = list(self.points)
+    self.assertTrue(rs.PointArrayTransform(points, self.xform, True) is points)
+    self.assertValuesAlmostEqual(flat(points), expected)
+
+  @unittest.skipIf(sys.version_info[0]<3, "memoryview.cast needs Python 3")
+  def test_InPlaceRejectsReadOnlyInput(self):
+    readonly = memoryview(array.array('d', self.values).tobytes()).cast('d')
+    self.assertRaises(ValueError, rs.PointArrayTransform, readonly, self.xform, True)
+    self.assertRaises(ValueError, rs.PointArrayTransform, tuple(self.points), self.xform, True)
+
+  @unittest.skipIf(numpy is None, "numpy is not installed")
+  def test_Numpy(self):
+    expected = self.expected(self.projective)
+    xyz = numpy.array(self.values).reshape(-1, 3)
+    self.assertValuesAlmostEqual(rs.PointArrayTransform(xyz, self.projective).ravel(), expected)
+    self.assertTrue(rs.PointArrayTransform(xyz, self.projective, True) is xyz)
+    self.assertValuesAlmostEqual(xyz.ravel(), expected)
+
+  @unittest.skipIf(numpy is None, "numpy is not installed")
+  def test_NumpyIntegersInPlaceRaise(self):
+    xyz = numpy.array([[0,0,0], [1,2,3]])
+    self.assertRaises(TypeError, rs.PointArrayTransform, xyz, self.xform, True)
+    self.assertEqual(xyz.tolist(), [[0,0,0], [1,2,3]])
+    self.assertEqual(rs.PointArrayTransform(xyz, self.xform).dtype.kind, 'f')
+
+suite = unittest.TestLoader().loadTestsFromTestCase(PointArrayTransformTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
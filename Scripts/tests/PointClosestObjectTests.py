@@ -0,0 +1,66 @@
+import random
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+class PointClosestObjectTests(unittest.TestCase):
+  def setUp(self):
+    r = random.Random(7)
+    self.ids = []
+    for i in range(40):
+      start = (r.uniform(0,20), r.uniform(0,20), r.uniform(0,2))
+      end = (r.uniform(0,20), r.uniform(0,20), r.uniform(0,2))
+      self.ids.append(rs.AddLine(start, end))
+    self.points = [(r.uniform(-5,25), r.uniform(-5,25), r.uniform(-2,4)) for i in range(25)]
+
+  def tearDown(self):
+    rs.DeleteObjects(self.ids)
+
+  def brute_force(self, point, ids):
+    # exact closest point against every object, first object wins a tie
+    closest = None
+    for id in ids:
+      location = rs.EvaluateCurve(id, rs.CurveClosestPoint(id, point))
+      distance = rs.Distance(point, location)
+      if closest is None or distance<closest[0]: closest = distance, id, location
+    return closest
+
+  def assertClosest(self, rc, point, ids):
+    distance, id, location = self.brute_force(point, ids)
+    self.assertEqual(rc[0], id)
+    self.assertAlmostEqual(rs.Distance(point, rc[1]), distance)
+    self.assertAlmostEqual(rs.Distance(location, rc[1]), 0.0)
+
+  def test_SinglePoint(self):
+    for point in self.points:
+      self.assertClosest(rs.PointClosestObject(point, self.ids), point, self.ids)
+
+  def test_ListOfPoints(self):
+    rc = rs.PointClosestObject(self.points, self.ids)
+    self.assertEqual(len(rc), len(self.points))
+    for closest, point in zip(rc, self.points):
+      self.assertClosest(closest, point, self.ids)
+
+  def test_OverlappingBoxesInDifferentOrder(self):
+    # the diagonal's box contains the test point, the short line's box does
+    # not, but the short line is the closer object
+    ids = [rs.AddLine((0,0,0), (10,10,0)), rs.AddLine((9,-1,0), (10,-1,0)), rs.AddLine((0,10,0), (6,4,0))]
+    self.ids.extend(ids)
+    for point in ((9,1,0), (2,2.5,0), (8,-0.2,0), (5,5,3)):
+      self.assertClosest(rs.PointClosestObject(point, ids), point, ids)
+    self.assertEqual(rs.PointClosestObject((9,1,0), ids)[0], ids[1])
+
+  def test_ObjectCacheMatches(self):
+    expected = rs.PointClosestObject(self.points, self.ids)
+    with rs.objectcache():
+      first = [rs.PointClosestObject(point, self.ids) for point in self.points]
+      second = rs.PointClosestObject(self.points, self.ids)
+    for a, b, c in zip(expected, first, second):
+      self.assertEqual(a[0], b[0])
+      self.assertEqual(a[0], c[0])
+      self.assertAlmostEqual(rs.Distance(a[1], b[1]), 0.0)
+      self.assertAlmostEqual(rs.Distance(a[1], c[1]), 0.0)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(PointClosestObjectTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
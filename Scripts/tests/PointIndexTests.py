@@ -0,0 +1,47 @@
+import random
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def brute_force(points, point, radius):
+  found = sorted((sum((a-b)**2 for a, b in zip(p, point)), i) for i, p in enumerate(points))
+  return [i for d, i in found if d<=radius*radius]
+
+
+class PointIndexTests(unittest.TestCase):
+  def setUp(self):
+    r = random.Random(3)
+    self.points = [(r.uniform(0,10), r.uniform(0,10), r.uniform(0,10)) for i in range(300)]
+    self.index = rs.PointIndex(self.points)
+
+  def test_IndicesInSphere(self):
+    for radius in (0.5, 2.0, 50.0):
+      self.assertEqual(self.index.IndicesInSphere((5,5,5), radius), brute_force(self.points, (5,5,5), radius))
+
+  def test_IndicesInSphereOutsideOfPoints(self):
+    self.assertEqual(self.index.IndicesInSphere((100,100,100), 1.0), [])
+    self.assertEqual(rs.PointIndex().IndicesInSphere((0,0,0), 1.0), [])
+
+  def test_ClosestIndexAfterRemove(self):
+    i = self.index.ClosestIndex((1,1,1))
+    self.assertEqual(i, brute_force(self.points, (1,1,1), 20.0)[0])
+    self.assertTrue(self.index.Remove(i))
+    self.assertNotEqual(self.index.ClosestIndex((1,1,1)), i)
+    self.assertEqual(len(self.index), 299)
+
+  def test_ClusteredPointsWithOutlier(self):
+    # one far outlier must not make the cells so wide that the cluster
+    # shares a handful of them
+    r = random.Random(5)
+    points = [(r.gauss(0,0.01), r.gauss(0,0.01), r.gauss(0,0.01)) for i in range(2000)]
+    points.append((1000.0, 1000.0, 1000.0))
+    index = rs.PointIndex(points)
+    self.assertTrue(len(index.cells)>len(points)//4)
+    for test in ((0,0,0), (0.02,-0.01,0.005), (1000,1000,999), (500,500,500), (-50,0,0)):
+      expected = brute_force(points, test, 1.0e6)
+      self.assertEqual(index.ClosestIndices(test, 3), expected[:3])
+      self.assertEqual(index.ClosestIndex(test), expected[0])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(PointIndexTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,41 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+class RangeTests(unittest.TestCase):
+  def test_FrangeIncludesStop(self):
+    self.assertEqual(rs.frange(0, 1, 0.25), [0, 0.25, 0.5, 0.75, 1.0])
+
+  def test_FrangeIncludesStopWithinRoundingError(self):
+    rc = rs.frange(0, 1, 0.1)
+    self.assertEqual(len(rc), 11)
+    self.assertAlmostEqual(rc[-1], 1.0)
+
+  def test_FrangeExcludesStopPastLastStep(self):
+    rc = rs.frange(0, 1, 0.3)
+    self.assertEqual(len(rc), 4)
+    self.assertAlmostEqual(rc[-1], 0.9)
+
+  def test_FrangeDescendingAndSingleValue(self):
+    self.assertEqual(rs.frange(1, 0, -0.5), [1, 0.5, 0.0])
+    self.assertEqual(rs.frange(2, 2, 1), [2])
+    self.assertRaises(ValueError, rs.frange, 0, 1, -0.5)
+
+  def test_FrangeBuffer(self):
+    self.assertEqual(rs.frange(0, 1, 0.5, True), array.array('d', [0, 0.5, 1]))
+
+  def test_LinspaceEndpoint(self):
+    self.assertEqual(rs.linspace(0, 1, 5), [0, 0.25, 0.5, 0.75, 1.0])
+    self.assertEqual(rs.linspace(0, 1, 4, False), [0, 0.25, 0.5, 0.75])
+
+  def test_LinspaceLastValueIsExactlyStop(self):
+    self.assertEqual(rs.linspace(0.1, 0.7, 7)[-1], 0.7)
+
+  def test_LinspaceShortCounts(self):
+    self.assertEqual(rs.linspace(3, 4, 1), [3.0])
+    self.assertEqual(rs.linspace(3, 4, 0), [])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(RangeTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,36 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def xyz(points):
+  return [(p.X, p.Y, p.Z) for p in points]
+
+
+class SortPointsTests(unittest.TestCase):
+  def setUp(self):
+    self.points = [(1,2,0), (0,5,1), (1,0,2), (0,5,0)]
+
+  def test_DefaultSortsByXYZ(self):
+    self.assertEqual(xyz(rs.SortPoints(self.points)), [(0,5,0), (0,5,1), (1,0,2), (1,2,0)])
+
+  def test_Orders(self):
+    # order 4 is Z, X, Y and order 2 is Y, X, Z
+    self.assertEqual(xyz(rs.SortPoints(self.points, order=4)), [(0,5,0), (1,2,0), (0,5,1), (1,0,2)])
+    self.assertEqual(xyz(rs.SortPoints(self.points, order=2)), [(1,0,2), (1,2,0), (0,5,0), (0,5,1)])
+
+  def test_DescendingReversesEveryKey(self):
+    self.assertEqual(xyz(rs.SortPoints(self.points, False)), [(1,2,0), (1,0,2), (0,5,1), (0,5,0)])
+
+  def test_ReturnsIndices(self):
+    rc, indices = rs.SortPoints(self.points, return_indices=True)
+    self.assertEqual(list(indices), [3, 1, 2, 0])
+
+  def test_Buffer(self):
+    flat = array.array('d', [c for p in self.points for c in p])
+    rc = rs.SortPoints(flat, False, 5)
+    self.assertEqual(list(rc), [1,0,2, 0,5,1, 0,5,0, 1,2,0])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(SortPointsTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
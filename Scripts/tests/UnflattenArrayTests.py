@@ -0,0 +1,43 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+
+
+def xyz(points):
+  return [(p.X, p.Y, p.Z) for p in points]
+
+
+class UnflattenArrayTests(unittest.TestCase):
+  def setUp(self):
+    self.numbers = array.array('d', [0,1,2, 3,4,5, 6,7,8])
+
+  def test_CopyIsIndependentOfNumbers(self):
+    points = rs.UnflattenArray(self.numbers)
+    self.assertEqual(xyz(points), [(0,1,2), (3,4,5), (6,7,8)])
+    self.numbers[0] = 10
+    self.assertEqual(points[0].X, 0)
+
+  def test_ViewReadsAndWritesNumbers(self):
+    view = rs.UnflattenArray(self.numbers, True)
+    self.assertEqual(len(view), 3)
+    self.numbers[3] = 10
+    self.assertEqual(view[1].X, 10)
+    view[2] = (1, 1, 1)
+    self.assertEqual(list(self.numbers[6:]), [1, 1, 1])
+
+  def test_ViewSlice(self):
+    view = rs.UnflattenArray(self.numbers, True)[1:]
+    self.assertEqual(xyz(view), [(3,4,5), (6,7,8)])
+    view[-1] = (0, 0, 0)
+    self.assertEqual(list(self.numbers[6:]), [0, 0, 0])
+
+  def test_SimplifyArrayRoundTrip(self):
+    points = rs.UnflattenArray(list(self.numbers))
+    self.assertEqual(rs.SimplifyArray(points), list(self.numbers))
+
+  def test_LengthMustBeMultipleOfThree(self):
+    self.assertRaises(ValueError, rs.UnflattenArray, [0, 1])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(UnflattenArrayTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,6 +1,7 @@
 import unittest
 import uuid
 
+import Rhino
 import Rhino.Geometry as g
 
 import rhinoscriptsyntax as rs
@@ -33,6 +34,7 @@ class UserDataDocumentLevelTests(unittest.TestCase):
       _, k, v = sec_ent_val()
       rs.SetDocumentUserText(k, v)
       self.assertEqual(v, rs.GetDocumentUserText(k))
+  @unittest.skipUnless(Rhino.Runtime.HostUtils.RunningInRhino, "needs the IronPython list .Count property")
   def test_GetDocumentUserTextWithNoArgsIgnoresDocumentData(self):
       s,k,v = sec_ent_val()
       rs.SetDocumentData(s,k,v)
@@ -0,0 +1,79 @@
+import array
+import unittest
+
+import rhinoscriptsyntax as rs
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+
+def xyz(vectors):
+  return [(v.X, v.Y, v.Z) for v in vectors]
+
+
+class VectorArrayTests(unittest.TestCase):
+  def setUp(self):
+    self.vectors1 = [(1,0,0), (3,4,0), (1,2,3)]
+    self.vectors2 = [(0,1,0), (0,0,2), (-1,0,1)]
+
+  def assertVectorsAlmostEqual(self, rc, expected):
+    self.assertEqual(len(rc), len(expected))
+    for a, b in zip(xyz(rc), xyz(expected)):
+      for x, y in zip(a, b): self.assertAlmostEqual(x, y)
+
+  def test_AddAndSubtractMatchScalar(self):
+    self.assertVectorsAlmostEqual(rs.VectorArrayAdd(self.vectors1, self.vectors2),
+      [rs.VectorAdd(a, b) for a, b in zip(self.vectors1, self.vectors2)])
+    self.assertVectorsAlmostEqual(rs.VectorArraySubtract(self.vectors1, (1,1,1)),
+      [rs.VectorSubtract(a, (1,1,1)) for a in self.vectors1])
+
+  def test_ProductsMatchScalar(self):
+    self.assertEqual(rs.VectorArrayDotProduct(self.vectors1, self.vectors2),
+      [rs.VectorDotProduct(a, b) for a, b in zip(self.vectors1, self.vectors2)])
+    self.assertVectorsAlmostEqual(rs.VectorArrayCrossProduct(self.vectors1, self.vectors2),
+      [rs.VectorCrossProduct(a, b) for a, b in zip(self.vectors1, self.vectors2)])
+
+  def test_LengthAndUnitize(self):
+    self.assertEqual(rs.VectorArrayLength([(3,4,0), (0,0,2)]), [5.0, 2.0])
+    self.assertVectorsAlmostEqual(rs.VectorArrayUnitize(self.vectors1),
+      [rs.VectorUnitize(v) for v in self.vectors1])
+
+  def test_AngleMatchesScalar(self):
+    rc = rs.VectorArrayAngle(self.vectors1, self.vectors2)
+    for angle, a, b in zip(rc, self.vectors1, self.vectors2):
+      self.assertAlmostEqual(angle, rs.VectorAngle(a, b))
+
+  def test_RotateAndTransformMatchScalar(self):
+    self.assertVectorsAlmostEqual(rs.VectorArrayRotate(self.vectors1, 30.0, (0,0,1)),
+      [rs.VectorRotate(v, 30.0, (0,0,1)) for v in self.vectors1])
+    xform = rs.XformRotation2(90.0, (1,1,0), (0,0,0))
+    self.assertVectorsAlmostEqual(rs.VectorArrayTransform(self.vectors1, xform),
+      [rs.VectorTransform(v, xform) for v in self.vectors1])
+
+  def test_RotatePerVectorAngles(self):
+    angles = [10.0, 20.0, 30.0]
+    self.assertVectorsAlmostEqual(rs.VectorArrayRotate(self.vectors1, angles, (0,0,1)),
+      [rs.VectorRotate(v, angle, (0,0,1)) for v, angle in zip(self.vectors1, angles)])
+
+  def test_RotateRejectsWrongNumberOfAngles(self):
+    self.assertRaises(ValueError, rs.VectorArrayRotate, self.vectors1, [10.0, 20.0], (0,0,1))
+    self.assertRaises(ValueError, rs.VectorArrayRotate, self.vectors1, [10.0, 20.0, 30.0, 40.0], (0,0,1))
+
+  @unittest.skipIf(numpy is None, "requires numpy")
+  def test_NumpyRotateRejectsWrongNumberOfAngles(self):
+    vectors = numpy.array(self.vectors1, dtype=float)
+    self.assertRaises(ValueError, rs.VectorArrayRotate, vectors, numpy.array([10.0, 20.0]), (0,0,1))
+    self.assertRaises(ValueError, rs.VectorArrayRotate, vectors, [10.0], (0,0,1))
+    self.assertEqual(rs.VectorArrayRotate(vectors, [0.0, 90.0, 0.0], (0,0,1)).shape, (3,3))
+
+  def test_BufferReturnsBuffer(self):
+    flat = array.array('d', [c for v in self.vectors1 for c in v])
+    rc = rs.VectorArrayAdd(flat, (1,1,1))
+    self.assertTrue(isinstance(rc, array.array))
+    self.assertEqual(list(rc), [2,1,1, 4,5,1, 2,3,4])
+    self.assertEqual(list(rs.VectorArrayLength(flat))[:2], [1.0, 5.0])
+
+suite = unittest.TestLoader().loadTestsFromTestCase(VectorArrayTests)
+unittestresult = unittest.TextTestRunner(verbosity=2).run(suite)
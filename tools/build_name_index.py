@@ -0,0 +1,137 @@
+"""Utility to build the name index used by the lazy rhinoscriptsyntax module"""
+import ast
+import functools
+import os.path as op
+
+
+THIS_DIR = op.dirname(op.abspath(__file__))
+ROOT_DIR = op.dirname(THIS_DIR)
+PACKAGE_DIR = op.join(ROOT_DIR, "Scripts", "rhinoscript")
+DEST = op.join(PACKAGE_DIR, "nameindex.py")
+
+# order in which rhinoscriptsyntax used to star-import the submodules.
+# a name defined by more than one module resolves to the last one listed
+MODULES = [
+    "application",
+    "curve",
+    "document",
+    "geometry",
+    "layer",
+    "object",
+    "plane",
+    "selection",
+    "surface",
+    "userinterface",
+    "view",
+    "utility",
+    "block",
+    "group",
+    "mesh",
+    "line",
+    "transformation",
+    "grips",
+    "pointvector",
+    "userdata",
+    "material",
+    "dimension",
+    "light",
+    "hatch",
+    "linetype",
+    "toolbar",
+    "instrumentation",
+]
+
+
+def bound_names(node):
+    """Yield the names bound by a top-level statement. Imported modules, such
+    as sys, System or rhinoscript.utility as rhutil, and names imported from
+    outside of rhinoscript are implementation details of the submodules and
+    are skipped"""
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        yield node.name
+    elif isinstance(node, ast.ImportFrom):
+        # from rhinoscript import utility binds a module, from
+        # rhinoscript.plane import PlaneFitAccumulator binds a name
+        if node.level == 0 and node.module and node.module.startswith("rhinoscript."):
+            for alias in node.names:
+                yield alias.asname or alias.name
+    elif isinstance(node, ast.Assign):
+        for target in node.targets:
+            for name in ast.walk(target):
+                if isinstance(name, ast.Name):
+                    yield name.id
+    elif isinstance(node, (ast.If, ast.Try)):
+        for child in node.body + node.orelse + getattr(node, "finalbody", []):
+            yield from bound_names(child)
+
+
+def top_level(nodes):
+    """Yield top-level statements, including those nested in if/try blocks"""
+    for node in nodes:
+        yield node
+        if isinstance(node, (ast.If, ast.Try)):
+            yield from top_level(node.body + node.orelse + getattr(node, "finalbody", []))
+
+
+@functools.lru_cache(maxsize=None)
+def parse(module):
+    with open(op.join(PACKAGE_DIR, module + ".py"), "r") as rf:
+        return ast.parse(rf.read())
+
+
+def public_names(module):
+    """Return the names a star import of rhinoscript.<module> would bind"""
+    for node in parse(module).body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            return list(ast.literal_eval(node.value))
+    names = []
+    for node in parse(module).body:
+        names.extend(n for n in bound_names(node) if not n.startswith("_"))
+    return names
+
+
+def defining_module(module, name, seen=()):
+    """Return the rhinoscript module whose def or class statement creates
+    rhinoscript.<module>.<name>, following imports between submodules"""
+    if (module, name) in seen:
+        return None
+    seen += ((module, name),)
+    for node in top_level(parse(module).body):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name == name:
+            return module
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("rhinoscript."):
+            for alias in node.names:
+                if (alias.asname or alias.name) == name:
+                    return defining_module(node.module.split(".", 1)[1], alias.name, seen)
+    return None
+
+
+def write_dict(wf, name, index):
+    wf.write(f"{name} = {{\n")
+    for key in sorted(index, key=lambda n: (n.lower(), n)):
+        wf.write(f"    {key!r}: {index[key]!r},\n")
+    wf.write("}\n")
+
+
+def main():
+    index = {}
+    for module in MODULES:
+        for name in public_names(module):
+            index[name] = module
+    defined = {}
+    for name, module in index.items():
+        source = defining_module(module, name)
+        if source:
+            defined[name] = source
+
+    with open(DEST, "w") as wf:
+        wf.write("# generated by tools/build_name_index.py - do not edit\n")
+        wf.write("# public name -> rhinoscript submodule that provides it to rhinoscriptsyntax\n")
+        write_dict(wf, "NAMES", index)
+        wf.write("\n# function or class name -> rhinoscript submodule that defines it\n")
+        write_dict(wf, "DEFINED", defined)
+    print(f"Wrote {len(index)} names to {DEST}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Rhino.Collections stand-ins"""
+from _standin import module_getattr
+import System
+from Rhino.Geometry import Point3d
+
+__getattr__ = module_getattr(__name__)
+
+
+class Point3dList(object):
+    def __init__(self, points=None):
+        # Point3dList(int) only sets the initial capacity
+        if points is None or isinstance(points, int): self._items = []
+        else: self._items = [Point3d(point) for point in points]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        self._items[index] = Point3d(value)
+
+    Count = property(lambda self: len(self._items))
+
+    def Add(self, x, y=None, z=None):
+        self._items.append(Point3d(x) if y is None else Point3d(x, y, z))
+
+    def AddRange(self, points):
+        self._items.extend(Point3d(point) for point in points)
+
+    def ToArray(self):
+        return System.Array[Point3d](self._items)
+
+    def ClosestIndex(self, testPoint):
+        return Point3dList.ClosestIndexInList(self._items, testPoint)
+
+    @staticmethod
+    def ClosestIndexInList(points, testPoint):
+        # linear scan, as RhinoCommon does
+        rc = -1
+        best = None
+        for i, point in enumerate(points):
+            d = point.DistanceToSquared(testPoint)
+            if best is None or d<best:
+                best = d
+                rc = i
+        return rc
+
+    @staticmethod
+    def ClosestPointInList(points, testPoint):
+        index = Point3dList.ClosestIndexInList(points, testPoint)
+        return Point3d.Unset if index<0 else Point3d(list(points)[index])
+
+
+class RhinoList(object):
+    @staticmethod
+    def Point3dKNeighbors(hayPoints, needlePoints, amount):
+        hay = list(hayPoints)
+        for needle in needlePoints:
+            order = sorted(range(len(hay)), key=lambda i: hay[i].DistanceToSquared(needle))
+            yield System.Array[int](order[:amount])
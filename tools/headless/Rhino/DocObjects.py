@@ -0,0 +1,221 @@
+"""Rhino.DocObjects types used by the document tables"""
+import enum
+
+from _standin import module_getattr
+import System
+import System.Drawing
+
+__getattr__ = module_getattr(__name__)
+
+
+class ObjectType(enum.IntFlag):
+    NONE = 0
+    Point = 1
+    PointSet = 2
+    Curve = 4
+    Surface = 8
+    Brep = 0x10
+    Mesh = 0x20
+    Light = 0x100
+    Annotation = 0x200
+    InstanceDefinition = 0x800
+    InstanceReference = 0x1000
+    TextDot = 0x2000
+    Grip = 0x4000
+    Detail = 0x8000
+    Hatch = 0x10000
+    MorphControl = 0x20000
+    SubD = 0x40000
+    BrepLoop = 0x80000
+    PolysrfFilter = 0x200000
+    EdgeFilter = 0x400000
+    PolyedgeFilter = 0x800000
+    MeshVertex = 0x1000000
+    MeshEdge = 0x2000000
+    MeshFace = 0x4000000
+    Cage = 0x8000000
+    Phantom = 0x10000000
+    ClipPlane = 0x20000000
+    Extrusion = 0x40000000
+    AnyObject = 0xFFFFFFFF
+
+
+class ObjectMode(enum.IntEnum):
+    Normal = 0
+    Hidden = 1
+    Locked = 2
+    InstanceDefinitionObject = 3
+
+
+class ObjectColorSource(enum.IntEnum):
+    ColorFromLayer = 0
+    ColorFromObject = 1
+    ColorFromMaterial = 2
+    ColorFromParent = 3
+
+
+class ActiveSpace(enum.IntEnum):
+    NONE = 0
+    ModelSpace = 1
+    PageSpace = 2
+
+
+class ObjectEnumeratorSettings(object):
+    def __init__(self):
+        self.NormalObjects = True
+        self.LockedObjects = True
+        self.HiddenObjects = False
+        self.ActiveObjects = True
+        self.ReferenceObjects = True
+        self.DeletedObjects = False
+        self.IncludeLights = False
+        self.IncludeGrips = False
+        self.IncludePhantoms = False
+        self.SelectedObjectsFilter = False
+        self.VisibleFilter = False
+        self.ObjectTypeFilter = ObjectType.AnyObject
+        self.NameFilter = None
+        self.LayerIndexFilter = -1
+
+
+class ObjectAttributes(object):
+    def __init__(self):
+        self.Name = ""
+        self.LayerIndex = 0
+        self.ObjectColor = System.Drawing.Color.Black
+        self.ColorSource = ObjectColorSource.ColorFromLayer
+        self.Mode = ObjectMode.Normal
+        self.Visible = True
+        self.Space = ActiveSpace.ModelSpace
+        self.ObjectId = System.Guid.Empty
+        self._user_strings = {}
+
+    def Duplicate(self):
+        rc = ObjectAttributes()
+        rc.__dict__.update(self.__dict__)
+        rc._user_strings = dict(self._user_strings)
+        return rc
+
+    def GetUserString(self, key):
+        return self._user_strings.get(key)
+
+    def SetUserString(self, key, value):
+        if value is None: self._user_strings.pop(key, None)
+        else: self._user_strings[key] = value
+        return True
+
+    def GetUserStrings(self):
+        return dict(self._user_strings)
+
+    def DeleteAllUserStrings(self):
+        self._user_strings.clear()
+
+    UserStringCount = property(lambda self: len(self._user_strings))
+
+
+class RhinoObject(object):
+    """Object stored in a document. Created by the ObjectTable"""
+
+    def __init__(self, document, geometry, attributes):
+        self.Document = document
+        self.Geometry = geometry
+        self.Attributes = attributes
+        self.Id = attributes.ObjectId
+        self.IsDeleted = False
+        self._selected = 0
+
+    ObjectType = property(lambda self: self.Geometry.ObjectType)
+    Name = property(lambda self: self.Attributes.Name)
+    IsHidden = property(lambda self: self.Attributes.Mode==ObjectMode.Hidden)
+    IsLocked = property(lambda self: self.Attributes.Mode==ObjectMode.Locked)
+    IsNormal = property(lambda self: self.Attributes.Mode==ObjectMode.Normal)
+    Visible = property(lambda self: self.Attributes.Visible and not self.IsHidden)
+    IsReference = property(lambda self: False)
+    IsValid = property(lambda self: self.Geometry.IsValid)
+
+    def IsSelected(self, checkSubObjects=False):
+        return self._selected
+
+    def IsSelectable(self, ignoreSelectionState=False, ignoreGripsState=False,
+                     ignoreLayerLocking=False, ignoreLayerVisibility=False):
+        return not self.IsDeleted and self.IsNormal
+
+    def Select(self, on, syncHighlight=True, persistentSelect=True, ignoreGripsState=False,
+               ignoreLayerLocking=False, ignoreLayerVisibility=False):
+        if on and not self.IsSelectable(): return 0
+        self._selected = 2 if on and persistentSelect else 1 if on else 0
+        return 1
+
+    def CommitChanges(self):
+        return self.Document.Objects.ModifyAttributes(self, self.Attributes, True)
+
+    def DuplicateGeometry(self):
+        return self.Geometry.Duplicate()
+
+
+class PointObject(RhinoObject):
+    PointGeometry = property(lambda self: self.Geometry)
+
+
+class CurveObject(RhinoObject):
+    CurveGeometry = property(lambda self: self.Geometry)
+
+
+class ObjRef(object):
+    def __init__(self, object_or_id):
+        if isinstance(object_or_id, RhinoObject):
+            self._object = object_or_id
+            self.ObjectId = object_or_id.Id
+        else:
+            self._object = None
+            self.ObjectId = object_or_id
+
+    def Object(self):
+        if self._object is None:
+            import Rhino
+            self._object = Rhino.RhinoDoc.ActiveDoc.Objects.Find(self.ObjectId)
+        return self._object
+
+    def Geometry(self):
+        rhobj = self.Object()
+        return rhobj.Geometry if rhobj else None
+
+    def __geometry_of(self, typename):
+        import Rhino.Geometry
+        geometry = self.Geometry()
+        return geometry if isinstance(geometry, getattr(Rhino.Geometry, typename)) else None
+
+    def Curve(self):
+        return self.__geometry_of("Curve")
+
+    def Point(self):
+        return self.__geometry_of("Point")
+
+
+class Layer(object):
+    def __init__(self):
+        self.Name = ""
+        self.Id = System.Guid.Empty
+        self.Index = -1
+        self.ParentLayerId = System.Guid.Empty
+        self.Color = System.Drawing.Color.Black
+        self.IsVisible = True
+        self.IsLocked = False
+        self.IsDeleted = False
+        self.IsExpanded = False
+        self._table = None
+
+    @staticmethod
+    def GetDefaultLayerProperties():
+        return Layer()
+
+    LayerIndex = property(lambda self: self.Index)
+
+    @property
+    def FullPath(self):
+        if self._table is None or self.ParentLayerId==System.Guid.Empty: return self.Name
+        parent = self._table.FindId(self.ParentLayerId)
+        return self.Name if parent is None else parent.FullPath + "::" + self.Name
+
+    def CommitChanges(self):
+        return self._table is not None
@@ -0,0 +1,1233 @@
+"""Rhino.Geometry value types and the few geometry classes rhinoscript needs
+to run headless. Semantics follow RhinoCommon: points and vectors are mutable
+value types, statics such as Point3d.Origin hand out copies, and methods with
+out parameters return tuples the way IronPython and pythonnet do.
+"""
+import enum
+import math
+
+from _standin import module_getattr, static
+import System
+
+__getattr__ = module_getattr(__name__)
+
+UNSET = -1.23432101234321e+308
+ZERO_TOLERANCE = 2.3283064365386963e-10
+
+
+def _text(value):
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+class _XYZ(object):
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if isinstance(x, _XYZ):
+            x, y, z = x.X, x.Y, x.Z
+        self.X = float(x)
+        self.Y = float(y)
+        self.Z = float(z)
+
+    def __getitem__(self, index):
+        if index==0: return self.X
+        if index==1: return self.Y
+        if index==2: return self.Z
+        raise IndexError("index out of range")
+
+    def __setitem__(self, index, value):
+        if index==0: self.X = float(value)
+        elif index==1: self.Y = float(value)
+        elif index==2: self.Z = float(value)
+        else: raise IndexError("index out of range")
+
+    def __eq__(self, other):
+        if type(other) is not type(self): return NotImplemented
+        return self.X==other.X and self.Y==other.Y and self.Z==other.Z
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash((self.X, self.Y, self.Z))
+
+    def __lt__(self, other):
+        return (self.X, self.Y, self.Z) < (other.X, other.Y, other.Z)
+
+    def __str__(self):
+        return "%s,%s,%s" % (_text(self.X), _text(self.Y), _text(self.Z))
+
+    def __repr__(self):
+        return "<%s %s>" % (type(self).__name__, self)
+
+    ToString = __str__
+
+    def CompareTo(self, other):
+        a = (self.X, self.Y, self.Z)
+        b = (other.X, other.Y, other.Z)
+        return (a > b) - (a < b)
+
+    def EpsilonEquals(self, other, epsilon):
+        return (abs(self.X-other.X)<=epsilon and abs(self.Y-other.Y)<=epsilon
+                and abs(self.Z-other.Z)<=epsilon)
+
+    @property
+    def IsValid(self):
+        return all(v!=UNSET and math.isfinite(v) for v in (self.X, self.Y, self.Z))
+
+
+class Point3d(_XYZ):
+    __slots__ = ()
+    Origin = static(lambda: Point3d(0, 0, 0))
+    Unset = static(lambda: Point3d(UNSET, UNSET, UNSET))
+
+    def __add__(self, other):
+        if isinstance(other, (Point3d, Vector3d)):
+            return Point3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if type(other) is Point3d:
+            return Vector3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+        if type(other) is Vector3d:
+            return Point3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+        return NotImplemented
+
+    def __mul__(self, t):
+        if isinstance(t, (int, float)): return Point3d(self.X*t, self.Y*t, self.Z*t)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, t):
+        return Point3d(self.X/t, self.Y/t, self.Z/t)
+
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return Point3d(-self.X, -self.Y, -self.Z)
+
+    def DistanceTo(self, other):
+        return math.sqrt(self.DistanceToSquared(other))
+
+    def DistanceToSquared(self, other):
+        dx = self.X-other.X
+        dy = self.Y-other.Y
+        dz = self.Z-other.Z
+        return dx*dx + dy*dy + dz*dz
+
+    def Transform(self, xform):
+        m = xform._m
+        x, y, z = self.X, self.Y, self.Z
+        w = m[12]*x + m[13]*y + m[14]*z + m[15]
+        if w!=0.0: w = 1.0/w
+        self.X = w*(m[0]*x + m[1]*y + m[2]*z + m[3])
+        self.Y = w*(m[4]*x + m[5]*y + m[6]*z + m[7])
+        self.Z = w*(m[8]*x + m[9]*y + m[10]*z + m[11])
+
+    @staticmethod
+    def CullDuplicates(points, tolerance):
+        # quadratic on purpose, this mirrors the brute force check in RhinoCommon
+        rc = []
+        tol2 = tolerance*tolerance
+        for point in points:
+            if all(point.DistanceToSquared(kept)>tol2 for kept in rc):
+                rc.append(Point3d(point))
+        return System.Array[Point3d](rc)
+
+    @staticmethod
+    def SortAndCullPointList(points, tolerance):
+        rc = []
+        for point in sorted(points):
+            if rc and point.DistanceTo(rc[-1])<=tolerance: continue
+            rc.append(Point3d(point))
+        return System.Array[Point3d](rc)
+
+    @staticmethod
+    def ArePointsCoplanar(points, tolerance):
+        result, plane = Plane.FitPlaneToPoints(points)
+        if result==PlaneFitResult.Failure: return False
+        return all(abs(plane.DistanceTo(point))<=tolerance for point in points)
+
+
+class Vector3d(_XYZ):
+    __slots__ = ()
+    Zero = static(lambda: Vector3d(0, 0, 0))
+    XAxis = static(lambda: Vector3d(1, 0, 0))
+    YAxis = static(lambda: Vector3d(0, 1, 0))
+    ZAxis = static(lambda: Vector3d(0, 0, 1))
+    Unset = static(lambda: Vector3d(UNSET, UNSET, UNSET))
+
+    def __add__(self, other):
+        if type(other) is Vector3d:
+            return Vector3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+        if type(other) is Point3d:
+            return Point3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if type(other) is Vector3d:
+            return Vector3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if type(other) is Vector3d:
+            return self.X*other.X + self.Y*other.Y + self.Z*other.Z
+        if isinstance(other, (int, float)):
+            return Vector3d(self.X*other, self.Y*other, self.Z*other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, t):
+        return Vector3d(self.X/t, self.Y/t, self.Z/t)
+
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return Vector3d(-self.X, -self.Y, -self.Z)
+
+    @property
+    def Length(self):
+        return math.sqrt(self.X*self.X + self.Y*self.Y + self.Z*self.Z)
+
+    @property
+    def SquareLength(self):
+        return self.X*self.X + self.Y*self.Y + self.Z*self.Z
+
+    @property
+    def IsZero(self):
+        return self.X==0.0 and self.Y==0.0 and self.Z==0.0
+
+    @property
+    def IsUnitVector(self):
+        return abs(self.Length-1.0)<=1.490116119385e-8
+
+    def IsTiny(self, tolerance=1.0e-12):
+        return abs(self.X)<=tolerance and abs(self.Y)<=tolerance and abs(self.Z)<=tolerance
+
+    def Unitize(self):
+        length = self.Length
+        if length==0.0: return False
+        self.X /= length
+        self.Y /= length
+        self.Z /= length
+        return True
+
+    def Reverse(self):
+        self.X, self.Y, self.Z = -self.X, -self.Y, -self.Z
+        return True
+
+    def Transform(self, xform):
+        m = xform._m
+        x, y, z = self.X, self.Y, self.Z
+        self.X = m[0]*x + m[1]*y + m[2]*z
+        self.Y = m[4]*x + m[5]*y + m[6]*z
+        self.Z = m[8]*x + m[9]*y + m[10]*z
+
+    def Rotate(self, angle_radians, rotation_axis):
+        if rotation_axis.IsZero: return False
+        self.Transform(Transform.Rotation(angle_radians, rotation_axis, Point3d(0, 0, 0)))
+        return True
+
+    def PerpendicularTo(self, other):
+        # same axis choice as ON_3dVector::PerpendicularTo
+        v = (other.X, other.Y, other.Z)
+        if abs(v[1])>abs(v[0]):
+            if abs(v[2])>abs(v[1]): i, j, k = 2, 1, 0
+            elif abs(v[2])>abs(v[0]): i, j, k = 1, 2, 0
+            else: i, j, k = 1, 0, 2
+        else:
+            if abs(v[2])>abs(v[0]): i, j, k = 2, 0, 1
+            elif abs(v[2])>abs(v[1]): i, j, k = 0, 2, 1
+            else: i, j, k = 0, 1, 2
+        rc = [0.0, 0.0, 0.0]
+        rc[j] = v[i]
+        rc[i] = -v[j]
+        rc[k] = 0.0
+        self.X, self.Y, self.Z = rc
+        return v[i]!=0.0
+
+    def IsParallelTo(self, other, angleTolerance=math.pi/180.0):
+        ll = self.Length*other.Length
+        if ll<=0.0: return 0
+        cos_angle = (self*other)/ll
+        cos_tol = math.cos(angleTolerance)
+        if cos_angle>=cos_tol: return 1
+        if cos_angle<=-cos_tol: return -1
+        return 0
+
+    def IsPerpendicularTo(self, other, angleTolerance=math.pi/180.0):
+        ll = self.Length*other.Length
+        if ll<=0.0: return False
+        return abs((self*other)/ll)<=math.sin(angleTolerance)
+
+    @staticmethod
+    def CrossProduct(a, b):
+        return Vector3d(a.Y*b.Z - b.Y*a.Z, a.Z*b.X - b.Z*a.X, a.X*b.Y - b.X*a.Y)
+
+    @staticmethod
+    def Multiply(a, b):
+        if isinstance(a, (int, float)): return b*a
+        return a*b
+
+    @staticmethod
+    def Add(a, b):
+        return a+b
+
+    @staticmethod
+    def Subtract(a, b):
+        return a-b
+
+    @staticmethod
+    def Negate(a):
+        return -a
+
+    @staticmethod
+    def Divide(a, t):
+        return a/t
+
+    @staticmethod
+    def VectorAngle(a, b, plane=None):
+        a = Vector3d(a)
+        b = Vector3d(b)
+        if not a.Unitize() or not b.Unitize(): return UNSET
+        dot = max(-1.0, min(1.0, a*b))
+        return math.acos(dot)
+
+
+class Point3f(_XYZ):
+    __slots__ = ()
+
+
+class Vector3f(_XYZ):
+    __slots__ = ()
+
+
+class Point2d(object):
+    __slots__ = ("X", "Y")
+
+    def __init__(self, x=0.0, y=0.0):
+        if isinstance(x, (Point2d, _XYZ)):
+            x, y = x.X, x.Y
+        self.X = float(x)
+        self.Y = float(y)
+
+    def __getitem__(self, index):
+        if index==0: return self.X
+        if index==1: return self.Y
+        raise IndexError("index out of range")
+
+    def __eq__(self, other):
+        if type(other) is not Point2d: return NotImplemented
+        return self.X==other.X and self.Y==other.Y
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash((self.X, self.Y))
+
+    def __str__(self):
+        return "%s,%s" % (_text(self.X), _text(self.Y))
+
+    ToString = __str__
+
+    def DistanceTo(self, other):
+        return math.hypot(self.X-other.X, self.Y-other.Y)
+
+
+class Interval(object):
+    __slots__ = ("T0", "T1")
+
+    def __init__(self, t0=0.0, t1=0.0):
+        if isinstance(t0, Interval):
+            t0, t1 = t0.T0, t0.T1
+        self.T0 = float(t0)
+        self.T1 = float(t1)
+
+    def __getitem__(self, index):
+        if index==0: return self.T0
+        if index==1: return self.T1
+        raise IndexError("index out of range")
+
+    def __eq__(self, other):
+        if type(other) is not Interval: return NotImplemented
+        return self.T0==other.T0 and self.T1==other.T1
+
+    def __hash__(self):
+        return hash((self.T0, self.T1))
+
+    Min = property(lambda self: min(self.T0, self.T1))
+    Max = property(lambda self: max(self.T0, self.T1))
+    Mid = property(lambda self: 0.5*(self.T0+self.T1))
+    Length = property(lambda self: self.T1-self.T0)
+    IsIncreasing = property(lambda self: self.T0<self.T1)
+    IsDecreasing = property(lambda self: self.T0>self.T1)
+    IsSingleton = property(lambda self: self.T0==self.T1)
+    IsValid = property(lambda self: math.isfinite(self.T0) and math.isfinite(self.T1) and UNSET not in (self.T0, self.T1))
+
+    def ParameterAt(self, normalized):
+        return (1.0-normalized)*self.T0 + normalized*self.T1
+
+    def NormalizedParameterAt(self, t):
+        length = self.T1-self.T0
+        return (t-self.T0)/length if length else UNSET
+
+    def IncludesParameter(self, t, strict=False):
+        if strict: return self.Min<t<self.Max
+        return self.Min<=t<=self.Max
+
+    def Reverse(self):
+        self.T0, self.T1 = -self.T1, -self.T0
+
+    def Swap(self):
+        self.T0, self.T1 = self.T1, self.T0
+
+
+class _overload(object):
+    """Method that is static when called on the class and an instance method
+    when called on an instance, e.g. BoundingBox.Union(a, b) and bbox.Union(b)"""
+
+    def __init__(self, static_method, instance_method):
+        self.static_method = static_method
+        self.instance_method = instance_method
+
+    def __get__(self, instance, owner):
+        if instance is None: return self.static_method
+        return self.instance_method.__get__(instance, owner)
+
+
+def _union_instance(self, other):
+    if isinstance(other, BoundingBox):
+        if not other.IsValid: return
+        self._BoundingBox__grow([other.Min, other.Max])
+    else:
+        self._BoundingBox__grow([other])
+
+
+def _union_static(a, b):
+    rc = BoundingBox(a.Min, a.Max)
+    _union_instance(rc, b)
+    return rc
+
+
+class BoundingBox(object):
+    __slots__ = ("Min", "Max")
+    Empty = static(lambda: BoundingBox(Point3d(1, 0, 0), Point3d(-1, 0, 0)))
+    Unset = static(lambda: BoundingBox(Point3d.Unset, Point3d.Unset))
+
+    def __init__(self, *args):
+        if len(args)==6:
+            self.Min = Point3d(args[0], args[1], args[2])
+            self.Max = Point3d(args[3], args[4], args[5])
+        elif len(args)==2:
+            self.Min = Point3d(args[0])
+            self.Max = Point3d(args[1])
+        elif len(args)==1:
+            self.Min = Point3d(1, 0, 0)
+            self.Max = Point3d(-1, 0, 0)
+            self.__grow(args[0])
+        else:
+            self.Min = Point3d()
+            self.Max = Point3d()
+
+    def __grow(self, points):
+        xs = []
+        ys = []
+        zs = []
+        for point in points:
+            xs.append(point.X)
+            ys.append(point.Y)
+            zs.append(point.Z)
+        if not xs: return
+        if self.IsValid:
+            xs += (self.Min.X, self.Max.X)
+            ys += (self.Min.Y, self.Max.Y)
+            zs += (self.Min.Z, self.Max.Z)
+        self.Min = Point3d(min(xs), min(ys), min(zs))
+        self.Max = Point3d(max(xs), max(ys), max(zs))
+
+    @property
+    def IsValid(self):
+        return (self.Min.IsValid and self.Max.IsValid and self.Min.X<=self.Max.X
+                and self.Min.Y<=self.Max.Y and self.Min.Z<=self.Max.Z)
+
+    Center = property(lambda self: (self.Min+self.Max)*0.5)
+    Diagonal = property(lambda self: self.Max-self.Min)
+
+    def GetCorners(self):
+        a, b = self.Min, self.Max
+        return System.Array[Point3d]([
+            Point3d(a.X, a.Y, a.Z), Point3d(b.X, a.Y, a.Z), Point3d(b.X, b.Y, a.Z), Point3d(a.X, b.Y, a.Z),
+            Point3d(a.X, a.Y, b.Z), Point3d(b.X, a.Y, b.Z), Point3d(b.X, b.Y, b.Z), Point3d(a.X, b.Y, b.Z)])
+
+    Union = _overload(_union_static, _union_instance)
+
+    def Contains(self, other, strict=False):
+        points = [other.Min, other.Max] if isinstance(other, BoundingBox) else [other]
+        for point in points:
+            for axis in range(3):
+                if strict and not self.Min[axis]<point[axis]<self.Max[axis]: return False
+                if not self.Min[axis]<=point[axis]<=self.Max[axis]: return False
+        return True
+
+    def ClosestPoint(self, point):
+        return Point3d(*[min(max(point[axis], self.Min[axis]), self.Max[axis]) for axis in range(3)])
+
+    def Inflate(self, x, y=None, z=None):
+        if y is None: y = z = x
+        self.Min = Point3d(self.Min.X-x, self.Min.Y-y, self.Min.Z-z)
+        self.Max = Point3d(self.Max.X+x, self.Max.Y+y, self.Max.Z+z)
+
+    def Transform(self, xform):
+        if not self.IsValid: return False
+        corners = self.GetCorners()
+        for corner in corners: corner.Transform(xform)
+        self.Min = Point3d(1, 0, 0)
+        self.Max = Point3d(-1, 0, 0)
+        self.__grow(corners)
+        return True
+
+    @staticmethod
+    def Intersection(a, b):
+        rc = BoundingBox(Point3d(*[max(a.Min[i], b.Min[i]) for i in range(3)]),
+                         Point3d(*[min(a.Max[i], b.Max[i]) for i in range(3)]))
+        return rc if rc.IsValid else BoundingBox.Empty
+
+
+class PlaneFitResult(enum.IntEnum):
+    Success = 0
+    Inconsistent = 1
+    Failure = -1
+
+
+class Plane(object):
+    __slots__ = ("Origin", "XAxis", "YAxis", "ZAxis")
+    WorldXY = static(lambda: Plane(Point3d(0, 0, 0), Vector3d(1, 0, 0), Vector3d(0, 1, 0)))
+    WorldYZ = static(lambda: Plane(Point3d(0, 0, 0), Vector3d(0, 1, 0), Vector3d(0, 0, 1)))
+    WorldZX = static(lambda: Plane(Point3d(0, 0, 0), Vector3d(0, 0, 1), Vector3d(1, 0, 0)))
+    Unset = static(lambda: Plane(Point3d.Unset, Vector3d.Unset, Vector3d.Unset, Vector3d.Unset))
+
+    def __init__(self, *args):
+        if len(args)==1:
+            other = args[0]
+            self.Origin = Point3d(other.Origin)
+            self.XAxis = Vector3d(other.XAxis)
+            self.YAxis = Vector3d(other.YAxis)
+            self.ZAxis = Vector3d(other.ZAxis)
+        elif len(args)==2:
+            origin, normal = args
+            z = Vector3d(normal)
+            z.Unitize()
+            x = Vector3d()
+            x.PerpendicularTo(z)
+            x.Unitize()
+            self.__set(Point3d(origin), x, Vector3d.CrossProduct(z, x), z)
+        elif len(args)==3 and type(args[1]) is Point3d:
+            origin, xpoint, ypoint = args
+            self.__frompoints(Point3d(origin), xpoint-origin, ypoint-origin)
+        elif len(args)==3:
+            self.__frompoints(Point3d(args[0]), Vector3d(args[1]), Vector3d(args[2]))
+        elif len(args)==4 and isinstance(args[0], (int, float)):
+            a, b, c, d = args
+            z = Vector3d(a, b, c)
+            length = z.Length
+            origin = Point3d(-d*a, -d*b, -d*c)/(length*length)
+            self.__init__(origin, z)
+        elif len(args)==4:
+            self.__set(Point3d(args[0]), Vector3d(args[1]), Vector3d(args[2]), Vector3d(args[3]))
+        else:
+            self.__set(Point3d(), Vector3d(), Vector3d(), Vector3d())
+
+    def __set(self, origin, x, y, z):
+        self.Origin = origin
+        self.XAxis = x
+        self.YAxis = y
+        self.ZAxis = z
+
+    def __frompoints(self, origin, xdir, ydir):
+        x = Vector3d(xdir)
+        x.Unitize()
+        y = ydir - x*(x*ydir)
+        y.Unitize()
+        z = Vector3d.CrossProduct(x, y)
+        z.Unitize()
+        self.__set(origin, x, y, z)
+
+    def __eq__(self, other):
+        if type(other) is not Plane: return NotImplemented
+        return (self.Origin==other.Origin and self.XAxis==other.XAxis
+                and self.YAxis==other.YAxis and self.ZAxis==other.ZAxis)
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash((self.Origin, self.XAxis, self.YAxis, self.ZAxis))
+
+    def __str__(self):
+        return "Origin=%s XAxis=%s, YAxis=%s, ZAxis=%s" % (self.Origin, self.XAxis, self.YAxis, self.ZAxis)
+
+    ToString = __str__
+
+    Normal = property(lambda self: Vector3d(self.ZAxis))
+
+    @property
+    def IsValid(self):
+        return self.Origin.IsValid and self.ZAxis.IsValid and abs(self.ZAxis.Length-1.0)<1e-8
+
+    def Clone(self):
+        return Plane(self)
+
+    def Flip(self):
+        self.XAxis, self.YAxis = self.YAxis, self.XAxis
+        self.ZAxis = -self.ZAxis
+
+    def PointAt(self, u, v, w=0.0):
+        o, x, y, z = self.Origin, self.XAxis, self.YAxis, self.ZAxis
+        return Point3d(o.X + u*x.X + v*y.X + w*z.X,
+                       o.Y + u*x.Y + v*y.Y + w*z.Y,
+                       o.Z + u*x.Z + v*y.Z + w*z.Z)
+
+    def ClosestParameter(self, point):
+        v = point - self.Origin
+        return True, v*self.XAxis, v*self.YAxis
+
+    def ClosestPoint(self, point):
+        rc, u, v = self.ClosestParameter(point)
+        return self.PointAt(u, v)
+
+    def DistanceTo(self, point):
+        return (point - self.Origin)*self.ZAxis
+
+    def RemapToPlaneSpace(self, point):
+        v = point - self.Origin
+        return True, Point3d(v*self.XAxis, v*self.YAxis, v*self.ZAxis)
+
+    def GetPlaneEquation(self):
+        z = self.ZAxis
+        return System.Array[float]([z.X, z.Y, z.Z, -(z.X*self.Origin.X + z.Y*self.Origin.Y + z.Z*self.Origin.Z)])
+
+    def Transform(self, xform):
+        origin = Point3d(self.Origin)
+        origin.Transform(xform)
+        xpoint = self.Origin + self.XAxis
+        ypoint = self.Origin + self.YAxis
+        xpoint.Transform(xform)
+        ypoint.Transform(xform)
+        self.__frompoints(origin, xpoint-origin, ypoint-origin)
+        return True
+
+    def EpsilonEquals(self, other, epsilon):
+        return (self.Origin.EpsilonEquals(other.Origin, epsilon) and self.XAxis.EpsilonEquals(other.XAxis, epsilon)
+                and self.YAxis.EpsilonEquals(other.YAxis, epsilon) and self.ZAxis.EpsilonEquals(other.ZAxis, epsilon))
+
+    @staticmethod
+    def FitPlaneToPoints(points):
+        points = list(points)
+        if len(points)<3: return PlaneFitResult.Failure, Plane.Unset
+        n = float(len(points))
+        cx = sum(p.X for p in points)/n
+        cy = sum(p.Y for p in points)/n
+        cz = sum(p.Z for p in points)/n
+        m = [[0.0]*3 for i in range(3)]
+        for p in points:
+            d = (p.X-cx, p.Y-cy, p.Z-cz)
+            for i in range(3):
+                for j in range(3):
+                    m[i][j] += d[i]*d[j]
+        values, vectors = _jacobi_eigen(m)
+        order = sorted(range(3), key=lambda i: values[i])
+        normal = Vector3d(*[vectors[k][order[0]] for k in range(3)])
+        if not normal.Unitize(): return PlaneFitResult.Failure, Plane.Unset
+        result = PlaneFitResult.Success
+        if values[order[1]]<=ZERO_TOLERANCE*max(1.0, values[order[2]]):
+            result = PlaneFitResult.Inconsistent
+        return result, Plane(Point3d(cx, cy, cz), normal)
+
+
+def _jacobi_eigen(a, sweeps=50):
+    """Eigen decomposition of a symmetric 3x3 matrix. Returns the eigenvalues
+    and a matrix whose columns are the eigenvectors"""
+    a = [row[:] for row in a]
+    v = [[1.0 if i==j else 0.0 for j in range(3)] for i in range(3)]
+    for sweep in range(sweeps):
+        off = a[0][1]**2 + a[0][2]**2 + a[1][2]**2
+        if off<1e-30: break
+        for p, q in ((0, 1), (0, 2), (1, 2)):
+            if a[p][q]==0.0: continue
+            theta = (a[q][q]-a[p][p])/(2.0*a[p][q])
+            t = math.copysign(1.0, theta)/(abs(theta)+math.sqrt(theta*theta+1.0))
+            c = 1.0/math.sqrt(t*t+1.0)
+            s = t*c
+            for k in range(3):
+                akp, akq = a[k][p], a[k][q]
+                a[k][p] = c*akp - s*akq
+                a[k][q] = s*akp + c*akq
+            for k in range(3):
+                apk, aqk = a[p][k], a[q][k]
+                a[p][k] = c*apk - s*aqk
+                a[q][k] = s*apk + c*aqk
+            for k in range(3):
+                vkp, vkq = v[k][p], v[k][q]
+                v[k][p] = c*vkp - s*vkq
+                v[k][q] = s*vkp + c*vkq
+    return [a[i][i] for i in range(3)], v
+
+
+class Transform(object):
+    """4x4 matrix stored row major in a list of 16 floats"""
+    __slots__ = ("_m",)
+
+    def __init__(self, diagonal=None):
+        if isinstance(diagonal, Transform):
+            self._m = list(diagonal._m)
+            return
+        self._m = [0.0]*16
+        if diagonal is not None:
+            for i in range(4): self._m[i*5] = float(diagonal)
+
+    def __getitem__(self, index):
+        row, column = index
+        return self._m[row*4+column]
+
+    def __setitem__(self, index, value):
+        row, column = index
+        self._m[row*4+column] = float(value)
+
+    def __eq__(self, other):
+        if type(other) is not Transform: return NotImplemented
+        return self._m==other._m
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash(tuple(self._m))
+
+    def __mul__(self, other):
+        if type(other) is Transform:
+            a, b = self._m, other._m
+            rc = Transform()
+            rc._m = [sum(a[r*4+k]*b[k*4+c] for k in range(4)) for r in range(4) for c in range(4)]
+            return rc
+        if isinstance(other, (Point3d, Vector3d)):
+            rc = type(other)(other)
+            rc.Transform(self)
+            return rc
+        return NotImplemented
+
+    Identity = static(lambda: Transform(1.0))
+    ZeroTransformation = static(lambda: Transform(0.0))
+    Unset = static(lambda: Transform(UNSET))
+
+    @property
+    def IsIdentity(self):
+        return self._m==Transform(1.0)._m
+
+    @property
+    def IsValid(self):
+        return all(math.isfinite(v) and v!=UNSET for v in self._m)
+
+    @property
+    def Determinant(self):
+        m = self._m
+        def det3(a, b, c, d, e, f, g, h, i):
+            return a*(e*i-f*h) - b*(d*i-f*g) + c*(d*h-e*g)
+        rc = 0.0
+        for column in range(4):
+            minor = [m[r*4+c] for r in range(1, 4) for c in range(4) if c!=column]
+            rc += (-1)**column * m[column] * det3(*minor)
+        return rc
+
+    def Clone(self):
+        return Transform(self)
+
+    def Transpose(self):
+        m = self._m
+        rc = Transform()
+        rc._m = [m[c*4+r] for r in range(4) for c in range(4)]
+        return rc
+
+    def TryGetInverse(self):
+        # Gauss-Jordan elimination with partial pivoting
+        a = [self._m[r*4:r*4+4] + [1.0 if r==c else 0.0 for c in range(4)] for r in range(4)]
+        for column in range(4):
+            pivot = max(range(column, 4), key=lambda r: abs(a[r][column]))
+            if abs(a[pivot][column])<1e-300: return False, Transform.ZeroTransformation
+            a[column], a[pivot] = a[pivot], a[column]
+            scale = 1.0/a[column][column]
+            a[column] = [v*scale for v in a[column]]
+            for r in range(4):
+                if r!=column and a[r][column]!=0.0:
+                    factor = a[r][column]
+                    a[r] = [v - factor*w for v, w in zip(a[r], a[column])]
+        rc = Transform()
+        rc._m = [a[r][4+c] for r in range(4) for c in range(4)]
+        return True, rc
+
+    def TransformBoundingBox(self, bbox):
+        rc = BoundingBox(bbox.Min, bbox.Max)
+        rc.Transform(self)
+        return rc
+
+    def TransformList(self, points):
+        rc = []
+        for point in points:
+            point = Point3d(point)
+            point.Transform(self)
+            rc.append(point)
+        return System.Array[Point3d](rc)
+
+    def ToFloatArray(self, rowDominant):
+        m = self._m if rowDominant else self.Transpose()._m
+        return System.Array[System.Single](m)
+
+    @staticmethod
+    def Multiply(a, b):
+        return a*b
+
+    @staticmethod
+    def Translation(x, y=None, z=None):
+        if y is None: x, y, z = x.X, x.Y, x.Z
+        rc = Transform(1.0)
+        rc._m[3], rc._m[7], rc._m[11] = float(x), float(y), float(z)
+        return rc
+
+    @staticmethod
+    def Scale(anchor, x, y=None, z=None):
+        if y is None:
+            rc = Transform(1.0)
+            for i in range(3): rc._m[i*5] = float(x)
+            return Transform.Translation(anchor.X, anchor.Y, anchor.Z) * rc * Transform.Translation(-anchor.X, -anchor.Y, -anchor.Z)
+        plane = anchor
+        scale = Transform(1.0)
+        scale._m[0], scale._m[5], scale._m[10] = float(x), float(y), float(z)
+        return Transform.ChangeBasis(plane, Plane.WorldXY) * scale * Transform.ChangeBasis(Plane.WorldXY, plane)
+
+    @staticmethod
+    def Rotation(*args):
+        if len(args)==3 and type(args[0]) is Vector3d:
+            start, end, center = Vector3d(args[0]), Vector3d(args[1]), args[2]
+            if not start.Unitize() or not end.Unitize(): return Transform.Identity
+            axis = Vector3d.CrossProduct(start, end)
+            sin_angle = axis.Length
+            cos_angle = start*end
+            if sin_angle<=ZERO_TOLERANCE:
+                if cos_angle>0.0: return Transform.Identity
+                axis.PerpendicularTo(start)
+            return Transform.Rotation(sin_angle, cos_angle, axis, center)
+        if len(args)==3:
+            angle, axis, center = args
+            return Transform.Rotation(math.sin(angle), math.cos(angle), axis, center)
+        if len(args)==2:
+            angle, center = args
+            return Transform.Rotation(math.sin(angle), math.cos(angle), Vector3d.ZAxis, center)
+        sin_angle, cos_angle, axis, center = args
+        axis = Vector3d(axis)
+        axis.Unitize()
+        length = math.hypot(sin_angle, cos_angle)
+        s, c = sin_angle/length, cos_angle/length
+        t = 1.0-c
+        x, y, z = axis.X, axis.Y, axis.Z
+        rc = Transform(1.0)
+        rc._m[0:3] = [t*x*x + c, t*x*y - s*z, t*x*z + s*y]
+        rc._m[4:7] = [t*x*y + s*z, t*y*y + c, t*y*z - s*x]
+        rc._m[8:11] = [t*x*z - s*y, t*y*z + s*x, t*z*z + c]
+        return Transform.Translation(center.X, center.Y, center.Z) * rc * Transform.Translation(-center.X, -center.Y, -center.Z)
+
+    @staticmethod
+    def Mirror(point_or_plane, normal=None):
+        if normal is None:
+            point_or_plane, normal = point_or_plane.Origin, point_or_plane.ZAxis
+        n = Vector3d(normal)
+        n.Unitize()
+        d = 2.0*(n.X*point_or_plane.X + n.Y*point_or_plane.Y + n.Z*point_or_plane.Z)
+        rc = Transform(1.0)
+        rc._m[0:4] = [1-2*n.X*n.X, -2*n.X*n.Y, -2*n.X*n.Z, d*n.X]
+        rc._m[4:8] = [-2*n.Y*n.X, 1-2*n.Y*n.Y, -2*n.Y*n.Z, d*n.Y]
+        rc._m[8:12] = [-2*n.Z*n.X, -2*n.Z*n.Y, 1-2*n.Z*n.Z, d*n.Z]
+        return rc
+
+    @staticmethod
+    def ChangeBasis(plane0, plane1):
+        """Maps coordinates relative to plane0 to coordinates relative to plane1"""
+        o0, x0, y0, z0 = plane0.Origin, plane0.XAxis, plane0.YAxis, plane0.ZAxis
+        o1, x1, y1, z1 = plane1.Origin, plane1.XAxis, plane1.YAxis, plane1.ZAxis
+        to_world = Transform(1.0)
+        to_world._m[0:4] = [x0.X, y0.X, z0.X, o0.X]
+        to_world._m[4:8] = [x0.Y, y0.Y, z0.Y, o0.Y]
+        to_world._m[8:12] = [x0.Z, y0.Z, z0.Z, o0.Z]
+        from_world = Transform(1.0)
+        from_world._m[0:4] = [x1.X, x1.Y, x1.Z, -(x1.X*o1.X + x1.Y*o1.Y + x1.Z*o1.Z)]
+        from_world._m[4:8] = [y1.X, y1.Y, y1.Z, -(y1.X*o1.X + y1.Y*o1.Y + y1.Z*o1.Z)]
+        from_world._m[8:12] = [z1.X, z1.Y, z1.Z, -(z1.X*o1.X + z1.Y*o1.Y + z1.Z*o1.Z)]
+        return from_world * to_world
+
+    @staticmethod
+    def PlaneToPlane(plane0, plane1):
+        """Maps plane0 onto plane1"""
+        return Transform.ChangeBasis(plane1, Plane.WorldXY) * Transform.ChangeBasis(Plane.WorldXY, plane0)
+
+    @staticmethod
+    def PlanarProjection(plane):
+        n = plane.ZAxis
+        rc = Transform(1.0)
+        d = n.X*plane.Origin.X + n.Y*plane.Origin.Y + n.Z*plane.Origin.Z
+        rc._m[0:4] = [1-n.X*n.X, -n.X*n.Y, -n.X*n.Z, d*n.X]
+        rc._m[4:8] = [-n.Y*n.X, 1-n.Y*n.Y, -n.Y*n.Z, d*n.Y]
+        rc._m[8:12] = [-n.Z*n.X, -n.Z*n.Y, 1-n.Z*n.Z, d*n.Z]
+        return rc
+
+
+for _row in range(4):
+    for _column in range(4):
+        setattr(Transform, "M%d%d" % (_row, _column), property(
+            lambda self, i=_row*4+_column: self._m[i],
+            lambda self, value, i=_row*4+_column: self._m.__setitem__(i, float(value))))
+
+
+class Line(object):
+    __slots__ = ("From", "To")
+
+    def __init__(self, *args):
+        if len(args)==6:
+            self.From = Point3d(args[0], args[1], args[2])
+            self.To = Point3d(args[3], args[4], args[5])
+        elif len(args)==2 and type(args[1]) is Vector3d:
+            self.From = Point3d(args[0])
+            self.To = args[0] + args[1]
+        elif len(args)==2:
+            self.From = Point3d(args[0])
+            self.To = Point3d(args[1])
+        else:
+            self.From = Point3d()
+            self.To = Point3d()
+
+    def __eq__(self, other):
+        if type(other) is not Line: return NotImplemented
+        return self.From==other.From and self.To==other.To
+
+    def __hash__(self):
+        return hash((self.From, self.To))
+
+    Length = property(lambda self: self.From.DistanceTo(self.To))
+    Direction = property(lambda self: self.To-self.From)
+    IsValid = property(lambda self: self.From!=self.To and self.From.IsValid and self.To.IsValid)
+    BoundingBox = property(lambda self: BoundingBox([self.From, self.To]))
+
+    @property
+    def UnitTangent(self):
+        rc = self.Direction
+        rc.Unitize()
+        return rc
+
+    def PointAt(self, t):
+        s = 1.0-t
+        return Point3d(s*self.From.X + t*self.To.X, s*self.From.Y + t*self.To.Y, s*self.From.Z + t*self.To.Z)
+
+    def ClosestParameter(self, point):
+        d = self.Direction
+        dd = d*d
+        if dd==0.0: return 0.0
+        return ((point-self.From)*d)/dd
+
+    def ClosestPoint(self, point, limitToFiniteSegment):
+        t = self.ClosestParameter(point)
+        if limitToFiniteSegment: t = min(max(t, 0.0), 1.0)
+        return self.PointAt(t)
+
+    def DistanceTo(self, point, limitToFiniteSegment):
+        return point.DistanceTo(self.ClosestPoint(point, limitToFiniteSegment))
+
+    def Flip(self):
+        self.From, self.To = self.To, self.From
+
+    def Transform(self, xform):
+        self.From.Transform(xform)
+        self.To.Transform(xform)
+        return True
+
+
+class GeometryBase(object):
+    ObjectType = property(lambda self: self._object_type())
+
+    def _object_type(self):
+        import Rhino.DocObjects
+        return Rhino.DocObjects.ObjectType.NONE
+
+    def Duplicate(self):
+        raise NotImplementedError
+
+    def DuplicateShallow(self):
+        return self.Duplicate()
+
+    def Transform(self, xform):
+        raise NotImplementedError
+
+    def Translate(self, x, y=None, z=None):
+        return self.Transform(Transform.Translation(x, y, z))
+
+    def _points(self):
+        raise NotImplementedError
+
+    def GetBoundingBox(self, arg=True):
+        points = [Point3d(point) for point in self._points()]
+        if isinstance(arg, Transform):
+            for point in points: point.Transform(arg)
+        elif isinstance(arg, Plane):
+            xform = Transform.ChangeBasis(Plane.WorldXY, arg)
+            for point in points: point.Transform(xform)
+        return BoundingBox(points)
+
+    @property
+    def IsValid(self):
+        return True
+
+
+class Point(GeometryBase):
+    def __init__(self, location):
+        self.Location = Point3d(location)
+
+    def _object_type(self):
+        import Rhino.DocObjects
+        return Rhino.DocObjects.ObjectType.Point
+
+    def _points(self):
+        return [self.Location]
+
+    def Duplicate(self):
+        return Point(self.Location)
+
+    def Transform(self, xform):
+        self.Location.Transform(xform)
+        return True
+
+
+class Curve(GeometryBase):
+    """Abstract base of the curve types. Subclasses implement PointAt over
+    their Domain"""
+
+    def _object_type(self):
+        import Rhino.DocObjects
+        return Rhino.DocObjects.ObjectType.Curve
+
+    PointAtStart = property(lambda self: self.PointAt(self.Domain.T0))
+    PointAtEnd = property(lambda self: self.PointAt(self.Domain.T1))
+    IsClosed = property(lambda self: self.PointAtStart.DistanceTo(self.PointAtEnd)<=ZERO_TOLERANCE)
+
+    def IsLinear(self, tolerance=ZERO_TOLERANCE):
+        return False
+
+    def DuplicateCurve(self):
+        return self.Duplicate()
+
+    @staticmethod
+    def JoinCurves(inputCurves, joinTolerance=2.0*ZERO_TOLERANCE):
+        """Greedy joiner for line and polyline curves. Every step searches all
+        remaining curves, so it is quadratic like a naive join"""
+        remaining = []
+        for curve in inputCurves:
+            if not isinstance(curve, (LineCurve, PolylineCurve)):
+                raise NotImplementedError("the headless stand-in only joins line and polyline curves")
+            remaining.append([Point3d(point) for point in curve._points()])
+        rc = []
+        while remaining:
+            chain = remaining.pop(0)
+            joined = True
+            while joined and remaining:
+                joined = False
+                for i, points in enumerate(remaining):
+                    if chain[-1].DistanceTo(points[0])<=joinTolerance: chain.extend(points[1:])
+                    elif chain[-1].DistanceTo(points[-1])<=joinTolerance: chain.extend(points[-2::-1])
+                    elif chain[0].DistanceTo(points[-1])<=joinTolerance: chain[:0] = points[:-1]
+                    elif chain[0].DistanceTo(points[0])<=joinTolerance: chain[:0] = points[:0:-1]
+                    else: continue
+                    del remaining[i]
+                    joined = True
+                    break
+            rc.append(LineCurve(chain[0], chain[1]) if len(chain)==2 else PolylineCurve(chain))
+        return rc
+
+
+class LineCurve(Curve):
+    def __init__(self, *args):
+        if len(args)==1 and isinstance(args[0], LineCurve):
+            self.Line = Line(args[0].Line.From, args[0].Line.To)
+            self.Domain = Interval(args[0].Domain)
+            return
+        self.Line = args[0] if len(args)==1 else Line(*args)
+        self.Line = Line(self.Line.From, self.Line.To)
+        self.Domain = Interval(0.0, self.Line.Length)
+
+    def _points(self):
+        return [self.Line.From, self.Line.To]
+
+    def Duplicate(self):
+        return LineCurve(self)
+
+    def Transform(self, xform):
+        self.Line.Transform(xform)
+        return True
+
+    def IsLinear(self, tolerance=ZERO_TOLERANCE):
+        return True
+
+    def PointAt(self, t):
+        return self.Line.PointAt(self.Domain.NormalizedParameterAt(t))
+
+    def TangentAt(self, t):
+        return self.Line.UnitTangent
+
+    def DerivativeAt(self, t, derivativeCount):
+        span = self.Domain.Length
+        rc = [Vector3d(self.PointAt(t)), self.Line.Direction/span if span else Vector3d()]
+        return rc[:derivativeCount+1] + [Vector3d() for i in range(derivativeCount-1)]
+
+    def CurvatureAt(self, t):
+        return Vector3d()
+
+    def PerpendicularFrameAt(self, t):
+        return True, Plane(self.PointAt(t), self.Line.UnitTangent)
+
+    def GetLength(self, subdomain=None):
+        if subdomain is None: return self.Line.Length
+        span = self.Domain.Length
+        return self.Line.Length*abs(subdomain.T1-subdomain.T0)/span if span else 0.0
+
+    def DivideByCount(self, segmentCount, includeEnds):
+        if segmentCount<1: return None
+        t0, span = self.Domain.T0, self.Domain.Length
+        rc = [t0 + span*i/segmentCount for i in range(segmentCount+1)]
+        return rc if includeEnds else rc[1:-1]
+
+    def DivideByLength(self, segmentLength, includeEnds):
+        length = self.Line.Length
+        if segmentLength<=0.0 or segmentLength>length: return None
+        rc = [self.Domain.ParameterAt(segmentLength*i/length) for i in range(int(length/segmentLength)+1)]
+        return rc if includeEnds else rc[1:]
+
+    def DivideEquidistant(self, distance):
+        rc = self.DivideByLength(distance, True)
+        if rc is None: return None
+        return [self.PointAt(t) for t in rc]
+
+    def ClosestPoint(self, point, maximumDistance=0.0):
+        s = min(max(self.Line.ClosestParameter(point), 0.0), 1.0)
+        if maximumDistance>0.0 and self.Line.PointAt(s).DistanceTo(point)>maximumDistance:
+            return False, 0.0
+        return True, self.Domain.ParameterAt(s)
+
+
+
+class PolylineCurve(Curve):
+    def __init__(self, points):
+        self._vertices = [Point3d(point) for point in points]
+        self.Domain = Interval(0.0, len(self._vertices)-1.0)
+
+    PointCount = property(lambda self: len(self._vertices))
+
+    def _points(self):
+        return self._vertices
+
+    def Point(self, index):
+        return Point3d(self._vertices[index])
+
+    def Duplicate(self):
+        return PolylineCurve(self._vertices)
+
+    def Transform(self, xform):
+        for point in self._vertices: point.Transform(xform)
+        return True
+
+    def PointAt(self, t):
+        s = min(max(t-self.Domain.T0, 0.0), len(self._vertices)-1.0)
+        i = min(int(s), len(self._vertices)-2)
+        return Line(self._vertices[i], self._vertices[i+1]).PointAt(s-i)
+
+    def GetLength(self, subdomain=None):
+        if subdomain is not None: raise NotImplementedError
+        return sum(a.DistanceTo(b) for a, b in zip(self._vertices, self._vertices[1:]))
+
+class IntersectionEvent(object):
+    def __init__(self, pointA, pointB, overlapA, overlapB, pointA2=None, pointB2=None):
+        self.IsOverlap = overlapA.T0!=overlapA.T1
+        self.IsPoint = not self.IsOverlap
+        self.PointA = pointA
+        self.PointB = pointB
+        self.PointA2 = pointA if pointA2 is None else pointA2
+        self.PointB2 = pointB if pointB2 is None else pointB2
+        self.OverlapA = overlapA
+        self.OverlapB = overlapB
+        self.ParameterA = overlapA.T0
+        self.ParameterB = overlapB.T0
+
+
+class CurveIntersections(object):
+    def __init__(self, events):
+        self._events = events
+
+    Count = property(lambda self: len(self._events))
+
+    def __getitem__(self, index):
+        return self._events[index]
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def __len__(self):
+        return len(self._events)
+
+
+def _segmentevent(a, b, tolerance):
+    """Intersection of two LineCurves, as IntersectionEvent or None"""
+    p, d1 = a.Line.From, a.Line.Direction
+    q, d2 = b.Line.From, b.Line.Direction
+    aa, bb, ab = d1*d1, d2*d2, d1*d2
+    r = p-q
+    ar, br = d1*r, d2*r
+    denominator = aa*bb - ab*ab
+    if denominator<=ZERO_TOLERANCE*aa*bb:
+        # parallel, overlap along a of the part of b within tolerance
+        if b.Line.DistanceTo(p, False)>tolerance or not aa: return None
+        s0, s1 = sorted((a.Line.ClosestParameter(b.Line.From), a.Line.ClosestParameter(b.Line.To)))
+        s0, s1 = max(s0, 0.0), min(s1, 1.0)
+        if s1-s0<-tolerance/math.sqrt(aa): return None
+        s1 = max(s0, s1)
+        t0, t1 = b.Line.ClosestParameter(a.Line.PointAt(s0)), b.Line.ClosestParameter(a.Line.PointAt(s1))
+        return IntersectionEvent(a.Line.PointAt(s0), b.Line.PointAt(t0),
+            Interval(a.Domain.ParameterAt(s0), a.Domain.ParameterAt(s1)),
+            Interval(b.Domain.ParameterAt(t0), b.Domain.ParameterAt(t1)),
+            a.Line.PointAt(s1), b.Line.PointAt(t1))
+    s = min(max((ab*br - bb*ar)/denominator, 0.0), 1.0)
+    t = min(max((ab*s + br)/bb, 0.0), 1.0)
+    s = min(max((ab*t - ar)/aa, 0.0), 1.0)
+    pointA, pointB = a.Line.PointAt(s), b.Line.PointAt(t)
+    if pointA.DistanceTo(pointB)>tolerance: return None
+    s, t = a.Domain.ParameterAt(s), b.Domain.ParameterAt(t)
+    return IntersectionEvent(pointA, pointB, Interval(s, s), Interval(t, t))
+
+
+class Intersect(object):
+    """Stands in for the Rhino.Geometry.Intersect namespace. Only line curves
+    are intersected"""
+
+    class Intersection(object):
+        @staticmethod
+        def CurveCurve(curveA, curveB, tolerance, overlapTolerance):
+            if type(curveA) is not LineCurve or type(curveB) is not LineCurve:
+                raise NotImplementedError("the headless stand-in only intersects line curves")
+            event = _segmentevent(curveA, curveB, tolerance)
+            return CurveIntersections([event] if event else [])
+
+        @staticmethod
+        def CurveSelf(curve, tolerance):
+            if type(curve) is not LineCurve:
+                raise NotImplementedError("the headless stand-in only intersects line curves")
+            return CurveIntersections([])
@@ -0,0 +1,14 @@
+"""Rhino.Runtime stand-ins"""
+import sys
+
+from _standin import module_getattr, Placeholder
+
+__getattr__ = module_getattr(__name__)
+
+
+class HostUtils(Placeholder):
+    """Host queries. Members that are not listed here are placeholders"""
+    # tests that need geometry the stand-in does not implement skip on this
+    RunningInRhino = False
+    RunningOnWindows = sys.platform=="win32"
+    RunningOnOSX = sys.platform=="darwin"
@@ -0,0 +1,51 @@
+"""Headless stand-in for the RhinoCommon "Rhino" namespace"""
+import math
+
+import _standin
+
+_standin.install()
+__getattr__ = _standin.module_getattr(__name__)
+
+
+class RhinoMath(object):
+    ZeroTolerance = 2.3283064365386963e-10
+    SqrtEpsilon = 1.490116119385e-8
+    UnsetValue = -1.23432101234321e+308
+    UnsetSingle = -1.234321e+38
+    UnsetIntIndex = -2147483647
+    DefaultAngleTolerance = math.pi/180.0
+
+    @staticmethod
+    def ToRadians(degrees):
+        return degrees*math.pi/180.0
+
+    @staticmethod
+    def ToDegrees(radians):
+        return radians*180.0/math.pi
+
+    @staticmethod
+    def Clamp(value, bound1, bound2):
+        lo, hi = min(bound1, bound2), max(bound1, bound2)
+        return min(max(value, lo), hi)
+
+    @staticmethod
+    def IsValidDouble(x):
+        return x!=RhinoMath.UnsetValue and math.isfinite(x)
+
+    @staticmethod
+    def EpsilonEquals(x, y, epsilon):
+        return abs(x-y)<=epsilon
+
+
+class RhinoApp(object):
+    @staticmethod
+    def Wait():
+        pass
+
+    @staticmethod
+    def WriteLine(message="", *args):
+        print(message.format(*args) if args else message)
+
+
+from Rhino import Geometry, DocObjects, Collections
+from Rhino._document import RhinoDoc
@@ -0,0 +1,436 @@
+"""In-memory RhinoDoc with the object, layer, string and view tables"""
+import System
+import System.Drawing
+from _standin import Event
+from Rhino import Geometry, DocObjects
+
+
+class RhinoObjectEventArgs(object):
+    def __init__(self, rhobj):
+        self.TheObject = rhobj
+        self.ObjectId = rhobj.Id
+
+
+class RhinoReplaceObjectEventArgs(object):
+    def __init__(self, old_object, new_object):
+        self.ObjectId = old_object.Id
+        self.OldRhinoObject = old_object
+        self.NewRhinoObject = new_object
+
+
+class RhinoModifyObjectAttributesEventArgs(object):
+    def __init__(self, rhobj, old_attributes, new_attributes):
+        self.RhinoObject = rhobj
+        self.OldAttributes = old_attributes
+        self.NewAttributes = new_attributes
+
+
+class DocumentEventArgs(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self.DocumentSerialNumber = doc.RuntimeSerialNumber
+
+
+_OBJECT_CLASSES = {
+    Geometry.Point: DocObjects.PointObject,
+    Geometry.LineCurve: DocObjects.CurveObject,
+    }
+
+
+class ObjectTable(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self._objects = {}
+
+    def __iter__(self):
+        return (rhobj for rhobj in list(self._objects.values()) if not rhobj.IsDeleted)
+
+    Count = property(lambda self: sum(1 for rhobj in self))
+
+    def __fire(self, event, args):
+        event.fire(self.Document, args)
+
+    def __coerceid(self, item):
+        if isinstance(item, DocObjects.RhinoObject): return item.Id
+        if isinstance(item, DocObjects.ObjRef): return item.ObjectId
+        return item
+
+    def Add(self, geometry, attributes=None):
+        if attributes is None:
+            attributes = DocObjects.ObjectAttributes()
+            attributes.LayerIndex = self.Document.Layers.CurrentLayerIndex
+        else:
+            attributes = attributes.Duplicate()
+        if attributes.ObjectId==System.Guid.Empty or attributes.ObjectId in self._objects:
+            attributes.ObjectId = System.Guid.NewGuid()
+        cls = _OBJECT_CLASSES.get(type(geometry), DocObjects.RhinoObject)
+        rhobj = cls(self.Document, geometry, attributes)
+        self._objects[rhobj.Id] = rhobj
+        self.__fire(self.Document.AddRhinoObject, RhinoObjectEventArgs(rhobj))
+        return rhobj.Id
+
+    def AddPoint(self, x, y=None, z=None, attributes=None):
+        point = Geometry.Point3d(x) if y is None or isinstance(y, DocObjects.ObjectAttributes) else Geometry.Point3d(x, y, z)
+        if isinstance(y, DocObjects.ObjectAttributes): attributes = y
+        return self.Add(Geometry.Point(point), attributes)
+
+    def AddPoints(self, points, attributes=None):
+        return System.Array[System.Guid]([self.AddPoint(point, attributes) for point in points])
+
+    def AddLine(self, start, end=None, attributes=None):
+        line = start if end is None or isinstance(end, DocObjects.ObjectAttributes) else Geometry.Line(start, end)
+        if isinstance(end, DocObjects.ObjectAttributes): attributes = end
+        return self.Add(Geometry.LineCurve(line), attributes)
+
+    def AddCurve(self, curve, attributes=None):
+        return self.Add(curve.Duplicate(), attributes)
+
+    def Find(self, id):
+        rhobj = self._objects.get(id)
+        if rhobj is None or rhobj.IsDeleted: return None
+        return rhobj
+
+    FindId = Find
+
+    def TryFindPoint(self, id):
+        rhobj = self.Find(id)
+        if rhobj is None or not isinstance(rhobj.Geometry, Geometry.Point): return False, Geometry.Point3d.Unset
+        return True, Geometry.Point3d(rhobj.Geometry.Location)
+
+    def FindByLayer(self, layer):
+        index = layer if isinstance(layer, int) else layer.Index
+        if not isinstance(layer, int) and index<0: return None
+        return System.Array[DocObjects.RhinoObject]([rhobj for rhobj in self if rhobj.Attributes.LayerIndex==index])
+
+    def Delete(self, item, quiet=True):
+        if not isinstance(item, (System.Guid, DocObjects.RhinoObject, DocObjects.ObjRef)):
+            return sum(1 for id in list(item) if self.Delete(id, quiet))
+        rhobj = self.Find(self.__coerceid(item))
+        if rhobj is None or rhobj.IsLocked: return False
+        rhobj.IsDeleted = True
+        self.__fire(self.Document.DeleteRhinoObject, RhinoObjectEventArgs(rhobj))
+        return True
+
+    def Undelete(self, item):
+        rhobj = self._objects.get(self.__coerceid(item))
+        if rhobj is None or not rhobj.IsDeleted: return False
+        rhobj.IsDeleted = False
+        self.__fire(self.Document.UndeleteRhinoObject, RhinoObjectEventArgs(rhobj))
+        return True
+
+    def Replace(self, item, geometry):
+        old = self.Find(self.__coerceid(item))
+        if old is None: return False
+        if isinstance(geometry, Geometry.Point3d): geometry = Geometry.Point(geometry)
+        elif isinstance(geometry, Geometry.Line): geometry = Geometry.LineCurve(geometry)
+        else: geometry = geometry.Duplicate()
+        cls = _OBJECT_CLASSES.get(type(geometry), DocObjects.RhinoObject)
+        new = cls(self.Document, geometry, old.Attributes)
+        self._objects[new.Id] = new
+        self.__fire(self.Document.ReplaceRhinoObject, RhinoReplaceObjectEventArgs(old, new))
+        return True
+
+    def Transform(self, item, xform, deleteOriginal):
+        rhobj = self.Find(self.__coerceid(item))
+        if rhobj is None: return System.Guid.Empty
+        geometry = rhobj.Geometry.Duplicate()
+        if not geometry.Transform(xform): return System.Guid.Empty
+        if deleteOriginal:
+            self.Replace(rhobj.Id, geometry)
+            return rhobj.Id
+        return self.Add(geometry, rhobj.Attributes)
+
+    def ModifyAttributes(self, item, attributes, quiet):
+        rhobj = self.Find(self.__coerceid(item))
+        if rhobj is None: return False
+        old = rhobj.Attributes
+        rhobj.Attributes = attributes.Duplicate()
+        rhobj.Attributes.ObjectId = rhobj.Id
+        self.__fire(self.Document.ModifyObjectAttributes, RhinoModifyObjectAttributesEventArgs(rhobj, old, rhobj.Attributes))
+        return True
+
+    def __setmode(self, item, mode):
+        rhobj = self.Find(self.__coerceid(item))
+        if rhobj is None: return False
+        attributes = rhobj.Attributes.Duplicate()
+        attributes.Mode = mode
+        if mode!=DocObjects.ObjectMode.Normal: rhobj.Select(False)
+        return self.ModifyAttributes(rhobj, attributes, True)
+
+    def Hide(self, item, ignoreLayerMode):
+        return self.__setmode(item, DocObjects.ObjectMode.Hidden)
+
+    def Lock(self, item, ignoreLayerMode):
+        return self.__setmode(item, DocObjects.ObjectMode.Locked)
+
+    def Show(self, item, ignoreLayerMode):
+        return self.__setmode(item, DocObjects.ObjectMode.Normal)
+
+    Unlock = Show
+
+    def Select(self, item, select=True, syncHighlight=True, persistentSelect=True):
+        if not isinstance(item, (System.Guid, DocObjects.RhinoObject, DocObjects.ObjRef)):
+            return sum(1 for id in list(item) if self.Select(id, select))
+        rhobj = self.Find(self.__coerceid(item))
+        return rhobj is not None and rhobj.Select(select)==1
+
+    def UnselectAll(self, ignorePersistentSelections=False):
+        count = 0
+        for rhobj in self:
+            if rhobj.IsSelected(False):
+                rhobj.Select(False)
+                count += 1
+        return count
+
+    def GetSelectedObjects(self, includeLights, includeGrips):
+        return (rhobj for rhobj in self if rhobj.IsSelected(False))
+
+    def GetObjectList(self, settings):
+        if isinstance(settings, type): settings = DocObjects.ObjectType.AnyObject
+        if not isinstance(settings, DocObjects.ObjectEnumeratorSettings):
+            object_type = settings
+            settings = DocObjects.ObjectEnumeratorSettings()
+            settings.ObjectTypeFilter = object_type
+        return (rhobj for rhobj in list(self._objects.values()) if self.__matches(rhobj, settings))
+
+    def __matches(self, rhobj, settings):
+        if rhobj.IsDeleted and not settings.DeletedObjects: return False
+        mode = rhobj.Attributes.Mode
+        if mode==DocObjects.ObjectMode.Normal and not settings.NormalObjects: return False
+        if mode==DocObjects.ObjectMode.Locked and not settings.LockedObjects: return False
+        if mode==DocObjects.ObjectMode.Hidden and not settings.HiddenObjects: return False
+        if not rhobj.ObjectType & settings.ObjectTypeFilter: return False
+        if rhobj.ObjectType==DocObjects.ObjectType.Light and not settings.IncludeLights: return False
+        if settings.NameFilter is not None and rhobj.Attributes.Name!=settings.NameFilter: return False
+        if settings.LayerIndexFilter>=0 and rhobj.Attributes.LayerIndex!=settings.LayerIndexFilter: return False
+        if settings.SelectedObjectsFilter and not rhobj.IsSelected(False): return False
+        return True
+
+
+class LayerTable(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self._layers = []
+        self.CurrentLayerIndex = 0
+        default = DocObjects.Layer()
+        default.Name = "Default"
+        self.Add(default)
+
+    def __iter__(self):
+        return iter(list(self._layers))
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    Count = property(lambda self: len(self._layers))
+    ActiveCount = property(lambda self: sum(1 for layer in self._layers if not layer.IsDeleted))
+    CurrentLayer = property(lambda self: self._layers[self.CurrentLayerIndex])
+
+    def Add(self, layer, color=None):
+        if not isinstance(layer, DocObjects.Layer):
+            name = layer
+            layer = DocObjects.Layer()
+            layer.Name = name
+            if color is not None: layer.Color = color
+        if not layer.Name:
+            layer.Name = "Layer %02d" % len(self._layers)
+        for existing in self._layers:
+            if not existing.IsDeleted and existing.ParentLayerId==layer.ParentLayerId and existing.Name.lower()==layer.Name.lower():
+                return -1
+        added = DocObjects.Layer()
+        added.__dict__.update(layer.__dict__)
+        added.Id = System.Guid.NewGuid()
+        added.Index = len(self._layers)
+        added._table = self
+        self._layers.append(added)
+        return added.Index
+
+    def FindId(self, id):
+        for layer in self._layers:
+            if layer.Id==id and not layer.IsDeleted: return layer
+
+    def FindIndex(self, index):
+        if 0<=index<len(self._layers) and not self._layers[index].IsDeleted: return self._layers[index]
+
+    def FindName(self, name, startIndex=None):
+        name = name.lower()
+        for layer in self._layers:
+            if not layer.IsDeleted and layer.Name.lower()==name: return layer
+
+    def FindByFullPath(self, path, notFoundReturnValue):
+        path = path.lower()
+        for layer in self._layers:
+            if not layer.IsDeleted and layer.FullPath.lower()==path: return layer.Index
+        return notFoundReturnValue
+
+    def SetCurrentLayerIndex(self, index, quiet):
+        if self.FindIndex(index) is None: return False
+        self.CurrentLayerIndex = index
+        return True
+
+    def Delete(self, index, quiet):
+        layer = self.FindIndex(index)
+        if layer is None or index==self.CurrentLayerIndex: return False
+        if any(True for rhobj in self.Document.Objects if rhobj.Attributes.LayerIndex==index): return False
+        layer.IsDeleted = True
+        return True
+
+    Purge = Delete
+
+
+_KEY_ONLY = object()
+
+
+class StringTable(object):
+    """Document strings. Section/entry pairs are stored as "section\\entry"
+    keys next to the plain document user text keys, like Rhino does"""
+
+    def __init__(self, doc):
+        self._values = {}
+
+    @staticmethod
+    def __key(section, entry):
+        return section if entry is None else section + "\\" + entry
+
+    Count = property(lambda self: len(self._values))
+    DocumentDataCount = property(lambda self: sum(1 for key in self._values if "\\" in key))
+    DocumentUserTextCount = property(lambda self: sum(1 for key in self._values if "\\" not in key))
+
+    def GetKey(self, i):
+        return list(self._values)[i]
+
+    def GetValue(self, section, entry=None):
+        if isinstance(section, int): return list(self._values.values())[section]
+        return self._values.get(self.__key(section, entry))
+
+    def SetString(self, section, entry, value=_KEY_ONLY):
+        if value is _KEY_ONLY:
+            # SetString(key, value) for document user text
+            if "\\" in section: raise ValueError("key must not contain a backslash")
+            section, entry, value = section, None, entry
+        key = self.__key(section, entry)
+        rc = self._values.get(key)
+        self._values[key] = value
+        return rc
+
+    def Delete(self, section, entry=_KEY_ONLY):
+        if entry is _KEY_ONLY:
+            keys = [section]
+        elif entry is not None:
+            keys = [self.__key(section, entry)]
+        elif section is None:
+            keys = [key for key in self._values if "\\" in key]
+        else:
+            keys = [key for key in self._values if key.startswith(section + "\\")]
+        for key in keys: self._values.pop(key, None)
+
+    def GetSectionNames(self):
+        rc = []
+        for key in self._values:
+            if "\\" in key:
+                section = key.split("\\")[0]
+                if section not in rc: rc.append(section)
+        return System.Array[str](rc)
+
+    def GetEntryNames(self, section):
+        prefix = section + "\\"
+        return System.Array[str]([key[len(prefix):] for key in self._values if key.startswith(prefix)])
+
+
+class _Viewport(object):
+    def __init__(self, name):
+        self.Name = name
+
+    def ConstructionPlane(self):
+        return Geometry.Plane.WorldXY
+
+
+class _View(object):
+    def __init__(self, name):
+        self.ActiveViewport = _Viewport(name)
+        self.MainViewport = self.ActiveViewport
+        self.ActiveViewportID = System.Guid.NewGuid()
+
+    def Redraw(self):
+        pass
+
+
+class ViewTable(object):
+    def __init__(self, doc):
+        self.RedrawEnabled = True
+        self.RedrawCount = 0
+        self._views = [_View(name) for name in ("Top", "Front", "Right", "Perspective")]
+        self.ActiveView = self._views[-1]
+
+    def Redraw(self):
+        if self.RedrawEnabled: self.RedrawCount += 1
+
+    def GetStandardRhinoViews(self):
+        return System.Array[_View](self._views)
+
+    def GetViewList(self, includeStandardViews, includePageViews):
+        return System.Array[_View](self._views if includeStandardViews else [])
+
+    def Find(self, name_or_id, compareCaptionOnly=False):
+        for view in self._views:
+            if view.ActiveViewport.Name==name_or_id or view.ActiveViewportID==name_or_id: return view
+
+
+class RhinoDoc(object):
+    AddRhinoObject = Event()
+    DeleteRhinoObject = Event()
+    UndeleteRhinoObject = Event()
+    ReplaceRhinoObject = Event()
+    ModifyObjectAttributes = Event()
+    SelectObjects = Event()
+    DeselectObjects = Event()
+    CloseDocument = Event()
+    BeginOpenDocument = Event()
+    EndOpenDocument = Event()
+    NewDocument = Event()
+
+    ActiveDoc = None
+    __serial = 0
+
+    def __init__(self):
+        RhinoDoc.__serial += 1
+        self.RuntimeSerialNumber = RhinoDoc.__serial
+        self.Name = None
+        self.Path = None
+        self.Modified = False
+        self.Notes = ""
+        self.ModelAbsoluteTolerance = 0.001
+        self.ModelRelativeTolerance = 0.01
+        self.ModelAngleToleranceRadians = 0.017453292519943295
+        self.UndoRecordingEnabled = True
+        self.Objects = ObjectTable(self)
+        self.Layers = LayerTable(self)
+        self.Strings = StringTable(self)
+        self.Views = ViewTable(self)
+        self._undo_records = 0
+        self._undo_serial = 0
+
+    @staticmethod
+    def CreateHeadless(modelTemplateFileName):
+        doc = RhinoDoc()
+        if RhinoDoc.ActiveDoc is None: RhinoDoc.ActiveDoc = doc
+        RhinoDoc.NewDocument.fire(doc, DocumentEventArgs(doc))
+        return doc
+
+    @property
+    def ModelAngleToleranceDegrees(self):
+        return self.ModelAngleToleranceRadians*180.0/3.141592653589793
+
+    def BeginUndoRecord(self, description):
+        self._undo_serial += 1
+        self._undo_records += 1
+        return self._undo_serial
+
+    def EndUndoRecord(self, undoRecordSerialNumber):
+        if self._undo_records==0: return False
+        self._undo_records -= 1
+        return True
+
+    def Dispose(self):
+        RhinoDoc.CloseDocument.fire(self, DocumentEventArgs(self))
+        if RhinoDoc.ActiveDoc is self: RhinoDoc.ActiveDoc = None
@@ -0,0 +1,21 @@
+"""The script host rhinocompat hands out as GET_HOST()"""
+import _standin
+
+__getattr__ = _standin.module_getattr(__name__)
+
+
+class McNeelPythonHost(object):
+    @staticmethod
+    def Coerce3dPointFromEnumerables(point):
+        import Rhino.Geometry
+        try:
+            values = [float(v) for v in point]
+        except (TypeError, ValueError):
+            return None
+        if len(values)==3: return Rhino.Geometry.Point3d(*values)
+        if len(values)==2: return Rhino.Geometry.Point3d(values[0], values[1], 0.0)
+        return None
+
+    @staticmethod
+    def EscapePressed(reset):
+        return False
@@ -0,0 +1,66 @@
+"""Generic collections. List[T] and IEnumerable[T] are only as typed as
+rhinoscript needs them to be"""
+import _standin
+import System
+
+__getattr__ = _standin.module_getattr(__name__)
+
+
+class _GenericType(type):
+    def __getitem__(cls, element_type):
+        typed = cls.__dict__.get("_typed")
+        if typed is None:
+            typed = cls._typed = {}
+        rc = typed.get(element_type)
+        if rc is None:
+            rc = _GenericType("%s[%s]" % (cls.__name__, getattr(element_type, "__name__", element_type)),
+                              (cls,), {"ElementType": element_type})
+            typed[element_type] = rc
+        return rc
+
+
+class List(metaclass=_GenericType):
+    ElementType = object
+
+    def __init__(self, items=()):
+        self._items = list(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+
+    Count = property(lambda self: len(self._items))
+
+    def Add(self, item):
+        self._items.append(item)
+
+    def AddRange(self, items):
+        self._items.extend(items)
+
+    def Clear(self):
+        del self._items[:]
+
+    def ToArray(self):
+        return System.Array[self.ElementType](self._items)
+
+
+class _EnumerableType(_GenericType):
+    def __instancecheck__(cls, instance):
+        element_type = cls.__dict__.get("ElementType")
+        if element_type is None: return hasattr(instance, "__iter__") and not isinstance(instance, (list, tuple))
+        if isinstance(instance, (System.Array, List)): return issubclass(instance.ElementType, element_type)
+        import Rhino.Collections
+        import Rhino.Geometry
+        return element_type is Rhino.Geometry.Point3d and isinstance(instance, Rhino.Collections.Point3dList)
+
+
+class IEnumerable(metaclass=_EnumerableType):
+    pass
@@ -0,0 +1,52 @@
+"""System.Drawing.Color"""
+import _standin
+
+__getattr__ = _standin.module_getattr(__name__)
+
+
+class Color(object):
+    __slots__ = ("A", "R", "G", "B", "IsEmpty")
+
+    def __init__(self, a=0, r=0, g=0, b=0, empty=True):
+        self.A, self.R, self.G, self.B = a, r, g, b
+        self.IsEmpty = empty
+
+    @staticmethod
+    def FromArgb(*args):
+        if len(args)==1:
+            argb = args[0] & 0xFFFFFFFF
+            return Color((argb >> 24) & 0xFF, (argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF, False)
+        if len(args)==2:
+            alpha, color = args
+            return Color(alpha, color.R, color.G, color.B, False)
+        if len(args)==3: args = (255,) + tuple(args)
+        for value in args:
+            if not 0<=value<=255: raise ValueError("Value of '%s' is not valid for a color component" % value)
+        return Color(int(args[0]), int(args[1]), int(args[2]), int(args[3]), False)
+
+    def ToArgb(self):
+        argb = (self.A << 24) | (self.R << 16) | (self.G << 8) | self.B
+        return argb - (1 << 32) if argb & 0x80000000 else argb
+
+    def __eq__(self, other):
+        if type(other) is not Color: return NotImplemented
+        return self.IsEmpty==other.IsEmpty and self.ToArgb()==other.ToArgb()
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash((self.IsEmpty, self.ToArgb()))
+
+    def __repr__(self):
+        if self.IsEmpty: return "Color [Empty]"
+        return "Color [A=%d, R=%d, G=%d, B=%d]" % (self.A, self.R, self.G, self.B)
+
+
+Color.Empty = Color()
+Color.Black = Color.FromArgb(0, 0, 0)
+Color.White = Color.FromArgb(255, 255, 255)
+Color.Red = Color.FromArgb(255, 0, 0)
+Color.Green = Color.FromArgb(0, 128, 0)
+Color.Blue = Color.FromArgb(0, 0, 255)
@@ -0,0 +1,71 @@
+"""Marshal and GCHandle. Raw addresses are read and written with ctypes,
+pinned arrays are copied to and from native memory element by element"""
+import ctypes
+import enum
+
+import _standin
+import System
+from Rhino.Geometry import Point3d
+
+__getattr__ = _standin.module_getattr(__name__)
+
+
+class GCHandleType(enum.IntEnum):
+    Weak = 0
+    WeakTrackResurrection = 1
+    Normal = 2
+    Pinned = 3
+
+
+class GCHandle(object):
+    """Pinned handles back their array with native memory, so Marshal.Copy
+    and ctypes can write to the address. Free copies the memory back into
+    the array"""
+
+    def __init__(self, target, pinned=False):
+        self.Target = target
+        self.IsAllocated = True
+        self._memory = None
+        if pinned:
+            values = _array_doubles(target)
+            self._memory = (ctypes.c_double*max(len(values), 1))(*values)
+
+    @staticmethod
+    def Alloc(target, handle_type=GCHandleType.Normal):
+        return GCHandle(target, handle_type==GCHandleType.Pinned)
+
+    def AddrOfPinnedObject(self):
+        if self._memory is None: raise RuntimeError("the handle is not pinned")
+        return System.IntPtr(ctypes.addressof(self._memory))
+
+    def Free(self):
+        if self._memory is not None:
+            _set_array_doubles(self.Target, self._memory)
+            self._memory = None
+        self.Target = None
+        self.IsAllocated = False
+
+
+def _array_doubles(array):
+    if array.ElementType is Point3d:
+        return [c for point in array for c in (point.X, point.Y, point.Z)]
+    return [float(value) for value in array]
+
+
+def _set_array_doubles(array, values):
+    if array.ElementType is Point3d:
+        for i in range(array.Length): array[i] = Point3d(values[i*3], values[i*3+1], values[i*3+2])
+        return
+    for i in range(array.Length): array[i] = values[i]
+
+
+class Marshal(object):
+    @staticmethod
+    def Copy(source, a, b, count):
+        if isinstance(source, System.IntPtr):
+            # Copy(IntPtr source, double[] destination, int startIndex, int length)
+            values = (ctypes.c_double*count).from_address(source.ToInt64())
+            for i, value in enumerate(values): a[b+i] = value
+        else:
+            # Copy(double[] source, int startIndex, IntPtr destination, int length)
+            (ctypes.c_double*count).from_address(b.ToInt64())[:] = [source[a+i] for i in range(count)]
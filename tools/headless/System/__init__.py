@@ -0,0 +1,189 @@
+"""Headless stand-in for the .NET "System" namespace"""
+import copy
+import struct
+import uuid
+
+import _standin
+
+_standin.install()
+__getattr__ = _standin.module_getattr(__name__)
+
+Double = float
+Int32 = int
+Int64 = int
+Boolean = bool
+String = str
+Object = object
+
+
+class Single(float):
+    pass
+
+
+class Byte(int):
+    pass
+
+
+class Guid(object):
+    __slots__ = ("_uuid",)
+
+    def __init__(self, value=None):
+        if value is None: self._uuid = uuid.UUID(int=0)
+        elif isinstance(value, uuid.UUID): self._uuid = value
+        elif isinstance(value, Guid): self._uuid = value._uuid
+        else: self._uuid = uuid.UUID(str(value).strip())
+
+    Empty = _standin.static(lambda: Guid())
+
+    @staticmethod
+    def NewGuid():
+        return Guid(uuid.uuid4())
+
+    @staticmethod
+    def Parse(text):
+        return Guid(text)
+
+    @staticmethod
+    def TryParse(text):
+        try:
+            return True, Guid(text)
+        except (ValueError, TypeError):
+            return False, Guid()
+
+    def __eq__(self, other):
+        if type(other) is not Guid: return NotImplemented
+        return self._uuid==other._uuid
+
+    def __ne__(self, other):
+        rc = self.__eq__(other)
+        return rc if rc is NotImplemented else not rc
+
+    def __hash__(self):
+        return hash(self._uuid)
+
+    def __lt__(self, other):
+        return self._uuid<other._uuid
+
+    def __str__(self):
+        return str(self._uuid)
+
+    def __repr__(self):
+        return "<System.Guid object at 0x0 [%s]>" % self._uuid
+
+    def ToString(self, format=None):
+        return str(self._uuid)
+
+    def CompareTo(self, other):
+        return (self._uuid>other._uuid) - (self._uuid<other._uuid)
+
+
+# struct format used when arrays are copied byte by byte
+_FORMATS = {float: "d", Single: "f", Byte: "B", int: "i", bool: "?"}
+_CONVERTERS = {float: float, Single: float, Byte: int, int: int, bool: bool, str: str}
+
+
+def _default(element_type):
+    if element_type in _CONVERTERS: return _CONVERTERS[element_type]()
+    try:
+        return element_type()
+    except Exception:
+        return None
+
+
+class _ArrayType(type):
+    """Metaclass that makes Array[T] return the array class for element type T"""
+    __typed = {}
+
+    def __getitem__(cls, element_type):
+        rc = _ArrayType.__typed.get(element_type)
+        if rc is None:
+            name = "Array[%s]" % getattr(element_type, "__name__", element_type)
+            rc = _ArrayType(name, (Array,), {"ElementType": element_type})
+            rc.__module__ = __name__
+            _ArrayType.__typed[element_type] = rc
+        return rc
+
+
+class Array(metaclass=_ArrayType):
+    """Fixed length, typed array. Not a python list, like .NET arrays under
+    IronPython and pythonnet"""
+    ElementType = object
+
+    def __init__(self, items=()):
+        convert = _CONVERTERS.get(self.ElementType)
+        self._items = [convert(item) for item in items] if convert else list(items)
+
+    @staticmethod
+    def CreateInstance(element_type, length):
+        rc = Array[element_type]()
+        if element_type in _CONVERTERS:
+            rc._items = [_default(element_type)]*length
+        else:
+            rc._items = [_default(element_type) for i in range(length)]
+        return rc
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rc = type(self)()
+            rc._items = self._items[index]
+            return rc
+        return self._items[index]
+
+    def __setitem__(self, index, value):
+        convert = _CONVERTERS.get(self.ElementType)
+        self._items[index] = convert(value) if convert else value
+
+    def __repr__(self):
+        return "%s((%s))" % (type(self).__name__, ", ".join(repr(item) for item in self._items))
+
+    Length = property(lambda self: len(self._items))
+
+    def Clone(self):
+        rc = type(self)()
+        rc._items = [copy.copy(item) for item in self._items]
+        return rc
+
+
+class IntPtr(object):
+    """A native address"""
+
+    def __init__(self, address=0):
+        self.address = int(address)
+
+    Zero = _standin.static(lambda: IntPtr(0))
+
+    def ToInt64(self):
+        return self.address
+
+
+class Enum(object):
+    @staticmethod
+    def ToObject(enum_type, value):
+        return enum_type(value)
+
+
+class ICloneable(object):
+    @staticmethod
+    def Clone(value):
+        if hasattr(value, "Clone"): return value.Clone()
+        return copy.copy(value)
+
+
+class Buffer(object):
+    @staticmethod
+    def BlockCopy(src, srcOffset, dst, dstOffset, count):
+        source = struct.pack("<%d%s" % (len(src), _FORMATS[src.ElementType]), *src)
+        size = struct.calcsize(_FORMATS[dst.ElementType])
+        target = bytearray(struct.pack("<%d%s" % (len(dst), _FORMATS[dst.ElementType]), *dst))
+        target[dstOffset:dstOffset+count] = source[srcOffset:srcOffset+count]
+        values = struct.unpack("<%d%s" % (len(target)//size, _FORMATS[dst.ElementType]), bytes(target))
+        for i, value in enumerate(values): dst[i] = value
+
+
+from System import Drawing
@@ -0,0 +1,119 @@
+"""Shared machinery for the headless RhinoCommon stand-in.
+
+Only the types needed to import and benchmark rhinoscript are implemented.
+Every other name in the Rhino, System, Eto and RhinoCodePlatform namespaces
+resolves to a placeholder class: modules can import, subclass and compare
+against it, but creating an instance raises NotImplementedError so a
+benchmark never silently measures fake work.
+"""
+import importlib
+import importlib.abc
+import importlib.machinery
+import sys
+import types
+
+ROOTS = ("Rhino", "System", "Eto", "RhinoCodePlatform", "RhinoPython")
+
+
+class PlaceholderType(type):
+    """Metaclass of placeholder classes. Unknown attributes resolve to nested
+    placeholders so enum members and nested types can be referenced at import
+    time."""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        nested = PlaceholderType(name, (Placeholder,), {"__qualname__": f"{cls.__qualname__}.{name}"})
+        nested.__module__ = cls.__module__
+        setattr(cls, name, nested)
+        return nested
+
+    def __getitem__(cls, key):
+        # generic instantiation, e.g. System.Collections.Generic.Dictionary[str, int]
+        return cls
+
+
+class Placeholder(metaclass=PlaceholderType):
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError(
+            f"{cls.__module__}.{cls.__qualname__} is not implemented by the headless RhinoCommon stand-in")
+
+
+def placeholder(module_name, name):
+    cls = PlaceholderType(name, (Placeholder,), {"__qualname__": name})
+    cls.__module__ = module_name
+    return cls
+
+
+def module_getattr(module_name):
+    """Return a PEP 562 module __getattr__ that creates placeholders for names
+    the stand-in does not implement"""
+    def __getattr__(name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        module = sys.modules[module_name]
+        path = getattr(module, "__path__", None)
+        if path and importlib.machinery.PathFinder.find_spec(module_name + "." + name, path):
+            # a submodule that is implemented on disk, e.g. "from Rhino import Geometry"
+            return importlib.import_module(module_name + "." + name)
+        value = placeholder(module_name, name)
+        setattr(module, name, value)
+        return value
+    return __getattr__
+
+
+class _NamespaceFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Creates an empty namespace module for any import under ROOTS that has
+    no implementation file, e.g. System.Windows.Forms or Eto.Forms"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] not in ROOTS:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        module = types.ModuleType(spec.name)
+        module.__path__ = []
+        module.__getattr__ = module_getattr(spec.name)
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def install():
+    """Let imports of unimplemented namespaces succeed. The finder is appended,
+    so modules that exist on disk always win"""
+    if not any(isinstance(finder, _NamespaceFinder) for finder in sys.meta_path):
+        sys.meta_path.append(_NamespaceFinder())
+
+
+class Event(object):
+    """A .NET style event. Supports handler subscription with += and -="""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+
+class static(object):
+    """Class level property, used for value-type statics such as Point3d.Origin
+    that must hand out a fresh copy on every access"""
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __get__(self, instance, owner):
+        return self.factory()
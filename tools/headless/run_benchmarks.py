@@ -0,0 +1,55 @@
+"""Runs the Scripts/benchmarks modules outside of Rhino.
+
+The Rhino, System and RhinoCodePlatform packages next to this file are a pure
+python stand-in for the parts of RhinoCommon that rhinoscript uses, so the
+benchmarks can run on any machine with CPython 3:
+
+    python tools/headless/run_benchmarks.py              # every *Benchmarks.py
+    python tools/headless/run_benchmarks.py Coerce Doc   # names starting with Coerce or Doc
+
+Absolute timings say little about Rhino itself, compare before/after numbers
+from the same machine instead.
+"""
+import glob
+import importlib
+import os
+import sys
+
+HEADLESS = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(HEADLESS)), "Scripts")
+
+
+def setup():
+    """Put the stand-in and the scripts on sys.path and create the document
+    that scriptcontext.doc refers to"""
+    for path in (SCRIPTS, os.path.join(SCRIPTS, "benchmarks"), HEADLESS):
+        if path not in sys.path: sys.path.insert(0, path)
+    import Rhino
+    import scriptcontext
+    if scriptcontext.doc is None:
+        scriptcontext.doc = Rhino.RhinoDoc.CreateHeadless(None)
+    return scriptcontext.doc
+
+
+def benchmark_names(prefixes=None):
+    pattern = os.path.join(SCRIPTS, "benchmarks", "*Benchmarks.py")
+    names = sorted(os.path.splitext(os.path.basename(path))[0] for path in glob.glob(pattern))
+    if prefixes: names = [name for name in names if any(name.startswith(prefix) for prefix in prefixes)]
+    return names
+
+
+def main(args):
+    setup()
+    names = benchmark_names(args)
+    if not names:
+        print("no benchmarks match %s" % " ".join(args))
+        return 1
+    for name in names:
+        print("== %s" % name)
+        importlib.import_module(name).run()
+        print("")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Runs the Scripts/tests unittest scripts outside of Rhino.
+
+Uses the same stand-in as run_benchmarks.py. Tests that need RhinoCommon
+types the stand-in does not implement skip themselves when
+Rhino.Runtime.HostUtils.RunningInRhino is False:
+
+    python tools/headless/run_tests.py                # every *Tests.py
+    python tools/headless/run_tests.py Cull Point     # names starting with Cull or Point
+"""
+import glob
+import os
+import runpy
+import sys
+
+from run_benchmarks import SCRIPTS, setup
+
+
+def test_paths(prefixes=None):
+    pattern = os.path.join(SCRIPTS, "tests", "*Tests.py")
+    paths = sorted(glob.glob(pattern))
+    if prefixes: paths = [path for path in paths if any(os.path.basename(path).startswith(prefix) for prefix in prefixes)]
+    return paths
+
+
+def main(args):
+    setup()
+    paths = test_paths(args)
+    if not paths:
+        print("no tests match %s" % " ".join(args))
+        return 1
+    failed = []
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        print("== %s" % name)
+        result = runpy.run_path(path, run_name="__main__")["unittestresult"]
+        if not result.wasSuccessful(): failed.append(name)
+        print("")
+    if failed:
+        print("failed: %s" % " ".join(failed))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))